@@ -43,15 +43,24 @@ from .capabilities import (
     OverlayCapabilities,
     TextOverlay,
     TextPosition,
+    
+    # Additional outputs
+    OutputKind,
+    DeliverableOutput,
+    THUMBNAIL_EXTENSIONS,
 )
 
 from .settings import (
     DeliverSettings,
     DEFAULT_DELIVER_SETTINGS,
+    DeliverSettingsInterner,
+    get_settings_interner,
+    settings_fingerprint,
 )
 
 from .paths import (
     OutputCollisionError,
+    resolve_additional_output_paths,
 )
 
 from .codec_specs import (
@@ -93,12 +102,21 @@ __all__ = [
     "TextOverlay",
     "TextPosition",
     
+    # Additional outputs
+    "OutputKind",
+    "DeliverableOutput",
+    "THUMBNAIL_EXTENSIONS",
+    
     # Settings
     "DeliverSettings",
     "DEFAULT_DELIVER_SETTINGS",
+    "DeliverSettingsInterner",
+    "get_settings_interner",
+    "settings_fingerprint",
     
     # Path Resolution (INC-003)
     "OutputCollisionError",
+    "resolve_additional_output_paths",
     
     # Codec Specs (Phase 20)
     "CodecSpec",
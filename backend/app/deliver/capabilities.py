@@ -310,3 +310,57 @@ class OverlayCapabilities:
     # safe_guides_enabled: bool = False
     # action_safe_percent: float = 0.9
     # title_safe_percent: float = 0.8
+
+
+# ============================================================================
+# ADDITIONAL OUTPUTS (Single-decode multi-deliverable)
+# ============================================================================
+
+class OutputKind(str, Enum):
+    """What an additional output contains."""
+    VIDEO = "video"          # A full-length render (video + audio)
+    THUMBNAIL = "thumbnail"  # One still frame
+
+
+# File types a THUMBNAIL output can be written as (others fall back to jpg)
+THUMBNAIL_EXTENSIONS = ("jpg", "jpeg", "png", "tif", "tiff")
+
+
+@dataclass(frozen=True)
+class DeliverableOutput:
+    """
+    An additional output rendered from the SAME decode as the primary output.
+    
+    e.g. an H.264 review file and a thumbnail next to a ProRes proxy:
+    the source is read and decoded once and fanned out to every output.
+    
+    Output filename: primary output stem + "_" + name + "." + extension,
+    in the primary output's directory.
+    """
+    
+    # Identifies the output and suffixes its filename (must be unique)
+    name: str
+    kind: OutputKind = OutputKind.VIDEO
+    
+    video: VideoCapabilities = field(default_factory=VideoCapabilities)
+    audio: AudioCapabilities = field(default_factory=AudioCapabilities)
+    
+    # Container/extension of this output (naming comes from the primary).
+    # THUMBNAIL outputs are always images: jpg unless one of
+    # THUMBNAIL_EXTENSIONS is given.
+    container: str = "mov"
+    extension: Optional[str] = None
+    
+    # THUMBNAIL: seconds into the clip of the captured frame
+    thumbnail_time: float = 0.0
+    
+    # Burn the primary's text overlays into this output as well
+    burn_in_overlays: bool = True
+    
+    @property
+    def file_extension(self) -> str:
+        extension = self.extension or self.container
+        if self.kind == OutputKind.THUMBNAIL and extension.lower() not in THUMBNAIL_EXTENSIONS:
+            # A still frame needs an image file (e.g. the default "mov")
+            return "jpg"
+        return extension
@@ -16,6 +16,7 @@ FFmpeg support status:
 - METADATA: Container passthrough supported
 - OVERLAYS: Text via drawtext supported (Phase 1)
 - SCALING: fit/fill/stretch modes supported
+- OUTPUTS: Additional outputs share one decode via a split filter graph
 """
 
 import logging
@@ -37,6 +38,8 @@ from .capabilities import (
     AudioCodec,
     DataLevels,
     ColorSpace,
+    DeliverableOutput,
+    OutputKind,
 )
 from .settings import DeliverSettings
 
@@ -55,6 +58,18 @@ class EngineWarning:
     fallback: Optional[str] = None  # What we're doing instead
 
 
+@dataclass
+class FFmpegOutputMapping:
+    """FFmpeg arguments of one additional output (see DeliverableOutput)."""
+    name: str
+    kind: OutputKind
+    video_args: List[str] = field(default_factory=list)
+    audio_args: List[str] = field(default_factory=list)
+    metadata_args: List[str] = field(default_factory=list)
+    filter_chains: List[str] = field(default_factory=list)
+    map_audio: bool = True
+
+
 @dataclass
 class FFmpegMappingResult:
     """
@@ -75,6 +90,12 @@ class FFmpegMappingResult:
     metadata_args: List[str] = field(default_factory=list)
     filter_chains: List[str] = field(default_factory=list)
     
+    # Stream selection of the primary output (single-output commands)
+    stream_maps: List[str] = field(default_factory=list)
+    
+    # Outputs rendered from the same decode as the primary output
+    additional_outputs: List[FFmpegOutputMapping] = field(default_factory=list)
+    
     # Warnings about unsupported capabilities
     warnings: List[EngineWarning] = field(default_factory=list)
     
@@ -83,6 +104,7 @@ class FFmpegMappingResult:
         ffmpeg_path: str,
         source_path: str,
         output_path: str,
+        additional_output_paths: Optional[List[str]] = None,
     ) -> List[str]:
         """
         Assemble complete FFmpeg command.
@@ -97,6 +119,15 @@ class FFmpegMappingResult:
         7. Audio codec/options
         8. Metadata options
         9. Output file
+        
+        With additional outputs the source is still read and decoded once:
+        the first video stream is split in a -filter_complex graph, and
+        each output maps its own branch, followed by its own options and
+        path (primary output first).
+        
+        Raises:
+            ValueError: If additional_output_paths does not match
+                additional_outputs one to one
         """
         cmd = [ffmpeg_path, "-y"]  # -y to overwrite
         
@@ -106,6 +137,11 @@ class FFmpegMappingResult:
         # Input
         cmd.extend(["-i", source_path])
         
+        if self.additional_outputs:
+            return self._build_multi_output_command(
+                cmd, output_path, additional_output_paths or []
+            )
+        
         # Video
         cmd.extend(self.video_args)
         
@@ -118,11 +154,84 @@ class FFmpegMappingResult:
         
         # Metadata
         cmd.extend(self.metadata_args)
+        cmd.extend(self.stream_maps)
         
         # Output
         cmd.append(output_path)
         
         return cmd
+    
+    def build_filter_graph(self) -> str:
+        """
+        -filter_complex graph fanning the decoded video out to every output.
+        
+        Branch 0 feeds the primary output as [v0], branch N the Nth
+        additional output as [vN].
+        """
+        chains = [self.filter_chains] + [output.filter_chains for output in self.additional_outputs]
+        split = f"[0:v:0]split={len(chains)}" + "".join(f"[s{i}]" for i in range(len(chains)))
+        branches = [
+            f"[s{i}]{','.join(chain) if chain else 'null'}[v{i}]"
+            for i, chain in enumerate(chains)
+        ]
+        return ";".join([split] + branches)
+    
+    def _build_multi_output_command(
+        self,
+        cmd: List[str],
+        output_path: str,
+        additional_output_paths: List[str],
+    ) -> List[str]:
+        """Append the split graph and every output to cmd (input already added)."""
+        if len(additional_output_paths) != len(self.additional_outputs):
+            raise ValueError(
+                f"Expected {len(self.additional_outputs)} additional output paths, "
+                f"got {len(additional_output_paths)}"
+            )
+        
+        cmd.extend(["-filter_complex", self.build_filter_graph()])
+        
+        # Primary output: its own stream maps, with the first video stream
+        # taken from the split instead of the input
+        cmd.extend(self._primary_stream_maps())
+        cmd.extend(self.video_args)
+        cmd.extend(self.audio_args)
+        cmd.extend(self.metadata_args)
+        cmd.append(output_path)
+        
+        # Additional outputs
+        for index, (output, path) in enumerate(
+            zip(self.additional_outputs, additional_output_paths), start=1
+        ):
+            cmd.extend(["-map", f"[v{index}]"])
+            if output.map_audio:
+                cmd.extend(["-map", "0:a?"])
+            cmd.extend(output.video_args)
+            cmd.extend(output.audio_args if output.map_audio else ["-an"])
+            cmd.extend(output.metadata_args)
+            cmd.append(path)
+        
+        return cmd
+    
+    def _primary_stream_maps(self) -> List[str]:
+        """
+        The primary output's -map arguments for a multi-output command.
+        
+        -map 0:v becomes [v0] (the filtered first video stream) plus any
+        further video streams of the input; other maps are kept as is.
+        Without explicit maps (metadata stripped), the first video and
+        all audio streams are mapped.
+        """
+        if not self.stream_maps:
+            return ["-map", "[v0]", "-map", "0:a?"]
+        maps: List[str] = []
+        for index in range(0, len(self.stream_maps), 2):
+            spec = self.stream_maps[index + 1]
+            if spec in ("0:v", "0:v?"):
+                maps.extend(["-map", "[v0]", "-map", spec, "-map", "-0:v:0"])
+            else:
+                maps.extend(self.stream_maps[index:index + 2])
+        return maps
 
 
 # ============================================================================
@@ -172,6 +281,15 @@ FFMPEG_SCALING_FILTER_MAP: Dict[str, str] = {
     "nearest": "neighbor",
 }
 
+# Still image encoders for THUMBNAIL outputs, by file extension
+FFMPEG_THUMBNAIL_CODEC_MAP: Dict[str, List[str]] = {
+    "jpg": ["-c:v", "mjpeg", "-q:v", "2"],
+    "jpeg": ["-c:v", "mjpeg", "-q:v", "2"],
+    "png": ["-c:v", "png"],
+    "tif": ["-c:v", "tiff"],
+    "tiff": ["-c:v", "tiff"],
+}
+
 
 # ============================================================================
 # TEXT OVERLAY POSITION MAPPING
@@ -238,8 +356,96 @@ class FFmpegEngineMapper:
         self._map_metadata(settings.metadata, result)
         self._map_overlays(settings.overlay, result, source_timecode)
         
+        # Additional outputs (single decode, see build_command)
+        seen_names = set()
+        for output in settings.additional_outputs:
+            if output.name in seen_names:
+                result.warnings.append(EngineWarning(
+                    capability=f"outputs[{output.name}].name",
+                    message=f"Duplicate output name '{output.name}'",
+                    fallback="Output paths will collide; rename the output",
+                ))
+            seen_names.add(output.name)
+            result.additional_outputs.append(self._map_additional_output(
+                output, settings, result, source_width, source_height, source_timecode
+            ))
+        
         return result
     
+    def _map_additional_output(
+        self,
+        output: DeliverableOutput,
+        settings: DeliverSettings,
+        result: FFmpegMappingResult,
+        source_width: Optional[int],
+        source_height: Optional[int],
+        source_timecode: Optional[str],
+    ) -> FFmpegOutputMapping:
+        """
+        Map one additional output into its own argument lists.
+        
+        Uses the same per-domain mappers as the primary output; warnings
+        are added to result with the capability prefixed by the output.
+        """
+        branch = FFmpegMappingResult()
+        
+        if output.kind == OutputKind.THUMBNAIL:
+            self._map_thumbnail(output, branch, source_width, source_height)
+        else:
+            self._map_video(output.video, branch, source_width, source_height)
+            self._map_audio(output.audio, branch)
+        
+        if output.burn_in_overlays:
+            self._map_overlays(settings.overlay, branch, source_timecode)
+        
+        for warning in branch.warnings:
+            result.warnings.append(EngineWarning(
+                capability=f"outputs[{output.name}].{warning.capability}",
+                message=warning.message,
+                fallback=warning.fallback,
+            ))
+        
+        is_video = output.kind == OutputKind.VIDEO
+        return FFmpegOutputMapping(
+            name=output.name,
+            kind=output.kind,
+            video_args=branch.video_args,
+            audio_args=branch.audio_args,
+            # Same metadata policy as the primary output (video outputs only)
+            metadata_args=list(result.metadata_args) if is_video else [],
+            filter_chains=branch.filter_chains,
+            map_audio=is_video,
+        )
+    
+    def _map_thumbnail(
+        self,
+        output: DeliverableOutput,
+        result: FFmpegMappingResult,
+        source_width: Optional[int],
+        source_height: Optional[int],
+    ) -> None:
+        """Map a THUMBNAIL output: one still frame at output.thumbnail_time."""
+        
+        if output.thumbnail_time > 0:
+            result.filter_chains.append(f"trim=start={output.thumbnail_time}")
+        
+        if output.video.resolution_policy != ResolutionPolicy.SOURCE:
+            self._build_scale_filter(output.video, result, source_width, source_height)
+        
+        extension = output.file_extension.lower()
+        if extension in FFMPEG_THUMBNAIL_CODEC_MAP:
+            result.video_args.extend(FFMPEG_THUMBNAIL_CODEC_MAP[extension])
+        else:
+            result.warnings.append(EngineWarning(
+                capability="thumbnail.extension",
+                message=f"No still image encoder for '.{extension}'",
+                fallback="Using MJPEG",
+            ))
+            result.video_args.extend(FFMPEG_THUMBNAIL_CODEC_MAP["jpg"])
+        
+        # A single image, overwritten in place (-update is an image2 option)
+        result.video_args.extend(["-frames:v", "1", "-f", "image2", "-update", "1"])
+    
     def _map_video(
         self,
         video: VideoCapabilities,
@@ -387,7 +593,7 @@ class FFmpegEngineMapper:
             result.metadata_args.extend(["-map_metadata", "0"])
         
         # Map all video and audio streams
-        result.metadata_args.extend(["-map", "0:v", "-map", "0:a?"])
+        result.stream_maps.extend(["-map", "0:v", "-map", "0:a?"])
         
         # Timecode passthrough
         # Note: FFmpeg preserves timecode in container metadata by default
@@ -17,9 +17,10 @@ CRITICAL RULES:
 import re
 import logging
 from datetime import datetime
-from pathlib import Path
 from typing import Optional, Dict, Any
 
+from ..metadata.sequences import source_stem
+
 logger = logging.getLogger(__name__)
 
 
@@ -113,8 +114,7 @@ def resolve_filename(
     Returns:
         Resolved filename (without extension)
     """
-    source = Path(source_path)
-    source_name = source.stem  # Filename without extension
+    source_name = source_stem(source_path)  # Filename without extension (or frame token)
     
     # Build token value map
     now = datetime.now()
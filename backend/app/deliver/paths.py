@@ -229,3 +229,40 @@ def ensure_output_directory(output_path: str) -> None:
     """
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
+
+
+def resolve_additional_output_paths(
+    primary_output_path: str,
+    settings: DeliverSettings,
+) -> list[str]:
+    """
+    Resolve the paths of settings.additional_outputs.
+    
+    Each additional output sits next to the primary output:
+    {primary stem}_{output name}.{output extension}
+    
+    The primary output's overwrite policy applies to every output.
+    
+    Returns:
+        One absolute path per additional output, in declaration order
+        
+    Raises:
+        OutputCollisionError: If two outputs resolve to the same path, or
+            an output exists and the overwrite policy forbids replacing it
+    """
+    primary = Path(primary_output_path)
+    policy = settings.file.overwrite_policy.value
+    
+    seen = {primary}
+    paths = []
+    for output in settings.additional_outputs:
+        candidate = primary.parent / f"{primary.stem}_{output.name}.{output.file_extension}"
+        if candidate in seen:
+            raise OutputCollisionError(
+                f"Additional output '{output.name}' resolves to an output path "
+                f"already in use: {candidate}. Output names must be unique."
+            )
+        seen.add(candidate)
+        paths.append(str(_handle_overwrite(output_path=candidate, policy=policy)))
+    
+    return paths
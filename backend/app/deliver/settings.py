@@ -14,8 +14,11 @@ This replaces the legacy JobSettings with a more comprehensive model.
 """
 
 from dataclasses import dataclass, field, asdict
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Callable, Dict, List
+import hashlib
 import json
+import threading
+import weakref
 
 from .capabilities import (
     VideoCapabilities,
@@ -35,6 +38,8 @@ from .capabilities import (
     AudioCodec,
     AudioChannelLayout,
     OverwritePolicy,
+    DeliverableOutput,
+    OutputKind,
 )
 
 
@@ -69,6 +74,10 @@ class DeliverSettings:
     # If None, falls back to source file's parent directory
     output_dir: Optional[str] = None
     
+    # Further outputs rendered from the same decode as the primary output
+    # (e.g. H.264 review + thumbnail next to a ProRes proxy)
+    additional_outputs: tuple[DeliverableOutput, ...] = ()
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Serialize to dictionary for JSON storage.
@@ -80,6 +89,8 @@ class DeliverSettings:
                 return val.value
             elif hasattr(val, '__dataclass_fields__'):  # Dataclass
                 return {k: serialize_value(v) for k, v in asdict(val).items()}
+            elif isinstance(val, dict):
+                return {k: serialize_value(v) for k, v in val.items()}
             elif isinstance(val, tuple):
                 return [serialize_value(v) for v in val]
             elif isinstance(val, list):
@@ -87,7 +98,7 @@ class DeliverSettings:
             else:
                 return val
         
-        return {
+        data = {
             "video": serialize_value(self.video),
             "audio": serialize_value(self.audio),
             "file": serialize_value(self.file),
@@ -95,6 +106,11 @@ class DeliverSettings:
             "overlay": serialize_value(self.overlay),
             "output_dir": self.output_dir,
         }
+        # Only present when used, so single-output settings keep their
+        # existing serialization (and fingerprint)
+        if self.additional_outputs:
+            data["additional_outputs"] = serialize_value(self.additional_outputs)
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DeliverSettings":
@@ -106,39 +122,8 @@ class DeliverSettings:
         if not data:
             return DEFAULT_DELIVER_SETTINGS
         
-        # Parse video capabilities
-        video_data = data.get("video", {})
-        video = VideoCapabilities(
-            codec=video_data.get("codec", "prores_422"),
-            profile=video_data.get("profile"),
-            level=video_data.get("level"),
-            pixel_format=video_data.get("pixel_format"),
-            resolution_policy=ResolutionPolicy(video_data.get("resolution_policy", "source")),
-            width=video_data.get("width"),
-            height=video_data.get("height"),
-            scaling_filter=ScalingFilter(video_data.get("scaling_filter", "auto")),
-            frame_rate_policy=FrameRatePolicy(video_data.get("frame_rate_policy", "source")),
-            frame_rate=video_data.get("frame_rate"),
-            field_order=FieldOrder(video_data.get("field_order", "progressive")),
-            color_space=ColorSpace(video_data.get("color_space", "source")),
-            gamma=GammaTransfer(video_data.get("gamma", "source")),
-            data_levels=DataLevels(video_data.get("data_levels", "source")),
-            hdr_metadata_passthrough=video_data.get("hdr_metadata_passthrough", True),
-            quality=video_data.get("quality"),
-            bitrate=video_data.get("bitrate"),
-            preset=video_data.get("preset"),
-        )
-        
-        # Parse audio capabilities
-        audio_data = data.get("audio", {})
-        audio = AudioCapabilities(
-            codec=AudioCodec(audio_data.get("codec", "copy")),
-            bitrate=audio_data.get("bitrate"),
-            channels=audio_data.get("channels"),
-            layout=AudioChannelLayout(audio_data.get("layout", "source")),
-            sample_rate=audio_data.get("sample_rate"),
-            passthrough=audio_data.get("passthrough", False),
-        )
+        video = _video_from_dict(data.get("video", {}))
+        audio = _audio_from_dict(data.get("audio", {}))
         
         # Parse file capabilities
         file_data = data.get("file", {})
@@ -186,6 +171,10 @@ class DeliverSettings:
             metadata=metadata,
             overlay=overlay,
             output_dir=data.get("output_dir"),
+            additional_outputs=tuple(
+                _output_from_dict(output_data)
+                for output_data in data.get("additional_outputs", [])
+            ),
         )
     
     def with_updates(self, **kwargs) -> "DeliverSettings":
@@ -245,5 +234,121 @@ class DeliverSettings:
         )
 
 
+def _video_from_dict(video_data: Dict[str, Any]) -> VideoCapabilities:
+    """Parse VideoCapabilities from its serialized dict."""
+    return VideoCapabilities(
+        codec=video_data.get("codec", "prores_422"),
+        profile=video_data.get("profile"),
+        level=video_data.get("level"),
+        pixel_format=video_data.get("pixel_format"),
+        resolution_policy=ResolutionPolicy(video_data.get("resolution_policy", "source")),
+        width=video_data.get("width"),
+        height=video_data.get("height"),
+        scaling_filter=ScalingFilter(video_data.get("scaling_filter", "auto")),
+        frame_rate_policy=FrameRatePolicy(video_data.get("frame_rate_policy", "source")),
+        frame_rate=video_data.get("frame_rate"),
+        field_order=FieldOrder(video_data.get("field_order", "progressive")),
+        color_space=ColorSpace(video_data.get("color_space", "source")),
+        gamma=GammaTransfer(video_data.get("gamma", "source")),
+        data_levels=DataLevels(video_data.get("data_levels", "source")),
+        hdr_metadata_passthrough=video_data.get("hdr_metadata_passthrough", True),
+        quality=video_data.get("quality"),
+        bitrate=video_data.get("bitrate"),
+        preset=video_data.get("preset"),
+    )
+
+
+def _audio_from_dict(audio_data: Dict[str, Any]) -> AudioCapabilities:
+    """Parse AudioCapabilities from its serialized dict."""
+    return AudioCapabilities(
+        codec=AudioCodec(audio_data.get("codec", "copy")),
+        bitrate=audio_data.get("bitrate"),
+        channels=audio_data.get("channels"),
+        layout=AudioChannelLayout(audio_data.get("layout", "source")),
+        sample_rate=audio_data.get("sample_rate"),
+        passthrough=audio_data.get("passthrough", False),
+    )
+
+
+def _output_from_dict(output_data: Dict[str, Any]) -> DeliverableOutput:
+    """Parse one DeliverableOutput from its serialized dict."""
+    return DeliverableOutput(
+        name=output_data["name"],
+        kind=OutputKind(output_data.get("kind", "video")),
+        video=_video_from_dict(output_data.get("video", {})),
+        audio=_audio_from_dict(output_data.get("audio", {})),
+        container=output_data.get("container", "mov"),
+        extension=output_data.get("extension"),
+        thumbnail_time=output_data.get("thumbnail_time", 0.0),
+        burn_in_overlays=output_data.get("burn_in_overlays", True),
+    )
+
+
 # Default settings instance
 DEFAULT_DELIVER_SETTINGS = DeliverSettings()
+
+
+def settings_fingerprint(data: Dict[str, Any]) -> str:
+    """
+    Deterministic hash of a serialized DeliverSettings dict.
+    
+    Same scheme as SettingsPreset.fingerprint, so a job created from a
+    preset has that preset's fingerprint until it gets overrides.
+    """
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+class DeliverSettingsInterner:
+    """
+    Shares one DeliverSettings instance per distinct settings dict.
+    
+    DeliverSettings is immutable, so jobs created from the same preset can
+    all hold the same object: 10k queued jobs cost one deserialization and
+    one instance. Entries are weak, so settings no job uses any more are
+    dropped.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_fingerprint: "weakref.WeakValueDictionary[str, DeliverSettings]" = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+    
+    def intern(
+        self,
+        data: Dict[str, Any],
+        factory: Callable[[Dict[str, Any]], DeliverSettings] = DeliverSettings.from_dict,
+    ) -> DeliverSettings:
+        """
+        Return the shared DeliverSettings for data, deserializing it on first use.
+        
+        factory must be deterministic in data (from_dict, or
+        from_legacy_job_settings for legacy dicts).
+        """
+        fingerprint = settings_fingerprint(data)
+        with self._lock:
+            settings = self._by_fingerprint.get(fingerprint)
+            if settings is not None:
+                self.hits += 1
+                return settings
+            self.misses += 1
+        
+        settings = factory(data)
+        with self._lock:
+            # Another thread may have interned it meanwhile: keep the first
+            return self._by_fingerprint.setdefault(fingerprint, settings)
+    
+    def __len__(self) -> int:
+        return len(self._by_fingerprint)
+
+
+_settings_interner: Optional[DeliverSettingsInterner] = None
+
+
+def get_settings_interner() -> DeliverSettingsInterner:
+    """Get the process-wide DeliverSettings intern table."""
+    global _settings_interner
+    if _settings_interner is None:
+        _settings_interner = DeliverSettingsInterner()
+    return _settings_interner
@@ -28,7 +28,20 @@ from .base import (
 )
 from .ffmpeg import FFmpegEngine
 from .engine_registry import EngineRegistry, get_engine_registry
-from .scheduler import Scheduler, get_scheduler
+from .scheduler import Scheduler, QueueEstimate, get_scheduler
+from .scheduling import (
+    QueuedJob,
+    SchedulingPolicy,
+    FifoPolicy,
+    ShortestJobFirstPolicy,
+    FairSharePolicy,
+    BinPackingPolicy,
+    create_policy,
+    priority_lane,
+)
+from .cost_model import EncodeCostModel, get_cost_model
+from .resources import ResourceManager, ThreadBudget, get_resource_manager
+from .segments import Segment, SegmentCheckpointStore, get_segment_checkpoints
 
 __all__ = [
     # Errors
@@ -52,5 +65,25 @@ __all__ = [
     "EngineRegistry",
     "get_engine_registry",
     "Scheduler",
+    "QueueEstimate",
     "get_scheduler",
+    # Scheduling policies and cost model
+    "QueuedJob",
+    "SchedulingPolicy",
+    "FifoPolicy",
+    "ShortestJobFirstPolicy",
+    "FairSharePolicy",
+    "BinPackingPolicy",
+    "create_policy",
+    "priority_lane",
+    "EncodeCostModel",
+    "get_cost_model",
+    # CPU budget per running clip
+    "ResourceManager",
+    "ThreadBudget",
+    "get_resource_manager",
+    # Checkpointed segment encodes
+    "Segment",
+    "SegmentCheckpointStore",
+    "get_segment_checkpoints",
 ]
@@ -94,6 +94,16 @@ class ExecutionEngine(ABC):
         """
         pass
     
+    @property
+    def version(self) -> Optional[str]:
+        """
+        Engine build identifier (e.g. the binary's version string).
+        
+        Part of the render ledger key: outputs are only reused from the
+        same engine build. None if unknown, which disables reuse.
+        """
+        return None
+    
     @abstractmethod
     def validate_job(
         self,
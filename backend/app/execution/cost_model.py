@@ -0,0 +1,266 @@
+"""
+Encode cost model for scheduling.
+
+Estimates how long a clip takes to render from the metadata every
+ClipTask carries from ingest (width, height, duration, frame_rate, codec)
+and the encode speed measured on earlier renders (ProgressInfo.encoding_fps).
+
+Encode fps is learned per (source codec, output codec, resolution class)
+as an exponentially weighted moving average, with fallbacks to
+(output codec, resolution class), then the resolution class, then a
+built-in default. Estimates therefore start rough and converge as renders
+complete.
+
+Used by the scheduler to order jobs (see scheduling.py) and to compute
+queue ETAs. Learned speeds are in memory only.
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..jobs.models import Job, ClipTask
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest sample in the moving average
+EWMA_ALPHA = 0.3
+
+# Assumed length of a clip whose duration is unknown
+DEFAULT_CLIP_SECONDS = 60.0
+
+# Assumed frame rate when the source frame rate is unknown
+DEFAULT_FRAME_RATE = 25.0
+
+# (max height, class) in ascending order
+RESOLUTION_CLASSES: Tuple[Tuple[int, str], ...] = (
+    (576, "sd"),
+    (1080, "hd"),
+    (2160, "uhd"),
+)
+
+# Encode fps before anything has been measured, per resolution class
+DEFAULT_ENCODE_FPS: Dict[str, float] = {
+    "sd": 240.0,
+    "hd": 90.0,
+    "uhd": 25.0,
+    "large": 10.0,
+}
+
+# Encoder threads a render of each resolution class keeps busy
+CORES_PER_CLASS: Dict[str, int] = {
+    "sd": 2,
+    "hd": 4,
+    "uhd": 8,
+    "large": 8,
+}
+
+
+# Frame rate the nominal rates below are quoted at (29.97)
+NOMINAL_FRAME_RATE = 30000 / 1001
+
+# Nominal video data rate (Mbit/s) of output codecs at 1920x1080, 29.97 fps
+NOMINAL_OUTPUT_MBPS: Dict[str, float] = {
+    "prores_proxy": 45.0,
+    "prores_lt": 102.0,
+    "prores_422": 147.0,
+    "prores_422_hq": 220.0,
+    "prores_4444": 330.0,
+    "prores_4444_xq": 500.0,
+    "dnxhr_lb": 45.0,
+    "dnxhr_sq": 145.0,
+    "dnxhr_hq": 220.0,
+    "dnxhr_hqx": 220.0,
+    "dnxhr_444": 440.0,
+    "h264": 20.0,
+}
+
+# Rate assumed for codecs missing above (a high-rate intermediate)
+DEFAULT_OUTPUT_MBPS = 220.0
+
+# Output size estimates exceed the video data rate by this factor (audio, container, VBR)
+OUTPUT_SIZE_HEADROOM = 1.25
+
+
+def resolution_class(height: Optional[int]) -> str:
+    """Resolution class of a source height ("hd" if unknown)."""
+    if not height:
+        return "hd"
+    for max_height, name in RESOLUTION_CLASSES:
+        if height <= max_height:
+            return name
+    return "large"
+
+
+def parse_frame_rate(frame_rate) -> Optional[float]:
+    """Frame rate from a number, "25", "23.976" or "24000/1001"; None if unusable."""
+    if frame_rate is None:
+        return None
+    try:
+        if isinstance(frame_rate, str) and "/" in frame_rate:
+            num, den = frame_rate.split("/", 1)
+            value = float(num) / float(den)
+        else:
+            value = float(frame_rate)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return value if value > 0 else None
+
+
+def parse_bitrate(bitrate) -> Optional[float]:
+    """Bits per second from a number, "20M", "192k" or "8000000"; None if unusable."""
+    if bitrate is None:
+        return None
+    text = str(bitrate).strip().lower()
+    scale = {"k": 1e3, "m": 1e6, "g": 1e9}.get(text[-1:], 1.0)
+    if scale != 1.0:
+        text = text[:-1]
+    try:
+        value = float(text) * scale
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def estimate_output_bytes(
+    task: "ClipTask",
+    output_codec: Optional[str],
+    video_bitrate: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Expected size of a clip's rendered output: data rate x duration.
+
+    The rate is video_bitrate when the output has one, else the codec's
+    nominal rate scaled to the source resolution and frame rate (outputs
+    are rarely larger than their source, so this errs high).
+
+    Returns:
+        Bytes, or None if the clip's duration is unknown
+    """
+    if not task.duration or task.duration <= 0:
+        return None
+    bits_per_second = parse_bitrate(video_bitrate)
+    if bits_per_second is None:
+        mbps = NOMINAL_OUTPUT_MBPS.get((output_codec or "").lower(), DEFAULT_OUTPUT_MBPS)
+        pixels = (task.width or 1920) * (task.height or 1080)
+        fps = parse_frame_rate(task.frame_rate) or NOMINAL_FRAME_RATE
+        bits_per_second = mbps * 1e6 * (pixels / (1920 * 1080)) * (fps / NOMINAL_FRAME_RATE)
+    return int(bits_per_second / 8 * task.duration * OUTPUT_SIZE_HEADROOM)
+
+
+def _source_codec(task: "ClipTask") -> str:
+    # task.codec is "<codec_name> <profile>"
+    return (task.codec or "").split(" ", 1)[0].lower() or "unknown"
+
+
+class EncodeCostModel:
+    """
+    Learned encode speed and clip/job duration estimates. Thread-safe.
+    """
+
+    def __init__(self, cores: Optional[int] = None):
+        """
+        Args:
+            cores: CPU cores available to renders (default: os.cpu_count())
+        """
+        self.cores = cores or os.cpu_count() or 1
+        self._fps: Dict[Tuple[str, ...], float] = {}
+        self._samples = 0
+        self._lock = threading.Lock()
+
+    def _keys(self, task: "ClipTask", output_codec: str) -> Tuple[Tuple[str, ...], ...]:
+        """Lookup keys from most to least specific."""
+        res = resolution_class(task.height)
+        output_codec = (output_codec or "unknown").lower()
+        return (
+            (_source_codec(task), output_codec, res),
+            (output_codec, res),
+            (res,),
+        )
+
+    def observe(self, task: "ClipTask", output_codec: str, encoding_fps: float) -> None:
+        """Record the encode speed measured for a finished render."""
+        if not encoding_fps or encoding_fps <= 0:
+            return
+        with self._lock:
+            for key in self._keys(task, output_codec):
+                previous = self._fps.get(key)
+                self._fps[key] = (
+                    encoding_fps if previous is None
+                    else EWMA_ALPHA * encoding_fps + (1 - EWMA_ALPHA) * previous
+                )
+            self._samples += 1
+
+    def encode_fps(self, task: "ClipTask", output_codec: str) -> float:
+        """Expected encode speed of a clip (most specific measurement available)."""
+        with self._lock:
+            for key in self._keys(task, output_codec):
+                fps = self._fps.get(key)
+                if fps is not None:
+                    return fps
+        return DEFAULT_ENCODE_FPS[resolution_class(task.height)]
+
+    def estimate_task_seconds(self, task: "ClipTask", output_codec: str) -> float:
+        """Expected render time of a whole clip in seconds."""
+        duration = task.duration if task.duration and task.duration > 0 else DEFAULT_CLIP_SECONDS
+        frame_rate = parse_frame_rate(task.frame_rate) or DEFAULT_FRAME_RATE
+        return duration * frame_rate / self.encode_fps(task, output_codec)
+
+    def estimate_job_seconds(self, job: "Job", output_codec: Optional[str] = None) -> float:
+        """
+        Expected remaining render time of a job.
+
+        Counts queued clips in full and running clips by their remaining
+        progress; finished clips cost nothing.
+
+        Args:
+            job: The job
+            output_codec: Video codec the job renders with, as observe()
+                was given it (JobEngine.resolve_job_params().video_codec, so
+                a bound preset's codec wins). Default: job.settings.video.codec
+        """
+        from ..jobs.models import TaskStatus
+
+        if output_codec is None:
+            output_codec = job.settings.video.codec
+        total = 0.0
+        for task in job.tasks:
+            if task.status == TaskStatus.QUEUED:
+                total += self.estimate_task_seconds(task, output_codec)
+            elif task.status == TaskStatus.RUNNING:
+                remaining = max(0.0, 1.0 - task.progress_percent / 100.0)
+                total += self.estimate_task_seconds(task, output_codec) * remaining
+        return total
+
+    def job_cores(self, job: "Job") -> int:
+        """Cores a job's largest clip keeps busy (capped at self.cores)."""
+        demand = max(
+            (CORES_PER_CLASS[resolution_class(task.height)] for task in job.tasks),
+            default=CORES_PER_CLASS["hd"],
+        )
+        return min(demand, self.cores)
+
+    def snapshot(self) -> Dict:
+        """Learned speeds for diagnostics."""
+        with self._lock:
+            return {
+                "samples": self._samples,
+                "encode_fps": {"/".join(key): round(fps, 2) for key, fps in self._fps.items()},
+            }
+
+
+_cost_model: Optional[EncodeCostModel] = None
+
+
+def get_cost_model() -> EncodeCostModel:
+    """
+    Get the default cost model instance.
+
+    Creates the model on first access (lazy initialization).
+    """
+    global _cost_model
+    if _cost_model is None:
+        _cost_model = EncodeCostModel()
+    return _cost_model
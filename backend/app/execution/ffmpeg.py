@@ -24,6 +24,7 @@ import select
 import signal
 import shutil
 import subprocess
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, List, Callable, TYPE_CHECKING
@@ -38,9 +39,12 @@ from .base import (
     EngineValidationError,
 )
 from .results import ExecutionResult, ExecutionStatus
+from . import segments
 from .resolved_params import ResolvedPresetParams, DEFAULT_H264_PARAMS
+from ..metadata.sequences import ImageSequence, get_image_sequence, is_sequence_pattern
 
 if TYPE_CHECKING:
+    from ..filesystem.staging import StagedOutputs
     from ..jobs.models import Job, ClipTask
     from ..presets.registry import PresetRegistry
     from ..deliver.settings import DeliverSettings
@@ -108,6 +112,7 @@ class FFmpegEngine(ExecutionEngine):
         self._active_processes: Dict[str, subprocess.Popen] = {}
         self._cancelled_tasks: set[str] = set()
         self._ffmpeg_path: Optional[str] = None
+        self._version: Optional[str] = None
     
     @property
     def engine_type(self) -> EngineType:
@@ -130,6 +135,28 @@ class FFmpegEngine(ExecutionEngine):
             EngineCapability.AUDIO_PASSTHROUGH,
         }
     
+    @property
+    def version(self) -> Optional[str]:
+        """First line of `ffmpeg -version` (queried once)."""
+        if self._version is None:
+            ffmpeg_path = self._find_ffmpeg()
+            if not ffmpeg_path:
+                return None
+            try:
+                completed = subprocess.run(
+                    [ffmpeg_path, "-version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10,
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                return None
+            first_line = completed.stdout.splitlines()[0] if completed.stdout else ""
+            if completed.returncode != 0 or not first_line:
+                return None
+            self._version = first_line.strip()
+        return self._version
+    
     def _find_ffmpeg(self) -> Optional[str]:
         """Find ffmpeg binary path."""
         if self._ffmpeg_path:
@@ -204,10 +231,13 @@ class FFmpegEngine(ExecutionEngine):
                 if codec_str not in FFMPEG_CODEC_MAP and codec_str != "h264":
                     return False, f"Codec '{codec_str}' is not supported by FFmpeg engine"
         
-        # Validate source files exist
+        # Validate source files exist (image sequences: at least one frame)
         missing_files = []
         for task in job.tasks:
-            if not Path(task.source_path).is_file():
+            if is_sequence_pattern(task.source_path):
+                if self._resolve_image_sequence(task) is None:
+                    missing_files.append(task.source_path)
+            elif not Path(task.source_path).is_file():
                 missing_files.append(task.source_path)
         
         if missing_files:
@@ -217,6 +247,67 @@ class FFmpegEngine(ExecutionEngine):
         
         return True, None
     
+    def _resolve_image_sequence(self, task: "ClipTask") -> Optional[ImageSequence]:
+        """
+        Return the image sequence behind a task, or None for file sources.
+        
+        Uses the sequence resolved at ingest when present; otherwise (e.g.
+        after a restart), or if frames were missing at ingest and may have
+        landed since, resolves the pattern via the shared sequence cache.
+        """
+        if task.image_sequence is not None and not task.image_sequence.has_gaps:
+            return task.image_sequence
+        if not is_sequence_pattern(task.source_path):
+            return None
+        try:
+            task.image_sequence = get_image_sequence(task.source_path)
+        except OSError as e:
+            logger.warning(f"[FFmpeg] Cannot read image sequence {task.source_path}: {e}")
+            return None
+        return task.image_sequence
+    
+    def _spawn(
+        self,
+        task: "ClipTask",
+        cmd: List[str],
+        output_paths: List[str],
+    ) -> subprocess.Popen:
+        """
+        Start FFmpeg for a clip within its CPU budget and track it for cancellation.
+        
+        The budget (thread options, core affinity) is leased from the
+        resource manager until _forget_process().
+        """
+        from .resources import get_resource_manager
+        
+        resources = get_resource_manager()
+        budget = resources.acquire(task.id)
+        try:
+            process = subprocess.Popen(
+                budget.apply(cmd, output_paths),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except Exception:
+            resources.release(task.id)
+            raise
+        if budget.threads:
+            pinned = budget.pin(process.pid)
+            logger.info(
+                f"[FFmpeg] Clip {task.id}: {budget.threads} threads"
+                + (f", pinned to CPUs {list(budget.cpus)}" if pinned else "")
+            )
+        self._active_processes[task.id] = process
+        return process
+    
+    def _forget_process(self, task_id: str) -> None:
+        """Stop tracking a clip's FFmpeg process and return its CPU budget."""
+        from .resources import get_resource_manager
+        
+        self._active_processes.pop(task_id, None)
+        get_resource_manager().release(task_id)
+    
     def _truncate_stderr(self, stderr: str) -> str:
         """Truncate stderr to last MAX_STDERR_LINES lines for storage."""
         lines = stderr.strip().split('\n')
@@ -230,6 +321,7 @@ class FFmpegEngine(ExecutionEngine):
         output_path: str,
         resolved_params: ResolvedPresetParams,
         watermark_text: Optional[str] = None,
+        image_sequence: Optional[ImageSequence] = None,
     ) -> List[str]:
         """
         Build FFmpeg command line arguments from ResolvedPresetParams.
@@ -237,6 +329,7 @@ class FFmpegEngine(ExecutionEngine):
         Phase 16.4: This method receives ONLY ResolvedPresetParams.
         Engine NEVER constructs output paths - receives resolved path verbatim.
         Watermark text is applied via drawtext filter if provided.
+        Image sequences are read from their first frame via -start_number.
         """
         ffmpeg_path = self._find_ffmpeg()
         if not ffmpeg_path:
@@ -249,6 +342,9 @@ class FFmpegEngine(ExecutionEngine):
         cmd = [ffmpeg_path, "-y"]  # -y to overwrite output
         
         # Input file
+        if image_sequence is not None:
+            cmd.extend(image_sequence.input_args())
+            source_path = image_sequence.pattern
         cmd.extend(["-i", source_path])
         
         # Video codec
@@ -336,6 +432,8 @@ class FFmpegEngine(ExecutionEngine):
         source_width: Optional[int] = None,
         source_height: Optional[int] = None,
         source_timecode: Optional[str] = None,
+        image_sequence: Optional[ImageSequence] = None,
+        additional_output_paths: Optional[List[str]] = None,
     ) -> tuple[List[str], List[str]]:
         """
         Build FFmpeg command from DeliverSettings via engine_mapping.
@@ -351,6 +449,9 @@ class FFmpegEngine(ExecutionEngine):
             source_width: Source video width for scaling
             source_height: Source video height for scaling
             source_timecode: Source timecode for burn-in
+            image_sequence: Resolved sequence when source_path is a pattern
+            additional_output_paths: Resolved paths of
+                deliver_settings.additional_outputs (same order)
             
         Returns:
             (command_list, warnings_list) - FFmpeg command and any mapping warnings
@@ -383,7 +484,13 @@ class FFmpegEngine(ExecutionEngine):
                 stderr="FFmpeg not found"
             )
         
-        cmd = mapping_result.build_command(ffmpeg_path, source_path, output_path)
+        if image_sequence is not None:
+            mapping_result.pre_input_args.extend(image_sequence.input_args())
+            source_path = image_sequence.pattern
+        
+        cmd = mapping_result.build_command(
+            ffmpeg_path, source_path, output_path, additional_output_paths
+        )
         
         return cmd, warnings
     
@@ -393,6 +500,7 @@ class FFmpegEngine(ExecutionEngine):
         deliver_settings: "DeliverSettings",
         output_path: str,
         on_progress: Optional[Callable[[ProgressInfo], None]] = None,
+        additional_output_paths: Optional[List[str]] = None,
     ) -> ExecutionResult:
         """
         Execute a clip using DeliverSettings (Phase 17).
@@ -400,31 +508,35 @@ class FFmpegEngine(ExecutionEngine):
         This is the preferred method for executing clips with the full
         capability model. Uses engine_mapping for translation.
         
+        Additional outputs (deliver_settings.additional_outputs) are
+        rendered by the same FFmpeg process from a single decode.
+        
+        Outputs may be rendered to local scratch and published atomically
+        afterwards (see filesystem/staging.py); the source is read from the
+        prefetch cache when a local copy exists (filesystem/prefetch.py).
+        
         Args:
             task: ClipTask with source path and metadata
             deliver_settings: Complete DeliverSettings
             output_path: Resolved output path (engine uses verbatim)
             on_progress: Optional progress callback
+            additional_output_paths: Resolved paths of the additional
+                outputs; resolved next to output_path when omitted
             
         Returns:
             ExecutionResult with status, warnings, timing
         """
+        from ..deliver.paths import resolve_additional_output_paths
+        from ..filesystem.prefetch import get_prefetch_cache
+        
         start_time = datetime.now()
         source_path = task.source_path
         
-        # Ensure output directory exists
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        
-        # Build command from DeliverSettings
         try:
-            cmd, warnings = self._build_command_from_deliver_settings(
-                source_path=source_path,
-                output_path=output_path,
-                deliver_settings=deliver_settings,
-                source_width=task.width,
-                source_height=task.height,
-                source_timecode=None,  # TODO: Extract from metadata
-            )
+            if additional_output_paths is None:
+                additional_output_paths = resolve_additional_output_paths(
+                    output_path, deliver_settings
+                )
         except Exception as e:
             return ExecutionResult(
                 status=ExecutionStatus.FAILED,
@@ -435,16 +547,279 @@ class FFmpegEngine(ExecutionEngine):
                 completed_at=datetime.now(),
             )
         
-        # Execute using existing subprocess infrastructure
-        return self._execute_ffmpeg_command(
-            task=task,
-            cmd=cmd,
-            output_path=output_path,
-            start_time=start_time,
-            on_progress=on_progress,
-            warnings=warnings,
+        with get_prefetch_cache().local_source(source_path) as input_path, \
+                self._stage_outputs(
+                    task,
+                    [output_path, *additional_output_paths],
+                    deliver_settings.video.codec,
+                    deliver_settings.video.bitrate,
+                ) as staged:
+            render_path, *render_additional_paths = staged.render_paths
+            
+            # Build command from DeliverSettings
+            try:
+                # Ensure output directories exist
+                for path in staged.render_paths:
+                    Path(path).parent.mkdir(parents=True, exist_ok=True)
+                
+                cmd, warnings = self._build_command_from_deliver_settings(
+                    source_path=input_path,
+                    output_path=render_path,
+                    deliver_settings=deliver_settings,
+                    source_width=task.width,
+                    source_height=task.height,
+                    source_timecode=None,  # TODO: Extract from metadata
+                    image_sequence=self._resolve_image_sequence(task),
+                    additional_output_paths=render_additional_paths,
+                )
+            except Exception as e:
+                return ExecutionResult(
+                    status=ExecutionStatus.FAILED,
+                    source_path=source_path,
+                    output_path=None,
+                    failure_reason=f"Failed to build FFmpeg command: {e}",
+                    started_at=start_time,
+                    completed_at=datetime.now(),
+                )
+            
+            # Long clips encode in checkpointed segments
+            result = None
+            if not render_additional_paths:
+                result = self._run_segmented(
+                    task, cmd, input_path, render_path, start_time, on_progress, warnings
+                )
+            
+            # Execute using existing subprocess infrastructure
+            if result is None:
+                result = self._execute_ffmpeg_command(
+                    task=task,
+                    cmd=cmd,
+                    output_path=render_path,
+                    start_time=start_time,
+                    on_progress=on_progress,
+                    warnings=warnings,
+                    additional_output_paths=render_additional_paths,
+                )
+            if render_additional_paths:
+                result.additional_output_paths = list(render_additional_paths)
+                if result.status == ExecutionStatus.COMPLETED:
+                    # Every output of the shared decode must exist, not just the primary
+                    missing = [path for path in render_additional_paths if not Path(path).is_file()]
+                    if missing:
+                        result.status = ExecutionStatus.FAILED
+                        result.failure_reason = (
+                            f"FFmpeg exited successfully but additional output(s) not found: "
+                            f"{', '.join(missing)}"
+                        )
+            return self._publish_staged(staged, result)
+    
+    def _stage_outputs(
+        self,
+        task: "ClipTask",
+        final_paths: List[str],
+        output_codec: Optional[str] = None,
+        video_bitrate: Optional[str] = None,
+    ):
+        """
+        Scratch staging context for a clip's outputs (see filesystem/staging.py).
+        
+        The reservation is the expected output size (cost_model.estimate_output_bytes)
+        for each output, not the size of the camera original, which can be
+        many times larger than its proxy. Unknown durations reserve the
+        staging default.
+        
+        While output checksums are enabled every clip is staged, so they
+        are computed in the publish pass instead of re-reading the outputs.
+        """
+        from ..filesystem.checksums import get_checksum_policy
+        from ..filesystem.staging import get_scratch_space
+        from .cost_model import estimate_output_bytes
+        
+        output_bytes = estimate_output_bytes(task, output_codec, video_bitrate)
+        return get_scratch_space().stage(
+            task.id,
+            final_paths,
+            output_bytes * len(final_paths) if output_bytes is not None else None,
+            force=bool(get_checksum_policy().algorithms),
         )
     
+    def _publish_staged(self, staged: "StagedOutputs", result: ExecutionResult) -> ExecutionResult:
+        """
+        Publish a staged render to its destination and report final paths.
+        
+        Unsuccessful renders are not published (the scratch copy is
+        discarded), so nothing partial ever reaches the destination.
+        
+        Checksums enabled by the checksum policy are computed in the same
+        pass (see filesystem/checksums.py), stored on the result and, if
+        requested, written to MHL sidecars next to the outputs.
+        """
+        from ..filesystem.checksums import get_checksum_policy, write_mhl
+        
+        policy = get_checksum_policy()
+        algorithms = policy.algorithms
+        if not staged.staged and not algorithms:
+            return result
+        
+        final_for = dict(zip(staged.render_paths, staged.final_paths))
+        if result.output_path in final_for:
+            result.output_path = final_for[result.output_path]
+        if result.additional_output_paths:
+            result.additional_output_paths = [
+                final_for.get(path, path) for path in result.additional_output_paths
+            ]
+        
+        if result.status not in (
+            ExecutionStatus.SUCCESS,
+            ExecutionStatus.SUCCESS_WITH_WARNINGS,
+            ExecutionStatus.COMPLETED,
+        ):
+            return result
+        
+        try:
+            result.checksums = staged.publish(algorithms)
+        except OSError as e:
+            if not staged.staged:
+                # Output is in place; only hashing it failed
+                self._add_warning(result, f"Output checksums not computed: {e}")
+                return result
+            logger.error(f"[FFmpeg] Publishing staged output failed: {e}")
+            result.status = ExecutionStatus.FAILED
+            result.output_path = None
+            result.failure_reason = f"Rendered, but publishing to the destination failed: {e}"
+            result.completed_at = datetime.now()
+            return result
+        
+        if staged.staged:
+            logger.info(f"[FFmpeg] Published staged output(s) to {', '.join(staged.final_paths)}")
+        
+        if result.checksums and policy.write_mhl:
+            for path, checksums in result.checksums.items():
+                try:
+                    write_mhl(path, checksums, started_at=result.started_at)
+                except OSError as e:
+                    self._add_warning(result, f"MHL sidecar not written for {path}: {e}")
+        return result
+    
+    @staticmethod
+    def _add_warning(result: ExecutionResult, warning: str) -> None:
+        logger.warning(f"[FFmpeg] {warning}")
+        result.warnings.append(warning)
+        if result.status in (ExecutionStatus.SUCCESS, ExecutionStatus.COMPLETED):
+            result.status = ExecutionStatus.SUCCESS_WITH_WARNINGS
+    
+    def _run_segmented(
+        self,
+        task: "ClipTask",
+        cmd: List[str],
+        input_path: str,
+        output_path: str,
+        start_time: datetime,
+        on_progress: Optional[Callable[[ProgressInfo], None]] = None,
+        warnings: Optional[List[str]] = None,
+    ) -> Optional[ExecutionResult]:
+        """
+        Encode a long clip in checkpointed segments, then concatenate them.
+        
+        Segments checkpointed by an earlier, interrupted render of the same
+        clip and settings are reused; only the remainder is encoded. On
+        failure or cancellation the completed segments stay checkpointed.
+        See execution/segments.py.
+        
+        Returns:
+            The result, or None if the clip is not segmented (short,
+            several inputs or outputs, timecode-dependent, or the same
+            render is already in progress); the caller then encodes it
+            in one pass.
+        """
+        if not segments.is_segmentable(cmd, input_path, task.duration):
+            return None
+        key = segments.checkpoint_key(task.source_path, cmd, input_path, output_path)
+        store = segments.get_segment_checkpoints()
+        if key is None or not store.acquire(key):
+            return None
+        
+        try:
+            work_dir = store.work_dir(key)
+            work_dir.mkdir(parents=True, exist_ok=True)
+            plan = segments.plan_segments(task.duration, segments.SEGMENT_SECONDS)
+            completed = store.completed(key)
+            if completed:
+                logger.info(
+                    f"[FFmpeg] Resuming clip {task.id}: "
+                    f"{len(completed)}/{len(plan)} segments already encoded"
+                )
+            
+            suffix = Path(output_path).suffix
+            segment_paths = []
+            for segment in plan:
+                segment_path = completed.get(segment.index) or str(
+                    work_dir / f"segment_{segment.index:05d}{suffix}"
+                )
+                segment_paths.append(segment_path)
+                if segment.index in completed:
+                    continue
+                
+                if task.id in self._cancelled_tasks:
+                    self._cancelled_tasks.discard(task.id)
+                    return ExecutionResult(
+                        status=ExecutionStatus.CANCELLED,
+                        source_path=task.source_path,
+                        failure_reason="Cancelled by operator",
+                        started_at=start_time,
+                        completed_at=datetime.now(),
+                        warnings=warnings or [],
+                    )
+                
+                result = self._execute_ffmpeg_command(
+                    task=task,
+                    cmd=segments.segment_command(cmd, input_path, output_path, segment, segment_path),
+                    output_path=segment_path,
+                    start_time=start_time,
+                    on_progress=self._segment_progress(on_progress, segment, task.duration),
+                    warnings=warnings,
+                )
+                if result.status != ExecutionStatus.COMPLETED:
+                    result.output_path = None
+                    return result
+                store.record(key, segment, segment_path)
+            
+            list_path = str(work_dir / segments.CONCAT_LIST_NAME)
+            segments.write_concat_list(list_path, segment_paths)
+            result = self._execute_ffmpeg_command(
+                task=task,
+                cmd=segments.concat_command(cmd[0], list_path, output_path),
+                output_path=output_path,
+                start_time=start_time,
+                warnings=warnings,
+            )
+            if result.status == ExecutionStatus.COMPLETED:
+                store.clear(key)
+            return result
+        finally:
+            store.release(key)
+    
+    @staticmethod
+    def _segment_progress(
+        on_progress: Optional[Callable[[ProgressInfo], None]],
+        segment: segments.Segment,
+        total_duration: float,
+    ) -> Optional[Callable[[ProgressInfo], None]]:
+        """Report a segment's progress as progress through the whole clip."""
+        if on_progress is None:
+            return None
+        
+        def report(info: ProgressInfo) -> None:
+            current_time = segment.start + info.current_time
+            on_progress(replace(
+                info,
+                current_time=current_time,
+                total_duration=total_duration,
+                progress_percent=min(100.0, current_time / total_duration * 100.0),
+            ))
+        
+        return report
+    
     def _execute_ffmpeg_command(
         self,
         task: "ClipTask",
@@ -453,6 +828,7 @@ class FFmpegEngine(ExecutionEngine):
         start_time: datetime,
         on_progress: Optional[Callable[[ProgressInfo], None]] = None,
         warnings: Optional[List[str]] = None,
+        additional_output_paths: Optional[List[str]] = None,
     ) -> ExecutionResult:
         """
         Execute an FFmpeg command and handle output/progress.
@@ -460,11 +836,15 @@ class FFmpegEngine(ExecutionEngine):
         Internal method that handles subprocess execution, progress parsing,
         and result construction. Used by both legacy and DeliverSettings paths.
         
+        additional_output_paths lists the command's other outputs, so the
+        CPU budget's per-output thread options can be placed.
+        
         V1 OBSERVABILITY: Records FFmpeg command and output to job trace.
         """
         from ..observability.trace import get_trace_manager
         
         warnings = warnings or []
+        output_paths = [output_path] + list(additional_output_paths or [])
         trace_mgr = get_trace_manager()
         
         # Log the command for audit
@@ -495,14 +875,7 @@ class FFmpegEngine(ExecutionEngine):
         
         # Execute via subprocess
         try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-            
-            self._active_processes[task.id] = process
+            process = self._spawn(task, cmd, output_paths)
             logger.info(f"[FFmpeg] Started PID {process.pid} for clip {task.id}")
             
             # Read stderr for progress
@@ -538,7 +911,7 @@ class FFmpegEngine(ExecutionEngine):
             exit_code = process.returncode
             stderr = '\n'.join(stderr_lines)
             
-            self._active_processes.pop(task.id, None)
+            self._forget_process(task.id)
             end_time = datetime.now()
             
             logger.info(f"[FFmpeg] PID {process.pid} exited with code {exit_code}")
@@ -599,7 +972,7 @@ class FFmpegEngine(ExecutionEngine):
                 )
                 
         except Exception as e:
-            self._active_processes.pop(task.id, None)
+            self._forget_process(task.id)
             return ExecutionResult(
                 status=ExecutionStatus.FAILED,
                 source_path=task.source_path,
@@ -626,6 +999,10 @@ class FFmpegEngine(ExecutionEngine):
         - output_path must be provided - no fallback to source directory
         - Progress is parsed from FFmpeg stderr in real-time
         - Watermark applied via drawtext filter if text provided
+        - Output may be rendered to local scratch and published atomically
+          afterwards (see filesystem/staging.py)
+        - Source is read from the prefetch cache when a local copy exists
+          (see filesystem/prefetch.py)
         
         Args:
             task: ClipTask with source path and metadata
@@ -637,6 +1014,42 @@ class FFmpegEngine(ExecutionEngine):
         Returns:
             ExecutionResult with status, output path, timing.
         """
+        from ..filesystem.prefetch import get_prefetch_cache
+        
+        if output_path is None:
+            output_path = task.output_path
+        if output_path is None:
+            # Reported as a failed result by the direct path
+            return self._run_clip_direct(task, resolved_params, None, watermark_text, on_progress)
+        
+        with get_prefetch_cache().local_source(task.source_path) as input_path, \
+                self._stage_outputs(
+                    task,
+                    [output_path],
+                    resolved_params.video_codec if resolved_params else None,
+                    resolved_params.video_bitrate if resolved_params else None,
+                ) as staged:
+            result = self._run_clip_direct(
+                task, resolved_params, staged.render_paths[0], watermark_text, on_progress,
+                input_path=input_path,
+            )
+            return self._publish_staged(staged, result)
+    
+    def _run_clip_direct(
+        self,
+        task: "ClipTask",
+        resolved_params: ResolvedPresetParams,
+        output_path: Optional[str] = None,
+        watermark_text: Optional[str] = None,
+        on_progress: Optional[Callable[[ProgressInfo], None]] = None,
+        input_path: Optional[str] = None,
+    ) -> ExecutionResult:
+        """
+        run_clip() without staging: FFmpeg writes output_path itself.
+        
+        FFmpeg reads input_path (a prefetched local copy) when given,
+        task.source_path otherwise; results always report task.source_path.
+        """
         # Type guard: reject CategoryPreset or GlobalPreset if somehow passed
         if not isinstance(resolved_params, ResolvedPresetParams):
             raise EngineValidationError(
@@ -672,10 +1085,11 @@ class FFmpegEngine(ExecutionEngine):
         # Build command
         try:
             cmd = self._build_ffmpeg_command(
-                source_path=source_path_str,
+                source_path=input_path or source_path_str,
                 output_path=output_path,
                 resolved_params=resolved_params,
                 watermark_text=watermark_text,
+                image_sequence=self._resolve_image_sequence(task),
             )
         except Exception as e:
             return ExecutionResult(
@@ -687,6 +1101,13 @@ class FFmpegEngine(ExecutionEngine):
                 completed_at=datetime.now(),
             )
         
+        # Long clips encode in checkpointed segments
+        segmented = self._run_segmented(
+            task, cmd, input_path or source_path_str, output_path, start_time, on_progress
+        )
+        if segmented is not None:
+            return segmented
+        
         # Log the command for audit
         cmd_string = " ".join(cmd)
         logger.info(f"[FFmpeg] Executing: {cmd_string}")
@@ -701,15 +1122,7 @@ class FFmpegEngine(ExecutionEngine):
         
         # Execute via subprocess with non-blocking stderr for progress
         try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-            
-            # Track active process for cancellation
-            self._active_processes[task.id] = process
+            process = self._spawn(task, cmd, [output_path])
             
             logger.info(f"[FFmpeg] Started PID {process.pid} for clip {task.id}")
             
@@ -752,7 +1165,7 @@ class FFmpegEngine(ExecutionEngine):
             stderr = '\n'.join(stderr_lines)
             
             # Remove from active processes
-            self._active_processes.pop(task.id, None)
+            self._forget_process(task.id)
             
             end_time = datetime.now()
             
@@ -811,7 +1224,7 @@ class FFmpegEngine(ExecutionEngine):
             )
             
         except Exception as e:
-            self._active_processes.pop(task.id, None)
+            self._forget_process(task.id)
             logger.exception(f"[FFmpeg] Exception during execution: {e}")
             return ExecutionResult(
                 status=ExecutionStatus.FAILED,
@@ -855,6 +1268,6 @@ class FFmpegEngine(ExecutionEngine):
                     except ProcessLookupError:
                         pass  # Process already dead
                     
-                    self._active_processes.pop(task.id, None)
+                    self._forget_process(task.id)
         
         logger.info(f"[FFmpeg] Job {job.id} cancellation complete")
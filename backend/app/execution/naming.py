@@ -32,9 +32,10 @@ Rules:
 
 import re
 from datetime import datetime
-from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+from ..metadata.sequences import source_stem
+
 if TYPE_CHECKING:
     from ..jobs.models import ClipTask, Job
     from .resolved_params import ResolvedPresetParams
@@ -71,8 +72,7 @@ def resolve_filename(
         >>> resolve_filename("{source_name}_{codec}", clip, job, params)
         "interview_01_prores_422"
     """
-    source_path = Path(clip.source_path)
-    source_name = source_path.stem
+    source_name = source_stem(clip.source_path)
     
     # V1 DOGFOOD FIX: Naming tokens must resolve fully.
     # Add all common tokens including fps, tc, timecode, date, datetime.
@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Optional
 
 from ..metadata.models import MediaMetadata
+from ..metadata.sequences import source_stem
 from ..presets.schemas import CodecPreset
 
 
@@ -100,7 +101,7 @@ def generate_output_path(
     """
     
     # Extract source name without extension
-    source_name = source_path.stem
+    source_name = source_stem(str(source_path))
     source_name_safe = _sanitize_filename(source_name)
     
     # Get codec identifier
@@ -8,6 +8,8 @@ Strategy:
 - Short GOP for responsive scrubbing
 - Cache by source path + mtime hash
 - Non-blocking, runs async with progress
+- Optional progressive mode: fragmented MP4 written to a .partial.mp4 file
+  that the stream endpoint can serve while the encode is still running
 
 ============================================================================
 V1 OBSERVABILITY HARDENING
@@ -34,10 +36,12 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Set
 import threading
 from datetime import datetime
 
+from .resources import get_resource_manager
+
 logger = logging.getLogger(__name__)
 
 # Preview video settings
@@ -64,6 +68,13 @@ PREVIEW_GOP = 15  # Short GOP for responsive scrubbing
 PREVIEW_AUDIO_CODEC = "aac"
 PREVIEW_AUDIO_BITRATE = "128k"
 
+# Progressive previews: fragmented MP4 with an empty moov up front so the
+# browser can start playback from the first fragment. Each keyframe starts
+# a new fragment, so with PREVIEW_GOP the first bytes are playable within
+# a fraction of a second of encode start.
+PREVIEW_PROGRESSIVE_MOVFLAGS = "+frag_keyframe+empty_moov+default_base_moof"
+PARTIAL_PREVIEW_SUFFIX = ".partial.mp4"
+
 # Cache directory
 CACHE_DIR = Path(tempfile.gettempdir()) / "awaire_proxy_previews"
 
@@ -170,6 +181,38 @@ def get_cached_preview_path(source_path: str) -> Optional[Path]:
     return None
 
 
+def get_partial_preview_path(source_path: str) -> Path:
+    """Path of the in-progress (progressive) preview for a source file."""
+    return CACHE_DIR / f"{get_cache_key(source_path)}{PARTIAL_PREVIEW_SUFFIX}"
+
+
+def final_path_for_partial(partial_path: Path) -> Path:
+    """Map a .partial.mp4 preview path to its finished cache path."""
+    return partial_path.with_name(partial_path.name[:-len(PARTIAL_PREVIEW_SUFFIX)] + ".mp4")
+
+
+def is_progressive_preview_active(preview_path: Path) -> bool:
+    """True while a progressive encode is still writing to preview_path."""
+    with _progressive_lock:
+        return str(preview_path) in _progressive_active
+
+
+def get_progressive_preview_path(source_path: str) -> Optional[Path]:
+    """
+    Get the growing preview file for a source, if a progressive encode is
+    running and has written at least its initial fragment header.
+    """
+    partial_path = get_partial_preview_path(source_path)
+    if not is_progressive_preview_active(partial_path):
+        return None
+    try:
+        if partial_path.stat().st_size > 0:
+            return partial_path
+    except OSError:
+        pass
+    return None
+
+
 def find_ffmpeg() -> Optional[str]:
     """Find ffmpeg binary path."""
     ffmpeg_path = shutil.which("ffmpeg")
@@ -231,6 +274,7 @@ def generate_preview_sync(
     width: int = PREVIEW_WIDTH,
     height: int = PREVIEW_HEIGHT,
     progress_callback: Optional[callable] = None,
+    progressive: bool = False,
 ) -> Optional[str]:
     """
     Generate a preview video from a source file synchronously.
@@ -241,6 +285,8 @@ def generate_preview_sync(
         width: Target width
         height: Target height
         progress_callback: Optional callback for progress updates (0-100)
+        progressive: Write fragmented MP4 to a .partial.mp4 file that is
+            playable while encoding, then rename it into the cache on success
         
     Returns:
         Path to generated preview video, or None on failure
@@ -269,6 +315,15 @@ def generate_preview_sync(
         cache_key = get_cache_key(source_path)
         output_path = str(CACHE_DIR / f"{cache_key}.mp4")
     
+    # Progressive mode encodes to a sibling .partial.mp4 and publishes it
+    # under output_path only once the encode has completed
+    encode_path = output_path
+    if progressive:
+        encode_path = str(Path(output_path).with_suffix(PARTIAL_PREVIEW_SUFFIX))
+        with _progressive_lock:
+            _progressive_active.add(encode_path)
+    lease_id = f"preview:{encode_path}"
+    
     try:
         # Get source duration for progress calculation
         video_info = get_video_info(source_path)
@@ -298,20 +353,24 @@ def generate_preview_sync(
             "-g", str(PREVIEW_GOP),  # Keyframe interval
             "-c:a", PREVIEW_AUDIO_CODEC,
             "-b:a", PREVIEW_AUDIO_BITRATE,
-            "-movflags", "+faststart",  # Web playback optimization
+            "-movflags", PREVIEW_PROGRESSIVE_MOVFLAGS if progressive else "+faststart",
             "-y",  # Overwrite
             "-progress", "pipe:1",  # Progress to stdout
-            output_path
+            encode_path
         ]
         
         logger.info(f"Generating preview for: {source_path}")
         
+        # Preview encodes share the CPUs with renders (see resources.py)
+        budget = get_resource_manager().acquire(lease_id)
         process = subprocess.Popen(
-            cmd,
+            budget.apply(cmd, [encode_path]),
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             universal_newlines=True,
         )
+        if budget.threads:
+            budget.pin(process.pid)
         
         # Monitor progress
         current_time = 0.0
@@ -328,6 +387,9 @@ def generate_preview_sync(
         
         process.wait()
         
+        if progressive and process.returncode == 0 and Path(encode_path).exists():
+            os.replace(encode_path, output_path)
+        
         if process.returncode == 0 and Path(output_path).exists():
             logger.info(f"Generated preview: {output_path}")
             if progress_callback:
@@ -341,17 +403,37 @@ def generate_preview_sync(
     except Exception as e:
         logger.error(f"Preview generation error: {e}")
         return None
+    finally:
+        get_resource_manager().release(lease_id)
+        if progressive:
+            with _progressive_lock:
+                _progressive_active.discard(encode_path)
+            # A failed progressive encode must not leave a playable partial
+            if Path(encode_path).exists():
+                try:
+                    Path(encode_path).unlink()
+                except OSError:
+                    pass
 
 
 # Track in-progress generations
 _generation_locks: Dict[str, threading.Lock] = {}
 _generation_results: Dict[str, Optional[str]] = {}
 
+# Partial preview paths currently being written by progressive encodes
+_progressive_active: Set[str] = set()
+_progressive_lock = threading.Lock()
+
 
-def get_or_generate_preview(source_path: str) -> Tuple[Optional[str], bool]:
+def get_or_generate_preview(source_path: str, progressive: bool = False) -> Tuple[Optional[str], bool]:
     """
     Get cached preview or start generation.
     
+    Args:
+        source_path: Path to source video file
+        progressive: Generate a fragmented MP4 that can be streamed while
+            the encode is still running (see get_progressive_preview_path)
+    
     Returns:
         Tuple of (preview_path or None, is_ready boolean)
         If is_ready is False, generation is in progress
@@ -377,7 +459,7 @@ def get_or_generate_preview(source_path: str) -> Tuple[Optional[str], bool]:
     
     def generate():
         with _generation_locks[cache_key]:
-            result = generate_preview_sync(source_path)
+            result = generate_preview_sync(source_path, progressive=progressive)
             _generation_results[cache_key] = result
             del _generation_locks[cache_key]
     
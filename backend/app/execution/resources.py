@@ -0,0 +1,270 @@
+"""
+CPU budget for concurrent FFmpeg processes.
+
+FFmpeg sizes its decoder, encoder and filter thread pools to the whole
+machine. One render at a time that is what we want, but N concurrent
+renders each spawning a full set of threads oversubscribe the cores and
+thrash caches. The resource manager splits the CPUs the process may use
+into one share per concurrent FFmpeg process:
+
+- Thread budget: -threads (decoder and encoder) and -filter_threads
+  sized to the share
+- Affinity: optionally pin the FFmpeg process to the share's cores
+  (os.sched_setaffinity, Linux). Shares are cut from CPUs ordered by
+  NUMA node, so a share stays on one node whenever the split allows.
+
+The number of shares is the number of leases held, counting the one
+being acquired, and at least the configured slot count
+(Scheduler.max_concurrent). Renders are not the only FFmpeg processes:
+watch folder auto-execute runs jobs outside the scheduler, and preview
+encodes lease a share too. A process running alone gets the "automatic"
+budget: its command is left as is and FFmpeg chooses its own thread
+counts. Budgets are fixed at spawn time, so a clip that started alone
+keeps its automatic threads when others start next to it.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# os.sched_setaffinity is Linux-only
+AFFINITY_SUPPORTED = hasattr(os, "sched_setaffinity")
+
+NUMA_NODE_ROOT = Path("/sys/devices/system/node")
+
+
+@dataclass(frozen=True)
+class ThreadBudget:
+    """Threads and cores one running clip may use."""
+    threads: int = 0  # 0 = FFmpeg automatic
+    filter_threads: int = 0  # 0 = FFmpeg automatic
+    cpus: Optional[Tuple[int, ...]] = None  # Affinity set (None = unpinned)
+
+    def apply(self, cmd: List[str], output_paths: Sequence[str]) -> List[str]:
+        """
+        Add the thread options to a built FFmpeg command.
+
+        -filter_threads is global, -threads is given before the input
+        (decoder) and before each output path (encoders of that output).
+
+        Args:
+            cmd: Complete command, ffmpeg binary first
+            output_paths: Output paths as they appear in cmd
+
+        Returns:
+            New command (cmd itself if the budget is automatic)
+        """
+        if not self.threads:
+            return cmd
+        threads = ["-threads", str(self.threads)]
+        args = list(cmd)
+        # Back to front so earlier indexes stay valid
+        positions = sorted(
+            (len(args) - 1 - args[::-1].index(path) for path in output_paths if path in args),
+            reverse=True,
+        )
+        for index in positions:
+            args[index:index] = threads
+        if "-i" in args:
+            index = args.index("-i")
+            args[index:index] = threads
+        args[1:1] = ["-filter_threads", str(self.filter_threads or self.threads)]
+        return args
+
+    def pin(self, pid: int) -> bool:
+        """
+        Restrict a started process to the budget's cores.
+
+        Threads FFmpeg creates afterwards inherit the affinity. Failure
+        (unsupported platform, process already gone) is logged, not raised:
+        pinning is an optimization.
+
+        Returns:
+            True if the affinity was set
+        """
+        if not self.cpus or not AFFINITY_SUPPORTED:
+            return False
+        try:
+            os.sched_setaffinity(pid, self.cpus)
+        except OSError as e:
+            logger.debug(f"[Resources] Could not pin PID {pid}: {e}")
+            return False
+        return True
+
+
+def parse_cpulist(text: str) -> Tuple[int, ...]:
+    """Parse a kernel cpulist such as "0-3,8,10-11"."""
+    cpus: List[int] = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-", 1)
+            cpus.extend(range(int(first), int(last) + 1))
+        else:
+            cpus.append(int(part))
+    return tuple(cpus)
+
+
+def available_cpus() -> Tuple[int, ...]:
+    """CPUs this process may run on (respects an inherited affinity mask)."""
+    if hasattr(os, "sched_getaffinity"):
+        return tuple(sorted(os.sched_getaffinity(0)))
+    return tuple(range(os.cpu_count() or 1))
+
+
+def numa_nodes(root: Path = NUMA_NODE_ROOT) -> Dict[int, Tuple[int, ...]]:
+    """
+    CPUs per NUMA node from sysfs.
+
+    Returns:
+        node -> CPUs, or {} where the topology is not exposed
+    """
+    nodes: Dict[int, Tuple[int, ...]] = {}
+    try:
+        for node_dir in root.glob("node[0-9]*"):
+            nodes[int(node_dir.name[4:])] = parse_cpulist((node_dir / "cpulist").read_text())
+    except (OSError, ValueError):
+        return {}
+    return nodes
+
+
+def partition_cpus(
+    cpus: Sequence[int],
+    slots: int,
+    nodes: Optional[Dict[int, Tuple[int, ...]]] = None,
+) -> List[Tuple[int, ...]]:
+    """
+    Split CPUs into one contiguous share per slot.
+
+    CPUs are ordered by NUMA node first, so with a slot count that divides
+    the node size evenly no share spans two nodes. With more slots than
+    CPUs, shares are single CPUs reused round-robin.
+    """
+    node_of = {cpu: node for node, members in (nodes or {}).items() for cpu in members}
+    ordered = sorted(cpus, key=lambda cpu: (node_of.get(cpu, 0), cpu))
+    if not ordered:
+        return [()] * slots
+    if slots >= len(ordered):
+        return [(ordered[index % len(ordered)],) for index in range(slots)]
+    shares = []
+    size, extra = divmod(len(ordered), slots)
+    start = 0
+    for index in range(slots):
+        end = start + size + (1 if index < extra else 0)
+        shares.append(tuple(ordered[start:end]))
+        start = end
+    return shares
+
+
+class ResourceManager:
+    """
+    Hands each running clip the thread budget of a free share of the CPUs.
+
+    Thread-safe. Clips are never refused (admission is the scheduler's
+    job): when more clips run than there are slots, the CPUs are split
+    into one share per lease held.
+    """
+
+    def __init__(
+        self,
+        slots: int = 1,
+        cpus: Optional[Sequence[int]] = None,
+        pin: Optional[bool] = None,
+        nodes: Optional[Dict[int, Tuple[int, ...]]] = None,
+    ):
+        """
+        Args:
+            slots: Concurrent renders to budget for at least (Scheduler.max_concurrent)
+            cpus: CPUs to divide (default: available_cpus())
+            pin: Set CPU affinity per budgeted clip (default: where supported)
+            nodes: NUMA topology (default: numa_nodes())
+        """
+        self.slots = max(1, slots)
+        self.cpus = tuple(cpus) if cpus is not None else available_cpus()
+        self.pin = AFFINITY_SUPPORTED if pin is None else pin
+        self._nodes = numa_nodes() if nodes is None else nodes
+        # Share count -> shares, cut on first use
+        self._shares: Dict[int, List[Tuple[int, ...]]] = {}
+        self._leases: Dict[str, int] = {}
+        self._budgets: Dict[str, ThreadBudget] = {}
+        self._lock = threading.Lock()
+
+    def _shares_for(self, count: int) -> List[Tuple[int, ...]]:
+        shares = self._shares.get(count)
+        if shares is None:
+            shares = self._shares[count] = partition_cpus(self.cpus, count, self._nodes)
+        return shares
+
+    def budget(self, slot: int, slots: Optional[int] = None) -> ThreadBudget:
+        """Budget of one slot when the CPUs are split slots ways (default: self.slots)."""
+        slots = max(self.slots, slots or 0)
+        if slots == 1:
+            return ThreadBudget()
+        share = self._shares_for(slots)[slot % slots]
+        threads = max(1, len(share))
+        return ThreadBudget(
+            threads=threads,
+            filter_threads=threads,
+            cpus=share if self.pin else None,
+        )
+
+    def acquire(self, clip_id: str) -> ThreadBudget:
+        """
+        Lease a budget for a clip (idempotent per clip_id while held).
+
+        The CPUs are split into one share per lease held, this one
+        included, and at least self.slots; the clip gets the lowest
+        share no other lease holds.
+        """
+        with self._lock:
+            if clip_id in self._leases:
+                return self._budgets[clip_id]
+            taken = set(self._leases.values())
+            slot = next(index for index in range(len(taken) + 1) if index not in taken)
+            self._leases[clip_id] = slot
+            budget = self._budgets[clip_id] = self.budget(slot, len(self._leases))
+        logger.debug(
+            f"[Resources] Clip {clip_id}: slot {slot}, threads={budget.threads or 'auto'}, "
+            f"cpus={list(budget.cpus) if budget.cpus else 'any'}"
+        )
+        return budget
+
+    def release(self, clip_id: str) -> None:
+        """Return a clip's slot (no-op if it holds none)."""
+        with self._lock:
+            self._leases.pop(clip_id, None)
+            self._budgets.pop(clip_id, None)
+
+    def snapshot(self) -> Dict:
+        """Slot shares and current leases for diagnostics."""
+        with self._lock:
+            count = max(self.slots, len(self._leases))
+            return {
+                "slots": self.slots,
+                "pin": self.pin,
+                "shares": [list(share) for share in self._shares_for(count)],
+                "leases": dict(self._leases),
+            }
+
+
+_resource_manager: Optional[ResourceManager] = None
+
+
+def get_resource_manager() -> ResourceManager:
+    """
+    Get the default resource manager.
+
+    Created on first access with at least one slot per scheduler
+    execution slot.
+    """
+    global _resource_manager
+    if _resource_manager is None:
+        from .scheduler import get_scheduler
+        _resource_manager = ResourceManager(slots=get_scheduler().max_concurrent)
+    return _resource_manager
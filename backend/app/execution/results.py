@@ -6,7 +6,7 @@ Results are machine-readable and human-readable.
 """
 
 from enum import Enum
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -54,6 +54,9 @@ class ExecutionResult(BaseModel):
     output_path: Optional[str] = None
     """Output file path (if render succeeded)."""
     
+    additional_output_paths: List[str] = Field(default_factory=list)
+    """Paths of DeliverSettings.additional_outputs rendered in the same pass."""
+    
     started_at: datetime = Field(default_factory=datetime.now)
     """When execution started."""
     
@@ -66,6 +69,9 @@ class ExecutionResult(BaseModel):
     failure_reason: Optional[str] = None
     """Human-readable failure reason (required if status is FAILED)."""
     
+    checksums: Dict[str, Dict[str, str]] = Field(default_factory=dict)
+    """Checksums per output path (algorithm → hex digest), computed while publishing."""
+    
     def duration_seconds(self) -> Optional[float]:
         """Calculate execution duration in seconds."""
         if self.completed_at is None:
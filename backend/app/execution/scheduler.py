@@ -1,23 +1,46 @@
 """
-Minimal FIFO scheduler for execution.
+Minimal scheduler for execution.
 
 Phase 16: Single-node, max 1 concurrent clip, FIFO order.
 INC-002 Fix: Added job-level FIFO queue to ensure strict execution order.
 
+Queue order comes from a pluggable SchedulingPolicy (scheduling.py):
+FIFO by default, or shortest-expected-job-first, fair share per watch
+folder, or core-aware bin packing, using estimates from the encode cost
+model (cost_model.py). The order is always deterministic and visible.
+
+Priority lanes (JobPriority) come before the policy: urgent dailies start
+ahead of a bulk archive re-transcode. Waiting jobs are promoted one lane
+per AGING_SECONDS so low priority work is never starved. With preemption
+enabled, a running job yields the slot at its next clip boundary when a
+job of a more urgent lane is waiting to run (wait_for_turn), and resumes
+when its turn comes again.
+
 Design rules:
-- No prioritization
 - No parallel execution
 - Sequential job processing (single job at a time)
 - Sequential clip processing within jobs
 - Respects job pause state
 """
 
+import dataclasses
+import heapq
+import itertools
 import logging
 import threading
-from typing import Optional, List, TYPE_CHECKING
-from collections import deque
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, List, Tuple, TYPE_CHECKING
 from datetime import datetime
 
+from .scheduling import (
+    PRIORITY_LANES,
+    QueuedJob,
+    SchedulingPolicy,
+    FifoPolicy,
+    priority_lane,
+)
+
 if TYPE_CHECKING:
     from ..jobs.models import Job, ClipTask
     from ..presets.registry import PresetRegistry
@@ -26,6 +49,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Seconds a waiting job spends in a lane before it is promoted to the next
+AGING_SECONDS = 600.0
+
+# Upper bound on a wait_for_turn() sleep between checks
+TURN_POLL_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class QueueEstimate:
+    """Expected start and duration of a queued (or the current) job."""
+    job_id: str
+    position: int  # 0 = executing
+    estimated_seconds: float  # Remaining render time of this job
+    eta_seconds: float  # Seconds until this job is expected to finish
+    priority: str = "normal"  # Current lane (after aging)
+
 
 class Scheduler:
     """
@@ -34,8 +73,9 @@ class Scheduler:
     Phase 16 constraints:
     - Single-node only
     - Max concurrent clips = 1
-    - FIFO order (first in, first out)
-    - No prioritization
+    - Queue order: priority lanes (with aging), then the scheduling
+      policy (FIFO by default)
+    - Optional preemption at clip boundaries
     
     INC-002 Fix: Added job-level FIFO queue.
     - Jobs are queued in strict order when started
@@ -44,27 +84,58 @@ class Scheduler:
     
     Future phases will add:
     - Parallel execution (Phase 17+)
-    - Priority queuing
     - Multi-node distribution
     """
     
-    def __init__(self, max_concurrent: int = 1):
+    def __init__(
+        self,
+        max_concurrent: int = 1,
+        policy: Optional[SchedulingPolicy] = None,
+        aging_seconds: float = AGING_SECONDS,
+        preemption: bool = False,
+    ):
         """
         Initialize scheduler.
         
         Args:
             max_concurrent: Maximum concurrent clips (always 1 in Phase 16)
+            policy: Queue ordering within a priority lane (default: FIFO)
+            aging_seconds: Wait before a job is promoted one lane (0 = no aging)
+            preemption: Let more urgent jobs take the slot at clip boundaries
         """
         self.max_concurrent = max_concurrent
         self._running_count = 0
         self._lock = threading.Lock()
+        # Signalled when the slot is freed or the queue changes
+        self._cond = threading.Condition(self._lock)
         self._paused = False
+        self._policy = policy or FifoPolicy()
+        self.aging_seconds = aging_seconds
+        self._preemption = preemption
         
-        # INC-002: Job-level FIFO queue
-        # Stores job_id in order of submission
-        self._job_queue: deque[str] = deque()
+        # INC-002: Job-level queue
+        # job_id -> QueuedJob, plus the policy's order (recomputed on change)
+        self._queued: Dict[str, QueuedJob] = {}
+        self._order: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._sequence = itertools.count()
+        # job_id -> current lane (after aging), and the aging heap of
+        # (promotion due, token, job_id); entries whose token is no longer
+        # the job's current one are stale and skipped
+        self._lanes: Dict[str, int] = {}
+        self._aging: List[Tuple[float, int, str]] = []
+        self._aging_token: Dict[str, int] = {}
+        self._aging_tokens = itertools.count()
         # Currently executing job (only one at a time)
         self._current_job_id: Optional[str] = None
+        self._current: Optional[QueuedJob] = None
+        self._current_started = 0.0
+        # job_id -> threads blocked in wait_for_turn() for it. Only these
+        # jobs can actually take a freed slot; the others are started later
+        # by another start request.
+        self._waiters: Dict[str, int] = {}
+        # Estimated render seconds started per group (fair share)
+        self._group_service: Dict[Optional[str], float] = {}
     
     @property
     def is_busy(self) -> bool:
@@ -86,8 +157,9 @@ class Scheduler:
     
     def resume(self) -> None:
         """Resume the scheduler."""
-        with self._lock:
+        with self._cond:
             self._paused = False
+            self._cond.notify_all()
         logger.info("[Scheduler] Resumed")
     
     @property
@@ -119,25 +191,114 @@ class Scheduler:
             logger.debug(f"[Scheduler] Clip completed, running: {self._running_count}")
     
     # =========================================================================
-    # INC-002: Job-level FIFO queue methods
+    # INC-002: Job-level queue methods
     # =========================================================================
     
-    def enqueue_job(self, job_id: str) -> int:
+    @property
+    def policy(self) -> SchedulingPolicy:
+        with self._lock:
+            return self._policy
+    
+    def set_policy(self, policy: SchedulingPolicy) -> None:
+        """Switch the queue ordering policy (re-orders waiting jobs)."""
+        with self._lock:
+            self._policy = policy
+            self._reorder()
+        logger.info(f"[Scheduler] Scheduling policy set to '{policy.name}'")
+    
+    @property
+    def preemption_enabled(self) -> bool:
+        with self._lock:
+            return self._preemption
+    
+    def set_preemption(self, enabled: bool) -> None:
+        """Allow (or stop) more urgent jobs taking the slot at clip boundaries."""
+        with self._lock:
+            self._preemption = enabled
+        logger.info(f"[Scheduler] Preemption {'enabled' if enabled else 'disabled'}")
+    
+    def _reorder(self) -> None:
+        """
+        Recompute the queue order (caller holds the lock).
+        
+        Lanes first (most urgent first), then the policy's order within a lane.
+        """
+        ordered = self._policy.order(list(self._queued.values()), dict(self._group_service))
+        ranks = {job.job_id: rank for rank, job in enumerate(ordered)}
+        self._order = sorted(ranks, key=lambda job_id: (self._lanes[job_id], ranks[job_id]))
+        self._positions = {job_id: index + 1 for index, job_id in enumerate(self._order)}
+    
+    def _admit(self, job: QueuedJob) -> None:
+        """Put a job in its lane and schedule its aging (caller holds the lock)."""
+        self._queued[job.job_id] = job
+        self._lanes[job.job_id] = job.priority
+        token = next(self._aging_tokens)
+        self._aging_token[job.job_id] = token
+        if self.aging_seconds > 0 and job.priority > 0:
+            heapq.heappush(self._aging, (time.monotonic() + self.aging_seconds, token, job.job_id))
+    
+    def _discard(self, job_id: str) -> Optional[QueuedJob]:
+        """Take a job out of the queue (caller holds the lock; no reorder)."""
+        self._lanes.pop(job_id, None)
+        self._aging_token.pop(job_id, None)  # Its heap entries become stale
+        return self._queued.pop(job_id, None)
+    
+    def _promote_aged(self) -> None:
+        """
+        Promote waiting jobs whose aging interval elapsed (caller holds the lock).
+        
+        Each queued job below the top lane has one entry in the aging heap,
+        due when it is next promoted, so this only pops due entries
+        (O(log n) each) instead of scanning the queue.
+        """
+        now = time.monotonic()
+        promoted = False
+        while self._aging and self._aging[0][0] <= now:
+            due, token, job_id = heapq.heappop(self._aging)
+            if self._aging_token.get(job_id) != token:
+                continue  # Job left the queue or was re-admitted
+            lane = self._lanes[job_id] - 1
+            self._lanes[job_id] = lane
+            promoted = True
+            if lane > 0:
+                heapq.heappush(self._aging, (due + self.aging_seconds, token, job_id))
+        if promoted:
+            self._reorder()
+    
+    def enqueue_job(
+        self,
+        job_id: str,
+        estimated_seconds: float = 0.0,
+        group: Optional[str] = None,
+        cores: int = 1,
+        priority: str = "normal",
+    ) -> int:
         """
-        Add a job to the FIFO queue.
+        Add a job to the queue.
         
-        INC-002: Jobs execute in strict order of enqueue.
+        INC-002: Jobs execute in the order given by the priority lanes and
+        the scheduling policy (strict enqueue order for equal priority under
+        the default FIFO policy).
         
         Args:
             job_id: The job identifier
+            estimated_seconds: Expected render time (EncodeCostModel.estimate_job_seconds)
+            group: Watch folder ID the job came from (None for manual starts)
+            cores: Cores the job keeps busy (EncodeCostModel.job_cores)
+            priority: JobPriority value ("urgent", "high", "normal", "low")
             
         Returns:
             Position in queue (1-indexed, 1 = will execute next)
+            
+        Raises:
+            ValueError: If the priority is unknown
         """
-        with self._lock:
+        lane = priority_lane(priority)
+        with self._cond:
+            self._promote_aged()
             # Don't enqueue if already in queue or currently executing
-            if job_id in self._job_queue:
-                position = list(self._job_queue).index(job_id) + 1
+            if job_id in self._positions:
+                position = self._positions[job_id]
                 logger.debug(f"[Scheduler] Job {job_id} already in queue at position {position}")
                 return position
             
@@ -145,40 +306,117 @@ class Scheduler:
                 logger.debug(f"[Scheduler] Job {job_id} is currently executing")
                 return 0  # 0 means currently executing
             
-            self._job_queue.append(job_id)
-            position = len(self._job_queue)
-            logger.info(f"[Scheduler] Job {job_id} enqueued at position {position}")
+            self._admit(QueuedJob(
+                job_id=job_id,
+                sequence=next(self._sequence),
+                enqueued_at=datetime.now(),
+                estimated_seconds=estimated_seconds,
+                group=group,
+                cores=cores,
+                priority=lane,
+            ))
+            self._reorder()
+            self._cond.notify_all()
+            position = self._positions[job_id]
+            logger.info(
+                f"[Scheduler] Job {job_id} enqueued at position {position} "
+                f"(priority={PRIORITY_LANES[lane]}, policy={self._policy.name}, "
+                f"estimate={estimated_seconds:.0f}s)"
+            )
             return position
     
+    def set_job_priority(self, job_id: str, priority: str) -> bool:
+        """
+        Move a queued job to another priority lane (restarts its aging).
+        
+        Returns:
+            True if the job was queued and moved
+            
+        Raises:
+            ValueError: If the priority is unknown
+        """
+        lane = priority_lane(priority)
+        with self._cond:
+            job = self._discard(job_id)
+            if job is None:
+                return False
+            self._admit(dataclasses.replace(job, priority=lane))
+            self._reorder()
+            self._cond.notify_all()
+            return True
+    
     def get_queue_position(self, job_id: str) -> int:
         """
         Get the current queue position for a job.
         
+        Positions are kept in a dict and only recomputed when the queue
+        changes (enqueue, dequeue, policy change or an aging promotion).
+        
         Returns:
             Position (1-indexed), 0 if currently executing, -1 if not in queue
         """
         with self._lock:
             if self._current_job_id == job_id:
                 return 0
-            try:
-                return list(self._job_queue).index(job_id) + 1
-            except ValueError:
-                return -1
+            self._promote_aged()
+            return self._positions.get(job_id, -1)
     
     def get_queued_job_ids(self) -> List[str]:
         """
-        Get list of all queued job IDs in FIFO order.
+        Get list of all queued job IDs in execution order.
         
         INC-002: This allows UI to show provable queue order.
         """
         with self._lock:
-            return list(self._job_queue)
+            self._promote_aged()
+            return list(self._order)
     
     def get_current_job_id(self) -> Optional[str]:
         """Get the currently executing job ID."""
         with self._lock:
             return self._current_job_id
     
+    def get_queue_estimates(self) -> List[QueueEstimate]:
+        """
+        Expected duration and completion time of the current and queued jobs.
+        
+        The current job's remaining time is its estimate minus the time it
+        has been executing; each queued job finishes after everything
+        ahead of it.
+        """
+        with self._lock:
+            self._promote_aged()
+            estimates: List[QueueEstimate] = []
+            elapsed = 0.0
+            if self._current is not None:
+                remaining = self._current_remaining()
+                elapsed = remaining
+                estimates.append(QueueEstimate(
+                    job_id=self._current.job_id,
+                    position=0,
+                    estimated_seconds=remaining,
+                    eta_seconds=remaining,
+                    priority=PRIORITY_LANES[self._current.priority],
+                ))
+            for position, job_id in enumerate(self._order, start=1):
+                job = self._queued[job_id]
+                elapsed += job.estimated_seconds
+                estimates.append(QueueEstimate(
+                    job_id=job_id,
+                    position=position,
+                    estimated_seconds=job.estimated_seconds,
+                    eta_seconds=elapsed,
+                    priority=PRIORITY_LANES[self._lanes[job_id]],
+                ))
+            return estimates
+    
+    def _current_remaining(self) -> float:
+        """Estimated seconds left for the executing job (caller holds the lock)."""
+        return max(
+            0.0,
+            self._current.estimated_seconds - (time.monotonic() - self._current_started),
+        )
+    
     def is_job_turn(self, job_id: str) -> bool:
         """
         Check if it's this job's turn to execute.
@@ -201,18 +439,15 @@ class Scheduler:
             if self._current_job_id is not None:
                 return False
             
-            # Queue is empty
-            if not self._job_queue:
-                return False
-            
-            # Check if at front of queue
-            return self._job_queue[0] == job_id
+            self._promote_aged()
+            # Check if at front of queue (False if the queue is empty)
+            return bool(self._order) and self._order[0] == job_id
     
     def acquire_execution(self, job_id: str) -> bool:
         """
         Attempt to acquire execution slot for a job.
         
-        INC-002: Only succeeds if it's this job's turn (FIFO enforced).
+        INC-002: Only succeeds if it's this job's turn (queue order enforced).
         
         Args:
             job_id: The job requesting execution
@@ -221,29 +456,168 @@ class Scheduler:
             True if job can now execute, False if it must wait
         """
         with self._lock:
-            # Already executing this job
-            if self._current_job_id == job_id:
-                return True
+            return self._acquire(job_id)
+    
+    def _acquire(self, job_id: str, waiting: bool = False) -> bool:
+        """
+        acquire_execution() body (caller holds the lock).
+        
+        With waiting=True (wait_for_turn), queued jobs nobody is waiting
+        to run are passed over: they cannot use the slot, and holding it
+        free for them would stall the waiting job indefinitely.
+        """
+        # Already executing this job
+        if self._current_job_id == job_id:
+            return True
+        
+        # Another job is executing
+        if self._current_job_id is not None:
+            logger.debug(f"[Scheduler] Job {job_id} blocked - {self._current_job_id} executing")
+            return False
+        
+        # Scheduler is paused
+        if self._paused:
+            logger.debug(f"[Scheduler] Job {job_id} blocked - scheduler paused")
+            return False
+        
+        # Queue is empty or job not in queue
+        self._promote_aged()
+        order = self._order
+        if waiting:
+            order = [queued_id for queued_id in order if queued_id in self._waiters]
+        if not order or order[0] != job_id:
+            logger.debug(f"[Scheduler] Job {job_id} blocked - not at front of queue")
+            return False
+        
+        # This job is at front - acquire execution slot
+        job = self._discard(job_id)
+        self._current_job_id = job_id
+        self._current = job
+        self._current_started = time.monotonic()
+        self._group_service[job.group] = (
+            self._group_service.get(job.group, 0.0) + job.estimated_seconds
+        )
+        self._reorder()
+        logger.info(f"[Scheduler] Job {job_id} acquired execution slot")
+        return True
+    
+    def wait_for_turn(
+        self,
+        job_id: str,
+        timeout: Optional[float] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> bool:
+        """
+        Block until the job acquires the execution slot.
+        
+        While waiting, the job counts as ready to run: a running job of a
+        less urgent lane yields to it (should_yield), and it takes the slot
+        ahead of queued jobs that nobody is waiting for.
+        
+        Args:
+            job_id: A queued (or executing) job
+            timeout: Maximum seconds to wait (None = until acquired or dequeued)
+            cancelled: Checked at least every TURN_POLL_SECONDS; the wait
+                ends when it returns True
             
-            # Another job is executing
-            if self._current_job_id is not None:
-                logger.debug(f"[Scheduler] Job {job_id} blocked - {self._current_job_id} executing")
-                return False
+        Returns:
+            True once the job holds the slot, False if it left the queue,
+            the timeout expired or the wait was cancelled
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._waiters[job_id] = self._waiters.get(job_id, 0) + 1
+            try:
+                while not self._acquire(job_id, waiting=True):
+                    if job_id not in self._queued:
+                        return False
+                    if cancelled is not None and cancelled():
+                        return False
+                    wait = TURN_POLL_SECONDS
+                    if deadline is not None:
+                        wait = min(wait, deadline - time.monotonic())
+                        if wait <= 0:
+                            return False
+                    # Polls too: aging and resume() change turns without a notify
+                    self._cond.wait(wait)
+                return True
+            finally:
+                self._waiters[job_id] -= 1
+                if not self._waiters[job_id]:
+                    del self._waiters[job_id]
+                    # Waiters behind this job may now be at the front
+                    self._cond.notify_all()
+    
+    # -------------------------------------------------------------------------
+    # Preemption
+    # -------------------------------------------------------------------------
+    
+    def will_preempt_for(self, job_id: str) -> bool:
+        """
+        Check if the executing job will yield the slot to this queued job.
+        
+        True when preemption is enabled and the job's own priority lane is
+        more urgent than the executing job's. (Aging never preempts.)
+        """
+        with self._lock:
+            job = self._queued.get(job_id)
+            return (
+                self._preemption
+                and job is not None
+                and self._current is not None
+                and job.priority < self._current.priority
+            )
+    
+    def should_yield(self, job_id: str) -> bool:
+        """
+        Check, at a clip boundary, if the executing job should yield.
+        
+        Args:
+            job_id: The executing job
             
-            # Scheduler is paused
-            if self._paused:
-                logger.debug(f"[Scheduler] Job {job_id} blocked - scheduler paused")
+        Returns:
+            True if preemption is enabled and a job of a more urgent
+            priority lane is waiting to run (blocked in wait_for_turn).
+            Queued jobs without a waiter never preempt: nothing would take
+            the slot the executing job gives up.
+        """
+        with self._lock:
+            if not self._preemption or self._current_job_id != job_id:
                 return False
-            
-            # Queue is empty or job not in queue
-            if not self._job_queue or self._job_queue[0] != job_id:
-                logger.debug(f"[Scheduler] Job {job_id} blocked - not at front of queue")
+            return any(
+                self._queued[waiting_id].priority < self._current.priority
+                for waiting_id in self._waiters
+                if waiting_id in self._queued
+            )
+    
+    def yield_execution(self, job_id: str) -> bool:
+        """
+        Preempt the executing job: requeue it and free the slot.
+        
+        The job keeps its submission sequence (so it stays ahead of later
+        jobs in its lane) and its remaining estimate. The caller must only
+        yield between clips, then wait_for_turn() before continuing.
+        
+        Returns:
+            True if the job was executing and has been requeued
+        """
+        with self._cond:
+            if self._current_job_id != job_id:
                 return False
-            
-            # This job is at front - acquire execution slot
-            self._job_queue.popleft()
-            self._current_job_id = job_id
-            logger.info(f"[Scheduler] Job {job_id} acquired execution slot")
+            job = self._current
+            remaining = self._current_remaining()
+            # Only the part that actually ran counts as service
+            self._group_service[job.group] = max(
+                0.0, self._group_service.get(job.group, 0.0) - remaining
+            )
+            self._current_job_id = None
+            self._current = None
+            self._admit(dataclasses.replace(job, estimated_seconds=remaining))
+            self._reorder()
+            self._cond.notify_all()
+            logger.info(
+                f"[Scheduler] Job {job_id} preempted, requeued at position {self._positions[job_id]}"
+            )
             return True
     
     def release_execution(self, job_id: str) -> None:
@@ -253,9 +627,11 @@ class Scheduler:
         Args:
             job_id: The job releasing execution
         """
-        with self._lock:
+        with self._cond:
             if self._current_job_id == job_id:
                 self._current_job_id = None
+                self._current = None
+                self._cond.notify_all()
                 logger.info(f"[Scheduler] Job {job_id} released execution slot")
             else:
                 logger.warning(f"[Scheduler] Job {job_id} tried to release but wasn't executing")
@@ -270,9 +646,10 @@ class Scheduler:
         Returns:
             True if job was in queue and removed
         """
-        with self._lock:
-            if job_id in self._job_queue:
-                self._job_queue.remove(job_id)
+        with self._cond:
+            if self._discard(job_id) is not None:
+                self._reorder()
+                self._cond.notify_all()
                 logger.info(f"[Scheduler] Job {job_id} removed from queue")
                 return True
             return False
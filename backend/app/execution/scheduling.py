@@ -0,0 +1,176 @@
+"""
+Scheduling policies for the job queue.
+
+A policy orders the queued jobs within a priority lane; the scheduler
+puts more urgent lanes first and executes the first job whenever the
+execution slot is free. Policies only see QueuedJob records
+(cost estimates come from cost_model.py) and are pure functions of them,
+so the resulting order is deterministic and can be shown to the operator.
+
+Policies:
+- fifo:        Submission order (INC-002 behaviour, the default)
+- sjf:         Shortest expected job first; ties in submission order
+- fair_share:  Interleave watch folders (and manual starts) so that the
+               one that received the least render time goes next
+- bin_packing: Core-aware: group jobs into waves whose core demand fits
+               the machine (first-fit decreasing), shortest wave first
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Priority lanes, most urgent first (JobPriority values)
+PRIORITY_LANES = ("urgent", "high", "normal", "low")
+DEFAULT_LANE = PRIORITY_LANES.index("normal")
+
+
+def priority_lane(priority: str) -> int:
+    """
+    Lane index of a priority (0 = most urgent).
+
+    Raises:
+        ValueError: If the priority is unknown
+    """
+    try:
+        return PRIORITY_LANES.index(str(getattr(priority, "value", priority)))
+    except ValueError:
+        raise ValueError(
+            f"Unknown priority '{priority}'. Expected one of: {', '.join(PRIORITY_LANES)}"
+        ) from None
+
+
+@dataclass(frozen=True)
+class QueuedJob:
+    """What a policy knows about a queued job."""
+    job_id: str
+    sequence: int  # Submission order
+    enqueued_at: datetime
+    estimated_seconds: float = 0.0
+    group: Optional[str] = None  # Watch folder ID (None = manual start)
+    cores: int = 1
+    priority: int = DEFAULT_LANE  # Lane index (0 = most urgent)
+
+
+class SchedulingPolicy(ABC):
+    """Orders queued jobs. Implementations must be deterministic."""
+
+    name: str = ""
+
+    @abstractmethod
+    def order(
+        self,
+        jobs: List[QueuedJob],
+        group_service: Dict[Optional[str], float],
+    ) -> List[QueuedJob]:
+        """
+        Return jobs in execution order.
+
+        Args:
+            jobs: Queued jobs (any order)
+            group_service: Estimated render seconds already started per group
+        """
+
+
+class FifoPolicy(SchedulingPolicy):
+    name = "fifo"
+
+    def order(self, jobs, group_service):
+        return sorted(jobs, key=lambda job: job.sequence)
+
+
+class ShortestJobFirstPolicy(SchedulingPolicy):
+    name = "sjf"
+
+    def order(self, jobs, group_service):
+        return sorted(jobs, key=lambda job: (job.estimated_seconds, job.sequence))
+
+
+class FairSharePolicy(SchedulingPolicy):
+    """
+    Deficit round-robin over groups.
+
+    Repeatedly picks the group with the least (already served + already
+    ordered) render time and takes its oldest job, so a folder dropping a
+    large batch cannot starve another folder or manual starts.
+    """
+
+    name = "fair_share"
+
+    def order(self, jobs, group_service):
+        groups: Dict[Optional[str], deque] = {}
+        for job in sorted(jobs, key=lambda job: job.sequence):
+            groups.setdefault(job.group, deque()).append(job)
+
+        served = {group: group_service.get(group, 0.0) for group in groups}
+        ordered: List[QueuedJob] = []
+        while groups:
+            group = min(groups, key=lambda g: (served[g], groups[g][0].sequence))
+            job = groups[group].popleft()
+            ordered.append(job)
+            served[group] += job.estimated_seconds
+            if not groups[group]:
+                del groups[group]
+        return ordered
+
+
+class BinPackingPolicy(SchedulingPolicy):
+    """
+    First-fit decreasing by core demand into waves of `cores` capacity.
+
+    Jobs in one wave can share the machine without oversubscribing it;
+    waves run shortest (longest member) first. With one execution slot
+    this still keeps light jobs together ahead of heavy ones.
+    """
+
+    name = "bin_packing"
+
+    def __init__(self, cores: int):
+        self.cores = max(1, cores)
+
+    def order(self, jobs, group_service):
+        waves: List[List[QueuedJob]] = []
+        free: List[int] = []
+        for job in sorted(jobs, key=lambda job: (-job.cores, -job.estimated_seconds, job.sequence)):
+            demand = min(job.cores, self.cores)
+            for index, capacity in enumerate(free):
+                if demand <= capacity:
+                    waves[index].append(job)
+                    free[index] -= demand
+                    break
+            else:
+                waves.append([job])
+                free.append(self.cores - demand)
+
+        waves.sort(key=lambda wave: (
+            max(job.estimated_seconds for job in wave),
+            min(job.sequence for job in wave),
+        ))
+        return [
+            job
+            for wave in waves
+            for job in sorted(wave, key=lambda job: (job.estimated_seconds, job.sequence))
+        ]
+
+
+POLICY_NAMES = ("fifo", "sjf", "fair_share", "bin_packing")
+
+
+def create_policy(name: str, cores: int = 1) -> SchedulingPolicy:
+    """
+    Create a policy by name (see POLICY_NAMES).
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name == "fifo":
+        return FifoPolicy()
+    if name == "sjf":
+        return ShortestJobFirstPolicy()
+    if name == "fair_share":
+        return FairSharePolicy()
+    if name == "bin_packing":
+        return BinPackingPolicy(cores)
+    raise ValueError(f"Unknown scheduling policy '{name}'. Expected one of: {', '.join(POLICY_NAMES)}")
@@ -0,0 +1,284 @@
+"""
+Checkpointed segment encodes for long clips.
+
+A backend restart used to lose every minute of an in-flight encode; for
+multi-hour camera originals that is hours of work. Long clips are
+therefore encoded as consecutive time ranges (segments) and concatenated
+with the concat demuxer (stream copy) once all of them exist:
+
+- Each segment is the clip's own FFmpeg command with an input-side
+  -ss/-t (accurate seek: decoding starts at the previous keyframe and
+  frames before the boundary are discarded), written to a local
+  checkpoint directory (~/.proxx/segments/<key>/)
+- A segment is checkpointed (PersistenceManager, segment_checkpoints
+  table) only after FFmpeg exited cleanly and the file exists; its size
+  is recorded and re-checked before reuse
+- The checkpoint key is derived from what determines the output: source
+  path, size and mtime, and the FFmpeg command with its input and output
+  paths normalized. Any later render of the same clip with the same
+  settings (a resumed or re-submitted job after a restart) encodes only
+  the segments that are missing, then concatenates
+- Checkpoints and segment files are removed once the output is complete;
+  abandoned ones are purged after CHECKPOINT_MAX_AGE_SECONDS
+
+Only clips of at least MIN_SEGMENTED_SECONDS with a single file input and
+a single output are segmented. Commands that depend on absolute source
+time or frame numbers (timecode tracks, burnt-in timecode and other
+drawtext expansions) and image sequences always encode in one pass.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+# Segment length, and the clip duration from which clips are segmented
+SEGMENT_SECONDS = 600.0
+MIN_SEGMENTED_SECONDS = 1800.0
+
+CHECKPOINT_ROOT = Path.home() / ".proxx" / "segments"
+CHECKPOINT_MAX_AGE_SECONDS = 7 * 24 * 3600.0
+
+CONCAT_LIST_NAME = "segments.txt"
+
+
+@dataclass(frozen=True)
+class Segment:
+    """A time range of a clip, in source seconds."""
+    index: int
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def plan_segments(duration: float, segment_seconds: float = SEGMENT_SECONDS) -> List[Segment]:
+    """Split [0, duration) into consecutive segments of segment_seconds (last one shorter)."""
+    segments = []
+    start = 0.0
+    while start < duration:
+        end = min(start + segment_seconds, duration)
+        segments.append(Segment(index=len(segments), start=start, end=end))
+        start = end
+    return segments
+
+
+def is_segmentable(cmd: Sequence[str], input_path: str, duration: Optional[float]) -> bool:
+    """Whether a single-output FFmpeg command can be encoded in segments."""
+    if not duration or duration < MIN_SEGMENTED_SECONDS:
+        return False
+    inputs = [cmd[i + 1] for i, arg in enumerate(cmd[:-1]) if arg == "-i"]
+    if inputs != [input_path]:
+        return False
+    return not any(_uses_source_time(arg) for arg in cmd)
+
+
+def _uses_source_time(arg: str) -> bool:
+    """
+    Whether an argument renders absolute source time or frame numbers.
+
+    Each segment's timestamps and frame count restart at zero, so timecode
+    tracks and drawtext expansions (%{pts}, %{n}, %{frame_num}, %{expr:t}
+    and the like, as in a burnt-in {timecode} without source timecode)
+    would restart every segment.
+    """
+    if "timecode" in arg:
+        return True
+    if "drawtext" not in arg or "expansion=none" in arg:
+        return False
+    # textfile= contents may hold expansions too
+    return "%{" in arg or "textfile=" in arg
+
+
+def segment_command(
+    cmd: Sequence[str],
+    input_path: str,
+    output_path: str,
+    segment: Segment,
+    segment_path: str,
+) -> List[str]:
+    """The clip's command restricted to one segment, writing segment_path."""
+    segment_cmd = list(cmd)
+    input_index = segment_cmd.index("-i")
+    segment_cmd[input_index:input_index] = [
+        "-ss", f"{segment.start:.6f}", "-t", f"{segment.duration:.6f}",
+    ]
+    output_index = len(segment_cmd) - 1 - segment_cmd[::-1].index(output_path)
+    segment_cmd[output_index] = segment_path
+    return segment_cmd
+
+
+def concat_command(ffmpeg_path: str, list_path: str, output_path: str) -> List[str]:
+    """Stream-copy concatenation of the segments listed in list_path."""
+    return [
+        ffmpeg_path, "-y",
+        "-f", "concat", "-safe", "0", "-i", list_path,
+        "-map", "0", "-c", "copy",
+        output_path,
+    ]
+
+
+def write_concat_list(list_path: str, segment_paths: Sequence[str]) -> None:
+    """Write a concat demuxer list file."""
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in segment_paths:
+            escaped = path.replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+
+
+def checkpoint_key(source_path: str, cmd: Sequence[str], input_path: str, output_path: str) -> Optional[str]:
+    """
+    Identify a render for checkpointing.
+
+    Returns:
+        Hex key, or None if the source cannot be stat'ed
+    """
+    try:
+        st = os.stat(source_path)
+    except OSError:
+        return None
+    normalized = [
+        "{input}" if arg == input_path else "{output}" if arg == output_path else arg
+        for arg in cmd[1:]  # Not the binary path
+    ]
+    payload = json.dumps({
+        "source": source_path,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "cmd": normalized,
+        "suffix": Path(output_path).suffix,
+        "segment_seconds": SEGMENT_SECONDS,
+    })
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SegmentCheckpointStore:
+    """
+    Completed segments per checkpoint key. Thread-safe.
+
+    Written through to a PersistenceManager when one is attached, held in
+    memory otherwise (checkpoints then do not survive a restart).
+    """
+
+    def __init__(self, persistence_manager=None, root: Path = CHECKPOINT_ROOT):
+        self.root = Path(root)
+        self._persistence = persistence_manager
+        self._memory: Dict[str, Dict[int, Dict]] = {}
+        self._active: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def attach(self, persistence_manager) -> None:
+        """Persist checkpoints from now on, and purge abandoned ones."""
+        self._persistence = persistence_manager
+        self.purge_stale()
+
+    def work_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def acquire(self, key: str) -> bool:
+        """Claim a key for one render (False if another render holds it)."""
+        with self._lock:
+            if key in self._active:
+                return False
+            self._active.add(key)
+            return True
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._active.discard(key)
+
+    def completed(self, key: str) -> Dict[int, str]:
+        """
+        Segments already encoded for key.
+
+        Returns:
+            Segment index -> segment path, for checkpoints whose file still
+            exists with the recorded size (others are dropped)
+        """
+        if self._persistence is not None:
+            rows = self._persistence.load_segment_checkpoints(key)
+        else:
+            with self._lock:
+                rows = list(self._memory.get(key, {}).values())
+
+        completed = {}
+        for row in rows:
+            try:
+                valid = os.path.getsize(row["segment_path"]) == row["segment_size"]
+            except OSError:
+                valid = False
+            if valid:
+                completed[row["segment_index"]] = row["segment_path"]
+            else:
+                logger.warning(f"[Segments] Checkpointed segment missing or changed: {row['segment_path']}")
+        return completed
+
+    def record(self, key: str, segment: Segment, segment_path: str) -> None:
+        """Checkpoint a segment whose file is complete."""
+        row = {
+            "checkpoint_key": key,
+            "segment_index": segment.index,
+            "start_seconds": segment.start,
+            "end_seconds": segment.end,
+            "segment_path": segment_path,
+            "segment_size": os.path.getsize(segment_path),
+            "recorded_at": datetime.now().isoformat(),
+        }
+        if self._persistence is not None:
+            self._persistence.save_segment_checkpoint(row)
+        else:
+            with self._lock:
+                self._memory.setdefault(key, {})[segment.index] = row
+
+    def clear(self, key: str) -> None:
+        """Forget a render's checkpoints and delete its segment files."""
+        if self._persistence is not None:
+            self._persistence.delete_segment_checkpoints(key)
+        with self._lock:
+            self._memory.pop(key, None)
+        shutil.rmtree(self.work_dir(key), ignore_errors=True)
+
+    def purge_stale(self, max_age_seconds: float = CHECKPOINT_MAX_AGE_SECONDS) -> int:
+        """
+        Remove checkpoints not touched for max_age_seconds.
+
+        Returns:
+            Number of renders purged
+        """
+        if not self.root.is_dir():
+            return 0
+        cutoff = time.time() - max_age_seconds
+        purged = 0
+        for entry in self.root.iterdir():
+            try:
+                stale = entry.is_dir() and entry.stat().st_mtime < cutoff
+            except OSError:
+                continue
+            if stale:
+                self.clear(entry.name)
+                purged += 1
+        if purged:
+            logger.info(f"[Segments] Purged {purged} abandoned checkpoint(s)")
+        return purged
+
+
+_segment_checkpoints: Optional[SegmentCheckpointStore] = None
+
+
+def get_segment_checkpoints() -> SegmentCheckpointStore:
+    """Get the process-wide segment checkpoint store (created on first access)."""
+    global _segment_checkpoints
+    if _segment_checkpoints is None:
+        _segment_checkpoints = SegmentCheckpointStore()
+    return _segment_checkpoints
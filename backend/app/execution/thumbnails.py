@@ -9,6 +9,13 @@ Strategy:
 - Scale to 320px width, maintain aspect ratio
 - Store alongside job metadata as base64 or file path
 - Non-blocking, runs in background
+
+Fast mode (ingest):
+- Reuse the duration already extracted at ingest (no ffprobe round-trip)
+- Decode keyframes only (-skip_frame nokey, seeking to the keyframe at or
+  before the position with -noaccurate_seek), so long-GOP sources cost a
+  single decoded frame instead of a 100-frame thumbnail-filter window
+- Fall back to the quality path only when the keyframe is black
 """
 
 import asyncio
@@ -19,7 +26,7 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +37,14 @@ THUMBNAIL_WIDTH = 320
 # Default position in video (0.0 - 1.0, where 0.3 = 30%)
 DEFAULT_THUMBNAIL_POSITION = 0.3
 
+# Fast-mode black detection (FFmpeg blackframe filter):
+# a frame is "black" when at least AMOUNT percent of pixels fall below
+# THRESHOLD luma. Black keyframes trigger the quality fallback.
+BLACK_FRAME_AMOUNT = 98
+BLACK_FRAME_THRESHOLD = 32
+
+THUMBNAIL_TIMEOUT_SECONDS = 30
+
 
 def find_ffmpeg() -> Optional[str]:
     """Find ffmpeg binary path."""
@@ -55,6 +70,8 @@ def generate_thumbnail_sync(
     output_path: Optional[str] = None,
     position: float = DEFAULT_THUMBNAIL_POSITION,
     width: int = THUMBNAIL_WIDTH,
+    duration: Optional[float] = None,
+    fast: bool = False,
 ) -> Optional[str]:
     """
     Generate a thumbnail from a video file synchronously.
@@ -64,6 +81,9 @@ def generate_thumbnail_sync(
         output_path: Path to save thumbnail (default: temp file)
         position: Position in video (0.0 - 1.0)
         width: Target thumbnail width in pixels
+        duration: Known duration in seconds (skips the ffprobe call)
+        fast: Decode a single keyframe instead of a thumbnail-filter window.
+            Falls back to the quality path if the keyframe is black.
         
     Returns:
         Path to generated thumbnail, or None on failure
@@ -83,32 +103,33 @@ def generate_thumbnail_sync(
         output_path = tempfile.mktemp(suffix=".jpg", prefix="awaire_thumb_")
     
     try:
-        # First, get video duration
-        duration = get_video_duration(source_path, ffmpeg_path)
+        # Get video duration unless the caller already knows it
+        if duration is None:
+            duration = get_video_duration(source_path, ffmpeg_path)
         if duration is None or duration <= 0:
             # Fallback: just grab first frame
             seek_time = 0
         else:
             seek_time = duration * position
         
-        # Generate thumbnail using FFmpeg
-        # -ss before -i for fast seeking
-        # thumbnail filter selects best frame in a window
-        # scale filter maintains aspect ratio
-        cmd = [
-            ffmpeg_path,
-            "-ss", str(seek_time),
-            "-i", source_path,
-            "-vf", f"thumbnail,scale={width}:-1",
-            "-frames:v", "1",
-            "-y",
-            output_path
-        ]
+        if fast:
+            result = subprocess.run(
+                build_fast_thumbnail_command(ffmpeg_path, source_path, output_path, seek_time, width),
+                capture_output=True,
+                timeout=THUMBNAIL_TIMEOUT_SECONDS,
+            )
+            if result.returncode == 0 and Path(output_path).exists():
+                if not is_black_frame_output(result.stderr.decode(errors="replace")):
+                    logger.debug(f"Generated thumbnail (fast): {output_path}")
+                    return output_path
+                logger.debug(f"Keyframe thumbnail is black, falling back: {source_path}")
+            else:
+                logger.debug(f"Fast thumbnail failed, falling back: {result.stderr.decode()[-500:]}")
         
         result = subprocess.run(
-            cmd,
+            build_thumbnail_command(ffmpeg_path, source_path, output_path, seek_time, width),
             capture_output=True,
-            timeout=30,  # 30 second timeout
+            timeout=THUMBNAIL_TIMEOUT_SECONDS,
         )
         
         if result.returncode == 0 and Path(output_path).exists():
@@ -126,6 +147,68 @@ def generate_thumbnail_sync(
         return None
 
 
+def build_thumbnail_command(
+    ffmpeg_path: str,
+    source_path: str,
+    output_path: str,
+    seek_time: float,
+    width: int,
+) -> List[str]:
+    """
+    Build the quality thumbnail command.
+    
+    -ss before -i for fast seeking; the thumbnail filter selects the most
+    representative frame in a 100-frame window; scale maintains aspect ratio.
+    """
+    return [
+        ffmpeg_path,
+        "-ss", str(seek_time),
+        "-i", source_path,
+        "-vf", f"thumbnail,scale={width}:-1",
+        "-frames:v", "1",
+        "-y",
+        output_path
+    ]
+
+
+def build_fast_thumbnail_command(
+    ffmpeg_path: str,
+    source_path: str,
+    output_path: str,
+    seek_time: float,
+    width: int,
+) -> List[str]:
+    """
+    Build the fast keyframe-only thumbnail command.
+    
+    -noaccurate_seek makes the input seek stop at the nearest keyframe at
+    or before seek_time instead of discarding frames up to seek_time, and
+    -skip_frame nokey makes the decoder discard everything but keyframes,
+    so exactly one frame, that keyframe, is decoded. (With an accurate
+    seek the first frame kept would be the next keyframe after seek_time,
+    and a source with a single keyframe at 0 would output nothing.)
+    blackframe reports (on stderr) if that frame is black so the caller
+    can fall back to the quality path.
+    """
+    return [
+        ffmpeg_path,
+        "-skip_frame", "nokey",
+        "-noaccurate_seek",
+        "-ss", str(seek_time),
+        "-i", source_path,
+        "-an", "-sn",
+        "-vf", f"blackframe=amount={BLACK_FRAME_AMOUNT}:threshold={BLACK_FRAME_THRESHOLD},scale={width}:-1",
+        "-frames:v", "1",
+        "-y",
+        output_path
+    ]
+
+
+def is_black_frame_output(stderr: str) -> bool:
+    """Check FFmpeg stderr for a blackframe filter detection line."""
+    return "Parsed_blackframe" in stderr and "pblack:" in stderr
+
+
 def get_video_duration(source_path: str, ffmpeg_path: str) -> Optional[float]:
     """Get video duration in seconds using ffprobe."""
     ffprobe_path = ffmpeg_path.replace("ffmpeg", "ffprobe")
@@ -190,6 +273,8 @@ async def generate_thumbnail_async(
     output_path: Optional[str] = None,
     position: float = DEFAULT_THUMBNAIL_POSITION,
     width: int = THUMBNAIL_WIDTH,
+    duration: Optional[float] = None,
+    fast: bool = False,
 ) -> Optional[str]:
     """
     Generate thumbnail asynchronously.
@@ -204,6 +289,8 @@ async def generate_thumbnail_async(
         output_path,
         position,
         width,
+        duration,
+        fast,
     )
 
 
@@ -0,0 +1,165 @@
+"""
+Filesystem access layer for browsing and enumeration.
+
+Keeps the syscall-heavy parts of directory access out of the route handlers
+so they can be cached and reused.
+
+Public API:
+    ListingEntry — A single scanned directory entry
+    DirectoryListing — Immutable result of one directory scan
+    DirectoryListingCache — Per-directory listing cache keyed on mtime
+    scan_directory — os.scandir-based listing with minimal syscalls
+    iter_directory — Same scan, yielding entries in scan order
+    get_listing_cache — Process-wide listing cache
+    BrowseSession — Incremental scan backing paginated/streamed browse
+    BrowseSessionStore — Active browse sessions (cursor lookup)
+    get_browse_session_store — Process-wide session store
+    MediaClassifier — Precompiled media test over raw file names (batch capable)
+    get_media_classifier — Classifier shared by browse and enumeration
+    iter_media — Streaming media enumeration with per-directory sequence grouping
+    FrameRanges — Frame numbers stored as merged ranges
+    SequenceGroup — A numbered image sequence found in one directory
+    MountTable — Cached mount table with lexical path → mount lookup
+    mount_point_for — Mount point containing a path (no I/O on the path)
+    MountHealthMonitor — Background mount probes with cached roots
+    get_mount_health_monitor — Process-wide mount health monitor
+    FilesystemIOPool — Per-mount I/O executors with circuit breakers
+    get_io_pool — Process-wide filesystem I/O pool
+    ScratchSpace — Quota-managed local scratch for staged render outputs
+    get_scratch_space — Process-wide scratch space
+    publish_file — Atomic copy-and-rename of a finished file to its destination
+    SourcePrefetchCache — Bounded local cache of sources read ahead of the encoder
+    get_prefetch_cache — Process-wide prefetch cache
+    StreamHasher — Several checksums of one byte stream in a single pass
+    get_checksum_policy — Process-wide output checksum / MHL sidecar settings
+"""
+
+from .listing import (
+    ListingEntry,
+    DirectoryListing,
+    DirectoryListingCache,
+    scan_directory,
+    iter_directory,
+    get_listing_cache,
+)
+from .browse_sessions import (
+    BrowseSession,
+    BrowseSessionStore,
+    encode_cursor,
+    decode_cursor,
+    get_browse_session_store,
+)
+from .classifier import (
+    MediaClassifier,
+    MediaKind,
+    get_media_classifier,
+    get_watch_folder_classifier,
+    sniff_media,
+)
+from .enumeration import (
+    EnumerationProgress,
+    FrameRanges,
+    SequenceGroup,
+    SequenceGrouper,
+    frame_pattern,
+    iter_media,
+)
+from .mounts import (
+    MountInfo,
+    MountTable,
+    get_mount_table,
+    mount_point_for,
+    read_mounts,
+)
+from .mount_health import (
+    MountHealthMonitor,
+    MountState,
+    MountStatus,
+    RootEntry,
+    get_mount_health_monitor,
+)
+from .io_pool import (
+    CircuitState,
+    FilesystemIOPool,
+    MountIOStats,
+    MountUnavailableError,
+    get_io_pool,
+)
+from .staging import (
+    STAGING_MODES,
+    ScratchSpace,
+    StagedOutputs,
+    copy_file,
+    get_scratch_space,
+    is_network_path,
+    publish_file,
+)
+from .prefetch import (
+    PREFETCH_MODES,
+    SourcePrefetchCache,
+    get_prefetch_cache,
+)
+from .checksums import (
+    CHECKSUM_ALGORITHMS,
+    ChecksumPolicy,
+    StreamHasher,
+    get_checksum_policy,
+    hash_file,
+    write_mhl,
+)
+
+__all__ = [
+    "ListingEntry",
+    "DirectoryListing",
+    "DirectoryListingCache",
+    "scan_directory",
+    "iter_directory",
+    "get_listing_cache",
+    "BrowseSession",
+    "BrowseSessionStore",
+    "encode_cursor",
+    "decode_cursor",
+    "get_browse_session_store",
+    "MediaClassifier",
+    "MediaKind",
+    "get_media_classifier",
+    "get_watch_folder_classifier",
+    "sniff_media",
+    "EnumerationProgress",
+    "FrameRanges",
+    "SequenceGroup",
+    "SequenceGrouper",
+    "frame_pattern",
+    "iter_media",
+    "MountInfo",
+    "MountTable",
+    "get_mount_table",
+    "mount_point_for",
+    "read_mounts",
+    "MountHealthMonitor",
+    "MountState",
+    "MountStatus",
+    "RootEntry",
+    "get_mount_health_monitor",
+    "CircuitState",
+    "FilesystemIOPool",
+    "MountIOStats",
+    "MountUnavailableError",
+    "get_io_pool",
+    "STAGING_MODES",
+    "ScratchSpace",
+    "StagedOutputs",
+    "copy_file",
+    "get_scratch_space",
+    "is_network_path",
+    "publish_file",
+    "PREFETCH_MODES",
+    "SourcePrefetchCache",
+    "get_prefetch_cache",
+    "CHECKSUM_ALGORITHMS",
+    "ChecksumPolicy",
+    "StreamHasher",
+    "get_checksum_policy",
+    "hash_file",
+    "write_mhl",
+]
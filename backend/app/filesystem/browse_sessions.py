@@ -0,0 +1,232 @@
+"""
+Incremental browse sessions.
+
+A session scans one directory in a filesystem worker thread and appends
+entries to an append-only list as they are read, so the first page of a
+browse (or the first NDJSON lines of a streamed browse) can be returned
+before the scan finishes. Offsets into that list never change, which makes
+(session_id, offset) a stable pagination cursor.
+
+Ordering:
+- A session opened on an unchanged, cached directory is complete and sorted
+  (directories first, then files) from the start.
+- A session that is still scanning serves entries in scan order. When the
+  scan completes, the sorted listing is published to the listing cache, so
+  the next browse of that directory is sorted and instant.
+"""
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Executor
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from .listing import (
+    DirectoryListing,
+    DirectoryListingCache,
+    ListingEntry,
+    get_listing_cache,
+    iter_directory,
+    sort_entries,
+)
+
+# Idle sessions are dropped after this many seconds
+SESSION_TTL_SECONDS = 120.0
+
+# Upper bound on concurrently tracked sessions (least recently used evicted)
+MAX_BROWSE_SESSIONS = 64
+
+
+class BrowseSession:
+    """One incremental scan of a directory."""
+    
+    def __init__(
+        self,
+        directory: str,
+        include_hidden: bool = False,
+        media_extensions: Optional[FrozenSet[str]] = None,
+        listing: Optional[DirectoryListing] = None,
+    ):
+        """
+        Create a session.
+        
+        Args:
+            directory: Directory being browsed
+            include_hidden: Include dot-files and dot-folders
+            media_extensions: Media-only filter (None = all files)
+            listing: Complete cached listing; if given, no scan is needed
+        """
+        self.session_id = uuid.uuid4().hex
+        self.directory = directory
+        self.include_hidden = include_hidden
+        self.media_extensions = media_extensions
+        self.entries: List[ListingEntry] = list(listing.entries) if listing else []
+        self.complete = listing is not None
+        self.sorted = listing is not None
+        self.error: Optional[OSError] = None
+        self.last_access = time.monotonic()
+        self._cond = threading.Condition()
+    
+    @property
+    def total(self) -> Optional[int]:
+        """Total entry count, known only once the scan has completed."""
+        if self.complete and self.error is None:
+            return len(self.entries)
+        return None
+    
+    def run_scan(self, listing_cache: DirectoryListingCache) -> None:
+        """Scan the directory, publishing entries as they are read."""
+        try:
+            dir_stat = os.stat(self.directory)
+            for entry in iter_directory(self.directory, self.include_hidden, self.media_extensions):
+                with self._cond:
+                    self.entries.append(entry)
+                    self._cond.notify_all()
+            
+            listing_cache.store(
+                DirectoryListing(
+                    path=self.directory,
+                    mtime_ns=dir_stat.st_mtime_ns,
+                    entries=sort_entries(self.entries),
+                ),
+                self.include_hidden,
+                self.media_extensions,
+                dir_mtime=dir_stat.st_mtime,
+            )
+        except OSError as e:
+            self.error = e
+        finally:
+            with self._cond:
+                self.complete = True
+                self._cond.notify_all()
+    
+    def wait_for(self, count: int, timeout: float) -> bool:
+        """
+        Block until at least count entries are available or the scan ends.
+        
+        Returns:
+            True if the wait was satisfied, False on timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self.complete or len(self.entries) >= count,
+                timeout=timeout,
+            )
+    
+    def page(self, offset: int, limit: int) -> List[ListingEntry]:
+        """Return up to limit entries starting at offset."""
+        self.last_access = time.monotonic()
+        return self.entries[offset:offset + limit]
+    
+    def has_more(self, offset: int) -> bool:
+        """True if entries beyond offset exist or may still arrive."""
+        return not self.complete or offset < len(self.entries)
+
+
+def encode_cursor(session: BrowseSession, offset: int) -> str:
+    """Encode a pagination cursor."""
+    return f"{session.session_id}.{offset}"
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a pagination cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    session_id, sep, offset_str = cursor.partition(".")
+    if not sep or not session_id:
+        raise ValueError(f"Malformed cursor: {cursor}")
+    offset = int(offset_str)
+    if offset < 0:
+        raise ValueError(f"Malformed cursor: {cursor}")
+    return session_id, offset
+
+
+class BrowseSessionStore:
+    """In-memory store of active browse sessions."""
+    
+    def __init__(
+        self,
+        listing_cache: Optional[DirectoryListingCache] = None,
+        ttl_seconds: float = SESSION_TTL_SECONDS,
+        max_sessions: int = MAX_BROWSE_SESSIONS,
+    ):
+        self._listing_cache = listing_cache
+        self._ttl_seconds = ttl_seconds
+        self._max_sessions = max_sessions
+        self._sessions: Dict[str, BrowseSession] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def listing_cache(self) -> DirectoryListingCache:
+        return self._listing_cache or get_listing_cache()
+    
+    def open(
+        self,
+        directory: str,
+        executor: Executor,
+        include_hidden: bool = False,
+        media_extensions: Optional[FrozenSet[str]] = None,
+    ) -> BrowseSession:
+        """
+        Open a session for directory.
+        
+        Blocking (stats the directory): call from a filesystem worker.
+        If the directory is cached and unchanged the session is complete
+        immediately; otherwise the scan is submitted to executor.
+        
+        Raises:
+            OSError: If the directory cannot be stat'ed
+        """
+        cached = self.listing_cache.get_fresh(directory, include_hidden, media_extensions)
+        session = BrowseSession(directory, include_hidden, media_extensions, listing=cached)
+        
+        with self._lock:
+            self._prune()
+            self._sessions[session.session_id] = session
+        
+        if cached is None:
+            executor.submit(session.run_scan, self.listing_cache)
+        
+        return session
+    
+    def get(self, session_id: str) -> Optional[BrowseSession]:
+        """Look up a live session, or None if unknown or expired."""
+        with self._lock:
+            self._prune()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_access = time.monotonic()
+            return session
+    
+    def _prune(self) -> None:
+        """Drop expired sessions and enforce the session limit (lock held)."""
+        now = time.monotonic()
+        for session_id in [
+            sid for sid, s in self._sessions.items()
+            if now - s.last_access > self._ttl_seconds
+        ]:
+            del self._sessions[session_id]
+        
+        while len(self._sessions) >= self._max_sessions:
+            oldest = min(self._sessions.values(), key=lambda s: s.last_access)
+            del self._sessions[oldest.session_id]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+
+# Process-wide session store
+_session_store: Optional[BrowseSessionStore] = None
+
+
+def get_browse_session_store() -> BrowseSessionStore:
+    """Get the process-wide browse session store."""
+    global _session_store
+    if _session_store is None:
+        _session_store = BrowseSessionStore()
+    return _session_store
@@ -0,0 +1,221 @@
+"""
+Output checksums computed while outputs are moved, not re-read later.
+
+Facility manifests need xxHash/MD5 of every delivered file. Hashing a
+finished proxy on the share means a second full read over the network.
+Instead, checksums are computed in the same pass that last touches the
+bytes:
+
+- Staged outputs published across filesystems are hashed inside the
+  publish copy (copy_file with a StreamHasher): each buffer read from
+  scratch is hashed and written, one read in total
+- Staged outputs on the destination's filesystem are hashed from local
+  scratch just before the rename
+- Outputs are always staged while checksums are enabled, whatever the
+  staging mode. Only a clip that gets no scratch reservation (quota or
+  free-space floor reached) is written in place and read back once from
+  its destination
+- Clips completed from the render ledger are hashed inside the ledger
+  copy; an output reused at its recorded path is read once
+
+FFmpeg's hash/tee muxers hash encoded packets, not the container bytes
+on disk (MOV/MXF headers are rewritten when the muxer finishes), so they
+cannot produce checksums that match the delivered file.
+
+Checksums go into the execution trace and job reports, and optionally
+into an MHL (ASC Media Hash List v1.1) sidecar next to each output.
+"""
+
+import getpass
+import hashlib
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+try:
+    import xxhash
+except ImportError:  # Optional: xxh64 unavailable, md5/sha1 still work
+    xxhash = None
+
+logger = logging.getLogger(__name__)
+
+CHECKSUM_ALGORITHMS = ("xxh64", "md5", "sha1")
+
+HASH_BUFFER_BYTES = 8 * 1024 * 1024
+
+MHL_SUFFIX = ".mhl"
+
+# Element names of each algorithm in an MHL v1.1 <hash> entry
+_MHL_ELEMENTS = {"xxh64": "xxhash64be", "md5": "md5", "sha1": "sha1"}
+
+
+def available_algorithms() -> Tuple[str, ...]:
+    """Algorithms usable in this installation (xxh64 needs the xxhash package)."""
+    return tuple(
+        algorithm for algorithm in CHECKSUM_ALGORITHMS
+        if algorithm != "xxh64" or xxhash is not None
+    )
+
+
+def _validate(algorithms: Iterable[str]) -> Tuple[str, ...]:
+    algorithms = tuple(dict.fromkeys(algorithms))
+    for algorithm in algorithms:
+        if algorithm not in CHECKSUM_ALGORITHMS:
+            raise ValueError(
+                f"Unknown checksum algorithm '{algorithm}'. "
+                f"Expected one of: {', '.join(CHECKSUM_ALGORITHMS)}"
+            )
+        if algorithm not in available_algorithms():
+            raise ValueError(f"Checksum algorithm '{algorithm}' requires the xxhash package")
+    return algorithms
+
+
+class StreamHasher:
+    """Feeds one stream of bytes to several hash algorithms at once."""
+
+    def __init__(self, algorithms: Sequence[str]):
+        """
+        Raises:
+            ValueError: If an algorithm is unknown or unavailable
+        """
+        self._hashes = {}
+        for algorithm in _validate(algorithms):
+            if algorithm == "xxh64":
+                self._hashes[algorithm] = xxhash.xxh64()
+            else:
+                self._hashes[algorithm] = hashlib.new(algorithm)
+        self.bytes_hashed = 0
+
+    def update(self, data: bytes) -> None:
+        for h in self._hashes.values():
+            h.update(data)
+        self.bytes_hashed += len(data)
+
+    def hexdigests(self) -> Dict[str, str]:
+        return {algorithm: h.hexdigest() for algorithm, h in self._hashes.items()}
+
+
+def hash_file(path: str, algorithms: Sequence[str]) -> Dict[str, str]:
+    """Checksums of a file, read once with large buffers."""
+    hasher = StreamHasher(algorithms)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_BUFFER_BYTES), b""):
+            hasher.update(chunk)
+    return hasher.hexdigests()
+
+
+def mhl_path_for(output_path: str) -> str:
+    return output_path + MHL_SUFFIX
+
+
+def write_mhl(output_path: str, checksums: Mapping[str, str], started_at: Optional[datetime] = None) -> str:
+    """
+    Write an MHL v1.1 sidecar for one output, atomically.
+
+    Returns:
+        Path of the sidecar (output_path + ".mhl")
+    """
+    now = datetime.now(timezone.utc)
+    started_at = started_at or now
+    st = os.stat(output_path)
+    modified = datetime.fromtimestamp(st.st_mtime, timezone.utc)
+
+    def ts(value: datetime) -> str:
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    hash_lines = "".join(
+        f"    <{_MHL_ELEMENTS[algorithm]}>{digest}</{_MHL_ELEMENTS[algorithm]}>\n"
+        for algorithm, digest in checksums.items()
+        if algorithm in _MHL_ELEMENTS
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<hashlist version="1.1">\n'
+        "  <creatorinfo>\n"
+        f"    <username>{escape(getpass.getuser())}</username>\n"
+        f"    <hostname>{escape(socket.gethostname())}</hostname>\n"
+        "    <tool>Proxx</tool>\n"
+        f"    <startdate>{ts(started_at)}</startdate>\n"
+        f"    <finishdate>{ts(now)}</finishdate>\n"
+        "  </creatorinfo>\n"
+        "  <hash>\n"
+        f"    <file>{escape(os.path.basename(output_path))}</file>\n"
+        f"    <size>{st.st_size}</size>\n"
+        f"    <lastmodificationdate>{ts(modified)}</lastmodificationdate>\n"
+        f"{hash_lines}"
+        f"    <hashdate>{ts(now)}</hashdate>\n"
+        "  </hash>\n"
+        "</hashlist>\n"
+    )
+
+    sidecar = mhl_path_for(output_path)
+    partial = f"{sidecar}.{uuid.uuid4().hex[:8]}.partial"
+    try:
+        with open(partial, "w", encoding="utf-8") as f:
+            f.write(document)
+        os.replace(partial, sidecar)
+    except BaseException:
+        try:
+            os.unlink(partial)
+        except OSError:
+            pass
+        raise
+    return sidecar
+
+
+class ChecksumPolicy:
+    """
+    Which checksums are computed for outputs, and whether MHL sidecars
+    are written. Thread-safe. Disabled (no algorithms) by default.
+    """
+
+    def __init__(self, algorithms: Sequence[str] = (), write_mhl: bool = False):
+        self._lock = threading.Lock()
+        self.configure(algorithms, write_mhl)
+
+    def configure(self, algorithms: Sequence[str], write_mhl: bool = False) -> None:
+        """
+        Raises:
+            ValueError: If an algorithm is unknown or unavailable, or MHL
+                sidecars are requested without any algorithm
+        """
+        algorithms = _validate(algorithms)
+        if write_mhl and not algorithms:
+            raise ValueError("MHL sidecars need at least one checksum algorithm")
+        with self._lock:
+            self._algorithms = algorithms
+            self._write_mhl = write_mhl
+
+    @property
+    def algorithms(self) -> Tuple[str, ...]:
+        with self._lock:
+            return self._algorithms
+
+    @property
+    def write_mhl(self) -> bool:
+        with self._lock:
+            return self._write_mhl
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "algorithms": list(self._algorithms),
+                "write_mhl": self._write_mhl,
+                "available": list(available_algorithms()),
+            }
+
+
+_checksum_policy: Optional[ChecksumPolicy] = None
+
+
+def get_checksum_policy() -> ChecksumPolicy:
+    """Get the process-wide checksum policy (created on first access)."""
+    global _checksum_policy
+    if _checksum_policy is None:
+        _checksum_policy = ChecksumPolicy()
+    return _checksum_policy
@@ -0,0 +1,263 @@
+"""
+Shared media classification of file names.
+
+Browse, enumeration and watch-folder scanning used to keep their own
+extension sets and test one Path at a time (Path() + .suffix + .lower()
+per name). MediaClassifier precompiles the decision once:
+
+- Extensions are looked up by the raw suffix in a table that already holds
+  the lowercase, UPPERCASE and Capitalized spelling of every extension, so
+  the common cases cost one rfind, one slice and one dict lookup; only
+  other spellings pay for .lower().
+- Names with a sequence extension are matched against the sequence
+  pattern to tell numbered frames from standalone images.
+- classify_names()/select() run the same lookup over a whole batch of raw
+  names with the per-call attribute lookups hoisted out of the loop.
+- An optional magic-byte sniff (classify_file) recognises media whose
+  name has no or the wrong extension. It costs an open + read, so it is
+  off unless the classifier is built with sniff=True.
+
+See qa/benchmarks/bench_media_classifier.py.
+"""
+
+import re
+from enum import Enum
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Pattern to detect numbered sequences: name.NNNNN.ext or name_NNNNN.ext
+SEQUENCE_PATTERN = re.compile(r'^(.+?)([\._])(\d{2,8})\.([\w]+)$')
+
+# Extensions offered by browse and enumeration (lowercase, without dot)
+MEDIA_EXTENSIONS: FrozenSet[str] = frozenset({
+    # Video formats
+    'mov', 'mp4', 'mxf', 'avi', 'mkv', 'webm', 'm4v', 'mpg', 'mpeg',
+    'dv', 'r3d', 'braw', 'ari',
+    # Audio formats
+    'wav', 'aiff', 'aif', 'mp3', 'flac', 'm4a', 'aac',
+    # Still images / sequence frames
+    'dpx', 'exr', 'tif', 'tiff', 'png', 'jpg', 'jpeg', 'cin', 'tga',
+})
+
+# Image frame extensions grouped into sequences when numbered
+SEQUENCE_EXTENSIONS: FrozenSet[str] = frozenset({
+    'dpx', 'exr', 'tif', 'tiff', 'png', 'jpg', 'jpeg', 'cin', 'tga',
+})
+
+# Video containers picked up by watch folders
+# Based on supported formats from metadata/extractors.py
+WATCH_FOLDER_EXTENSIONS: FrozenSet[str] = frozenset({'mov', 'mxf', 'mp4', 'avi', 'mkv'})
+
+# Bytes read for the magic-byte sniff
+SNIFF_BYTES = 16
+
+# (offset, magic, extension) in match order
+_MAGIC: Tuple[Tuple[int, bytes, str], ...] = (
+    (4, b"ftyp", "mp4"),  # ISO BMFF (QuickTime/MP4); refined below
+    (4, b"moov", "mov"),
+    (4, b"mdat", "mov"),
+    (4, b"wide", "mov"),
+    (4, b"free", "mov"),
+    (0, b"\x06\x0e\x2b\x34\x02\x05\x01\x01\x0d\x01\x02", "mxf"),
+    (0, b"\x1a\x45\xdf\xa3", "mkv"),
+    (0, b"SDPX", "dpx"),
+    (0, b"XPDS", "dpx"),
+    (0, b"\x76\x2f\x31\x01", "exr"),
+    (0, b"\x89PNG\r\n\x1a\n", "png"),
+    (0, b"\xff\xd8\xff", "jpg"),
+    (0, b"II*\x00", "tif"),
+    (0, b"MM\x00*", "tif"),
+    (0, b"\x80\x2a\x5f\xd7", "cin"),
+    (0, b"fLaC", "flac"),
+    (0, b"ID3", "mp3"),
+    (0, b"\x00\x00\x01\xba", "mpg"),
+    (4, b"RED1", "r3d"),
+    (4, b"RED2", "r3d"),
+)
+
+# RIFF/IFF containers: form type at offset 8
+_FORM_TYPES = {b"AVI ": "avi", b"WAVE": "wav", b"AIFF": "aiff", b"AIFC": "aiff"}
+
+
+class MediaKind(str, Enum):
+    """Classification of one file name."""
+
+    NONE = "none"  # Not media
+    MEDIA = "media"  # Standalone media file
+    FRAME = "frame"  # Numbered frame of a potential image sequence
+
+
+def sniff_media(path: str) -> Optional[str]:
+    """
+    Identify a media container from its first bytes.
+
+    Returns:
+        Canonical extension (e.g. "mov", "mxf"), or None if unrecognised
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+
+    if head[:4] in (b"RIFF", b"FORM"):
+        return _FORM_TYPES.get(head[8:12])
+    for offset, magic, extension in _MAGIC:
+        if head[offset:offset + len(magic)] == magic:
+            if magic == b"ftyp" and head[8:10] == b"qt":
+                return "mov"
+            return extension
+    return None
+
+
+class MediaClassifier:
+    """
+    Precompiled media test over raw file names (no Path objects, no I/O).
+
+    Immutable and hashable (by its extension sets), so one instance can be
+    shared across threads and used as a cache key.
+    """
+
+    __slots__ = ("media_extensions", "sequence_extensions", "sniff", "_table", "_key")
+
+    def __init__(
+        self,
+        media_extensions: Iterable[str],
+        sequence_extensions: Iterable[str] = (),
+        sniff: bool = False,
+    ):
+        """
+        Args:
+            media_extensions: Accepted extensions, without dot (any case)
+            sequence_extensions: Extensions whose numbered names are FRAMEs
+                (also accepted, whether or not listed in media_extensions)
+            sniff: Let classify_file() fall back to the magic-byte sniff
+        """
+        self.sequence_extensions = frozenset(ext.lower().lstrip(".") for ext in sequence_extensions)
+        self.media_extensions = (
+            frozenset(ext.lower().lstrip(".") for ext in media_extensions) | self.sequence_extensions
+        )
+        self.sniff = sniff
+        self._table: Dict[str, str] = {}
+        for ext in self.media_extensions:
+            for spelling in (ext, ext.upper(), ext.capitalize()):
+                self._table[spelling] = ext
+        self._key = (self.media_extensions, self.sequence_extensions, sniff)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, MediaClassifier) and self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        return f"MediaClassifier({sorted(self.media_extensions)}, sniff={self.sniff})"
+
+    def extension(self, name: str) -> Optional[str]:
+        """Lowercase extension of name if it is accepted media, else None."""
+        dot = name.rfind(".")
+        if dot <= 0:
+            return None
+        suffix = name[dot + 1:]
+        ext = self._table.get(suffix)
+        if ext is None and suffix:
+            ext = self._table.get(suffix.lower())
+        return ext
+
+    def is_media(self, name: str) -> bool:
+        return self.extension(name) is not None
+
+    def is_sequence_extension(self, ext: str) -> bool:
+        """ext (lowercase, without dot) is grouped into sequences."""
+        return ext in self.sequence_extensions
+
+    def classify(self, name: str) -> MediaKind:
+        """Classify one raw file name."""
+        ext = self.extension(name)
+        if ext is None:
+            return MediaKind.NONE
+        if ext in self.sequence_extensions and SEQUENCE_PATTERN.match(name) is not None:
+            return MediaKind.FRAME
+        return MediaKind.MEDIA
+
+    def classify_names(self, names: Iterable[str]) -> List[MediaKind]:
+        """Classify a batch of raw names (same result as classify() per name)."""
+        table_get = self._table.get
+        sequence_extensions = self.sequence_extensions
+        match = SEQUENCE_PATTERN.match
+        none, media, frame = MediaKind.NONE, MediaKind.MEDIA, MediaKind.FRAME
+        kinds: List[MediaKind] = []
+        append = kinds.append
+
+        for name in names:
+            dot = name.rfind(".")
+            if dot <= 0:
+                append(none)
+                continue
+            suffix = name[dot + 1:]
+            ext = table_get(suffix) or (table_get(suffix.lower()) if suffix else None)
+            if ext is None:
+                append(none)
+            elif ext in sequence_extensions and match(name) is not None:
+                append(frame)
+            else:
+                append(media)
+        return kinds
+
+    def select(self, names: Iterable[str]) -> List[str]:
+        """The names in a batch that are media (MEDIA or FRAME), in order."""
+        table_get = self._table.get
+        selected: List[str] = []
+        append = selected.append
+
+        for name in names:
+            dot = name.rfind(".")
+            if dot <= 0:
+                continue
+            suffix = name[dot + 1:]
+            if table_get(suffix) is not None or (suffix and table_get(suffix.lower()) is not None):
+                append(name)
+        return selected
+
+    def classify_file(self, path: str) -> MediaKind:
+        """
+        Classify a file by name, then (with sniff=True) by content.
+
+        The sniff only runs for names the extension test rejects. A sniffed
+        file is MEDIA, never FRAME: sequence patterns are name-based.
+        """
+        kind = self.classify(path.rsplit("/", 1)[-1])
+        if kind is not MediaKind.NONE or not self.sniff:
+            return kind
+        try:
+            sniffed = sniff_media(path)
+        except OSError:
+            return MediaKind.NONE
+        return MediaKind.MEDIA if sniffed in self.media_extensions else MediaKind.NONE
+
+
+_media_classifier: Optional[MediaClassifier] = None
+_watch_folder_classifiers: Dict[bool, MediaClassifier] = {}
+
+
+def get_media_classifier() -> MediaClassifier:
+    """Classifier used by browse and enumeration (MEDIA_EXTENSIONS)."""
+    global _media_classifier
+    if _media_classifier is None:
+        _media_classifier = MediaClassifier(MEDIA_EXTENSIONS, SEQUENCE_EXTENSIONS)
+    return _media_classifier
+
+
+def get_watch_folder_classifier(detect_sequences: bool = False) -> MediaClassifier:
+    """
+    Classifier used by watch folder scanning.
+
+    Watch folders only pick up video containers; image frames are added
+    when sequence detection is on.
+    """
+    classifier = _watch_folder_classifiers.get(detect_sequences)
+    if classifier is None:
+        classifier = _watch_folder_classifiers[detect_sequences] = MediaClassifier(
+            WATCH_FOLDER_EXTENSIONS,
+            SEQUENCE_EXTENSIONS if detect_sequences else (),
+        )
+    return classifier
@@ -0,0 +1,270 @@
+"""
+Streaming media enumeration with incremental image sequence grouping.
+
+Replaces the os.walk + Path-per-file + regex-per-path approach used by
+"Create Job from Folder":
+
+- Directories are read with os.scandir; directory-ness comes from d_type,
+  so no stat is issued for regular entries.
+- Extension filtering runs on the raw name through the shared
+  MediaClassifier (see classifier.py) BEFORE any Path object is built or
+  the sequence regex is run.
+- Sequence grouping is per directory: a frame sequence can only span one
+  directory, so a directory's groups are final once it has been read and
+  can be emitted straight away.
+- Each group keeps only its merged frame ranges (FrameRanges), never a
+  per-frame list, so a 500k-frame EXR plate with no gaps costs one range.
+
+iter_media() yields results as directories complete and can report
+progress for very large folders.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from .classifier import SEQUENCE_PATTERN, MediaClassifier
+
+# Progress is reported every this many directory entries
+PROGRESS_EVERY_ENTRIES = 10_000
+
+
+class FrameRanges:
+    """
+    Set of frame numbers stored as merged [first, last] ranges.
+
+    Frames may be added in any order (scandir order is arbitrary); adjacent
+    ranges are merged in O(1) per frame using start/end indexes.
+    """
+
+    __slots__ = ("_by_start", "_by_end", "count")
+
+    def __init__(self):
+        self._by_start: Dict[int, int] = {}  # first -> last
+        self._by_end: Dict[int, int] = {}  # last -> first
+        self.count = 0
+
+    def add(self, frame: int) -> None:
+        self.count += 1
+        first = self._by_end.pop(frame - 1, None)
+        last = self._by_start.pop(frame + 1, None)
+        if first is not None:
+            del self._by_start[first]
+        else:
+            first = frame
+        if last is not None:
+            del self._by_end[last]
+        else:
+            last = frame
+        self._by_start[first] = last
+        self._by_end[last] = first
+
+    def ranges(self) -> List[Tuple[int, int]]:
+        """Inclusive (first, last) ranges in frame order."""
+        return sorted(self._by_start.items())
+
+    @property
+    def first(self) -> int:
+        return min(self._by_start)
+
+    @property
+    def last(self) -> int:
+        return max(self._by_end)
+
+    def gaps(self) -> List[Tuple[int, int]]:
+        """Inclusive (first, last) ranges of missing frames between first and last."""
+        ranges = self.ranges()
+        return [
+            (previous_last + 1, next_first - 1)
+            for (_, previous_last), (next_first, _) in zip(ranges, ranges[1:])
+        ]
+
+
+@dataclass
+class SequenceGroup:
+    """A numbered image sequence found in one directory."""
+
+    directory: str
+    base_name: str
+    separator: str
+    extension: str
+    padding: int
+    frames: FrameRanges = field(default_factory=FrameRanges)
+    # One real filename, used if the group turns out to be a single frame
+    sample_name: str = ""
+
+    @property
+    def pattern(self) -> str:
+        """FFmpeg-compatible pattern path, e.g. /path/clip.%06d.exr"""
+        return os.path.join(
+            self.directory,
+            f"{self.base_name}{self.separator}%0{self.padding}d.{self.extension}",
+        )
+
+    def frame_path(self, frame: int) -> str:
+        return os.path.join(
+            self.directory,
+            f"{self.base_name}{self.separator}{frame:0{self.padding}d}.{self.extension}",
+        )
+
+
+def frame_pattern(directory: str, name: str) -> Optional[str]:
+    """Pattern path of the sequence a numbered frame name would belong to."""
+    match = SEQUENCE_PATTERN.match(name)
+    if match is None:
+        return None
+    base_name, separator, frame_str, extension = match.groups()
+    return os.path.join(directory, f"{base_name}{separator}%0{len(frame_str)}d.{extension}")
+
+
+class SequenceGrouper:
+    """
+    Groups the names of ONE directory into sequences and standalone files.
+
+    add() is called per candidate name; finish() returns the sequences
+    (2+ frames) and the names that are not part of any sequence.
+    """
+
+    def __init__(self, directory: str, sequence_extensions: FrozenSet[str]):
+        self.directory = directory
+        self.sequence_extensions = sequence_extensions
+        self._groups: Dict[Tuple[str, str, str, int], SequenceGroup] = {}
+        self._standalone: List[str] = []
+
+    def add(self, name: str, ext: str) -> None:
+        """Add a name whose lowercase extension (without dot) is ext."""
+        if ext not in self.sequence_extensions:
+            self._standalone.append(name)
+            return
+
+        match = SEQUENCE_PATTERN.match(name)
+        if match is None:
+            self._standalone.append(name)
+            return
+
+        base_name, separator, frame_str, extension = match.groups()
+        key = (base_name, separator, extension, len(frame_str))
+        group = self._groups.get(key)
+        if group is None:
+            group = SequenceGroup(
+                directory=self.directory,
+                base_name=base_name,
+                separator=separator,
+                extension=extension,
+                padding=len(frame_str),
+                sample_name=name,
+            )
+            self._groups[key] = group
+        group.frames.add(int(frame_str))
+
+    def finish(self) -> Tuple[List[SequenceGroup], List[str]]:
+        """Return (sequences, standalone names); single frames count as standalone."""
+        sequences = []
+        standalone = self._standalone
+        for group in self._groups.values():
+            if group.frames.count < 2:
+                standalone.append(group.sample_name)
+            else:
+                sequences.append(group)
+        return sequences, standalone
+
+
+@dataclass(frozen=True)
+class EnumerationProgress:
+    """Running totals reported during enumeration."""
+
+    directories: int
+    entries: int
+    files: int
+    sequences: int
+
+
+def iter_media(
+    root: str,
+    classifier: MediaClassifier,
+    recursive: bool = True,
+    detect_sequences: bool = True,
+    include_hidden: bool = False,
+    progress: Optional[Callable[[EnumerationProgress], None]] = None,
+    progress_every: int = PROGRESS_EVERY_ENTRIES,
+) -> Iterator[Union[str, SequenceGroup]]:
+    """
+    Enumerate media under root, yielding results as each directory completes.
+
+    Args:
+        root: Directory to enumerate (absolute)
+        classifier: Accepted media; its sequence extensions are grouped
+            into sequences when numbered
+        recursive: Descend into subdirectories (symlinked dirs are not followed)
+        detect_sequences: Group numbered frames into SequenceGroup results
+        include_hidden: Include dot-files (hidden directories are always walked,
+            matching the previous os.walk behaviour)
+        progress: Called every progress_every entries and once at the end
+        progress_every: Entries between progress callbacks
+
+    Yields:
+        Absolute file paths (str) and SequenceGroup objects
+
+    Raises:
+        OSError: If root itself cannot be read (subdirectory errors are skipped)
+    """
+    extension = classifier.extension
+    sequence_extensions = classifier.sequence_extensions
+    directories = entries = files = sequences = 0
+    next_report = progress_every
+    stack = [root]
+
+    while stack:
+        directory = stack.pop()
+        grouper = SequenceGrouper(directory, sequence_extensions) if detect_sequences else None
+        found: List[str] = []
+
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            if directory == root:
+                raise
+            continue
+
+        with it:
+            for entry in it:
+                entries += 1
+                # Before any skip, so directories of non-media still report progress
+                if progress is not None and entries >= next_report:
+                    next_report = entries + progress_every
+                    progress(EnumerationProgress(directories, entries, files, sequences))
+                name = entry.name
+
+                try:
+                    if entry.is_dir():
+                        # Matches os.walk(followlinks=False)
+                        if recursive and not entry.is_symlink():
+                            stack.append(entry.path)
+                        continue
+
+                    if not include_hidden and name.startswith("."):
+                        continue
+
+                    ext = extension(name)
+                    if ext is None or not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                if grouper is not None:
+                    grouper.add(name, ext)
+                else:
+                    found.append(name)
+
+        directories += 1
+        if grouper is not None:
+            dir_sequences, found = grouper.finish()
+            sequences += len(dir_sequences)
+            yield from dir_sequences
+
+        files += len(found)
+        for name in found:
+            yield os.path.join(directory, name)
+
+    if progress is not None:
+        progress(EnumerationProgress(directories, entries, files, sequences))
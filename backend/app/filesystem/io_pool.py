@@ -0,0 +1,298 @@
+"""
+Per-mount filesystem I/O executors with circuit breakers.
+
+asyncio.wait_for() around run_in_executor() stops WAITING on a hung
+network share, but the worker thread stays blocked in the syscall. With
+one shared pool, a few timeouts on one share exhaust it for every user.
+
+FilesystemIOPool gives each mount (looked up lexically, see mounts.py)
+its own small executor, so a hung share can only block its own workers:
+
+- A worker whose caller timed out is counted as stuck until its call
+  finally returns; both transitions are recorded in the browse log.
+- Per-mount circuit breaker: after FAILURE_THRESHOLD consecutive timeouts,
+  or once every worker of the mount is stuck, the circuit opens and new
+  calls fail immediately with MountUnavailableError. After
+  RESET_TIMEOUT_SECONDS one trial call is let through (half-open); its
+  success closes the circuit, a timeout re-opens it.
+- A call still queued when its caller times out is cancelled, never run,
+  and does not count as a failure (the mount is busy, not hung).
+
+MountUnavailableError subclasses OSError, so existing OSError handling
+in callers reports it as an I/O error.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..observability.browse_log import get_browse_log
+from .mounts import mount_point_for
+
+logger = logging.getLogger(__name__)
+
+# Worker threads per mount
+WORKERS_PER_MOUNT = 4
+
+# Consecutive timeouts that open a mount's circuit
+FAILURE_THRESHOLD = 2
+
+# Seconds an open circuit waits before letting a trial call through
+RESET_TIMEOUT_SECONDS = 30.0
+
+
+class MountUnavailableError(OSError):
+    """I/O to a mount was rejected because its circuit is open."""
+
+    def __init__(self, mount_point: str, reason: str):
+        super().__init__(f"Volume is not responding: {mount_point} ({reason})")
+        self.mount_point = mount_point
+        self.reason = reason
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state of one mount."""
+
+    CLOSED = "closed"  # Calls accepted
+    OPEN = "open"  # Calls rejected
+    HALF_OPEN = "half_open"  # One trial call in flight
+
+
+@dataclass(frozen=True)
+class MountIOStats:
+    """Snapshot of one mount's executor and circuit."""
+
+    mount_point: str
+    state: CircuitState
+    workers: int
+    in_flight: int
+    stuck_workers: int
+    oldest_stuck_seconds: Optional[float]
+    consecutive_timeouts: int
+    total_timeouts: int
+    rejected: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mount_point": self.mount_point,
+            "state": self.state.value,
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "stuck_workers": self.stuck_workers,
+            "oldest_stuck_seconds": self.oldest_stuck_seconds,
+            "consecutive_timeouts": self.consecutive_timeouts,
+            "total_timeouts": self.total_timeouts,
+            "rejected": self.rejected,
+        }
+
+
+@dataclass
+class _MountIO:
+    """Executor and circuit state of one mount (guarded by the pool lock)."""
+
+    mount_point: str
+    executor: ThreadPoolExecutor
+    in_flight: int = 0
+    stuck: Dict[Future, float] = field(default_factory=dict)  # -> monotonic time it got stuck
+    state: CircuitState = CircuitState.CLOSED
+    opened_at: float = 0.0
+    trial: Optional[Future] = None
+    consecutive_timeouts: int = 0
+    total_timeouts: int = 0
+    rejected: int = 0
+
+
+class _MountExecutor(Executor):
+    """Executor facade that routes submissions through the pool for one path."""
+
+    def __init__(self, pool: "FilesystemIOPool", path: str):
+        self._pool = pool
+        self._path = path
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        return self._pool.submit(self._path, fn, *args, **kwargs)
+
+
+class FilesystemIOPool:
+    """
+    Per-mount bounded executors for blocking filesystem calls.
+
+    Thread-safe. Executors are created on first use of a mount.
+    """
+
+    def __init__(
+        self,
+        workers_per_mount: int = WORKERS_PER_MOUNT,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reset_timeout_seconds: float = RESET_TIMEOUT_SECONDS,
+        mount_lookup: Callable[[str], str] = mount_point_for,
+    ):
+        self.workers_per_mount = workers_per_mount
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._mount_lookup = mount_lookup
+        self._lock = threading.Lock()
+        self._mounts: Dict[str, _MountIO] = {}
+
+    def _mount(self, path: str) -> _MountIO:
+        mount_point = self._mount_lookup(path)
+        mount = self._mounts.get(mount_point)
+        if mount is None:
+            executor = ThreadPoolExecutor(
+                max_workers=self.workers_per_mount,
+                thread_name_prefix=f"fs_io[{mount_point}]",
+            )
+            mount = self._mounts[mount_point] = _MountIO(mount_point=mount_point, executor=executor)
+        return mount
+
+    def executor_for(self, path: str) -> Executor:
+        """Executor for long-running work on path's mount (e.g. browse session scans)."""
+        return _MountExecutor(self, path)
+
+    def submit(self, path: str, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Submit a blocking call to the executor of path's mount.
+
+        Raises:
+            MountUnavailableError: If the mount's circuit is open
+        """
+        return self._submit(path, fn, *args, **kwargs)[1]
+
+    async def run(self, path: str, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """
+        Run a blocking call on path's mount executor and await it.
+
+        Raises:
+            MountUnavailableError: If the mount's circuit is open
+            asyncio.TimeoutError: If the call does not finish within timeout
+                (a running call is then accounted as a stuck worker)
+        """
+        mount, future = self._submit(path, fn, *args)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._on_timeout(mount, future, path)
+            raise
+
+    def _submit(self, path: str, fn: Callable, *args, **kwargs) -> Tuple[_MountIO, Future]:
+        with self._lock:
+            mount = self._mount(path)
+            trial = self._admit(mount)
+            future = mount.executor.submit(fn, *args, **kwargs)
+            mount.in_flight += 1
+            if trial:
+                mount.trial = future
+        future.add_done_callback(lambda done: self._on_done(mount, done))
+        return mount, future
+
+    # ------------------------------------------------------------------
+    # Circuit transitions
+    # ------------------------------------------------------------------
+
+    def _admit(self, mount: _MountIO) -> bool:
+        """Admission check under the lock; returns True for a half-open trial call."""
+        if mount.state == CircuitState.CLOSED and len(mount.stuck) >= self.workers_per_mount:
+            self._open(mount, f"all {self.workers_per_mount} workers stuck")
+
+        if mount.state == CircuitState.OPEN:
+            if time.monotonic() - mount.opened_at < self.reset_timeout_seconds:
+                mount.rejected += 1
+                raise MountUnavailableError(mount.mount_point, "circuit open")
+            if len(mount.stuck) >= self.workers_per_mount:
+                # A trial call could not even start
+                mount.rejected += 1
+                raise MountUnavailableError(mount.mount_point, "all workers stuck")
+            mount.state = CircuitState.HALF_OPEN
+            return True
+
+        if mount.state == CircuitState.HALF_OPEN:
+            if mount.trial is not None and not mount.trial.done():
+                mount.rejected += 1
+                raise MountUnavailableError(mount.mount_point, "recovery check in progress")
+            return True
+
+        return False
+
+    def _open(self, mount: _MountIO, reason: str) -> None:
+        mount.state = CircuitState.OPEN
+        mount.opened_at = time.monotonic()
+        mount.trial = None
+        logger.warning(f"Filesystem I/O circuit opened for {mount.mount_point}: {reason}")
+        get_browse_log().record_circuit_change(mount.mount_point, opened=True, reason=reason)
+
+    def _close(self, mount: _MountIO, reason: str) -> None:
+        mount.state = CircuitState.CLOSED
+        mount.trial = None
+        logger.info(f"Filesystem I/O circuit closed for {mount.mount_point}: {reason}")
+        get_browse_log().record_circuit_change(mount.mount_point, opened=False, reason=reason)
+
+    def _on_timeout(self, mount: _MountIO, future: Future, path: str) -> None:
+        with self._lock:
+            mount.total_timeouts += 1
+            # wait_for cancels the call; that only fails once it is running.
+            # A call that timed out in the queue means busy workers, not a
+            # dead mount, so it does not count towards opening the circuit.
+            if future.cancelled() or future.done():
+                return
+            mount.stuck[future] = time.monotonic()
+            mount.consecutive_timeouts += 1
+            stuck_workers = len(mount.stuck)
+            if mount.state == CircuitState.HALF_OPEN:
+                self._open(mount, "recovery check timed out")
+            elif mount.state == CircuitState.CLOSED and mount.consecutive_timeouts >= self.failure_threshold:
+                self._open(mount, f"{mount.consecutive_timeouts} consecutive timeouts")
+        get_browse_log().record_worker_stuck(path, mount.mount_point, stuck_workers)
+
+    def _on_done(self, mount: _MountIO, future: Future) -> None:
+        released = None
+        with self._lock:
+            mount.in_flight -= 1
+            stuck_since = mount.stuck.pop(future, None)
+            if stuck_since is not None:
+                released = (time.monotonic() - stuck_since, len(mount.stuck))
+            if stuck_since is None and not future.cancelled():
+                # Finished within its caller's timeout (or had none)
+                mount.consecutive_timeouts = 0
+                if mount.trial is future and mount.state == CircuitState.HALF_OPEN:
+                    self._close(mount, "recovery check succeeded")
+        if released is not None:
+            get_browse_log().record_worker_released(mount.mount_point, *released)
+
+    # ------------------------------------------------------------------
+    # Accounting
+    # ------------------------------------------------------------------
+
+    def stats(self) -> List[MountIOStats]:
+        """Per-mount executor and circuit state."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                MountIOStats(
+                    mount_point=mount.mount_point,
+                    state=mount.state,
+                    workers=self.workers_per_mount,
+                    in_flight=mount.in_flight,
+                    stuck_workers=len(mount.stuck),
+                    oldest_stuck_seconds=(now - min(mount.stuck.values())) if mount.stuck else None,
+                    consecutive_timeouts=mount.consecutive_timeouts,
+                    total_timeouts=mount.total_timeouts,
+                    rejected=mount.rejected,
+                )
+                for mount in sorted(self._mounts.values(), key=lambda m: m.mount_point)
+            ]
+
+
+_io_pool: Optional[FilesystemIOPool] = None
+
+
+def get_io_pool() -> FilesystemIOPool:
+    """Get the process-wide filesystem I/O pool."""
+    global _io_pool
+    if _io_pool is None:
+        _io_pool = FilesystemIOPool()
+    return _io_pool
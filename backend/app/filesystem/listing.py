@@ -0,0 +1,309 @@
+"""
+Directory listing engine.
+
+Built on os.scandir so that directory-ness comes from the d_type returned by
+getdents (no syscall), and at most ONE stat per kept entry is issued. The
+stat result is reused for size, file type and readability, replacing the
+previous os.access + is_dir + is_file + stat sequence per entry.
+
+Filtering (hidden names, media extensions) is applied to raw names BEFORE
+any stat, so non-media files in a media-only listing cost nothing beyond
+the directory read itself.
+
+Listings are cached per (directory, options) and validated against the
+directory's st_mtime_ns. Adding, removing or renaming an entry bumps the
+directory mtime, so a repeat browse of an unchanged folder costs a single
+stat of the directory.
+
+Limitation: a file growing in place does not change its directory's mtime,
+so its cached size may lag until the directory itself changes.
+"""
+
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, Iterator, Optional, Tuple
+
+# Maximum number of directory listings kept in memory
+MAX_CACHED_DIRECTORIES = 256
+
+# Directories modified within this window are not cached: filesystems with
+# coarse mtime granularity (SMB, FAT, some NFS servers) could otherwise hide
+# a change made in the same tick as the scan.
+MTIME_GRACE_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class ListingEntry:
+    """A single directory entry, as seen by one scan."""
+    
+    name: str
+    path: str
+    is_dir: bool
+    size: Optional[int] = None  # Files only
+    extension: Optional[str] = None  # Lowercase, without dot (files only)
+
+
+@dataclass(frozen=True)
+class DirectoryListing:
+    """Immutable result of scanning one directory."""
+    
+    path: str
+    mtime_ns: int
+    entries: Tuple[ListingEntry, ...]  # Sorted: directories first, then files
+    
+    @property
+    def dir_count(self) -> int:
+        return sum(1 for e in self.entries if e.is_dir)
+    
+    @property
+    def file_count(self) -> int:
+        return sum(1 for e in self.entries if not e.is_dir)
+
+
+def _effective_ids() -> Tuple[Optional[int], FrozenSet[int]]:
+    """Effective uid and group set of this process (None uid on Windows)."""
+    if not hasattr(os, "geteuid"):
+        return None, frozenset()
+    return os.geteuid(), frozenset(os.getgroups()) | {os.getegid()}
+
+
+_EUID, _GROUPS = _effective_ids()
+
+
+def _is_readable(st: os.stat_result) -> bool:
+    """
+    Approximate os.access(R_OK) from an existing stat result.
+    
+    Uses permission bits only (no ACLs), which avoids a syscall per entry.
+    """
+    if _EUID is None or _EUID == 0:
+        return True
+    if st.st_uid == _EUID:
+        return bool(st.st_mode & stat.S_IRUSR)
+    if st.st_gid in _GROUPS:
+        return bool(st.st_mode & stat.S_IRGRP)
+    return bool(st.st_mode & stat.S_IROTH)
+
+
+def _extension(name: str) -> Optional[str]:
+    """Lowercase extension without dot, matching Path.suffix semantics."""
+    dot = name.rfind(".")
+    if dot <= 0:
+        return None
+    return name[dot + 1:].lower() or None
+
+
+def iter_directory(
+    directory: str,
+    include_hidden: bool = False,
+    media_extensions: Optional[FrozenSet[str]] = None,
+) -> Iterator[ListingEntry]:
+    """
+    Yield entries of a directory in scan (getdents) order.
+    
+    Args:
+        directory: Directory to scan
+        include_hidden: Include dot-files and dot-folders
+        media_extensions: If given, only files with these extensions are
+            yielded (directories are always yielded)
+        
+    Raises:
+        PermissionError: If the directory cannot be read
+        OSError: For other filesystem errors
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            if not include_hidden and name.startswith("."):
+                continue
+            
+            try:
+                # d_type answers this without a syscall (except for symlinks)
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            
+            ext = None
+            if not is_dir:
+                ext = _extension(name)
+                if media_extensions is not None and ext not in media_extensions:
+                    continue
+            
+            try:
+                # Single stat per kept entry; follows symlinks like Path.stat()
+                st = entry.stat()
+            except OSError:
+                continue
+            
+            if not is_dir and not stat.S_ISREG(st.st_mode):
+                continue
+            if not _is_readable(st):
+                continue
+            
+            yield ListingEntry(
+                name=name,
+                path=entry.path,
+                is_dir=is_dir,
+                size=None if is_dir else st.st_size,
+                extension=ext,
+            )
+
+
+def sort_entries(entries: Iterable[ListingEntry]) -> Tuple[ListingEntry, ...]:
+    """Sort entries directories first, then case-insensitively by name."""
+    return tuple(sorted(entries, key=lambda e: (not e.is_dir, e.name.lower())))
+
+
+def scan_directory(
+    directory: str,
+    include_hidden: bool = False,
+    media_extensions: Optional[FrozenSet[str]] = None,
+    mtime_ns: Optional[int] = None,
+) -> DirectoryListing:
+    """
+    Scan a directory with os.scandir.
+    
+    Args:
+        directory: Directory to scan
+        include_hidden: Include dot-files and dot-folders
+        media_extensions: If given, only files with these extensions are
+            kept (directories are always kept)
+        mtime_ns: Directory mtime if already known (avoids a stat)
+        
+    Returns:
+        DirectoryListing with entries sorted directories first, then files
+        
+    Raises:
+        PermissionError: If the directory cannot be read
+        OSError: For other filesystem errors
+    """
+    if mtime_ns is None:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    
+    entries = iter_directory(directory, include_hidden, media_extensions)
+    return DirectoryListing(path=directory, mtime_ns=mtime_ns, entries=sort_entries(entries))
+
+
+class DirectoryListingCache:
+    """
+    LRU cache of directory listings validated by directory mtime.
+    
+    Thread-safe: listings are produced in filesystem executor threads.
+    """
+    
+    def __init__(self, max_directories: int = MAX_CACHED_DIRECTORIES):
+        self._max_directories = max_directories
+        self._listings: "OrderedDict[tuple, DirectoryListing]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def list_directory(
+        self,
+        directory: str,
+        include_hidden: bool = False,
+        media_extensions: Optional[FrozenSet[str]] = None,
+    ) -> DirectoryListing:
+        """
+        Return a listing for directory, rescanning only if it changed.
+        
+        Raises:
+            PermissionError: If the directory cannot be read
+            OSError: For other filesystem errors
+        """
+        dir_stat = os.stat(directory)
+        
+        cached = self._lookup(directory, include_hidden, media_extensions, dir_stat.st_mtime_ns)
+        if cached is not None:
+            return cached
+        
+        listing = scan_directory(
+            directory,
+            include_hidden=include_hidden,
+            media_extensions=media_extensions,
+            mtime_ns=dir_stat.st_mtime_ns,
+        )
+        self.store(listing, include_hidden, media_extensions, dir_mtime=dir_stat.st_mtime)
+        
+        return listing
+    
+    def get_fresh(
+        self,
+        directory: str,
+        include_hidden: bool = False,
+        media_extensions: Optional[FrozenSet[str]] = None,
+    ) -> Optional[DirectoryListing]:
+        """
+        Return the cached listing if the directory is unchanged, else None.
+        
+        Raises:
+            OSError: If the directory cannot be stat'ed
+        """
+        mtime_ns = os.stat(directory).st_mtime_ns
+        return self._lookup(directory, include_hidden, media_extensions, mtime_ns)
+    
+    def store(
+        self,
+        listing: DirectoryListing,
+        include_hidden: bool = False,
+        media_extensions: Optional[FrozenSet[str]] = None,
+        dir_mtime: Optional[float] = None,
+    ) -> None:
+        """Store a complete listing (skipped if the directory is too fresh)."""
+        if dir_mtime is None:
+            dir_mtime = listing.mtime_ns / 1e9
+        if time.time() - dir_mtime < MTIME_GRACE_SECONDS:
+            return
+        
+        key = (listing.path, include_hidden, media_extensions)
+        with self._lock:
+            self._listings[key] = listing
+            self._listings.move_to_end(key)
+            while len(self._listings) > self._max_directories:
+                self._listings.popitem(last=False)
+    
+    def _lookup(
+        self,
+        directory: str,
+        include_hidden: bool,
+        media_extensions: Optional[FrozenSet[str]],
+        mtime_ns: int,
+    ) -> Optional[DirectoryListing]:
+        key = (directory, include_hidden, media_extensions)
+        with self._lock:
+            cached = self._listings.get(key)
+            if cached is not None and cached.mtime_ns == mtime_ns:
+                self._listings.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+            return None
+    
+    def invalidate(self, directory: Optional[str] = None) -> None:
+        """Drop cached listings for one directory, or all if None."""
+        with self._lock:
+            if directory is None:
+                self._listings.clear()
+                return
+            for key in [k for k in self._listings if k[0] == directory]:
+                del self._listings[key]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._listings)
+
+
+# Process-wide listing cache
+_listing_cache: Optional[DirectoryListingCache] = None
+
+
+def get_listing_cache() -> DirectoryListingCache:
+    """Get the process-wide directory listing cache."""
+    global _listing_cache
+    if _listing_cache is None:
+        _listing_cache = DirectoryListingCache()
+    return _listing_cache
@@ -0,0 +1,339 @@
+"""
+Mount health monitoring and cached filesystem roots.
+
+/filesystem/roots used to list /Volumes and check each volume on every
+request, so one stale network mount could hold an executor worker for the
+full timeout. MountHealthMonitor moves that work to a background thread:
+
+- The mount table comes from /proc/self/mountinfo (Linux). Without it
+  (macOS) the /Volumes entries are the candidates, listed under a timeout.
+- Each candidate root is probed (statvfs) in a dedicated probe executor
+  with a per-probe timeout. A probe that never returns leaves its mount
+  DEAD and is not resubmitted until it does, so a hung mount costs at most
+  one probe thread.
+- The resulting roots list and per-mount status are kept in memory:
+  roots() and is_dead() do no I/O.
+
+Browse and enumerate consult is_dead() BEFORE touching a path (path
+resolution alone would block on a hung mount), and report timeouts back
+so a mount that stops responding is short-circuited immediately.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .mounts import MOUNTINFO_PATH, MountInfo, read_mounts
+
+logger = logging.getLogger(__name__)
+
+# Seconds between health checks
+MOUNT_CHECK_INTERVAL_SECONDS = 10.0
+
+# A probe taking longer than this marks the mount DEAD
+MOUNT_PROBE_TIMEOUT_SECONDS = 2.0
+
+# A probe taking longer than this marks the mount SLOW (still usable)
+MOUNT_SLOW_SECONDS = 0.5
+
+# Mounts below these directories are offered as roots
+ROOT_MOUNT_PREFIXES = ("/Volumes", "/mnt", "/media", "/run/media")
+
+# Network filesystems are offered as roots wherever they are mounted
+NETWORK_FS_TYPES = frozenset({
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "afpfs", "9p", "ceph", "lustre",
+    "glusterfs", "fuse.glusterfs", "fuse.sshfs", "sshfs", "davfs", "fuse.rclone",
+})
+
+# System trees never offered as roots (matches routes/filesystem.py)
+_SYSTEM_PREFIXES = ("/proc", "/sys", "/dev", "/run", "/boot", "/usr", "/etc", "/var", "/snap")
+
+# Probes run here, never on the monitor thread (a hung statvfs cannot be interrupted)
+_probe_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mount_probe")
+
+
+class MountState(str, Enum):
+    """Health of a monitored mount."""
+
+    OK = "ok"
+    SLOW = "slow"
+    DEAD = "dead"
+    UNKNOWN = "unknown"
+
+
+@dataclass(frozen=True)
+class MountStatus:
+    """Last known health of one monitored mount."""
+
+    mount_point: str
+    fs_type: str
+    source: str
+    state: MountState
+    latency_ms: Optional[float] = None
+    error: Optional[str] = None
+    checked_at: Optional[float] = None  # Wall-clock time of the last check
+    consecutive_failures: int = 0
+
+    @property
+    def is_network(self) -> bool:
+        return self.fs_type in NETWORK_FS_TYPES
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "mount_point": self.mount_point,
+            "fs_type": self.fs_type,
+            "source": self.source,
+            "is_network": self.is_network,
+            "state": self.state.value,
+            "latency_ms": self.latency_ms,
+            "error": self.error,
+            "checked_at": self.checked_at,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+@dataclass(frozen=True)
+class RootEntry:
+    """A navigable root (name shown in the UI, absolute path)."""
+
+    name: str
+    path: str
+
+
+def _probe(mount_point: str) -> float:
+    """statvfs + readability check; returns elapsed seconds (raises OSError)."""
+    started = time.monotonic()
+    os.statvfs(mount_point)
+    if not os.access(mount_point, os.R_OK):
+        raise PermissionError(f"Not readable: {mount_point}")
+    return time.monotonic() - started
+
+
+class MountHealthMonitor:
+    """
+    Background mount health checks with an in-memory roots cache.
+
+    Thread-safe. start() launches the monitor thread; refresh() runs one
+    check synchronously (bounded by the probe timeout).
+    """
+
+    def __init__(
+        self,
+        mountinfo_path: str = MOUNTINFO_PATH,
+        interval_seconds: float = MOUNT_CHECK_INTERVAL_SECONDS,
+        probe_timeout_seconds: float = MOUNT_PROBE_TIMEOUT_SECONDS,
+        volumes_path: str = "/Volumes",
+        home: Optional[str] = None,
+    ):
+        self.mountinfo_path = mountinfo_path
+        self.interval_seconds = interval_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self.volumes_path = volumes_path
+        self.home = home
+
+        self._lock = threading.Lock()
+        self._statuses: Dict[str, MountStatus] = {}
+        self._roots: Tuple[RootEntry, ...] = ()
+        self._probes: Dict[str, Future] = {}  # In flight, possibly hung
+        self._refreshed_at: Optional[float] = None
+        self._refresh_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background monitor thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="mount_health", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Mount health check failed: {e}")
+            self._wake.wait(self.interval_seconds)
+            self._wake.clear()
+
+    # ------------------------------------------------------------------
+    # Queries (memory only)
+    # ------------------------------------------------------------------
+
+    @property
+    def has_snapshot(self) -> bool:
+        return self._refreshed_at is not None
+
+    def roots(self) -> List[RootEntry]:
+        """Available roots from the last check, sorted by name."""
+        return list(self._roots)
+
+    def statuses(self) -> List[MountStatus]:
+        with self._lock:
+            return sorted(self._statuses.values(), key=lambda status: status.mount_point)
+
+    def status_for(self, path: str) -> Optional[MountStatus]:
+        """Status of the monitored mount containing path (lexical, no I/O)."""
+        normalized = os.path.normpath(os.path.abspath(path))
+        with self._lock:
+            best: Optional[MountStatus] = None
+            for mount_point, status in self._statuses.items():
+                if normalized == mount_point or normalized.startswith(mount_point.rstrip(os.sep) + os.sep):
+                    if best is None or len(mount_point) > len(best.mount_point):
+                        best = status
+            return best
+
+    def is_dead(self, path: str) -> bool:
+        """True if path lies on a monitored mount known not to respond."""
+        status = self.status_for(path)
+        return status is not None and status.state == MountState.DEAD
+
+    def report_timeout(self, path: str) -> None:
+        """
+        Record that an operation under path timed out.
+
+        The containing monitored mount is marked DEAD until a probe succeeds,
+        and a re-check is scheduled right away.
+        """
+        status = self.status_for(path)
+        if status is None or status.state == MountState.DEAD:
+            return
+        with self._lock:
+            self._statuses[status.mount_point] = MountStatus(
+                mount_point=status.mount_point,
+                fs_type=status.fs_type,
+                source=status.source,
+                state=MountState.DEAD,
+                error=f"Operation timed out under {path}",
+                checked_at=time.time(),
+                consecutive_failures=status.consecutive_failures + 1,
+            )
+            self._roots = tuple(root for root in self._roots if root.path != status.mount_point)
+        logger.warning(f"Mount {status.mount_point} marked unavailable after a timeout")
+        self._wake.set()
+
+    # ------------------------------------------------------------------
+    # Checking
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Run one health check of all candidate roots and rebuild the cache."""
+        with self._refresh_lock:
+            candidates = self._candidates()
+            for mount in candidates:
+                previous = self._probes.get(mount.mount_point)
+                if previous is None or previous.done():
+                    self._probes[mount.mount_point] = _probe_executor.submit(_probe, mount.mount_point)
+
+            deadline = time.monotonic() + self.probe_timeout_seconds
+            statuses: Dict[str, MountStatus] = {}
+            for mount in candidates:
+                statuses[mount.mount_point] = self._collect(mount, deadline)
+
+            # Forget probes of mounts that went away (unless still hung)
+            for mount_point in list(self._probes):
+                if mount_point not in statuses and self._probes[mount_point].done():
+                    del self._probes[mount_point]
+
+            roots = [
+                RootEntry(name=os.path.basename(mount_point) or mount_point, path=mount_point)
+                for mount_point, status in statuses.items()
+                if status.state in (MountState.OK, MountState.SLOW)
+            ]
+            home = self.home or str(Path.home())
+            if os.path.isdir(home):
+                roots.append(RootEntry(name=f"Home ({os.path.basename(home)})", path=home))
+            roots.sort(key=lambda root: root.name.lower())
+
+            with self._lock:
+                self._statuses = statuses
+                self._roots = tuple(roots)
+                self._refreshed_at = time.monotonic()
+
+    def _collect(self, mount: MountInfo, deadline: float) -> MountStatus:
+        previous = self._statuses.get(mount.mount_point)
+        failures = previous.consecutive_failures if previous is not None else 0
+        future = self._probes[mount.mount_point]
+        try:
+            elapsed = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            return MountStatus(
+                mount_point=mount.mount_point, fs_type=mount.fs_type, source=mount.source,
+                state=MountState.DEAD, error=f"No response within {self.probe_timeout_seconds}s",
+                checked_at=time.time(), consecutive_failures=failures + 1,
+            )
+        except OSError as e:
+            return MountStatus(
+                mount_point=mount.mount_point, fs_type=mount.fs_type, source=mount.source,
+                state=MountState.DEAD, error=str(e),
+                checked_at=time.time(), consecutive_failures=failures + 1,
+            )
+        return MountStatus(
+            mount_point=mount.mount_point, fs_type=mount.fs_type, source=mount.source,
+            state=MountState.SLOW if elapsed > MOUNT_SLOW_SECONDS else MountState.OK,
+            latency_ms=round(elapsed * 1000, 3), checked_at=time.time(),
+        )
+
+    def _candidates(self) -> List[MountInfo]:
+        """Mounts offered as roots."""
+        mounts = read_mounts(self.mountinfo_path)
+        if not mounts:
+            return self._volume_candidates()
+
+        candidates = {}
+        for mount in mounts:
+            mount_point = mount.mount_point
+            under_root_prefix = any(
+                mount_point.startswith(prefix + os.sep) for prefix in ROOT_MOUNT_PREFIXES
+            )
+            if not under_root_prefix and (mount_point == "/" or mount_point.startswith(_SYSTEM_PREFIXES)):
+                continue
+            if under_root_prefix or mount.fs_type in NETWORK_FS_TYPES:
+                # Later entries over-mount earlier ones
+                candidates[mount_point] = mount
+        return list(candidates.values())
+
+    def _volume_candidates(self) -> List[MountInfo]:
+        """Without a mount table: each /Volumes entry, listed under a timeout."""
+        def _list() -> List[str]:
+            return [entry.path for entry in os.scandir(self.volumes_path) if entry.is_dir()]
+
+        future = _probe_executor.submit(_list)
+        try:
+            paths = future.result(timeout=self.probe_timeout_seconds)
+        except FutureTimeoutError:
+            logger.warning(f"Timeout listing {self.volumes_path} - keeping previous roots")
+            with self._lock:
+                previous = list(self._statuses.values())
+            return [MountInfo(status.mount_point, status.fs_type, status.source) for status in previous]
+        except OSError:
+            return []
+        return [MountInfo(mount_point=path, fs_type="", source="") for path in paths]
+
+
+_mount_health_monitor: Optional[MountHealthMonitor] = None
+
+
+def get_mount_health_monitor() -> MountHealthMonitor:
+    """Get the process-wide mount health monitor (not started)."""
+    global _mount_health_monitor
+    if _mount_health_monitor is None:
+        _mount_health_monitor = MountHealthMonitor()
+    return _mount_health_monitor
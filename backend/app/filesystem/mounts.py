@@ -0,0 +1,131 @@
+"""
+Mount point lookup.
+
+Maps a path to the mount it lives on WITHOUT touching that mount: the mount
+table is read from /proc/self/mountinfo (Linux) and matched by path prefix.
+Calling os.stat() or os.path.ismount() on a path under a hung NFS/SMB
+share would block the caller, which is exactly what per-mount limits are
+meant to avoid.
+
+On platforms without /proc, the path's anchor (drive or "/") is used, so
+everything on one drive shares a mount key.
+"""
+
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+# Mount table is re-read at most this often
+MOUNT_TABLE_TTL_SECONDS = 30.0
+
+_OCTAL_ESCAPE = re.compile(rb"\\([0-7]{3})")
+
+
+def _unescape(field: bytes) -> str:
+    """Decode the octal escapes (\\040 etc.) used in mountinfo paths."""
+    return os.fsdecode(_OCTAL_ESCAPE.sub(lambda m: bytes([int(m.group(1), 8)]), field))
+
+
+@dataclass(frozen=True)
+class MountInfo:
+    """One mountinfo entry."""
+
+    mount_point: str
+    fs_type: str
+    source: str
+
+
+def read_mounts(mountinfo_path: str = MOUNTINFO_PATH) -> List[MountInfo]:
+    """
+    Return mounts from mountinfo, in table order.
+
+    Line format: "id parent major:minor root mount_point options [optional...] - fs_type source super_options".
+    Returns an empty list if the table cannot be read.
+    """
+    try:
+        with open(mountinfo_path, "rb") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+
+    mounts = []
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 5:
+            continue
+        fs_type = source = ""
+        try:
+            separator = fields.index(b"-", 5)
+        except ValueError:
+            pass
+        else:
+            tail = fields[separator + 1:]
+            if tail:
+                fs_type = os.fsdecode(tail[0])
+            if len(tail) > 1:
+                source = _unescape(tail[1])
+        mounts.append(MountInfo(mount_point=_unescape(fields[4]), fs_type=fs_type, source=source))
+    return mounts
+
+
+def read_mount_points(mountinfo_path: str = MOUNTINFO_PATH) -> List[str]:
+    """
+    Return mount points from mountinfo, longest first.
+
+    Returns an empty list if the table cannot be read.
+    """
+    mount_points = {mount.mount_point for mount in read_mounts(mountinfo_path)}
+    return sorted(mount_points, key=len, reverse=True)
+
+
+class MountTable:
+    """Cached mount table with longest-prefix lookup."""
+
+    def __init__(self, mountinfo_path: str = MOUNTINFO_PATH, ttl_seconds: float = MOUNT_TABLE_TTL_SECONDS):
+        self.mountinfo_path = mountinfo_path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._mount_points: List[str] = []
+        self._loaded_at: Optional[float] = None
+
+    def mount_points(self) -> List[str]:
+        with self._lock:
+            now = time.monotonic()
+            if self._loaded_at is None or now - self._loaded_at > self.ttl_seconds:
+                self._mount_points = read_mount_points(self.mountinfo_path)
+                self._loaded_at = now
+            return self._mount_points
+
+    def mount_point_for(self, path: str) -> str:
+        """
+        Return the mount point containing path (lexically, no I/O on path).
+
+        Falls back to the path's anchor when the mount table is unavailable.
+        """
+        normalized = os.path.normpath(os.path.abspath(path))
+        for mount_point in self.mount_points():
+            if mount_point == "/" or normalized == mount_point or normalized.startswith(mount_point + os.sep):
+                return mount_point
+        return Path(normalized).anchor or normalized
+
+
+_mount_table: Optional[MountTable] = None
+
+
+def get_mount_table() -> MountTable:
+    """Get the process-wide mount table."""
+    global _mount_table
+    if _mount_table is None:
+        _mount_table = MountTable()
+    return _mount_table
+
+
+def mount_point_for(path: str) -> str:
+    """Mount point containing path, via the process-wide mount table."""
+    return get_mount_table().mount_point_for(path)
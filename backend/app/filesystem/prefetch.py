@@ -0,0 +1,312 @@
+"""
+Source prefetch cache: read camera originals ahead of the encoder.
+
+Sources on archive NAS or object-store gateways serve FFmpeg's demuxer
+reads (small, partly random) slowly, and the encoder sits idle waiting on
+I/O. The prefetch cache copies upcoming sources to a bounded local cache
+with large sequential reads while the current clip encodes:
+
+- JobEngine._process_job calls prefetch() with the next PREFETCH_DEPTH
+  clips before it starts each clip
+- One background worker copies them in order (copy_file: large-block
+  in-kernel copy), to a temporary name renamed into place when complete
+- FFmpegEngine reads from local_source(), which returns the local copy
+  if it is complete (waiting for an in-flight copy of that source) and
+  still matches the source's size and mtime, else the original path
+
+The cache is bounded by a byte capacity and a free-space floor on its
+disk. A copy is released as soon as the clip that read it is done (each
+source is normally rendered once). Completed entries that are not being
+read are evicted least recently used first; a source that does not fit
+even after eviction is simply not prefetched. The cache index lives in
+memory; the cache directory is emptied on startup.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from .staging import copy_file, is_network_path
+
+logger = logging.getLogger(__name__)
+
+# off: never prefetch; network: prefetch sources on network mounts; always: prefetch everything
+PREFETCH_MODES = ("off", "network", "always")
+
+DEFAULT_CACHE_ROOT = Path(tempfile.gettempdir()) / "awaire_proxy_prefetch"
+# Enough for the clip being encoded and PREFETCH_DEPTH camera originals of typical size
+DEFAULT_CAPACITY_BYTES = 20 * 1024 ** 3
+# Nothing is prefetched if it would leave less than this free on the cache disk
+DEFAULT_MIN_FREE_BYTES = 5 * 1024 ** 3
+
+# Clips copied ahead of the one being encoded
+PREFETCH_DEPTH = 2
+
+
+@dataclass
+class _Entry:
+    """One cached (or in-flight) source."""
+    source_path: str
+    size: int
+    mtime_ns: int
+    local_path: str
+    future: Optional[Future] = None
+    ready: bool = False
+    readers: int = 0
+    failed: bool = False
+
+
+class SourcePrefetchCache:
+    """
+    Bounded local cache of prefetched source files. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        root: Path = DEFAULT_CACHE_ROOT,
+        capacity_bytes: int = DEFAULT_CAPACITY_BYTES,
+        min_free_bytes: int = DEFAULT_MIN_FREE_BYTES,
+        mode: str = "network",
+    ):
+        """
+        Args:
+            root: Local cache directory (emptied, then created)
+            capacity_bytes: Maximum bytes held (cached plus in flight)
+            min_free_bytes: Free space to leave on the cache disk
+            mode: One of PREFETCH_MODES
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        self.root = Path(root)
+        self.capacity_bytes = capacity_bytes
+        self.min_free_bytes = min_free_bytes
+        self.set_mode(mode)
+        # source_path -> entry, least recently used first
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self.hits = 0
+        self.misses = 0
+        self._purge()
+
+    def _purge(self) -> None:
+        """Remove files cached by an earlier process (the index is not persisted)."""
+        if not self.root.is_dir():
+            return
+        for entry in self.root.iterdir():
+            if entry.is_file():
+                try:
+                    entry.unlink()
+                except OSError:
+                    pass
+
+    def set_mode(self, mode: str) -> None:
+        if mode not in PREFETCH_MODES:
+            raise ValueError(f"Unknown prefetch mode '{mode}'. Expected one of: {', '.join(PREFETCH_MODES)}")
+        self.mode = mode
+
+    @property
+    def used_bytes(self) -> int:
+        with self._lock:
+            return sum(entry.size for entry in self._entries.values())
+
+    def _wants(self, source_path: str) -> bool:
+        if self.mode == "off":
+            return False
+        return self.mode == "always" or is_network_path(source_path)
+
+    def _make_room(self, size: int) -> bool:
+        """
+        Evict idle entries (LRU) until size fits the capacity and the
+        free-space floor (caller holds the lock).
+        """
+        used = sum(entry.size for entry in self._entries.values())
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            free = shutil.disk_usage(self.root).free
+        except OSError as e:
+            logger.warning(f"[Prefetch] Cache directory unusable ({e})")
+            return False
+        # Copies in flight still need their full size (bytes already written count twice: errs safe)
+        free -= sum(entry.size for entry in self._entries.values() if not entry.ready)
+
+        def fits() -> bool:
+            return used + size <= self.capacity_bytes and free - size >= self.min_free_bytes
+
+        if fits():
+            return True
+        idle = [
+            (source_path, entry) for source_path, entry in self._entries.items()
+            if entry.ready and entry.readers == 0
+        ]
+        idle_bytes = sum(entry.size for _, entry in idle)
+        if (used - idle_bytes + size > self.capacity_bytes
+                or free + idle_bytes - size < self.min_free_bytes):
+            return False  # Would not fit even after evicting every idle entry
+        for source_path, entry in idle:
+            self._evict(source_path)
+            used -= entry.size
+            free += entry.size
+            if fits():
+                break
+        return True
+
+    def _evict(self, source_path: str) -> None:
+        """Drop an entry and its file (caller holds the lock)."""
+        entry = self._entries.pop(source_path)
+        try:
+            os.unlink(entry.local_path)
+        except OSError:
+            pass
+        logger.debug(f"[Prefetch] Evicted {source_path}")
+
+    def prefetch(self, source_paths: Iterable[str]) -> int:
+        """
+        Queue sources for background copy, in order.
+
+        Sources already cached (and unchanged) or in flight, image sequence
+        patterns, unreadable sources and sources that do not fit are skipped.
+
+        Returns:
+            Number of copies queued
+        """
+        queued = 0
+        for source_path in source_paths:
+            if not self._wants(source_path):
+                continue
+            try:
+                st = os.stat(source_path)
+            except OSError:
+                continue
+            if not os.path.isfile(source_path):
+                continue
+            with self._lock:
+                entry = self._entries.get(source_path)
+                if entry is not None:
+                    if entry.size == st.st_size and entry.mtime_ns == st.st_mtime_ns and not entry.failed:
+                        continue
+                    if entry.readers or not entry.ready:
+                        continue  # Replace it once nobody uses it
+                    self._evict(source_path)
+                if st.st_size > self.capacity_bytes or not self._make_room(st.st_size):
+                    logger.debug(f"[Prefetch] No room for {source_path} ({st.st_size} bytes)")
+                    continue
+                entry = _Entry(
+                    source_path=source_path,
+                    size=st.st_size,
+                    mtime_ns=st.st_mtime_ns,
+                    local_path=str(self.root / f"{uuid.uuid4().hex}{Path(source_path).suffix}"),
+                )
+                self._entries[source_path] = entry
+                entry.future = self._executor.submit(self._copy, entry)
+                queued += 1
+        return queued
+
+    def _copy(self, entry: _Entry) -> None:
+        """Worker: copy one source into the cache."""
+        partial = entry.local_path + ".part"
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            copy_file(entry.source_path, partial)
+            os.replace(partial, entry.local_path)
+        except OSError as e:
+            logger.warning(f"[Prefetch] Copy of {entry.source_path} failed: {e}")
+            try:
+                os.unlink(partial)
+            except OSError:
+                pass
+            with self._lock:
+                entry.failed = True
+                if self._entries.get(entry.source_path) is entry:
+                    del self._entries[entry.source_path]
+            return
+        with self._lock:
+            entry.ready = True
+        logger.info(f"[Prefetch] Cached {entry.source_path}")
+
+    @contextmanager
+    def local_source(self, source_path: str, wait: bool = True) -> Iterator[str]:
+        """
+        Path to read a source from for the duration of the block.
+
+        The local copy if it is complete and the source is unchanged
+        (waiting for an in-flight copy first when wait is True), else
+        source_path itself. A local copy in use is never evicted; it is
+        released when its last reader leaves the block.
+        """
+        with self._lock:
+            entry = self._entries.get(source_path)
+            future = entry.future if entry is not None else None
+        if future is not None and wait:
+            try:
+                future.result()
+            except Exception:
+                pass  # Failed or abandoned copy: read the original
+
+        with self._lock:
+            entry = self._entries.get(source_path)
+            usable = entry is not None and entry.ready and self._unchanged(entry)
+            if usable:
+                entry.readers += 1
+                self._entries.move_to_end(source_path)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if not usable:
+            yield source_path
+            return
+
+        try:
+            logger.info(f"[Prefetch] Reading {source_path} from local cache")
+            yield entry.local_path
+        finally:
+            with self._lock:
+                entry.readers -= 1
+                if entry.readers == 0 and self._entries.get(source_path) is entry:
+                    self._evict(source_path)
+
+    def _unchanged(self, entry: _Entry) -> bool:
+        try:
+            st = os.stat(entry.source_path)
+        except OSError:
+            return False
+        return st.st_size == entry.size and st.st_mtime_ns == entry.mtime_ns
+
+    def snapshot(self) -> Dict:
+        """Usage and hit counts for diagnostics."""
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "capacity_bytes": self.capacity_bytes,
+                "min_free_bytes": self.min_free_bytes,
+                "used_bytes": sum(entry.size for entry in self._entries.values()),
+                "entries": len(self._entries),
+                "in_flight": sum(1 for entry in self._entries.values() if not entry.ready),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker (pending copies are abandoned)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_prefetch_cache: Optional[SourcePrefetchCache] = None
+
+
+def get_prefetch_cache() -> SourcePrefetchCache:
+    """Get the process-wide prefetch cache (created on first access)."""
+    global _prefetch_cache
+    if _prefetch_cache is None:
+        _prefetch_cache = SourcePrefetchCache()
+    return _prefetch_cache
@@ -0,0 +1,361 @@
+"""
+Local scratch staging for render outputs.
+
+Output folders are usually SMB/NFS shares. Writing a render straight to
+the share has two costs: the muxer's many small writes each wait on the
+network, throttling the encoder, and a failed or cancelled encode leaves
+a partial file at the final path where it looks like a finished proxy.
+
+With staging, FFmpeg writes to a local scratch directory. Only a
+successful render is published: the file is copied to a hidden temporary
+name next to the destination, using copy_file_range, then sendfile, then
+a large buffered copy. It is fsync'ed and renamed into place with
+os.replace, so the destination path either does not exist or holds the
+complete file. On the same filesystem the publish is a plain rename.
+
+The publish pass also computes output checksums when they are enabled
+(see checksums.py), so outputs are never read back just to hash them.
+
+Scratch space is bounded by a byte quota (and a free-space floor).
+Each staged clip reserves an estimate up front. When the reservation does
+not fit, the clip is written directly to its destination as before.
+"""
+
+import errno
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence
+
+from .mount_health import NETWORK_FS_TYPES
+from .mounts import MOUNTINFO_PATH, mount_point_for, read_mounts
+
+if TYPE_CHECKING:
+    from .checksums import StreamHasher
+
+logger = logging.getLogger(__name__)
+
+# off: never stage; network: stage outputs bound for network mounts; always: stage everything
+STAGING_MODES = ("off", "network", "always")
+
+DEFAULT_SCRATCH_ROOT = Path(tempfile.gettempdir()) / "awaire_proxy_scratch"
+DEFAULT_QUOTA_BYTES = 100 * 1024 ** 3
+# Scratch is not used if it would leave less than this free on its disk
+DEFAULT_MIN_FREE_BYTES = 5 * 1024 ** 3
+# Reserved per clip when its output size cannot be estimated (unknown duration)
+DEFAULT_RESERVATION_BYTES = 2 * 1024 ** 3
+
+# Bytes per copy_file_range/sendfile call, and buffer of the fallback copy
+COPY_CHUNK_BYTES = 64 * 1024 * 1024
+COPY_BUFFER_BYTES = 8 * 1024 * 1024
+
+# Errors meaning "this copy primitive does not work here", not "the copy failed"
+_UNSUPPORTED_ERRNOS = frozenset({errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL, errno.EBADF})
+
+_CLIP_DIR_PREFIX = "clip-"
+_PARTIAL_SUFFIX = ".partial"
+
+
+def is_network_path(path: str, mountinfo_path: str = MOUNTINFO_PATH) -> bool:
+    """True if path lies on a network filesystem (lexical lookup, no I/O on path)."""
+    mount_point = mount_point_for(path)
+    fs_type = ""
+    for mount in read_mounts(mountinfo_path):
+        if mount.mount_point == mount_point:
+            fs_type = mount.fs_type  # Last entry wins (over-mounts)
+    return fs_type in NETWORK_FS_TYPES
+
+
+def copy_file(source: str, destination: str, hasher: Optional["StreamHasher"] = None) -> int:
+    """
+    Copy a file's contents with the fastest primitive available.
+
+    copy_file_range (in-kernel, server-side on NFS 4.2/SMB3 where
+    supported), then sendfile, then a buffered copy with large buffers.
+    Each fallback continues from where the previous one stopped.
+
+    With a hasher, the buffered copy is used throughout and every buffer
+    is hashed as it is written, so the checksum costs no extra read.
+
+    Returns:
+        Bytes copied
+    """
+    with open(source, "rb") as fin, open(destination, "wb") as fout:
+        in_fd, out_fd = fin.fileno(), fout.fileno()
+        size = os.fstat(in_fd).st_size
+        copied = 0
+
+        if hasher is not None:
+            for chunk in iter(lambda: fin.read(COPY_BUFFER_BYTES), b""):
+                hasher.update(chunk)
+                fout.write(chunk)
+            fout.flush()
+            os.fsync(out_fd)
+            return fout.tell()
+
+        if hasattr(os, "copy_file_range"):
+            try:
+                while copied < size:
+                    sent = os.copy_file_range(in_fd, out_fd, min(COPY_CHUNK_BYTES, size - copied))
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+
+        if copied < size and hasattr(os, "sendfile"):
+            try:
+                while copied < size:
+                    sent = os.sendfile(out_fd, in_fd, copied, min(COPY_CHUNK_BYTES, size - copied))
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+
+        fin.seek(copied)
+        fout.seek(copied)
+        shutil.copyfileobj(fin, fout, COPY_BUFFER_BYTES)
+        fout.flush()
+        os.fsync(out_fd)
+        return fout.tell()
+
+
+def _same_filesystem(path: str, other: str) -> bool:
+    return os.stat(path).st_dev == os.stat(other).st_dev
+
+
+def publish_file(staged_path: str, final_path: str, hasher: Optional["StreamHasher"] = None) -> None:
+    """
+    Move a finished file to its destination atomically.
+
+    The destination either keeps its previous state or receives the
+    complete file; a failed copy only leaves (and then removes) a hidden
+    .partial file next to it. The staged file is removed on success.
+    The hasher, if given, is fed the file's contents on the way.
+    """
+    final_dir = os.path.dirname(final_path) or "."
+    os.makedirs(final_dir, exist_ok=True)
+
+    if _same_filesystem(staged_path, final_dir):
+        if hasher is not None:
+            with open(staged_path, "rb") as f:
+                for chunk in iter(lambda: f.read(COPY_BUFFER_BYTES), b""):
+                    hasher.update(chunk)
+        os.replace(staged_path, final_path)
+        return
+
+    partial = os.path.join(
+        final_dir, f".{os.path.basename(final_path)}.{uuid.uuid4().hex[:8]}{_PARTIAL_SUFFIX}"
+    )
+    try:
+        copy_file(staged_path, partial, hasher)
+        os.replace(partial, final_path)
+    except BaseException:
+        try:
+            os.unlink(partial)
+        except OSError:
+            pass
+        raise
+    os.unlink(staged_path)
+
+
+@dataclass(frozen=True)
+class StagedOutputs:
+    """Where to render a clip's outputs, and where they are published."""
+    final_paths: List[str]
+    render_paths: List[str]  # Same as final_paths when not staged
+
+    @property
+    def staged(self) -> bool:
+        return self.render_paths != self.final_paths
+
+    def publish(self, algorithms: Sequence[str] = ()) -> Dict[str, Dict[str, str]]:
+        """
+        Publish every rendered output to its final path.
+
+        Args:
+            algorithms: Checksums to compute on the way (see checksums.py).
+                Unstaged outputs (no scratch reservation) are read back
+                from their final path.
+
+        Returns:
+            Final path -> algorithm -> hex digest (empty without algorithms)
+
+        Raises:
+            OSError: If an output is missing or cannot be published. Outputs
+                published before the failure stay published.
+        """
+        from .checksums import StreamHasher, hash_file
+
+        checksums: Dict[str, Dict[str, str]] = {}
+        for render_path, final_path in zip(self.render_paths, self.final_paths):
+            if not self.staged:
+                if algorithms:
+                    checksums[final_path] = hash_file(final_path, algorithms)
+                continue
+            hasher = StreamHasher(algorithms) if algorithms else None
+            publish_file(render_path, final_path, hasher)
+            if hasher is not None:
+                checksums[final_path] = hasher.hexdigests()
+        return checksums
+
+
+class ScratchSpace:
+    """
+    Quota-managed local scratch directory for staged renders.
+
+    Thread-safe. Every staged clip gets its own subdirectory, removed when
+    the clip is done (published or not).
+    """
+
+    def __init__(
+        self,
+        root: Path = DEFAULT_SCRATCH_ROOT,
+        quota_bytes: int = DEFAULT_QUOTA_BYTES,
+        min_free_bytes: int = DEFAULT_MIN_FREE_BYTES,
+        mode: str = "network",
+    ):
+        """
+        Args:
+            root: Local scratch directory (created if missing)
+            quota_bytes: Maximum bytes reserved by concurrent staged clips
+            min_free_bytes: Free space to leave on the scratch disk
+            mode: One of STAGING_MODES
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        self.root = Path(root)
+        self.quota_bytes = quota_bytes
+        self.min_free_bytes = min_free_bytes
+        self.set_mode(mode)
+        self._reservations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._purge_stale()
+
+    def set_mode(self, mode: str) -> None:
+        if mode not in STAGING_MODES:
+            raise ValueError(f"Unknown staging mode '{mode}'. Expected one of: {', '.join(STAGING_MODES)}")
+        self.mode = mode
+
+    @property
+    def reserved_bytes(self) -> int:
+        with self._lock:
+            return sum(self._reservations.values())
+
+    def _purge_stale(self) -> None:
+        """Remove clip directories left behind by an earlier process."""
+        if not self.root.is_dir():
+            return
+        for entry in self.root.iterdir():
+            if entry.is_dir() and entry.name.startswith(_CLIP_DIR_PREFIX):
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def wants_staging(self, final_paths: Sequence[str]) -> bool:
+        """Whether outputs bound for these paths should be staged in this mode."""
+        if self.mode == "off" or not final_paths:
+            return False
+        if self.mode == "always":
+            return True
+        return any(is_network_path(path) for path in final_paths)
+
+    def _reserve(self, clip_id: str, size_hint: int) -> bool:
+        with self._lock:
+            reserved = sum(self._reservations.values())
+            if reserved + size_hint > self.quota_bytes:
+                logger.warning(
+                    f"[Staging] Scratch quota exhausted ({reserved + size_hint} > {self.quota_bytes} bytes), "
+                    f"clip {clip_id} writes directly to its destination"
+                )
+                return False
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                free = shutil.disk_usage(self.root).free
+            except OSError as e:
+                logger.warning(f"[Staging] Scratch directory unusable ({e}), writing directly")
+                return False
+            if free - size_hint < self.min_free_bytes:
+                logger.warning(
+                    f"[Staging] Scratch disk low on space ({free} bytes free), "
+                    f"clip {clip_id} writes directly to its destination"
+                )
+                return False
+            self._reservations[clip_id] = size_hint
+            return True
+
+    @contextmanager
+    def stage(
+        self,
+        clip_id: str,
+        final_paths: Sequence[str],
+        size_hint: Optional[int] = None,
+        force: bool = False,
+    ) -> Iterator[StagedOutputs]:
+        """
+        Stage a clip's outputs for the duration of the block.
+
+        Yields StagedOutputs whose render_paths the encoder should write.
+        The caller publishes them (StagedOutputs.publish) once the render
+        succeeded. On exit the clip's scratch directory and reservation
+        are released, so an unpublished render is discarded.
+
+        Args:
+            clip_id: Unique ID of the render (e.g. task ID)
+            final_paths: Destination of each output
+            size_hint: Expected bytes of all outputs (default: DEFAULT_RESERVATION_BYTES)
+            force: Stage whatever the mode (e.g. so checksums are computed
+                in the publish pass); the quota and free-space floor still apply
+        """
+        final_paths = list(final_paths)
+        wanted = bool(final_paths) if force else self.wants_staging(final_paths)
+        if not wanted or not self._reserve(
+            clip_id, size_hint if size_hint is not None else DEFAULT_RESERVATION_BYTES
+        ):
+            yield StagedOutputs(final_paths=final_paths, render_paths=final_paths)
+            return
+
+        clip_dir = self.root / f"{_CLIP_DIR_PREFIX}{clip_id}-{uuid.uuid4().hex[:8]}"
+        try:
+            clip_dir.mkdir(parents=True)
+            # Index prefix keeps outputs with the same file name apart
+            render_paths = [
+                str(clip_dir / f"{index}_{os.path.basename(path)}")
+                for index, path in enumerate(final_paths)
+            ]
+            logger.info(f"[Staging] Clip {clip_id} renders to scratch {clip_dir}")
+            yield StagedOutputs(final_paths=final_paths, render_paths=render_paths)
+        finally:
+            shutil.rmtree(clip_dir, ignore_errors=True)
+            with self._lock:
+                self._reservations.pop(clip_id, None)
+
+    def snapshot(self) -> Dict:
+        """Mode, quota and current reservations for diagnostics."""
+        with self._lock:
+            return {
+                "root": str(self.root),
+                "mode": self.mode,
+                "quota_bytes": self.quota_bytes,
+                "reserved_bytes": sum(self._reservations.values()),
+                "staged_clips": len(self._reservations),
+            }
+
+
+_scratch_space: Optional[ScratchSpace] = None
+
+
+def get_scratch_space() -> ScratchSpace:
+    """Get the process-wide scratch space (created on first access)."""
+    global _scratch_space
+    if _scratch_space is None:
+        _scratch_space = ScratchSpace()
+    return _scratch_space
@@ -24,6 +24,7 @@ from .errors import (
 )
 from .models import (
     JobStatus,
+    JobPriority,
     TaskStatus,
     ClipTask,
     Job,
@@ -34,6 +35,7 @@ from .state import (
 )
 from .engine import JobEngine
 from .registry import JobRegistry
+from .render_ledger import RenderLedger, RenderKey, RenderLedgerEntry
 
 __all__ = [
     # Errors
@@ -42,6 +44,7 @@ __all__ = [
     "InvalidStateTransitionError",
     # Models
     "JobStatus",
+    "JobPriority",
     "TaskStatus",
     "ClipTask",
     "Job",
@@ -52,4 +55,8 @@ __all__ = [
     "JobEngine",
     # Registry
     "JobRegistry",
+    # Render ledger
+    "RenderLedger",
+    "RenderKey",
+    "RenderLedgerEntry",
 ]
@@ -36,6 +36,7 @@ Invariants enforced:
 ============================================================================
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, TYPE_CHECKING
@@ -50,6 +51,13 @@ if TYPE_CHECKING:
     from ..execution.results import ExecutionResult
     from ..execution.base import EngineType
     from ..execution.engine_registry import EngineRegistry
+    from ..execution.resolved_params import ResolvedPresetParams
+    from .render_ledger import RenderLedger, RenderKey
+
+
+# Executor for ingest-time probing (ffprobe metadata + thumbnail) when a
+# batch of single-clip jobs is created at once. Work is subprocess-bound.
+_probe_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ingest_probe")
 
 
 class JobEngine:
@@ -66,6 +74,7 @@ class JobEngine:
         self,
         binding_registry: Optional["JobPresetBindingRegistry"] = None,
         engine_registry: Optional["EngineRegistry"] = None,
+        render_ledger: Optional["RenderLedger"] = None,
     ):
         """
         Initialize job engine.
@@ -73,9 +82,12 @@ class JobEngine:
         Args:
             binding_registry: Optional registry for job-preset bindings
             engine_registry: Optional registry for execution engines
+            render_ledger: Optional ledger of finished renders; clips whose
+                output is already in it complete without rendering
         """
         self.binding_registry = binding_registry
         self.engine_registry = engine_registry
+        self.render_ledger = render_ledger
     
     def create_job(
         self,
@@ -141,6 +153,12 @@ class JobEngine:
                 if metadata.audio:
                     task.audio_channels = metadata.audio.channel_count
                     task.audio_sample_rate = metadata.audio.sample_rate
+                
+                if metadata.image_sequence:
+                    task.image_sequence = metadata.image_sequence
+                    task.warnings.extend(
+                        w for w in metadata.warnings if w.startswith("Image sequence")
+                    )
                     
             except Exception as e:
                 # Metadata extraction failure is non-fatal
@@ -150,7 +168,17 @@ class JobEngine:
             # Phase 20: Generate thumbnail at ingest time
             try:
                 from ..execution.thumbnails import generate_thumbnail_sync, thumbnail_to_base64
-                thumb_path = generate_thumbnail_sync(path)
+                if task.image_sequence:
+                    # A single frame is a complete picture: no seek, no probe
+                    thumb_path = generate_thumbnail_sync(
+                        task.image_sequence.first_frame_path,
+                        position=0.0,
+                        duration=task.image_sequence.duration_seconds,
+                        fast=True,
+                    )
+                else:
+                    # Fast keyframe path: reuse the duration extracted above
+                    thumb_path = generate_thumbnail_sync(path, duration=task.duration, fast=True)
                 if thumb_path:
                     task.thumbnail = thumbnail_to_base64(thumb_path)
                     logger.debug(f"Generated thumbnail for {path}")
@@ -165,6 +193,30 @@ class JobEngine:
         
         return job
     
+    def create_jobs(
+        self,
+        source_paths: List[str],
+        engine: Optional[str] = None,
+    ) -> List[Job]:
+        """
+        Create one single-clip job per source path, probing sources concurrently.
+        
+        Equivalent to calling create_job([path]) for each path, but the
+        ingest-time metadata extraction and thumbnail generation run in
+        _probe_executor. This is NOT multi-clip batching: every job still
+        has exactly one task.
+        
+        Args:
+            source_paths: Absolute paths, one job each
+            engine: Engine type string ("ffmpeg" or "resolve")
+            
+        Returns:
+            Jobs in the same order as source_paths
+        """
+        if len(source_paths) <= 1:
+            return [self.create_job([path], engine=engine) for path in source_paths]
+        return list(_probe_executor.map(lambda path: self.create_job([path], engine=engine), source_paths))
+    
     def bind_preset(
         self, job: Job, preset_id: str, preset_registry: Optional["PresetRegistry"] = None
     ) -> None:
@@ -502,6 +554,64 @@ class JobEngine:
     
     # Execution stubs for Phase 5+ integration
 
+    def resolve_job_params(
+        self,
+        job: Job,
+        preset_registry,
+        global_preset_id: Optional[str],
+    ) -> "ResolvedPresetParams":
+        """
+        Resolve the params a job's clips are rendered with.
+        
+        Alpha: A bound (non-synthetic) global preset takes precedence;
+        otherwise (or if it cannot be resolved) params are built from
+        job.settings. Rendering, output naming and the scheduling cost
+        model all use this, so they agree on e.g. the output codec.
+        
+        Args:
+            job: The job
+            preset_registry: Registry for preset resolution (may be None)
+            global_preset_id: Preset ID (may be None or synthetic "_job_...")
+        """
+        from ..execution.resolved_params import ResolvedPresetParams
+        import logging
+        
+        logger = logging.getLogger(__name__)
+        
+        # Try preset resolution first (if preset is provided and not synthetic)
+        if global_preset_id and not global_preset_id.startswith("_job_") and preset_registry:
+            try:
+                resolved_params = preset_registry.resolve_preset_params(global_preset_id)
+                if resolved_params:
+                    return resolved_params
+            except Exception as e:
+                logger.warning(f"Preset resolution failed for '{global_preset_id}': {e}")
+        
+        # Fall back to job settings
+        settings = job.settings
+        
+        # Map video codec and audio codec from settings
+        video_codec = settings.video.codec if settings.video else "prores_422"
+        container = settings.file.container if settings.file else "mov"
+        audio_codec = settings.audio.codec.value if settings.audio and hasattr(settings.audio.codec, 'value') else "copy"
+        audio_bitrate = settings.audio.bitrate if settings.audio else None
+        audio_sample_rate = settings.audio.sample_rate if settings.audio else None
+        
+        return ResolvedPresetParams(
+            preset_id=f"_job_{job.id}",
+            preset_name=f"Job {job.id[:8]} Settings",
+            video_codec=video_codec,
+            container=container,
+            video_bitrate=settings.video.bitrate if settings.video else None,
+            video_quality=settings.video.quality if settings.video else None,
+            video_preset=settings.video.preset if settings.video else None,
+            audio_codec=audio_codec,
+            audio_bitrate=audio_bitrate,
+            audio_sample_rate=audio_sample_rate,
+            target_width=settings.video.width if settings.video else None,
+            target_height=settings.video.height if settings.video else None,
+        )
+    
     def _execute_task(
         self,
         task: ClipTask,
@@ -547,42 +657,7 @@ class JobEngine:
                 engine = self.engine_registry.get_available_engine(engine_type)
                 
                 # Alpha: Resolve params from preset or job settings
-                resolved_params = None
-                
-                # Try preset resolution first (if preset is provided and not synthetic)
-                if global_preset_id and not global_preset_id.startswith("_job_"):
-                    try:
-                        resolved_params = preset_registry.resolve_preset_params(global_preset_id)
-                    except Exception as e:
-                        logger.warning(f"Preset resolution failed for '{global_preset_id}': {e}")
-                
-                # Fall back to job settings
-                if not resolved_params:
-                    # Build ResolvedPresetParams from job.settings
-                    settings = job.settings
-                    from ..execution.resolved_params import ResolvedPresetParams
-                    
-                    # Map video codec and audio codec from settings
-                    video_codec = settings.video.codec if settings.video else "prores_422"
-                    container = settings.file.container if settings.file else "mov"
-                    audio_codec = settings.audio.codec.value if settings.audio and hasattr(settings.audio.codec, 'value') else "copy"
-                    audio_bitrate = settings.audio.bitrate if settings.audio else None
-                    audio_sample_rate = settings.audio.sample_rate if settings.audio else None
-                    
-                    resolved_params = ResolvedPresetParams(
-                        preset_id=f"_job_{job.id}",
-                        preset_name=f"Job {job.id[:8]} Settings",
-                        video_codec=video_codec,
-                        container=container,
-                        video_bitrate=settings.video.bitrate if settings.video else None,
-                        video_quality=settings.video.quality if settings.video else None,
-                        video_preset=settings.video.preset if settings.video else None,
-                        audio_codec=audio_codec,
-                        audio_bitrate=audio_bitrate,
-                        audio_sample_rate=audio_sample_rate,
-                        target_width=settings.video.width if settings.video else None,
-                        target_height=settings.video.height if settings.video else None,
-                    )
+                resolved_params = self.resolve_job_params(job, preset_registry, global_preset_id)
                 
                 # Phase 20: Get watermark text from DeliverSettings overlay
                 settings = job.settings
@@ -597,28 +672,69 @@ class JobEngine:
                 # Phase 16.4: Engine receives resolved output_path from task
                 # Output path was resolved in _resolve_clip_outputs() before execution started
                 
+                # Last measured encode speed, fed to the scheduling cost model
+                encode_fps = [0.0]
+                
                 # STRUCTURAL FIX: Connect progress updates to task model
                 # This ensures the UI can poll for real-time progress
                 def on_progress_callback(progress_info):
                     """Update task with progress info for UI polling."""
                     task.progress_percent = progress_info.progress_percent
                     task.eta_seconds = progress_info.eta_seconds
-                    # Phase 20: Enhanced progress fields
-                    if hasattr(progress_info, 'encoding_fps'):
-                        # Store on task for monitoring queries
+                    if progress_info.encoding_fps > 0:
+                        encode_fps[0] = progress_info.encoding_fps
+                        # Phase 20: Store on task for monitoring queries
                         task._encode_fps = progress_info.encoding_fps
                     logger.debug(
                         f"[PROGRESS] Clip {task.id}: {progress_info.progress_percent:.1f}% "
                         f"(ETA: {progress_info.eta_seconds or 'N/A'}s)"
                     )
                 
-                return engine.run_clip(
-                    task=task,
-                    resolved_params=resolved_params,
-                    output_path=task.output_path,  # Already resolved, stored on task
-                    watermark_text=watermark_text,
-                    on_progress=on_progress_callback,
-                )
+                if settings.additional_outputs:
+                    # Extra deliverables (thumbnails, second proxies) share the
+                    # primary's decode, which only the DeliverSettings path renders
+                    dropped = ", ".join(output.name for output in settings.additional_outputs)
+                    unsupported = None
+                    if not hasattr(engine, "run_clip_with_deliver_settings"):
+                        unsupported = f"the {job.engine} engine cannot render them"
+                    elif resolved_params.preset_id != f"_job_{job.id}":
+                        unsupported = f"they cannot be combined with preset '{resolved_params.preset_name}'"
+                    if unsupported:
+                        from ..execution.results import ExecutionResult, ExecutionStatus
+                        return ExecutionResult(
+                            status=ExecutionStatus.FAILED,
+                            source_path=task.source_path,
+                            output_path=None,
+                            failure_reason=f"Additional outputs ({dropped}) not rendered: {unsupported}",
+                            started_at=datetime.now(),
+                            completed_at=datetime.now(),
+                        )
+                    result = engine.run_clip_with_deliver_settings(
+                        task=task,
+                        deliver_settings=settings,
+                        output_path=task.output_path,  # Already resolved, stored on task
+                        on_progress=on_progress_callback,
+                    )
+                else:
+                    result = engine.run_clip(
+                        task=task,
+                        resolved_params=resolved_params,
+                        output_path=task.output_path,  # Already resolved, stored on task
+                        watermark_text=watermark_text,
+                        on_progress=on_progress_callback,
+                    )
+                
+                # Train the scheduling cost model on completed renders only
+                from ..execution.cost_model import get_cost_model
+                from ..execution.results import ExecutionStatus
+                if result.status in (
+                    ExecutionStatus.SUCCESS,
+                    ExecutionStatus.SUCCESS_WITH_WARNINGS,
+                    ExecutionStatus.COMPLETED,
+                ):
+                    get_cost_model().observe(task, resolved_params.video_codec, encode_fps[0])
+                
+                return result
             except Exception as e:
                 # If engine execution fails, return a failed result
                 from ..execution.results import ExecutionResult, ExecutionStatus
@@ -665,40 +781,7 @@ class JobEngine:
         logger = logging.getLogger(__name__)
         
         # Alpha: Resolve params from preset or job settings
-        resolved_params = None
-        
-        # Try preset resolution first (if preset is provided and not synthetic)
-        if global_preset_id and not global_preset_id.startswith("_job_") and preset_registry:
-            try:
-                resolved_params = preset_registry.resolve_preset_params(global_preset_id)
-            except Exception as e:
-                logger.warning(f"Preset resolution failed: {e}")
-        
-        # Fall back to job settings
-        if not resolved_params:
-            settings = job.settings
-            
-            # Map video codec and audio codec from settings
-            video_codec = settings.video.codec if settings.video else "prores_422"
-            container = settings.file.container if settings.file else "mov"
-            audio_codec = settings.audio.codec.value if settings.audio and hasattr(settings.audio.codec, 'value') else "copy"
-            audio_bitrate = settings.audio.bitrate if settings.audio else None
-            audio_sample_rate = settings.audio.sample_rate if settings.audio else None
-            
-            resolved_params = ResolvedPresetParams(
-                preset_id=f"_job_{job.id}",
-                preset_name=f"Job {job.id[:8]} Settings",
-                video_codec=video_codec,
-                container=container,
-                video_bitrate=settings.video.bitrate if settings.video else None,
-                video_quality=settings.video.quality if settings.video else None,
-                video_preset=settings.video.preset if settings.video else None,
-                audio_codec=audio_codec,
-                audio_bitrate=audio_bitrate,
-                audio_sample_rate=audio_sample_rate,
-                target_width=settings.video.width if settings.video else None,
-                target_height=settings.video.height if settings.video else None,
-            )
+        resolved_params = self.resolve_job_params(job, preset_registry, global_preset_id)
         
         settings = job.settings
         
@@ -745,6 +828,157 @@ class JobEngine:
                 task.status = TaskStatus.FAILED
                 task.completed_at = datetime.now()
     
+    def _render_settings_fingerprint(
+        self,
+        job: Job,
+        global_preset_id: Optional[str],
+        preset_registry,
+    ) -> str:
+        """
+        Fingerprint of everything _execute_task renders a job's clips with.
+        
+        The job's effective settings minus where the output goes (output
+        dir, naming, overwrite policy), plus the resolved params of a bound
+        (non-synthetic) global preset, which take precedence for codec.
+        Moving or renaming an output does not change its bytes.
+        """
+        from dataclasses import asdict
+        from ..deliver.settings import settings_fingerprint
+        
+        settings_data = job.settings.to_dict()
+        settings_data.pop("output_dir", None)
+        file_data = settings_data.get("file", {})
+        settings_data["file"] = {
+            "container": file_data.get("container"),
+            "extension": file_data.get("extension"),
+        }
+        
+        preset_params = None
+        if global_preset_id and not global_preset_id.startswith("_job_") and preset_registry:
+            try:
+                preset_params = asdict(preset_registry.resolve_preset_params(global_preset_id))
+            except Exception:
+                # _execute_task falls back to job settings as well
+                preset_params = None
+        
+        return settings_fingerprint({
+            "settings": settings_data,
+            "preset": preset_params,
+        })
+    
+    def _render_key(
+        self,
+        task: ClipTask,
+        job: Job,
+        render_settings_fingerprint: str,
+    ) -> Optional["RenderKey"]:
+        """
+        Render ledger key of a task, or None if its output cannot be reused.
+        
+        Requires a ledger, a bound engine that reports its version, and a
+        source file that can be fingerprinted (not an image sequence).
+        """
+        if self.render_ledger is None or not job.engine or not self.engine_registry:
+            return None
+        
+        from ..execution.base import EngineType
+        from .render_ledger import RenderKey, source_fingerprint
+        
+        try:
+            engine = self.engine_registry.get_available_engine(EngineType(job.engine))
+            engine_version = engine.version
+        except Exception:
+            return None
+        if not engine_version:
+            return None
+        
+        source_fp = source_fingerprint(task.source_path)
+        if source_fp is None:
+            return None
+        
+        return RenderKey(
+            source_fingerprint=source_fp,
+            settings_fingerprint=render_settings_fingerprint,
+            engine_version=f"{job.engine}:{engine_version}",
+        )
+    
+    def _reuse_cached_render(
+        self,
+        task: ClipTask,
+        render_key: "RenderKey",
+    ) -> Optional["ExecutionResult"]:
+        """
+        Complete a task from the render ledger instead of rendering it.
+        
+        The recorded output is reused in place, or copied to the task's
+        resolved output path if that differs. Checksums enabled by the
+        checksum policy are computed inside that copy (an output reused in
+        place is hashed where it is), and MHL sidecars written as for
+        rendered clips.
+        
+        Returns:
+            A COMPLETED ExecutionResult, or None to render normally
+        """
+        import logging
+        import os
+        import shutil
+        from ..execution.results import ExecutionResult, ExecutionStatus
+        from ..filesystem.checksums import StreamHasher, get_checksum_policy, hash_file, write_mhl
+        from ..filesystem.staging import copy_file
+        
+        logger = logging.getLogger(__name__)
+        
+        entry = self.render_ledger.lookup(render_key)
+        if entry is None:
+            return None
+        
+        started_at = datetime.now()
+        output_path = task.output_path or entry.output_path
+        policy = get_checksum_policy()
+        hasher = StreamHasher(policy.algorithms) if policy.algorithms else None
+        in_place = os.path.abspath(output_path) == os.path.abspath(entry.output_path)
+        
+        if not in_place:
+            # Copy (not link): a later re-render writes into its output in place
+            temp_path = f"{output_path}.ledger-tmp"
+            try:
+                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                copy_file(entry.output_path, temp_path, hasher)
+                shutil.copystat(entry.output_path, temp_path)
+                os.replace(temp_path, output_path)
+            except OSError as e:
+                logger.warning(f"[RenderLedger] Could not reuse {entry.output_path}: {e}")
+                Path(temp_path).unlink(missing_ok=True)
+                return None
+        
+        logger.info(f"[RenderLedger] Task {task.id} completed from cache: {output_path}")
+        task.from_render_cache = True
+        result = ExecutionResult(
+            status=ExecutionStatus.COMPLETED,
+            source_path=task.source_path,
+            output_path=output_path,
+            started_at=started_at,
+            warnings=[
+                f"Output reused from render cache "
+                f"(rendered {entry.recorded_at:%Y-%m-%d %H:%M:%S} as {entry.output_path})"
+            ],
+        )
+        
+        if hasher is not None:
+            try:
+                if in_place:
+                    result.checksums = {output_path: hash_file(output_path, policy.algorithms)}
+                else:
+                    result.checksums = {output_path: hasher.hexdigests()}
+                if policy.write_mhl:
+                    write_mhl(output_path, result.checksums[output_path], started_at=started_at)
+            except OSError as e:
+                logger.warning(f"[RenderLedger] Checksums not recorded for {output_path}: {e}")
+                result.warnings.append(f"Output checksums not computed: {e}")
+        
+        result.completed_at = datetime.now()
+        return result
+    
     def _process_job(
         self,
         job: Job,
@@ -764,7 +998,8 @@ class JobEngine:
         1. Resolve output paths for all clips BEFORE any execution
         2. Iterate through QUEUED tasks sequentially
         3. Check pause state before each task
-        4. Execute task via engine (or legacy pipeline)
+        4. Execute task via engine (or legacy pipeline), unless the render
+           ledger already holds its output
         5. Map ExecutionResult to task status
         6. Continue to next task (warn-and-continue)
         7. Finalize job when all tasks processed
@@ -782,6 +1017,8 @@ class JobEngine:
             Dict mapping task_id to ExecutionResult for reporting
         """
         from ..execution.results import ExecutionStatus
+        from ..execution.scheduler import get_scheduler
+        from ..filesystem.prefetch import PREFETCH_DEPTH, get_prefetch_cache
         from ..observability.trace import get_trace_manager
         from ..observability.invariants import (
             assert_naming_resolved,
@@ -794,7 +1031,8 @@ class JobEngine:
         
         logger = logging.getLogger(__name__)
         trace_mgr = get_trace_manager()
-        
+        scheduler = get_scheduler()
+
         # Track ExecutionResults for reporting (Phase 8)
         execution_results: Dict[str, "ExecutionResult"] = {}
         
@@ -809,12 +1047,43 @@ class JobEngine:
         # Get queued tasks (snapshot at start - some may have failed during path resolution)
         queued_tasks = [task for task in job.tasks if task.status == TaskStatus.QUEUED]
         
-        for task in queued_tasks:
+        # Render ledger: same for every clip of the job. It records only the
+        # primary output, so jobs with additional outputs always render
+        render_settings_fp = None
+        if self.render_ledger is not None and not job.settings.additional_outputs:
+            render_settings_fp = self._render_settings_fingerprint(
+                job, global_preset_id, preset_registry
+            )
+        
+        prefetch_cache = get_prefetch_cache()
+        
+        for index, task in enumerate(queued_tasks):
+            # Read ahead: copy the next clips' sources to local cache while
+            # this one encodes (no-op for sources on local disks)
+            prefetch_cache.prefetch(
+                next_task.source_path
+                for next_task in queued_tasks[index + 1:index + 1 + PREFETCH_DEPTH]
+            )
+            
             # Respect pause state before starting each clip
             if job.status == JobStatus.PAUSED:
                 logger.info(f"Job {job.id} paused, stopping at clip {task.id}")
                 break
-            
+
+            # Priority preemption: hand the slot to a more urgent job at the
+            # clip boundary, then continue once this job's turn comes again.
+            # The job stays RUNNING; its remaining clips stay QUEUED.
+            if scheduler.should_yield(job.id):
+                logger.info(f"Job {job.id} preempted before clip {task.id}")
+                scheduler.yield_execution(job.id)
+                if not scheduler.wait_for_turn(
+                    job.id, cancelled=lambda: job.status != JobStatus.RUNNING
+                ):
+                    # Cancelled or paused while preempted
+                    scheduler.remove_from_queue(job.id)
+                    logger.info(f"Job {job.id} stopped while preempted ({job.status.value})")
+                    break
+
             # ======================================================
             # V1 OBSERVABILITY: Create trace on job execution start
             # ======================================================
@@ -878,14 +1147,21 @@ class JobEngine:
             # Transition task to RUNNING
             self.update_task_status(task, TaskStatus.RUNNING)
             
-            # Execute single clip via engine
-            result = self._execute_task(
-                task=task,
-                job=job,
-                global_preset_id=global_preset_id,
-                preset_registry=preset_registry,
-                output_base_dir=output_base_dir,
-            )
+            # Reuse an identical earlier render, else execute single clip via engine
+            render_key = None
+            result = None
+            if render_settings_fp is not None:
+                render_key = self._render_key(task, job, render_settings_fp)
+                if render_key is not None:
+                    result = self._reuse_cached_render(task, render_key)
+            if result is None:
+                result = self._execute_task(
+                    task=task,
+                    job=job,
+                    global_preset_id=global_preset_id,
+                    preset_registry=preset_registry,
+                    output_base_dir=output_base_dir,
+                )
             
             # Store result for reporting (Phase 8)
             execution_results[task.id] = result
@@ -915,6 +1191,9 @@ class JobEngine:
                     # Output exists - task is truly COMPLETED
                     logger.info(f"[COMPLETION] Task {task.id} output verified: {result.output_path}")
                     
+                    if render_key is not None and not task.from_render_cache:
+                        self.render_ledger.record(render_key, result.output_path)
+                    
                     # V1 OBSERVABILITY: Record successful completion
                     trace_mgr.record_completion(
                         trace=trace,
@@ -922,6 +1201,7 @@ class JobEngine:
                         warnings=result.warnings,
                         output_file_exists=True,
                         output_file_size=output_size,
+                        output_checksums=result.checksums or None,
                     )
                     
                     if result.status == ExecutionStatus.SUCCESS_WITH_WARNINGS:
@@ -1152,11 +1432,16 @@ class JobEngine:
             # Extract output metadata from ExecutionResult
             output_path = None
             output_size_bytes = None
+            output_checksums = None
+            additional_output_paths = None
             execution_duration_seconds = None
             
             if result:
                 output_path = result.output_path
                 execution_duration_seconds = result.duration_seconds()
+                output_checksums = result.checksums.get(output_path)
+                if output_path:
+                    additional_output_paths = result.additional_output_paths
                 
                 # Get output file size if output exists
                 if output_path and Path(output_path).exists():
@@ -1167,6 +1452,8 @@ class JobEngine:
                 output_path=output_path,
                 output_size_bytes=output_size_bytes,
                 execution_duration_seconds=execution_duration_seconds,
+                output_checksums=output_checksums,
+                additional_output_paths=additional_output_paths,
             )
             clip_reports.append(clip_report)
         
@@ -15,8 +15,10 @@ Phase 17: DeliverSettings replaces JobSettings (breaking rename).
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List, TYPE_CHECKING, Dict, Any
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, TYPE_CHECKING, Dict, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from ..metadata.sequences import ImageSequence
 
 if TYPE_CHECKING:
     from ..execution.base import EngineType
@@ -24,6 +26,7 @@ if TYPE_CHECKING:
 # DeliverSettings is the canonical settings type (Phase 17)
 # Legacy JobSettings alias maintained in settings.py for migration
 from .settings import DeliverSettings, DEFAULT_DELIVER_SETTINGS
+from ..deliver.settings import get_settings_interner, settings_fingerprint
 
 
 class JobStatus(str, Enum):
@@ -47,6 +50,20 @@ class JobStatus(str, Enum):
     CANCELLED = "cancelled"  # Phase 13: Cancelled by operator (terminal)
 
 
+class JobPriority(str, Enum):
+    """
+    Scheduling priority lane of a job.
+    
+    Jobs in a more urgent lane are started first; waiting jobs are
+    promoted one lane per aging interval so bulk work is never starved.
+    """
+    
+    URGENT = "urgent"  # e.g. dailies needed on set
+    HIGH = "high"
+    NORMAL = "normal"  # Default
+    LOW = "low"  # e.g. archive re-transcodes
+
+
 class TaskStatus(str, Enum):
     """
     Clip task status.
@@ -109,6 +126,13 @@ class ClipTask(BaseModel):
     
     # Phase 20: Thumbnail preview (base64 data URI)
     thumbnail: Optional[str] = None  # Base64 data URI for preview image
+    
+    # Image sequence sources: source_path is the %0Nd pattern and this
+    # carries the resolved frame range (re-resolved from disk if None)
+    image_sequence: Optional[ImageSequence] = None
+    
+    # True if the output was reused from the render ledger instead of rendered
+    from_render_cache: bool = False
 
 
 class Job(BaseModel):
@@ -156,30 +180,61 @@ class Job(BaseModel):
     source_preset_name: Optional[str] = None  # Name of preset at creation time
     source_preset_fingerprint: Optional[str] = None  # SHA-256 hash of settings snapshot
     
+    # Watch folder that created this job (None for manual ingest).
+    # Used by the fair-share scheduling policy.
+    watch_folder_id: Optional[str] = None
+    
+    # Scheduling priority lane (editable while PENDING)
+    priority: JobPriority = JobPriority.NORMAL
+    
+    # Deserialized settings, memoized per dict object: (source dict, settings).
+    # The dicts are treated as immutable; assigning a new dict (or
+    # set_override_settings) invalidates. Instances are interned by
+    # fingerprint, so jobs sharing a preset share one DeliverSettings.
+    _snapshot_cache: Optional[Tuple[Dict[str, Any], DeliverSettings]] = PrivateAttr(default=None)
+    _override_cache: Optional[Tuple[Dict[str, Any], DeliverSettings]] = PrivateAttr(default=None)
+    
     @property
     def settings_snapshot(self) -> DeliverSettings:
         """Get the immutable settings snapshot from job creation."""
         if not self.settings_dict:
             return DEFAULT_DELIVER_SETTINGS
+        cached = self._snapshot_cache
+        if cached is not None and cached[0] is self.settings_dict:
+            return cached[1]
         # Handle legacy JobSettings format during migration
         if "video" not in self.settings_dict and "naming_template" in self.settings_dict:
-            return DeliverSettings.from_legacy_job_settings(self.settings_dict)
-        return DeliverSettings.from_dict(self.settings_dict)
+            factory = DeliverSettings.from_legacy_job_settings
+        else:
+            factory = DeliverSettings.from_dict
+        settings = get_settings_interner().intern(self.settings_dict, factory)
+        self._snapshot_cache = (self.settings_dict, settings)
+        return settings
     
     @property
     def override_settings(self) -> Optional[DeliverSettings]:
         """Get per-job override settings, if any."""
         if not self.override_settings_dict:
             return None
-        return DeliverSettings.from_dict(self.override_settings_dict)
+        cached = self._override_cache
+        if cached is not None and cached[0] is self.override_settings_dict:
+            return cached[1]
+        settings = get_settings_interner().intern(self.override_settings_dict)
+        self._override_cache = (self.override_settings_dict, settings)
+        return settings
     
     @property
     def effective_settings(self) -> DeliverSettings:
         """Get effective settings: overrides if present, else snapshot."""
         if self.override_settings_dict:
-            return DeliverSettings.from_dict(self.override_settings_dict)
+            return self.override_settings
         return self.settings_snapshot
     
+    @property
+    def settings_fingerprint(self) -> str:
+        """Fingerprint of the effective settings (see deliver.settings.settings_fingerprint)."""
+        return settings_fingerprint(self.override_settings_dict or self.settings_dict)
+    
     @property
     def settings(self) -> DeliverSettings:
         """
@@ -209,6 +264,7 @@ class Job(BaseModel):
                 f"Current status: {self.status.value}"
             )
         self.override_settings_dict = new_settings.to_dict()
+        self._override_cache = None
     
     def update_settings(self, new_settings: DeliverSettings) -> None:
         """
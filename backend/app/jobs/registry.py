@@ -17,6 +17,31 @@ from .models import Job, JobStatus, ClipTask, TaskStatus
 from .errors import JobNotFoundError
 
 
+def job_to_persistence_dict(job: Job) -> Dict:
+    """Serialize a job to the dict accepted by PersistenceManager.save_job()."""
+    return {
+        "id": job.id,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        "status": job.status.value,
+        "tasks": [
+            {
+                "id": task.id,
+                "source_path": task.source_path,
+                "status": task.status.value,
+                "started_at": task.started_at.isoformat() if task.started_at else None,
+                "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+                "failure_reason": task.failure_reason,
+                "warnings": task.warnings,
+                # Column kept for schema compatibility; ClipTask has no retries
+                "retry_count": 0,
+            }
+            for task in job.tasks
+        ],
+    }
+
+
 class JobRegistry:
     """
     In-memory registry for job tracking.
@@ -142,29 +167,7 @@ class JobRegistry:
         if not self._persistence:
             raise ValueError("No persistence_manager configured for JobRegistry")
         
-        # Serialize job to dict
-        job_data = {
-            "id": job.id,
-            "created_at": job.created_at.isoformat(),
-            "started_at": job.started_at.isoformat() if job.started_at else None,
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-            "status": job.status.value,
-            "tasks": [
-                {
-                    "id": task.id,
-                    "source_path": task.source_path,
-                    "status": task.status.value,
-                    "started_at": task.started_at.isoformat() if task.started_at else None,
-                    "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-                    "failure_reason": task.failure_reason,
-                    "warnings": task.warnings,
-                    "retry_count": task.retry_count,
-                }
-                for task in job.tasks
-            ],
-        }
-        
-        self._persistence.save_job(job_data)
+        self._persistence.save_job(job_to_persistence_dict(job))
     
     def load_all_jobs(self) -> None:
         """
@@ -192,7 +195,6 @@ class JobRegistry:
                     completed_at=datetime.fromisoformat(task_data["completed_at"]) if task_data["completed_at"] else None,
                     failure_reason=task_data["failure_reason"],
                     warnings=task_data["warnings"],
-                    retry_count=task_data["retry_count"],
                 )
                 for task_data in job_data["tasks"]
             ]
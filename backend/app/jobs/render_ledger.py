@@ -0,0 +1,206 @@
+"""
+Render ledger: reuse outputs that were already rendered.
+
+Re-submitting a folder used to re-encode every clip, even when an output
+made from the same source bytes with the same settings was already on
+disk. A render is identified by what determines its output:
+
+- Source fingerprint: identity (device, inode), size, mtime and sampled
+  content of the source file
+- Settings fingerprint: effective DeliverSettings (+ bound preset params)
+- Engine version: engine type and binary version
+
+The ledger maps that key to the output it produced (path, size, mtime).
+_process_job consults it before running a clip; if the recorded output is
+still on disk unchanged, the clip completes from cache without invoking
+the engine. Entries whose output changed or disappeared are dropped.
+
+Image sequence sources (frame patterns) are not fingerprinted and always
+render.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bytes hashed from the start and from the end of a source file
+SAMPLE_BYTES = 1 << 20
+
+
+@dataclass(frozen=True)
+class RenderKey:
+    """What determines a render's output."""
+    source_fingerprint: str
+    settings_fingerprint: str
+    engine_version: str
+
+
+@dataclass(frozen=True)
+class RenderLedgerEntry:
+    """The output a render produced, as it was on disk when recorded."""
+    key: RenderKey
+    output_path: str
+    output_size: int
+    output_mtime_ns: int
+    recorded_at: datetime
+
+    def matches_disk(self) -> bool:
+        """True if the output still exists with the recorded size and mtime."""
+        try:
+            st = os.stat(self.output_path)
+        except OSError:
+            return False
+        return st.st_size == self.output_size and st.st_mtime_ns == self.output_mtime_ns
+
+    def to_dict(self) -> Dict:
+        """Serialize for PersistenceManager.save_render_ledger_entry()."""
+        return {
+            "source_fingerprint": self.key.source_fingerprint,
+            "settings_fingerprint": self.key.settings_fingerprint,
+            "engine_version": self.key.engine_version,
+            "output_path": self.output_path,
+            "output_size": self.output_size,
+            "output_mtime_ns": self.output_mtime_ns,
+            "recorded_at": self.recorded_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RenderLedgerEntry":
+        return cls(
+            key=RenderKey(
+                source_fingerprint=data["source_fingerprint"],
+                settings_fingerprint=data["settings_fingerprint"],
+                engine_version=data["engine_version"],
+            ),
+            output_path=data["output_path"],
+            output_size=data["output_size"],
+            output_mtime_ns=data["output_mtime_ns"],
+            recorded_at=datetime.fromisoformat(data["recorded_at"]),
+        )
+
+
+def source_fingerprint(path: str) -> Optional[str]:
+    """
+    Fingerprint a source file by its identity and its first and last SAMPLE_BYTES.
+
+    The identity is the device, inode, size and mtime_ns: an edit in the
+    middle of the file that keeps its size changes the mtime, and a new
+    file written under the same name gets a new inode. Copies of a clip
+    therefore render again; that is the price of not reading whole
+    sources. Reads at most 2 * SAMPLE_BYTES regardless of file size, so
+    it is cheap next to a render.
+
+    Returns:
+        Hex digest, or None if path is not a readable regular file
+    """
+    try:
+        st = os.stat(path)
+        if not os.path.isfile(path):
+            return None
+        identity = f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+        digest = hashlib.sha256(identity.encode())
+        with open(path, "rb") as f:
+            digest.update(f.read(SAMPLE_BYTES))
+            if st.st_size > 2 * SAMPLE_BYTES:
+                f.seek(-SAMPLE_BYTES, os.SEEK_END)
+            digest.update(f.read(SAMPLE_BYTES))
+    except OSError:
+        return None
+    return digest.hexdigest()[:32]
+
+
+class RenderLedger:
+    """
+    In-memory render ledger with optional write-through persistence.
+
+    Thread-safe. One entry per RenderKey (the latest render wins).
+    """
+
+    def __init__(self, persistence_manager=None):
+        """
+        Initialize ledger.
+
+        Args:
+            persistence_manager: Optional PersistenceManager; entries are loaded
+                from it now and written through on every change
+        """
+        self._persistence = persistence_manager
+        self._entries: Dict[RenderKey, RenderLedgerEntry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if persistence_manager is not None:
+            for data in persistence_manager.load_render_ledger():
+                entry = RenderLedgerEntry.from_dict(data)
+                self._entries[entry.key] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: RenderKey) -> Optional[RenderLedgerEntry]:
+        """
+        Find a reusable output for key.
+
+        Returns:
+            The entry if its output is still on disk unchanged, else None
+            (a stale entry is forgotten)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None and not entry.matches_disk():
+            logger.info(f"[RenderLedger] Output changed or missing, forgetting: {entry.output_path}")
+            self.forget(key)
+            entry = None
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def record(self, key: RenderKey, output_path: str) -> Optional[RenderLedgerEntry]:
+        """
+        Record the output of a completed render.
+
+        Returns:
+            The new entry, or None if output_path cannot be stat'ed
+        """
+        try:
+            st = os.stat(output_path)
+        except OSError:
+            return None
+
+        entry = RenderLedgerEntry(
+            key=key,
+            output_path=output_path,
+            output_size=st.st_size,
+            output_mtime_ns=st.st_mtime_ns,
+            recorded_at=datetime.now(),
+        )
+        with self._lock:
+            self._entries[key] = entry
+        if self._persistence is not None:
+            self._persistence.save_render_ledger_entry(entry.to_dict())
+        return entry
+
+    def forget(self, key: RenderKey) -> None:
+        """Drop the entry for key (no-op if absent)."""
+        with self._lock:
+            removed = self._entries.pop(key, None)
+        if removed is not None and self._persistence is not None:
+            self._persistence.delete_render_ledger_entry(
+                key.source_fingerprint, key.settings_fingerprint, key.engine_version
+            )
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -12,10 +12,13 @@ from app.monitoring import server as monitoring
 from app.jobs.registry import JobRegistry
 from app.jobs.bindings import JobPresetBindingRegistry
 from app.jobs.engine import JobEngine
+from app.jobs.render_ledger import RenderLedger
 from app.presets.registry import PresetRegistry
 from app.persistence.manager import PersistenceManager
 from app.execution.engine_registry import get_engine_registry
+from app.execution.segments import get_segment_checkpoints
 from app.services.ingestion import IngestionService
+from app.filesystem.mount_health import get_mount_health_monitor
 
 app = FastAPI(title="Awaire Proxy Backend", version="1.0.0")
 
@@ -32,6 +35,9 @@ app.add_middleware(
 # Initialize persistence (Phase 12)
 persistence = PersistenceManager(db_path="./awaire_proxy.db")
 
+# Segment checkpoints of long encodes survive restarts
+get_segment_checkpoints().attach(persistence)
+
 # Initialize registries (Phase 4-13)
 app.state.job_registry = JobRegistry(persistence_manager=persistence)
 app.state.binding_registry = JobPresetBindingRegistry(persistence_manager=persistence)
@@ -57,6 +63,7 @@ for _p in _loaded_presets:
 app.state.job_engine = JobEngine(
     binding_registry=app.state.binding_registry,
     engine_registry=app.state.engine_registry,
+    render_ledger=RenderLedger(persistence_manager=persistence),
 )
 
 # Initialize canonical ingestion service (single entry point for all job creation)
@@ -121,6 +128,10 @@ app.include_router(control.router)  # Phase 14
 app.include_router(preview.router)  # Alpha: Preview video generation
 app.include_router(filesystem.router)  # Phase 4A: Directory navigator
 
+# Background mount health checks: /filesystem/roots is served from memory
+# and browse/enumerate short-circuit mounts that stopped responding
+get_mount_health_monitor().start()
+
 
 @app.get("/")
 async def root():
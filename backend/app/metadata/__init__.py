@@ -15,6 +15,10 @@ Usage:
     
     metadata = extract_metadata("/path/to/file.mov")
     print(summarize_metadata(metadata))
+    
+    # Image sequences are addressed by their pattern path
+    metadata = extract_metadata("/path/to/plate.%06d.exr")
+    print(metadata.image_sequence.first_frame, metadata.image_sequence.gaps)
 """
 
 from .errors import (
@@ -33,6 +37,14 @@ from .models import (
     ChromaSubsampling,
     GOPType,
 )
+from .sequences import (
+    ImageSequence,
+    ImageSequenceCache,
+    get_image_sequence,
+    get_sequence_cache,
+    is_sequence_pattern,
+    resolve_image_sequence,
+)
 from .extractors import (
     extract_metadata,
     check_ffprobe_available,
@@ -59,6 +71,13 @@ __all__ = [
     "MediaAudio",
     "ChromaSubsampling",
     "GOPType",
+    # Image sequences
+    "ImageSequence",
+    "ImageSequenceCache",
+    "get_image_sequence",
+    "get_sequence_cache",
+    "is_sequence_pattern",
+    "resolve_image_sequence",
     # Extraction
     "extract_metadata",
     "check_ffprobe_available",
@@ -26,6 +26,7 @@ from .models import (
     ChromaSubsampling,
     GOPType,
 )
+from .sequences import ImageSequence, get_image_sequence, is_sequence_pattern
 from .errors import (
     MetadataExtractionError,
     FFProbeNotFoundError,
@@ -54,14 +55,22 @@ def check_ffprobe_available() -> bool:
     return _ffprobe_available
 
 
-def extract_metadata(filepath: str) -> MediaMetadata:
+def extract_metadata(
+    filepath: str,
+    image_sequence: Optional[ImageSequence] = None,
+) -> MediaMetadata:
     """
     Extract metadata from a media file using ffprobe.
     
     This is the main entry point for metadata extraction.
     
+    Image sequence patterns (clip.%06d.exr) are accepted: only the first
+    frame is probed, and duration is derived from the frame range.
+    
     Args:
-        filepath: Absolute path to the media file
+        filepath: Absolute path to the media file, or an image sequence pattern
+        image_sequence: Already-resolved sequence for a pattern path (skips
+            resolving it again)
         
     Returns:
         MediaMetadata object with all extracted information
@@ -74,6 +83,9 @@ def extract_metadata(filepath: str) -> MediaMetadata:
     if not check_ffprobe_available():
         raise FFProbeNotFoundError()
     
+    if image_sequence is not None or is_sequence_pattern(filepath):
+        return _extract_sequence_metadata(filepath, image_sequence)
+    
     path = Path(filepath)
     
     if not path.exists():
@@ -129,6 +141,72 @@ def extract_metadata(filepath: str) -> MediaMetadata:
     return metadata
 
 
+def _extract_sequence_metadata(
+    pattern: str,
+    image_sequence: Optional[ImageSequence],
+) -> MediaMetadata:
+    """
+    Extract metadata for an image sequence by probing its first frame.
+    
+    Raises:
+        MetadataExtractionError: If no frames match or the frame cannot be probed
+    """
+    if image_sequence is None:
+        try:
+            image_sequence = get_image_sequence(pattern)
+        except OSError as e:
+            raise MetadataExtractionError(pattern, f"Cannot read sequence directory: {e}")
+        if image_sequence is None:
+            raise MetadataExtractionError(pattern, "No frames match image sequence pattern")
+    
+    first_frame = image_sequence.first_frame_path
+    try:
+        probe_data = _run_ffprobe(first_frame)
+    except subprocess.CalledProcessError as e:
+        raise MetadataExtractionError(
+            pattern, f"ffprobe failed on first frame with exit code {e.returncode}"
+        )
+    except json.JSONDecodeError as e:
+        raise MetadataExtractionError(
+            pattern, f"Failed to parse ffprobe output: {e}"
+        )
+    
+    try:
+        image = _extract_image(probe_data)
+        codec = _extract_codec(probe_data)
+    except Exception as e:
+        raise MetadataExtractionError(
+            pattern, f"Failed to parse metadata: {e}"
+        )
+    
+    # Image files carry no timebase: time comes from the frame range
+    time = MediaTime(
+        duration_seconds=image_sequence.duration_seconds,
+        frame_rate=image_sequence.frame_rate,
+    )
+    
+    # Sequences are decoded by the image2 demuxer regardless of the
+    # per-frame container name, so only the codec is checked
+    is_supported, skip_reason = _determine_support(codec, image, is_sequence=True)
+    
+    identity = _extract_identity(Path(pattern))
+    metadata = MediaMetadata(
+        identity=identity,
+        time=time,
+        image=image,
+        codec=codec,
+        audio=None,
+        image_sequence=image_sequence,
+        is_supported=is_supported,
+        skip_reason=skip_reason,
+        warnings=[],
+    )
+    
+    _add_warnings(metadata)
+    
+    return metadata
+
+
 def _run_ffprobe(filepath: str) -> Dict[str, Any]:
     """
     Run ffprobe and return parsed JSON output.
@@ -530,7 +608,11 @@ def _detect_gop_type(codec_name: str) -> GOPType:
     return GOPType.UNKNOWN
 
 
-def _determine_support(codec: MediaCodec, image: MediaImage) -> tuple[bool, Optional[str]]:
+def _determine_support(
+    codec: MediaCodec,
+    image: MediaImage,
+    is_sequence: bool = False,
+) -> tuple[bool, Optional[str]]:
     """
     Determine if a file is supported for processing.
     
@@ -541,6 +623,7 @@ def _determine_support(codec: MediaCodec, image: MediaImage) -> tuple[bool, Opti
     Args:
         codec: Codec metadata
         image: Image metadata
+        is_sequence: Source is an image sequence (container is not checked)
         
     Returns:
         Tuple of (is_supported, skip_reason)
@@ -555,7 +638,7 @@ def _determine_support(codec: MediaCodec, image: MediaImage) -> tuple[bool, Opti
     
     # Unknown containers
     known_containers = ["mov", "mxf", "mp4", "avi", "mkv"]
-    if codec.container not in known_containers:
+    if not is_sequence and codec.container not in known_containers:
         return False, f"Unsupported container: {codec.container}"
     
     # All other files are supported (even if they warn)
@@ -588,10 +671,21 @@ def _add_warnings(metadata: MediaMetadata) -> None:
             f"Unusual bit depth: {metadata.image.bit_depth} bits"
         )
     
-    # No audio warning
-    if metadata.audio is None:
+    # No audio warning (image sequences never carry audio)
+    if metadata.audio is None and metadata.image_sequence is None:
         metadata.add_warning("No audio tracks detected")
     
+    # Missing frames: FFmpeg's image2 demuxer stops at the first one, so the
+    # engine fails the clip unless the frames land before it renders
+    sequence = metadata.image_sequence
+    if sequence is not None and sequence.has_gaps:
+        first_missing = sequence.gaps[0][0]
+        metadata.add_warning(
+            f"Image sequence is missing {sequence.missing_frame_count} frame(s) "
+            f"in {len(sequence.gaps)} gap(s), first missing frame {first_missing} - "
+            "render will fail unless the missing frames arrive"
+        )
+    
     # Drop frame mismatch warning
     if metadata.time.drop_frame and metadata.time.timecode_start:
         # Drop frame timecode should use ";" separator
@@ -12,6 +12,8 @@ from typing import Optional
 from pathlib import Path
 from pydantic import BaseModel, ConfigDict, field_validator
 
+from .sequences import ImageSequence
+
 
 class ChromaSubsampling(str, Enum):
     """Chroma subsampling format."""
@@ -173,6 +175,9 @@ class MediaMetadata(BaseModel):
     codec: MediaCodec
     audio: Optional[MediaAudio] = None
     
+    # Set when the source is an image sequence (identity is the pattern path)
+    image_sequence: Optional[ImageSequence] = None
+    
     # Workflow flags
     is_supported: bool
     skip_reason: Optional[str] = None  # Human-readable explanation if unsupported
@@ -0,0 +1,283 @@
+"""
+Image sequence sources.
+
+A numbered image sequence (clip.000101.exr ... clip.000250.exr) is ONE
+source, addressed by its FFmpeg pattern path (clip.%06d.exr). The pattern
+alone loses what the frames on disk say, so ImageSequence carries it:
+
+- first/last frame (FFmpeg needs -start_number for sequences not starting at 0/1)
+- padding
+- missing-frame gaps (the image2 demuxer stops at the first missing frame,
+  so a sequence with gaps is refused rather than rendered short)
+- total bytes
+
+A sequence is resolved with ONE os.scandir of its directory (string prefix/
+suffix checks per name, no regex, no glob) and cached against the directory
+mtime, so ingestion, metadata extraction and the FFmpeg engine share one
+resolution instead of each re-globbing the frames. Metadata extraction
+probes only the first frame.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from ..filesystem.enumeration import FrameRanges, SequenceGroup
+
+# Frame rate used when the sequence itself carries none (image files have no
+# timebase; FFmpeg's image2 demuxer would otherwise assume 25)
+DEFAULT_SEQUENCE_FRAME_RATE = 24.0
+
+# Resolved sequences kept by the process-wide cache
+MAX_CACHED_SEQUENCES = 256
+
+# Directories modified this recently are not cached (frames may still be landing)
+MTIME_GRACE_SECONDS = 2.0
+
+# printf-style frame token in a pattern filename, e.g. %06d
+_FRAME_TOKEN = re.compile(r"%0(\d)d")
+
+
+class ImageSequence(BaseModel):
+    """
+    A numbered image sequence resolved from disk.
+
+    pattern is the FFmpeg-compatible pattern path and is what ClipTask.source_path
+    holds for sequence sources.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    pattern: str
+    first_frame: int
+    last_frame: int
+    padding: int
+    frame_count: int
+    gaps: List[Tuple[int, int]] = []  # Inclusive (first, last) missing frame ranges
+    total_bytes: int = 0
+    frame_rate: float = DEFAULT_SEQUENCE_FRAME_RATE
+
+    @property
+    def directory(self) -> str:
+        return os.path.dirname(self.pattern)
+
+    @property
+    def has_gaps(self) -> bool:
+        return bool(self.gaps)
+
+    @property
+    def missing_frame_count(self) -> int:
+        return sum(last - first + 1 for first, last in self.gaps)
+
+    @property
+    def duration_seconds(self) -> float:
+        """Duration of the rendered range, gaps included (first to last frame)."""
+        return (self.last_frame - self.first_frame + 1) / self.frame_rate
+
+    @property
+    def first_frame_path(self) -> str:
+        return self.frame_path(self.first_frame)
+
+    def frame_path(self, frame: int) -> str:
+        """Path of one frame of the sequence."""
+        directory, prefix, padding, suffix = parse_sequence_pattern(self.pattern)
+        return os.path.join(directory, f"{prefix}{frame:0{padding}d}{suffix}")
+
+    def input_args(self) -> List[str]:
+        """
+        FFmpeg options that must precede "-i <pattern>".
+
+        Raises:
+            ValueError: If frames are missing (FFmpeg would silently stop
+                at the first gap and the render would end short)
+        """
+        if self.has_gaps:
+            first, last = self.gaps[0]
+            missing = str(first) if first == last else f"{first}-{last}"
+            raise ValueError(
+                f"Image sequence {os.path.basename(self.pattern)} is missing "
+                f"{self.missing_frame_count} frame(s) in {len(self.gaps)} gap(s), "
+                f"first missing: {missing}"
+            )
+        return [
+            "-framerate", f"{self.frame_rate:g}",
+            "-start_number", str(self.first_frame),
+        ]
+
+
+def parse_sequence_pattern(path: str) -> Optional[Tuple[str, str, int, str]]:
+    """
+    Split a pattern path into (directory, prefix, padding, suffix).
+
+    Returns None unless the filename contains exactly one %0Nd token.
+    """
+    directory, name = os.path.split(path)
+    tokens = list(_FRAME_TOKEN.finditer(name))
+    if len(tokens) != 1:
+        return None
+    token = tokens[0]
+    return directory, name[:token.start()], int(token.group(1)), name[token.end():]
+
+
+def is_sequence_pattern(path: str) -> bool:
+    """True if path is an image sequence pattern rather than a file path."""
+    return parse_sequence_pattern(path) is not None
+
+
+def source_stem(path: str) -> str:
+    """
+    Filename stem used for output naming ({source_name}).
+
+    For a pattern the frame token and its separator are dropped, so
+    plate.%06d.exr names outputs "plate" rather than "plate.%06d".
+    """
+    parsed = parse_sequence_pattern(path)
+    if parsed is None:
+        return os.path.splitext(os.path.basename(path))[0]
+    prefix = parsed[1].rstrip("._-")
+    return prefix or os.path.basename(parsed[0]) or "sequence"
+
+
+def resolve_image_sequence(
+    pattern: str,
+    frame_rate: float = DEFAULT_SEQUENCE_FRAME_RATE,
+) -> Optional[ImageSequence]:
+    """
+    Resolve a pattern path against the frames currently on disk.
+
+    Returns:
+        ImageSequence, or None if path is not a pattern or no frames match
+
+    Raises:
+        OSError: If the sequence directory cannot be read
+    """
+    parsed = parse_sequence_pattern(pattern)
+    if parsed is None:
+        return None
+    directory, prefix, padding, suffix = parsed
+
+    frames = FrameRanges()
+    total_bytes = 0
+    prefix_len = len(prefix)
+    name_len = prefix_len + padding + len(suffix)
+
+    with os.scandir(directory or ".") as it:
+        for entry in it:
+            name = entry.name
+            if len(name) != name_len or not name.startswith(prefix) or not name.endswith(suffix):
+                continue
+            digits = name[prefix_len:prefix_len + padding]
+            if not (digits.isascii() and digits.isdigit()):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                total_bytes += entry.stat().st_size
+            except OSError:
+                continue
+            frames.add(int(digits))
+
+    if frames.count == 0:
+        return None
+
+    return ImageSequence(
+        pattern=pattern,
+        first_frame=frames.first,
+        last_frame=frames.last,
+        padding=padding,
+        frame_count=frames.count,
+        gaps=frames.gaps(),
+        total_bytes=total_bytes,
+        frame_rate=frame_rate,
+    )
+
+
+def image_sequence_from_group(group: SequenceGroup, total_bytes: int = 0) -> ImageSequence:
+    """Build an ImageSequence from an enumeration SequenceGroup (no I/O)."""
+    frames = group.frames
+    return ImageSequence(
+        pattern=group.pattern,
+        first_frame=frames.first,
+        last_frame=frames.last,
+        padding=group.padding,
+        frame_count=frames.count,
+        gaps=frames.gaps(),
+        total_bytes=total_bytes,
+    )
+
+
+class ImageSequenceCache:
+    """
+    LRU cache of resolved sequences validated by directory mtime.
+
+    Thread-safe: sequences are resolved from ingest probe threads and
+    execution threads.
+    """
+
+    def __init__(self, max_sequences: int = MAX_CACHED_SEQUENCES):
+        self._max_sequences = max_sequences
+        self._sequences: "OrderedDict[str, Tuple[int, ImageSequence]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, pattern: str) -> Optional[ImageSequence]:
+        """
+        Return the sequence for pattern, rescanning only if its directory changed.
+
+        Returns:
+            ImageSequence, or None if path is not a pattern or no frames match
+
+        Raises:
+            OSError: If the sequence directory cannot be read
+        """
+        parsed = parse_sequence_pattern(pattern)
+        if parsed is None:
+            return None
+
+        dir_stat = os.stat(parsed[0] or ".")
+        with self._lock:
+            cached = self._sequences.get(pattern)
+            if cached is not None and cached[0] == dir_stat.st_mtime_ns:
+                self._sequences.move_to_end(pattern)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        sequence = resolve_image_sequence(pattern)
+        if sequence is None:
+            return None
+
+        if time.time() - dir_stat.st_mtime >= MTIME_GRACE_SECONDS:
+            with self._lock:
+                self._sequences[pattern] = (dir_stat.st_mtime_ns, sequence)
+                self._sequences.move_to_end(pattern)
+                while len(self._sequences) > self._max_sequences:
+                    self._sequences.popitem(last=False)
+
+        return sequence
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sequences.clear()
+
+
+_sequence_cache: Optional[ImageSequenceCache] = None
+
+
+def get_sequence_cache() -> ImageSequenceCache:
+    """Get the process-wide image sequence cache."""
+    global _sequence_cache
+    if _sequence_cache is None:
+        _sequence_cache = ImageSequenceCache()
+    return _sequence_cache
+
+
+def get_image_sequence(pattern: str) -> Optional[ImageSequence]:
+    """Resolve pattern via the process-wide cache (see ImageSequenceCache.get)."""
+    return get_sequence_cache().get(pattern)
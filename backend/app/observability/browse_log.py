@@ -35,6 +35,10 @@ class BrowseEventType(str, Enum):
     BROWSE_ERROR = "browse_error"  # Directory listing failed
     ENUMERATE_REQUESTED = "enumerate_requested"  # Folder enumeration started
     ENUMERATE_RESPONSE = "enumerate_response"  # Folder enumeration completed
+    WORKER_STUCK = "worker_stuck"  # I/O worker still blocked after its caller timed out
+    WORKER_RELEASED = "worker_released"  # Stuck I/O worker finally returned
+    CIRCUIT_OPENED = "circuit_opened"  # Mount I/O rejected until it recovers
+    CIRCUIT_CLOSED = "circuit_closed"  # Mount I/O accepted again
 
 
 class BrowseEvent(BaseModel):
@@ -287,6 +291,61 @@ class BrowseEventLog:
             duration_ms=duration_ms,
         ))
     
+    def record_worker_stuck(self, path: str, mount_point: str, stuck_workers: int) -> None:
+        """
+        Record an I/O worker left blocked on a mount after its caller timed out.
+        
+        Args:
+            path: Path the worker was accessing
+            mount_point: Mount the worker is stuck on
+            stuck_workers: Workers currently stuck on that mount
+        """
+        self._record(BrowseEvent(
+            event_type=BrowseEventType.WORKER_STUCK,
+            timestamp=self._now(),
+            path=path,
+            success=False,
+            error_type="worker_stuck",
+            error_message=f"I/O worker still blocked on {mount_point}",
+            context={"mount_point": mount_point, "stuck_workers": stuck_workers},
+        ))
+    
+    def record_worker_released(self, mount_point: str, stuck_seconds: float, stuck_workers: int) -> None:
+        """
+        Record a stuck I/O worker returning.
+        
+        Args:
+            mount_point: Mount the worker was stuck on
+            stuck_seconds: Time between the caller's timeout and the return
+            stuck_workers: Workers still stuck on that mount
+        """
+        self._record(BrowseEvent(
+            event_type=BrowseEventType.WORKER_RELEASED,
+            timestamp=self._now(),
+            path=mount_point,
+            duration_ms=stuck_seconds * 1000,
+            context={"mount_point": mount_point, "stuck_workers": stuck_workers},
+        ))
+    
+    def record_circuit_change(self, mount_point: str, opened: bool, reason: str) -> None:
+        """
+        Record a mount circuit breaker opening or closing.
+        
+        Args:
+            mount_point: Mount whose circuit changed
+            opened: True when I/O to the mount is now rejected
+            reason: Human-readable cause
+        """
+        self._record(BrowseEvent(
+            event_type=BrowseEventType.CIRCUIT_OPENED if opened else BrowseEventType.CIRCUIT_CLOSED,
+            timestamp=self._now(),
+            path=mount_point,
+            success=not opened,
+            error_type="circuit_open" if opened else None,
+            error_message=reason if opened else None,
+            context={"mount_point": mount_point, "reason": reason},
+        ))
+    
     def get_events(self, limit: Optional[int] = None) -> List[BrowseEvent]:
         """
         Get recent browse events.
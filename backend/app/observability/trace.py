@@ -108,6 +108,7 @@ class JobExecutionTrace(BaseModel):
     # ==================== VERIFICATION ====================
     output_file_exists: Optional[bool] = None  # True if file verified on disk
     output_file_size_bytes: Optional[int] = None
+    output_checksums: Optional[Dict[str, Dict[str, str]]] = None  # Output path -> algorithm -> hex digest
     verification_timestamp: Optional[str] = None
     
     # ==================== PREVIEW METADATA ====================
@@ -330,6 +331,7 @@ class TraceManager:
         warnings: Optional[List[str]] = None,
         output_file_exists: Optional[bool] = None,
         output_file_size: Optional[int] = None,
+        output_checksums: Optional[Dict[str, Dict[str, str]]] = None,
     ) -> None:
         """
         Record job completion.
@@ -343,12 +345,14 @@ class TraceManager:
             warnings: List of warnings encountered
             output_file_exists: Whether output file was verified on disk
             output_file_size: Size of output file in bytes
+            output_checksums: Checksums computed while the output was written
         """
         trace.final_status = final_status
         trace.failure_reason = failure_reason
         trace.warnings = warnings or []
         trace.output_file_exists = output_file_exists
         trace.output_file_size_bytes = output_file_size
+        trace.output_checksums = output_checksums
         trace.verification_timestamp = datetime.now().isoformat()
         
         self._write_trace(trace)
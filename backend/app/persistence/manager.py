@@ -8,7 +8,7 @@ Explicit save/load only - no auto-persistence.
 import sqlite3
 import json
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime
 from contextlib import contextmanager
 
@@ -16,7 +16,7 @@ from .errors import PersistenceError, SchemaError, LoadError, SaveError
 
 
 # Database schema version for migrations
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 5
 
 
 class PersistenceManager:
@@ -28,6 +28,9 @@ class PersistenceManager:
     - Preset bindings (job_id → preset_id)
     - Watch folder configurations
     - Processed files tracking
+    - Watch folder directory snapshots (incremental scanning)
+    - Render ledger (outputs reusable for identical source + settings)
+    - Segment checkpoints (completed segments of long encodes)
     
     Does NOT store:
     - Preset definitions (remain file-based)
@@ -159,6 +162,78 @@ class PersistenceManager:
                 "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
                 (1, datetime.now().isoformat())
             )
+        
+        if from_version < 2:
+            # Per-directory state for snapshot-diff watch folder scanning
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS watch_folder_dir_snapshots (
+                    watch_folder_id TEXT NOT NULL,
+                    dir_path TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    entry_count INTEGER NOT NULL,
+                    subdirs TEXT NOT NULL,
+                    PRIMARY KEY (watch_folder_id, dir_path)
+                )
+            """)
+            
+            cursor.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (2, datetime.now().isoformat())
+            )
+        
+        if from_version < 3:
+            # Render ledger: (source, settings, engine) -> output it produced
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS render_ledger (
+                    source_fingerprint TEXT NOT NULL,
+                    settings_fingerprint TEXT NOT NULL,
+                    engine_version TEXT NOT NULL,
+                    output_path TEXT NOT NULL,
+                    output_size INTEGER NOT NULL,
+                    output_mtime_ns INTEGER NOT NULL,
+                    recorded_at TEXT NOT NULL,
+                    PRIMARY KEY (source_fingerprint, settings_fingerprint, engine_version)
+                )
+            """)
+            
+            cursor.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (3, datetime.now().isoformat())
+            )
+        
+        if from_version < 4:
+            # Segment checkpoints: completed time ranges of segmented encodes
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS segment_checkpoints (
+                    checkpoint_key TEXT NOT NULL,
+                    segment_index INTEGER NOT NULL,
+                    start_seconds REAL NOT NULL,
+                    end_seconds REAL NOT NULL,
+                    segment_path TEXT NOT NULL,
+                    segment_size INTEGER NOT NULL,
+                    recorded_at TEXT NOT NULL,
+                    PRIMARY KEY (checkpoint_key, segment_index)
+                )
+            """)
+            
+            cursor.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (4, datetime.now().isoformat())
+            )
+        
+        if from_version < 5:
+            # Per-folder image sequence ingest (off for existing folders)
+            cursor.execute(
+                "ALTER TABLE watch_folders ADD COLUMN detect_sequences INTEGER NOT NULL DEFAULT 0"
+            )
+            cursor.execute(
+                "ALTER TABLE watch_folders ADD COLUMN sequence_settle_seconds REAL NOT NULL DEFAULT 60"
+            )
+            
+            cursor.execute(
+                "INSERT INTO schema_version (version, applied_at) VALUES (?, ?)",
+                (5, datetime.now().isoformat())
+            )
     
     # Job persistence
     
@@ -169,46 +244,76 @@ class PersistenceManager:
         Args:
             job_data: Dict with keys: id, created_at, started_at, completed_at, status, tasks
         """
+        with self._connect() as conn:
+            self._write_job(conn.cursor(), job_data)
+    
+    def save_ingest_batch(self, jobs: List[Dict], processed_files: List[Tuple[str, str]]):
+        """
+        Save newly ingested jobs and their processed-file markers in ONE transaction.
+        
+        Used by watch folder burst ingest, so a card offload of N clips is
+        one commit instead of 2N, and a crash cannot leave a job without its
+        marker (or a marker without its job).
+        
+        Args:
+            jobs: Job dicts as accepted by save_job()
+            processed_files: (watch_folder_id, file_path) pairs
+        """
+        processed_at = datetime.now().isoformat()
         with self._connect() as conn:
             cursor = conn.cursor()
-            
-            # Upsert job
-            cursor.execute("""
-                INSERT INTO jobs (id, created_at, started_at, completed_at, status)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    started_at = excluded.started_at,
-                    completed_at = excluded.completed_at,
-                    status = excluded.status
-            """, (
+            for job_data in jobs:
+                self._write_job(cursor, job_data)
+            cursor.executemany("""
+                INSERT INTO processed_files (file_path, watch_folder_id, processed_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(file_path) DO NOTHING
+            """, [
+                (file_path, watch_folder_id, processed_at)
+                for watch_folder_id, file_path in processed_files
+            ])
+    
+    @staticmethod
+    def _write_job(cursor, job_data: Dict):
+        """Upsert a job and replace its tasks (caller owns the transaction)."""
+        cursor.execute("""
+            INSERT INTO jobs (id, created_at, started_at, completed_at, status)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                started_at = excluded.started_at,
+                completed_at = excluded.completed_at,
+                status = excluded.status
+        """, (
+            job_data["id"],
+            job_data["created_at"],
+            job_data.get("started_at"),
+            job_data.get("completed_at"),
+            job_data["status"],
+        ))
+        
+        # Delete existing tasks for this job
+        cursor.execute("DELETE FROM clip_tasks WHERE job_id = ?", (job_data["id"],))
+        
+        # Insert tasks
+        cursor.executemany("""
+            INSERT INTO clip_tasks (
+                id, job_id, source_path, status,
+                started_at, completed_at, failure_reason, warnings, retry_count
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                task["id"],
                 job_data["id"],
-                job_data["created_at"],
-                job_data.get("started_at"),
-                job_data.get("completed_at"),
-                job_data["status"],
-            ))
-            
-            # Delete existing tasks for this job
-            cursor.execute("DELETE FROM clip_tasks WHERE job_id = ?", (job_data["id"],))
-            
-            # Insert tasks
-            for task in job_data.get("tasks", []):
-                cursor.execute("""
-                    INSERT INTO clip_tasks (
-                        id, job_id, source_path, status,
-                        started_at, completed_at, failure_reason, warnings, retry_count
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    task["id"],
-                    job_data["id"],
-                    task["source_path"],
-                    task["status"],
-                    task.get("started_at"),
-                    task.get("completed_at"),
-                    task.get("failure_reason"),
-                    json.dumps(task.get("warnings", [])),
-                    task.get("retry_count", 0),
-                ))
+                task["source_path"],
+                task["status"],
+                task.get("started_at"),
+                task.get("completed_at"),
+                task.get("failure_reason"),
+                json.dumps(task.get("warnings", [])),
+                task.get("retry_count", 0),
+            )
+            for task in job_data.get("tasks", [])
+        ])
     
     def load_job(self, job_id: str) -> Optional[Dict]:
         """
@@ -317,19 +422,23 @@ class PersistenceManager:
         Save or update a watch folder configuration.
         
         Args:
-            watch_folder_data: Dict with keys: id, path, enabled, recursive, preset_id, auto_execute, created_at
+            watch_folder_data: Dict with keys: id, path, enabled, recursive, preset_id, auto_execute,
+                detect_sequences, sequence_settle_seconds, created_at
         """
         with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                INSERT INTO watch_folders (id, path, enabled, recursive, preset_id, auto_execute, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO watch_folders (id, path, enabled, recursive, preset_id, auto_execute,
+                                           detect_sequences, sequence_settle_seconds, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(id) DO UPDATE SET
                     path = excluded.path,
                     enabled = excluded.enabled,
                     recursive = excluded.recursive,
                     preset_id = excluded.preset_id,
-                    auto_execute = excluded.auto_execute
+                    auto_execute = excluded.auto_execute,
+                    detect_sequences = excluded.detect_sequences,
+                    sequence_settle_seconds = excluded.sequence_settle_seconds
             """, (
                 watch_folder_data["id"],
                 watch_folder_data["path"],
@@ -337,6 +446,8 @@ class PersistenceManager:
                 1 if watch_folder_data["recursive"] else 0,
                 watch_folder_data.get("preset_id"),
                 1 if watch_folder_data["auto_execute"] else 0,
+                1 if watch_folder_data.get("detect_sequences") else 0,
+                watch_folder_data.get("sequence_settle_seconds", 60.0),
                 watch_folder_data["created_at"],
             ))
     
@@ -350,15 +461,7 @@ class PersistenceManager:
             if not row:
                 return None
             
-            return {
-                "id": row["id"],
-                "path": row["path"],
-                "enabled": bool(row["enabled"]),
-                "recursive": bool(row["recursive"]),
-                "preset_id": row["preset_id"],
-                "auto_execute": bool(row["auto_execute"]),
-                "created_at": row["created_at"],
-            }
+            return self._watch_folder_from_row(row)
     
     def load_all_watch_folders(self) -> List[Dict]:
         """Load all watch folder configurations."""
@@ -366,18 +469,21 @@ class PersistenceManager:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM watch_folders")
             
-            return [
-                {
-                    "id": row["id"],
-                    "path": row["path"],
-                    "enabled": bool(row["enabled"]),
-                    "recursive": bool(row["recursive"]),
-                    "preset_id": row["preset_id"],
-                    "auto_execute": bool(row["auto_execute"]),
-                    "created_at": row["created_at"],
-                }
-                for row in cursor.fetchall()
-            ]
+            return [self._watch_folder_from_row(row) for row in cursor.fetchall()]
+    
+    @staticmethod
+    def _watch_folder_from_row(row) -> Dict:
+        return {
+            "id": row["id"],
+            "path": row["path"],
+            "enabled": bool(row["enabled"]),
+            "recursive": bool(row["recursive"]),
+            "preset_id": row["preset_id"],
+            "auto_execute": bool(row["auto_execute"]),
+            "detect_sequences": bool(row["detect_sequences"]),
+            "sequence_settle_seconds": row["sequence_settle_seconds"],
+            "created_at": row["created_at"],
+        }
     
     def delete_watch_folder(self, watch_folder_id: str):
         """Delete a watch folder configuration."""
@@ -432,3 +538,177 @@ class PersistenceManager:
         with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM processed_files WHERE watch_folder_id = ?", (watch_folder_id,))
+    
+    # Watch folder directory snapshots
+    
+    def save_directory_snapshot(
+        self,
+        watch_folder_id: str,
+        changed: Dict[str, Dict],
+        removed: List[str],
+    ):
+        """
+        Apply incremental changes to a watch folder's directory snapshot.
+        
+        Args:
+            watch_folder_id: Watch folder ID
+            changed: dir_path -> {"mtime_ns", "entry_count", "subdirs"}
+            removed: Directory paths no longer present
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO watch_folder_dir_snapshots
+                    (watch_folder_id, dir_path, mtime_ns, entry_count, subdirs)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(watch_folder_id, dir_path) DO UPDATE SET
+                    mtime_ns = excluded.mtime_ns,
+                    entry_count = excluded.entry_count,
+                    subdirs = excluded.subdirs
+            """, [
+                (watch_folder_id, dir_path, state["mtime_ns"], state["entry_count"],
+                 json.dumps(list(state["subdirs"])))
+                for dir_path, state in changed.items()
+            ])
+            cursor.executemany(
+                "DELETE FROM watch_folder_dir_snapshots WHERE watch_folder_id = ? AND dir_path = ?",
+                [(watch_folder_id, dir_path) for dir_path in removed]
+            )
+    
+    def load_directory_snapshot(self, watch_folder_id: str) -> Dict[str, Dict]:
+        """
+        Load a watch folder's directory snapshot.
+        
+        Returns:
+            dir_path -> {"mtime_ns", "entry_count", "subdirs"}
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT dir_path, mtime_ns, entry_count, subdirs "
+                "FROM watch_folder_dir_snapshots WHERE watch_folder_id = ?",
+                (watch_folder_id,)
+            )
+            return {
+                row["dir_path"]: {
+                    "mtime_ns": row["mtime_ns"],
+                    "entry_count": row["entry_count"],
+                    "subdirs": json.loads(row["subdirs"]),
+                }
+                for row in cursor.fetchall()
+            }
+    
+    def clear_directory_snapshot(self, watch_folder_id: str):
+        """Forget a watch folder's directory snapshot (forces a full walk)."""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "DELETE FROM watch_folder_dir_snapshots WHERE watch_folder_id = ?",
+                (watch_folder_id,)
+            )
+    
+    # Render ledger
+    
+    def save_render_ledger_entry(self, entry_data: Dict):
+        """
+        Save or replace a render ledger entry.
+        
+        Args:
+            entry_data: Dict with keys: source_fingerprint, settings_fingerprint,
+                engine_version, output_path, output_size, output_mtime_ns, recorded_at
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO render_ledger (
+                    source_fingerprint, settings_fingerprint, engine_version,
+                    output_path, output_size, output_mtime_ns, recorded_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(source_fingerprint, settings_fingerprint, engine_version) DO UPDATE SET
+                    output_path = excluded.output_path,
+                    output_size = excluded.output_size,
+                    output_mtime_ns = excluded.output_mtime_ns,
+                    recorded_at = excluded.recorded_at
+            """, (
+                entry_data["source_fingerprint"],
+                entry_data["settings_fingerprint"],
+                entry_data["engine_version"],
+                entry_data["output_path"],
+                entry_data["output_size"],
+                entry_data["output_mtime_ns"],
+                entry_data["recorded_at"],
+            ))
+    
+    def load_render_ledger(self) -> List[Dict]:
+        """Load all render ledger entries (dicts as accepted by save_render_ledger_entry)."""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM render_ledger")
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def delete_render_ledger_entry(
+        self,
+        source_fingerprint: str,
+        settings_fingerprint: str,
+        engine_version: str,
+    ):
+        """Delete one render ledger entry."""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "DELETE FROM render_ledger WHERE source_fingerprint = ? "
+                "AND settings_fingerprint = ? AND engine_version = ?",
+                (source_fingerprint, settings_fingerprint, engine_version)
+            )
+    
+    # Segment checkpoints
+    
+    def save_segment_checkpoint(self, checkpoint_data: Dict):
+        """
+        Save or replace a completed segment.
+        
+        Args:
+            checkpoint_data: Dict with keys: checkpoint_key, segment_index,
+                start_seconds, end_seconds, segment_path, segment_size, recorded_at
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO segment_checkpoints (
+                    checkpoint_key, segment_index, start_seconds, end_seconds,
+                    segment_path, segment_size, recorded_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(checkpoint_key, segment_index) DO UPDATE SET
+                    start_seconds = excluded.start_seconds,
+                    end_seconds = excluded.end_seconds,
+                    segment_path = excluded.segment_path,
+                    segment_size = excluded.segment_size,
+                    recorded_at = excluded.recorded_at
+            """, (
+                checkpoint_data["checkpoint_key"],
+                checkpoint_data["segment_index"],
+                checkpoint_data["start_seconds"],
+                checkpoint_data["end_seconds"],
+                checkpoint_data["segment_path"],
+                checkpoint_data["segment_size"],
+                checkpoint_data["recorded_at"],
+            ))
+    
+    def load_segment_checkpoints(self, checkpoint_key: str) -> List[Dict]:
+        """Load the completed segments of one render, in segment order."""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT * FROM segment_checkpoints WHERE checkpoint_key = ? ORDER BY segment_index",
+                (checkpoint_key,)
+            )
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def delete_segment_checkpoints(self, checkpoint_key: str):
+        """Delete all segment checkpoints of one render."""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "DELETE FROM segment_checkpoints WHERE checkpoint_key = ?",
+                (checkpoint_key,)
+            )
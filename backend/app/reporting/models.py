@@ -6,7 +6,7 @@ These models do NOT modify or persist job state—they are read-only views.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -35,6 +35,8 @@ class ClipReport(BaseModel):
     # Execution metadata (derived from ExecutionResult)
     output_path: Optional[str] = None
     output_size_bytes: Optional[int] = None
+    output_checksums: Dict[str, str] = Field(default_factory=dict)  # Algorithm -> hex digest
+    additional_output_paths: List[str] = Field(default_factory=list)  # DeliverSettings.additional_outputs
     execution_duration_seconds: Optional[float] = None
 
     # Timing
@@ -48,11 +50,13 @@ class ClipReport(BaseModel):
         output_path: Optional[str] = None,
         output_size_bytes: Optional[int] = None,
         execution_duration_seconds: Optional[float] = None,
+        output_checksums: Optional[Dict[str, str]] = None,
+        additional_output_paths: Optional[List[str]] = None,
     ) -> "ClipReport":
         """
         Create ClipReport from ClipTask.
 
-        Additional execution metadata (output_path, size, duration) must be
+        Additional execution metadata (output paths, size, duration, checksums) must be
         passed explicitly from ExecutionResult—they are not stored on ClipTask.
         """
         return cls(
@@ -63,6 +67,8 @@ class ClipReport(BaseModel):
             warnings=task.warnings.copy(),
             output_path=output_path,
             output_size_bytes=output_size_bytes,
+            output_checksums=dict(output_checksums or {}),
+            additional_output_paths=list(additional_output_paths or []),
             execution_duration_seconds=execution_duration_seconds,
             started_at=task.started_at,
             completed_at=task.completed_at,
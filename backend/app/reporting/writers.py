@@ -74,6 +74,8 @@ def write_csv_report(report: JobReport, output_dir: Path) -> Path:
                 "status",
                 "output_path",
                 "output_size_bytes",
+                "output_checksums",
+                "additional_output_paths",
                 "execution_duration_seconds",
                 "failure_reason",
                 "warnings",
@@ -89,6 +91,8 @@ def write_csv_report(report: JobReport, output_dir: Path) -> Path:
                     clip.status.value,
                     clip.output_path or "",
                     clip.output_size_bytes or "",
+                    " ".join(f"{algorithm}:{digest}" for algorithm, digest in clip.output_checksums.items()),
+                    "; ".join(clip.additional_output_paths),
                     clip.execution_duration_seconds or "",
                     clip.failure_reason or "",
                     "; ".join(clip.warnings) if clip.warnings else "",
@@ -199,6 +203,10 @@ def write_text_report(report: JobReport, output_dir: Path) -> Path:
                     f.write(f"    Output:       {clip.output_path}\n")
                     if clip.output_size_bytes is not None:
                         f.write(f"    Size:         {_format_size(clip.output_size_bytes)}\n")
+                    for algorithm, digest in clip.output_checksums.items():
+                        f.write(f"    {algorithm + ':':<14}{digest}\n")
+                    for path in clip.additional_output_paths:
+                        f.write(f"    Also:         {path}\n")
                 if clip.execution_duration_seconds is not None:
                     f.write(f"    Duration:     {_format_duration(clip.execution_duration_seconds)}\n")
                 if clip.failure_reason:
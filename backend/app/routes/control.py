@@ -11,6 +11,8 @@ No automatic actions. No silent mutations.
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Literal
+import asyncio
+import functools
 import logging
 from pathlib import Path
 
@@ -21,7 +23,7 @@ from app.cli.commands import (
     rebind_preset
 )
 from app.cli.errors import ValidationError, ConfirmationDenied
-from app.jobs.models import JobStatus, TaskStatus
+from app.jobs.models import JobPriority, JobStatus, TaskStatus
 
 logger = logging.getLogger(__name__)
 
@@ -1704,6 +1706,7 @@ async def start_job_endpoint(job_id: str, request: Request):
         500: Execution failed
     """
     from app.execution.scheduler import get_scheduler
+    from app.execution.cost_model import get_cost_model
     from datetime import datetime as dt
     
     try:
@@ -1729,12 +1732,37 @@ async def start_job_endpoint(job_id: str, request: Request):
                        f"Only PENDING jobs can be started."
             )
         
-        # INC-002: Enqueue job for FIFO execution
-        queue_position = scheduler.enqueue_job(job_id)
+        # Alpha: Preset is optional - get if available
+        preset_id = binding_registry.get_preset_id(job_id)
+        if preset_id:
+            # Validate preset exists if bound
+            preset = preset_registry.get_global_preset(preset_id)
+            if not preset:
+                logger.warning(f"Bound preset '{preset_id}' not found for job {job_id}, proceeding with job settings")
+                preset_id = None
+        
+        # INC-002: Enqueue job (order from the scheduling policy, FIFO by default).
+        # Estimated with the codec the job will actually render with.
+        cost_model = get_cost_model()
+        output_codec = job_engine.resolve_job_params(job, preset_registry, preset_id).video_codec
+        queue_position = scheduler.enqueue_job(
+            job_id,
+            estimated_seconds=cost_model.estimate_job_seconds(job, output_codec),
+            group=job.watch_folder_id,
+            cores=cost_model.job_cores(job),
+            priority=job.priority.value,
+        )
         logger.info(f"[INC-002] Job {job_id} enqueued at position {queue_position}")
         
+        loop = asyncio.get_event_loop()
+        
         # INC-002: Attempt to acquire execution slot (only succeeds if at front)
-        if not scheduler.acquire_execution(job_id):
+        acquired = scheduler.acquire_execution(job_id)
+        if not acquired and scheduler.will_preempt_for(job_id):
+            # Preemption: the running job yields at its next clip boundary
+            logger.info(f"[Scheduler] Job {job_id} waiting for preemption of {scheduler.get_current_job_id()}")
+            acquired = await loop.run_in_executor(None, scheduler.wait_for_turn, job_id)
+        if not acquired:
             # Job is queued but must wait for others ahead
             return OperationResponse(
                 success=True,
@@ -1742,24 +1770,19 @@ async def start_job_endpoint(job_id: str, request: Request):
                         f"Will execute after {queue_position - 1} job(s) complete."
             )
         
-        # Alpha: Preset is optional - get if available
-        preset_id = binding_registry.get_preset_id(job_id)
-        if preset_id:
-            # Validate preset exists if bound
-            preset = preset_registry.get_global_preset(preset_id)
-            if not preset:
-                logger.warning(f"Bound preset '{preset_id}' not found for job {job_id}, proceeding with job settings")
-                preset_id = None
-        
         logger.info(f"[LIFECYCLE] Calling execute_job() SYNCHRONOUSLY for job {job_id} at {dt.now().isoformat()}")
         try:
-            # Execute the job using embedded settings (preset optional)
-            job_engine.execute_job(
+            # Execute the job using embedded settings (preset optional).
+            # The request still returns only when the job is done; running it
+            # off the event loop keeps pause/cancel/status (and preempting
+            # starts) responsive meanwhile.
+            await loop.run_in_executor(None, functools.partial(
+                job_engine.execute_job,
                 job=job,
                 global_preset_id=preset_id,  # May be None - engine uses job.settings
                 preset_registry=preset_registry,
                 generate_reports=True,
-            )
+            ))
         finally:
             # INC-002: Release execution slot when done
             scheduler.release_execution(job_id)
@@ -2034,6 +2057,18 @@ async def cancel_clip_endpoint(task_id: str, request: Request):
 # INC-002: Queue Status Endpoint
 # =============================================================================
 
+class QueueEntryStatus(BaseModel):
+    """Cost-model estimate for one job in the queue."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    job_id: str
+    position: int  # 0 = executing
+    priority: str  # Current lane (after aging)
+    estimated_seconds: float  # Remaining render time of this job
+    eta_seconds: float  # Seconds until this job is expected to finish
+
+
 class QueueStatusResponse(BaseModel):
     """Response for queue status query."""
     
@@ -2042,6 +2077,33 @@ class QueueStatusResponse(BaseModel):
     current_job_id: Optional[str] = None
     queued_job_ids: List[str] = []
     queue_length: int = 0
+    policy: str = "fifo"
+    preemption: bool = False
+    entries: List[QueueEntryStatus] = []
+
+
+class QueuePolicyRequest(BaseModel):
+    """Request to change the scheduling policy."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    policy: Literal["fifo", "sjf", "fair_share", "bin_packing"]
+
+
+class QueuePreemptionRequest(BaseModel):
+    """Request to enable or disable priority preemption."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    enabled: bool
+
+
+class JobPriorityRequest(BaseModel):
+    """Request to change a job's priority lane."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    priority: JobPriority
 
 
 @router.get("/queue/status", response_model=QueueStatusResponse)
@@ -2049,7 +2111,8 @@ async def get_queue_status():
     """
     Get current execution queue status.
     
-    INC-002 Fix: Provides provable FIFO queue order for UI.
+    INC-002 Fix: Provides provable queue order for UI.
+    Positions and ETAs come from the encode cost model.
     
     Returns:
         Current executing job and queue of waiting jobs
@@ -2063,4 +2126,136 @@ async def get_queue_status():
         current_job_id=scheduler.get_current_job_id(),
         queued_job_ids=queued_ids,
         queue_length=len(queued_ids),
+        policy=scheduler.policy.name,
+        preemption=scheduler.preemption_enabled,
+        entries=[
+            QueueEntryStatus(
+                job_id=estimate.job_id,
+                position=estimate.position,
+                priority=estimate.priority,
+                estimated_seconds=round(estimate.estimated_seconds, 1),
+                eta_seconds=round(estimate.eta_seconds, 1),
+            )
+            for estimate in scheduler.get_queue_estimates()
+        ],
+    )
+
+
+@router.post("/queue/policy", response_model=OperationResponse)
+async def set_queue_policy(body: QueuePolicyRequest):
+    """
+    Change how waiting jobs are ordered.
+    
+    Takes effect immediately for jobs already in the queue.
+    The executing job is never interrupted.
+    """
+    from app.execution.scheduler import get_scheduler
+    from app.execution.scheduling import create_policy
+    from app.execution.cost_model import get_cost_model
+    
+    get_scheduler().set_policy(create_policy(body.policy, cores=get_cost_model().cores))
+    return OperationResponse(
+        success=True,
+        message=f"Scheduling policy set to {body.policy}",
+    )
+
+
+@router.post("/queue/preemption", response_model=OperationResponse)
+async def set_queue_preemption(body: QueuePreemptionRequest):
+    """
+    Enable or disable priority preemption.
+    
+    When enabled, a job started in a more urgent priority lane than the
+    executing job takes the slot at the executing job's next clip
+    boundary. The preempted job is requeued and continues later.
+    """
+    from app.execution.scheduler import get_scheduler
+    
+    get_scheduler().set_preemption(body.enabled)
+    return OperationResponse(
+        success=True,
+        message=f"Preemption {'enabled' if body.enabled else 'disabled'}",
+    )
+
+
+@router.post("/jobs/{job_id}/priority", response_model=OperationResponse)
+async def set_job_priority_endpoint(job_id: str, body: JobPriorityRequest, request: Request):
+    """
+    Change the priority lane of a job.
+    
+    Only PENDING jobs can be re-prioritized. A job already waiting in the
+    queue moves to the new lane immediately.
+    
+    Raises:
+        400: Job is not PENDING
+        404: Job not found
+    """
+    from app.execution.scheduler import get_scheduler
+    
+    job = request.app.state.job_registry.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    if job.status != JobStatus.PENDING:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Job {job_id} priority can only be changed while PENDING. "
+                   f"Current status: {job.status.value}."
+        )
+    
+    job.priority = body.priority
+    get_scheduler().set_job_priority(job_id, body.priority.value)
+    return OperationResponse(
+        success=True,
+        message=f"Job {job_id} priority set to {body.priority.value}",
+    )
+
+
+# ============================================================================
+# OUTPUT CHECKSUMS
+# ============================================================================
+
+
+class ChecksumPolicyRequest(BaseModel):
+    """Request to configure output checksums."""
+    
+    model_config = ConfigDict(extra="forbid")
+    
+    algorithms: List[Literal["xxh64", "md5", "sha1"]]
+    write_mhl: bool = False
+
+
+@router.get("/checksums/policy")
+async def get_checksum_policy_endpoint():
+    """Get the configured output checksum algorithms and MHL sidecar setting."""
+    from app.filesystem.checksums import get_checksum_policy
+    
+    return get_checksum_policy().snapshot()
+
+
+@router.post("/checksums/policy", response_model=OperationResponse)
+async def set_checksum_policy_endpoint(body: ChecksumPolicyRequest):
+    """
+    Configure output checksums.
+    
+    Checksums are computed while each output is published (no second
+    read of the output) and recorded in the trace and job reports. With
+    write_mhl, an MHL sidecar is written next to every output. An empty
+    algorithm list disables checksums. Applies to clips started afterwards.
+    
+    Raises:
+        400: Algorithm unavailable (xxh64 needs the xxhash package), or
+            MHL requested without algorithms
+    """
+    from app.filesystem.checksums import get_checksum_policy
+    
+    try:
+        get_checksum_policy().configure(body.algorithms, write_mhl=body.write_mhl)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return OperationResponse(
+        success=True,
+        message=(
+            f"Output checksums: {', '.join(body.algorithms) or 'off'}"
+            f"{' (MHL sidecars)' if body.write_mhl else ''}"
+        ),
     )
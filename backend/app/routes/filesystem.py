@@ -17,6 +17,14 @@ INC-001 Fix: All directory enumeration is async with timeout protection.
 Network volumes (/Volumes) can hang indefinitely - we now enforce a 3-second
 timeout on all iterdir() operations.
 
+Mount health: roots are served from the MountHealthMonitor cache, and
+paths on mounts it knows to be dead are rejected before any filesystem
+call (see app/filesystem/mount_health.py).
+
+Filesystem I/O runs on per-mount executors with circuit breakers, so the
+threads left blocked by timeouts on a hung share cannot starve browsing of
+other volumes (see app/filesystem/io_pool.py).
+
 ============================================================================
 V1 OBSERVABILITY HARDENING
 ============================================================================
@@ -33,17 +41,36 @@ See: app/observability/browse_log.py
 """
 
 import os
-import re
+import json
+import time
 import asyncio
 import logging
+import threading
+import concurrent.futures
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
-from collections import defaultdict
+from typing import AsyncIterator, List, Optional, Dict, Tuple
 from concurrent.futures import ThreadPoolExecutor
 from pydantic import BaseModel, ConfigDict
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from ..observability.browse_log import get_browse_log
+from ..filesystem.enumeration import (
+    EnumerationProgress,
+    SequenceGroup,
+    SequenceGrouper,
+    iter_media,
+)
+from ..filesystem.listing import ListingEntry, get_listing_cache
+from ..filesystem.classifier import get_media_classifier
+from ..filesystem.mount_health import MountState, get_mount_health_monitor
+from ..filesystem.io_pool import MountUnavailableError, get_io_pool
+from ..filesystem.browse_sessions import (
+    BrowseSession,
+    decode_cursor,
+    encode_cursor,
+    get_browse_session_store,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,27 +80,29 @@ router = APIRouter(prefix="/filesystem", tags=["filesystem"])
 # Network volumes can hang indefinitely - enforce a reasonable timeout
 DIRECTORY_TIMEOUT_SECONDS = 3.0
 
-# Executor for running blocking filesystem operations in threads
-_fs_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fs_enum")
+# Paginated browse: maximum page size, and NDJSON stream poll interval
+MAX_BROWSE_PAGE_SIZE = 5000
+BROWSE_STREAM_POLL_SECONDS = 0.05
+
+# Executor for the initial mount health pass (path I/O goes through get_io_pool())
+_fs_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fs_roots")
+
+# Media classification is shared with enumeration and watch folders
+# (see app/filesystem/classifier.py)
+_media_classifier = get_media_classifier()
 
 # Supported media extensions (lowercase, without dot)
-SUPPORTED_MEDIA_EXTENSIONS = {
-    # Video formats
-    'mov', 'mp4', 'mxf', 'avi', 'mkv', 'webm', 'm4v', 'mpg', 'mpeg',
-    'dv', 'r3d', 'braw', 'ari', 'dpx', 'exr',
-    # Audio formats  
-    'wav', 'aiff', 'aif', 'mp3', 'flac', 'm4a', 'aac',
-    # Image sequences (single frame)
-    'tif', 'tiff', 'png', 'jpg', 'jpeg',
-}
+SUPPORTED_MEDIA_EXTENSIONS = _media_classifier.media_extensions
+
+# Frozen set used as the listing cache key for media-only listings
+_MEDIA_EXTENSIONS_KEY = SUPPORTED_MEDIA_EXTENSIONS
 
 # Image sequence extensions (these get grouped when numbered)
-IMAGE_SEQUENCE_EXTENSIONS = {
-    'dpx', 'exr', 'tif', 'tiff', 'png', 'jpg', 'jpeg', 'cin', 'tga',
-}
+IMAGE_SEQUENCE_EXTENSIONS = _media_classifier.sequence_extensions
 
-# Pattern to detect numbered sequences: name.NNNNN.ext or name_NNNNN.ext
-SEQUENCE_PATTERN = re.compile(r'^(.+?)[\._](\d{2,8})\.([\w]+)$')
+# Enumeration stream: results per NDJSON chunk, and progress interval
+ENUMERATE_STREAM_BATCH_SIZE = 500
+ENUMERATE_PROGRESS_EVERY_ENTRIES = 10_000
 
 
 def detect_image_sequence(files: List[str]) -> Tuple[List[str], List[str]]:
@@ -85,72 +114,35 @@ def detect_image_sequence(files: List[str]) -> Tuple[List[str], List[str]]:
         - sequence_patterns: List of pattern paths like "/path/clip.%06d.exr"
         - standalone_files: List of files that aren't part of sequences
     """
-    # Group files by directory and base name
-    sequence_groups: Dict[str, List[Tuple[int, str, int]]] = defaultdict(list)
-    standalone_files: List[str] = []
-    
+    groupers: Dict[str, SequenceGrouper] = {}
+    extension = _media_classifier.extension
     for file_path in files:
-        path = Path(file_path)
-        ext = path.suffix.lower().lstrip('.')
-        
-        # Only group image sequence extensions
-        if ext not in IMAGE_SEQUENCE_EXTENSIONS:
-            standalone_files.append(file_path)
-            continue
-        
-        # Try to match sequence pattern
-        match = SEQUENCE_PATTERN.match(path.name)
-        if not match:
-            standalone_files.append(file_path)
-            continue
-        
-        base_name, frame_str, extension = match.groups()
-        frame_num = int(frame_str)
-        frame_padding = len(frame_str)
-        
-        # Create group key (directory + base_name + extension + padding)
-        group_key = f"{path.parent}|{base_name}|{extension}|{frame_padding}"
-        sequence_groups[group_key].append((frame_num, str(path.parent), frame_padding))
+        directory, name = os.path.split(file_path)
+        grouper = groupers.get(directory)
+        if grouper is None:
+            grouper = groupers[directory] = SequenceGrouper(directory, IMAGE_SEQUENCE_EXTENSIONS)
+        grouper.add(name, extension(name) or '')
     
-    # Convert groups to sequence patterns
     sequence_patterns: List[str] = []
-    
-    for group_key, frames in sequence_groups.items():
-        if len(frames) < 2:
-            # Single frame files aren't sequences, add to standalone
-            # Reconstruct the file path
-            parts = group_key.split('|')
-            dir_path, base_name, extension, frame_padding = parts[0], parts[1], parts[2], int(parts[3])
-            frame_num = frames[0][0]
-            frame_str = str(frame_num).zfill(frame_padding)
-            file_path = f"{dir_path}/{base_name}.{frame_str}.{extension}"
-            standalone_files.append(file_path)
-            continue
-        
-        # This is a valid sequence
-        parts = group_key.split('|')
-        dir_path, base_name, extension, frame_padding = parts[0], parts[1], parts[2], int(parts[3])
-        
-        # Create FFmpeg-compatible pattern
-        pattern = f"{dir_path}/{base_name}.%0{frame_padding}d.{extension}"
-        
-        # Sort frames to find range
-        sorted_frames = sorted(frames, key=lambda x: x[0])
-        first_frame = sorted_frames[0][0]
-        last_frame = sorted_frames[-1][0]
-        frame_count = len(sorted_frames)
-        
-        # Log sequence detection
-        logger.info(
-            f"Detected image sequence: {pattern} "
-            f"(frames {first_frame}-{last_frame}, {frame_count} files)"
-        )
-        
-        sequence_patterns.append(pattern)
+    standalone_files: List[str] = []
+    for directory, grouper in groupers.items():
+        sequences, standalone = grouper.finish()
+        for sequence in sequences:
+            _log_sequence(sequence)
+            sequence_patterns.append(sequence.pattern)
+        standalone_files.extend(os.path.join(directory, name) for name in standalone)
     
     return sequence_patterns, standalone_files
 
 
+def _log_sequence(sequence: SequenceGroup) -> None:
+    frames = sequence.frames
+    logger.info(
+        f"Detected image sequence: {sequence.pattern} "
+        f"(frames {frames.first}-{frames.last}, {frames.count} files)"
+    )
+
+
 class DirectoryEntry(BaseModel):
     """A single directory entry (file or folder)."""
     
@@ -172,6 +164,11 @@ class BrowseResponse(BaseModel):
     parent: Optional[str] = None
     entries: List[DirectoryEntry]
     error: Optional[str] = None
+    
+    # Pagination (only set when limit/cursor are used)
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
+    total: Optional[int] = None  # Known once the scan has completed
+    complete: bool = True  # False while the directory is still being scanned
 
 
 class RootsResponse(BaseModel):
@@ -239,10 +236,24 @@ def normalize_and_validate_path(path: str) -> Path:
 
 def is_supported_media_file(path: Path) -> bool:
     """Check if a file has a supported media extension."""
-    if not path.is_file():
-        return False
-    ext = path.suffix.lower().lstrip('.')
-    return ext in SUPPORTED_MEDIA_EXTENSIONS
+    return _media_classifier.is_media(path.name) and path.is_file()
+
+
+def _dead_mount_for(path: str) -> Optional[str]:
+    """
+    Mount point of path if the mount health monitor reports it dead.
+    
+    Lexical only: must run BEFORE normalize_and_validate_path, whose
+    resolve()/exists() would block on a hung mount.
+    """
+    status = get_mount_health_monitor().status_for(path)
+    if status is not None and status.state == MountState.DEAD:
+        return status.mount_point
+    return None
+
+
+def _dead_mount_message(mount_point: str) -> str:
+    return f"Volume is not responding: {mount_point}"
 
 
 async def list_directory_with_timeout(
@@ -267,17 +278,12 @@ async def list_directory_with_timeout(
         PermissionError: If access is denied
         OSError: For other filesystem errors
     """
-    loop = asyncio.get_event_loop()
-    
     def _sync_iterdir() -> List[Path]:
-        """Synchronous directory listing - runs in thread pool."""
+        """Synchronous directory listing - runs in the mount's I/O executor."""
         return list(directory.iterdir())
     
-    # Run blocking iterdir() in thread pool with timeout
-    return await asyncio.wait_for(
-        loop.run_in_executor(_fs_executor, _sync_iterdir),
-        timeout=timeout,
-    )
+    # Run blocking iterdir() on the mount's executor with timeout
+    return await get_io_pool().run(str(directory), _sync_iterdir, timeout=timeout)
 
 
 async def get_directory_entries(
@@ -290,6 +296,10 @@ async def get_directory_entries(
     
     INC-001 Fix: Uses timeout-protected directory enumeration.
     
+    Listing goes through the scandir-based listing cache: a repeat browse of
+    an unchanged directory costs one stat, and a fresh scan costs at most
+    one stat per kept entry (see app/filesystem/listing.py).
+    
     Args:
         directory: Path to directory to list
         include_hidden: Whether to include hidden files/folders
@@ -300,50 +310,110 @@ async def get_directory_entries(
         
     Raises:
         asyncio.TimeoutError: If directory enumeration times out
+        MountUnavailableError: If the volume's circuit is open
     """
-    entries: List[DirectoryEntry] = []
+    listing_cache = get_listing_cache()
+    
+    def _sync_list():
+        """Synchronous cached listing - runs in the mount's I/O executor."""
+        return listing_cache.list_directory(
+            str(directory),
+            include_hidden=include_hidden,
+            media_extensions=_MEDIA_EXTENSIONS_KEY if media_only else None,
+        )
     
     # INC-001: Use timeout-protected directory listing
-    items = await list_directory_with_timeout(directory)
+    listing = await get_io_pool().run(str(directory), _sync_list, timeout=DIRECTORY_TIMEOUT_SECONDS)
     
-    for item in items:
-        # Skip hidden files unless requested
-        if not include_hidden and item.name.startswith('.'):
-            continue
-        
-        # Skip unreadable items
-        if not os.access(item, os.R_OK):
-            continue
+    return [_to_directory_entry(item) for item in listing.entries]
+
+
+def _to_directory_entry(item: ListingEntry) -> DirectoryEntry:
+    """Convert a listing engine entry into the API model."""
+    return DirectoryEntry(
+        name=item.name,
+        path=item.path,
+        type="dir" if item.is_dir else "file",
+        size=item.size,
+        extension=item.extension,
+    )
+
+
+async def _open_browse_session(
+    directory: Path,
+    include_hidden: bool,
+    media_only: bool,
+) -> BrowseSession:
+    """
+    Open an incremental browse session with timeout protection.
+    
+    Raises:
+        asyncio.TimeoutError: If the directory cannot be stat'ed in time
+        MountUnavailableError: If the volume's circuit is open
+        OSError: For filesystem errors
+    """
+    io_pool = get_io_pool()
+    store = get_browse_session_store()
+    
+    def _sync_open() -> BrowseSession:
+        # The scan itself also runs on the directory's mount executor
+        return store.open(
+            str(directory),
+            io_pool.executor_for(str(directory)),
+            include_hidden=include_hidden,
+            media_extensions=_MEDIA_EXTENSIONS_KEY if media_only else None,
+        )
+    
+    return await io_pool.run(str(directory), _sync_open, timeout=DIRECTORY_TIMEOUT_SECONDS)
+
+
+async def get_directory_page(
+    directory: Path,
+    limit: int,
+    cursor: Optional[str] = None,
+    include_hidden: bool = False,
+    media_only: bool = True,
+) -> Tuple[List[DirectoryEntry], BrowseSession, int]:
+    """
+    Return one page of a directory listing.
+    
+    The first page is returned as soon as `limit` entries have been scanned
+    (or the scan ends), without waiting for the whole directory.
+    
+    Returns:
+        (page entries, session, offset of the next page)
         
-        if item.is_dir():
-            entries.append(DirectoryEntry(
-                name=item.name,
-                path=str(item),
-                type="dir",
-            ))
-        elif item.is_file():
-            # Filter by supported extensions if media_only
-            if media_only and not is_supported_media_file(item):
-                continue
-            
-            ext = item.suffix.lower().lstrip('.') or None
-            try:
-                size = item.stat().st_size
-            except (OSError, IOError):
-                size = None
-            
-            entries.append(DirectoryEntry(
-                name=item.name,
-                path=str(item),
-                type="file",
-                size=size,
-                extension=ext,
-            ))
+    Raises:
+        HTTPException: 400 for a malformed/mismatched cursor, 410 if expired
+        asyncio.TimeoutError: If no page could be produced in time
+        OSError: For filesystem errors
+    """
+    if cursor is None:
+        session = await _open_browse_session(directory, include_hidden, media_only)
+        offset = 0
+    else:
+        try:
+            session_id, offset = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+        session = get_browse_session_store().get(session_id)
+        if session is None:
+            raise HTTPException(status_code=410, detail="Browse cursor expired, restart from the first page")
+        if session.directory != str(directory):
+            raise HTTPException(status_code=400, detail="Cursor does not belong to this path")
     
-    # Sort: directories first (alphabetically), then files (alphabetically)
-    entries.sort(key=lambda e: (e.type != "dir", e.name.lower()))
+    loop = asyncio.get_event_loop()
+    satisfied = await loop.run_in_executor(
+        None, session.wait_for, offset + limit, DIRECTORY_TIMEOUT_SECONDS,
+    )
+    if session.error is not None:
+        raise session.error
     
-    return entries
+    items = session.page(offset, limit)
+    if not satisfied and not items:
+        raise asyncio.TimeoutError()
+    
+    return [_to_directory_entry(item) for item in items], session, offset + len(items)
 
 
 @router.get("/roots", response_model=RootsResponse)
@@ -351,52 +421,36 @@ async def get_filesystem_roots():
     """
     Get available filesystem roots for navigation.
     
-    INC-001 Fix: Uses timeout-protected enumeration to prevent hangs
-    on network volumes that are unreachable.
+    INC-001 Fix: Roots come from the mount health monitor's in-memory
+    cache, so an unreachable network volume never blocks this request.
     
     V1 OBSERVABILITY: All browse attempts are logged to browse event log.
     
-    Returns mounted volumes on macOS, common directories on other platforms.
+    Returns responsive mounted volumes (/Volumes on macOS; /mnt, /media and
+    network mounts on Linux) and the home directory.
     """
     browse_log = get_browse_log()
     browse_log.record_roots_start()
     
-    roots: List[DirectoryEntry] = []
-    
-    # macOS: /Volumes contains mounted drives
-    # INC-001: Network volumes can hang indefinitely - use timeout
-    volumes_path = Path("/Volumes")
-    if volumes_path.exists():
+    monitor = get_mount_health_monitor()
+    if not monitor.has_snapshot:
+        # First request before the monitor's first pass: run one pass now.
+        # Probes are individually time-limited, so this is bounded too.
+        loop = asyncio.get_event_loop()
         try:
-            # Use timeout-protected enumeration
-            volume_items = await list_directory_with_timeout(volumes_path)
-            for item in volume_items:
-                if item.is_dir() and os.access(item, os.R_OK):
-                    roots.append(DirectoryEntry(
-                        name=item.name,
-                        path=str(item),
-                        type="dir",
-                    ))
+            await asyncio.wait_for(
+                loop.run_in_executor(_fs_executor, monitor.refresh),
+                timeout=DIRECTORY_TIMEOUT_SECONDS,
+            )
         except asyncio.TimeoutError:
-            # INC-001: Volumes enumeration timed out - skip but log
-            # V1 OBSERVABILITY: Record timeout explicitly
-            logger.warning(f"Timeout listing /Volumes - skipping (INC-001)")
+            logger.warning("Timeout on initial mount health check - roots may be incomplete (INC-001)")
             browse_log.record_browse_timeout("/Volumes", DIRECTORY_TIMEOUT_SECONDS)
-        except PermissionError:
-            # V1 OBSERVABILITY: Record permission error
-            browse_log.record_browse_error("/Volumes", "permission", "Permission denied")
     
-    # Add user home directory
-    home = Path.home()
-    if home.exists():
-        roots.append(DirectoryEntry(
-            name=f"Home ({home.name})",
-            path=str(home),
-            type="dir",
-        ))
-    
-    # Sort by name
-    roots.sort(key=lambda r: r.name.lower())
+    # Served from memory: dead mounts are already excluded
+    roots = [
+        DirectoryEntry(name=root.name, path=root.path, type="dir")
+        for root in monitor.roots()
+    ]
     
     # V1 OBSERVABILITY: Record successful roots listing
     browse_log.record_roots_success(len(roots))
@@ -409,6 +463,8 @@ async def browse_directory(
     path: str = Query(..., description="Absolute path to directory to browse"),
     include_hidden: bool = Query(False, description="Include hidden files/folders"),
     media_only: bool = Query(True, description="Only show supported media files"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_BROWSE_PAGE_SIZE, description="Page size (enables pagination)"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
 ):
     """
     Browse a directory and return its contents.
@@ -421,10 +477,26 @@ async def browse_directory(
     
     Returns directories and optionally filtered media files.
     Path must be absolute and accessible.
+    
+    Pagination: pass `limit` (and `cursor` for later pages). The first page
+    is returned as soon as it has been scanned; `total` is filled in once
+    the scan completes. Pages of a directory that is still being scanned
+    are in scan order rather than sorted.
     """
     browse_log = get_browse_log()
     browse_log.record_browse_start(path)
     
+    dead_mount = _dead_mount_for(path)
+    if dead_mount is not None:
+        browse_log.record_browse_error(path, "mount_unavailable", _dead_mount_message(dead_mount))
+        lexical = os.path.normpath(os.path.abspath(path))
+        return BrowseResponse(
+            path=lexical,
+            parent=os.path.dirname(lexical) if lexical != os.sep else None,
+            entries=[],
+            error=_dead_mount_message(dead_mount),
+        )
+    
     resolved = normalize_and_validate_path(path)
     
     if not resolved.is_dir():
@@ -441,12 +513,23 @@ async def browse_directory(
     # INC-001: Use timeout-protected enumeration with HARD timeout.
     # Network volumes (/Volumes) can hang indefinitely.
     # V1 FILESYSTEM INVARIANT: Browse MUST resolve to directory list OR visible error.
+    page_session: Optional[BrowseSession] = None
+    next_offset = 0
     try:
-        entries = await get_directory_entries(
-            resolved,
-            include_hidden=include_hidden,
-            media_only=media_only,
-        )
+        if limit is not None or cursor is not None:
+            entries, page_session, next_offset = await get_directory_page(
+                resolved,
+                limit=limit or MAX_BROWSE_PAGE_SIZE,
+                cursor=cursor,
+                include_hidden=include_hidden,
+                media_only=media_only,
+            )
+        else:
+            entries = await get_directory_entries(
+                resolved,
+                include_hidden=include_hidden,
+                media_only=media_only,
+            )
         
         # V1 OBSERVABILITY: Record successful browse
         dir_count = sum(1 for e in entries if e.type == "dir")
@@ -458,6 +541,7 @@ async def browse_directory(
         # V1 OBSERVABILITY: Record timeout with explicit error payload
         logger.warning(f"INC-001: Timeout browsing directory after {DIRECTORY_TIMEOUT_SECONDS}s: {path}")
         browse_log.record_browse_timeout(path, DIRECTORY_TIMEOUT_SECONDS)
+        get_mount_health_monitor().report_timeout(str(resolved))
         
         return BrowseResponse(
             path=str(resolved),
@@ -465,6 +549,15 @@ async def browse_directory(
             entries=[],
             error="Unable to list this folder (permissions or slow volume)",
         )
+    except MountUnavailableError as e:
+        browse_log.record_browse_error(path, "mount_unavailable", str(e))
+        
+        return BrowseResponse(
+            path=str(resolved),
+            parent=parent,
+            entries=[],
+            error=str(e),
+        )
     except PermissionError:
         # V1 OBSERVABILITY: Record permission error
         browse_log.record_browse_error(path, "permission", "Permission denied")
@@ -486,6 +579,16 @@ async def browse_directory(
             error=str(e),
         )
     
+    if page_session is not None:
+        return BrowseResponse(
+            path=str(resolved),
+            parent=parent,
+            entries=entries,
+            next_cursor=encode_cursor(page_session, next_offset) if page_session.has_more(next_offset) else None,
+            total=page_session.total,
+            complete=page_session.complete,
+        )
+    
     return BrowseResponse(
         path=str(resolved),
         parent=parent,
@@ -493,6 +596,117 @@ async def browse_directory(
     )
 
 
+def _ndjson_line(payload: Dict) -> str:
+    """Serialize one NDJSON record."""
+    return json.dumps(payload, separators=(",", ":")) + "\n"
+
+
+@router.get("/browse/stream")
+async def browse_directory_stream(
+    path: str = Query(..., description="Absolute path to directory to browse"),
+    include_hidden: bool = Query(False, description="Include hidden files/folders"),
+    media_only: bool = Query(True, description="Only show supported media files"),
+):
+    """
+    Stream a directory listing as NDJSON while it is being scanned.
+    
+    Each line is a JSON object:
+    - {"record": "entry", ...DirectoryEntry fields} as entries are scanned
+    - {"record": "summary", "path", "parent", "total", "dir_count",
+       "file_count", "error"} once, at the end
+    
+    Entries arrive in scan order (sorted if the listing was cached).
+    INC-001: The stream ends with an error summary if the scan stalls for
+    longer than DIRECTORY_TIMEOUT_SECONDS.
+    """
+    browse_log = get_browse_log()
+    browse_log.record_browse_start(path)
+    
+    dead_mount = _dead_mount_for(path)
+    if dead_mount is not None:
+        browse_log.record_browse_error(path, "mount_unavailable", _dead_mount_message(dead_mount))
+        lexical = os.path.normpath(os.path.abspath(path))
+        summary = {"record": "summary", "path": lexical, "parent": os.path.dirname(lexical),
+                   "total": None, "dir_count": 0, "file_count": 0,
+                   "error": _dead_mount_message(dead_mount)}
+        return StreamingResponse(iter([_ndjson_line(summary)]), media_type="application/x-ndjson")
+    
+    resolved = normalize_and_validate_path(path)
+    
+    if not resolved.is_dir():
+        browse_log.record_browse_error(path, "not_directory", f"Path is not a directory: {path}")
+        raise HTTPException(
+            status_code=400,
+            detail=f"Path is not a directory: {path}"
+        )
+    
+    parent = str(resolved.parent) if resolved.parent != resolved else None
+    
+    async def _stream() -> AsyncIterator[str]:
+        summary = {"record": "summary", "path": str(resolved), "parent": parent,
+                   "total": None, "dir_count": 0, "file_count": 0, "error": None}
+        
+        try:
+            session = await _open_browse_session(resolved, include_hidden, media_only)
+        except asyncio.TimeoutError:
+            browse_log.record_browse_timeout(path, DIRECTORY_TIMEOUT_SECONDS)
+            get_mount_health_monitor().report_timeout(str(resolved))
+            summary["error"] = "Unable to list this folder (permissions or slow volume)"
+            yield _ndjson_line(summary)
+            return
+        except MountUnavailableError as e:
+            browse_log.record_browse_error(path, "mount_unavailable", str(e))
+            summary["error"] = str(e)
+            yield _ndjson_line(summary)
+            return
+        except OSError as e:
+            browse_log.record_browse_error(path, "io_error", str(e))
+            summary["error"] = str(e)
+            yield _ndjson_line(summary)
+            return
+        
+        sent = 0
+        last_progress = time.monotonic()
+        while True:
+            # Read completion BEFORE entries: every entry is appended before
+            # complete is set, so nothing can be missed on the final pass
+            done = session.complete
+            batch = session.page(sent, MAX_BROWSE_PAGE_SIZE)
+            if batch:
+                for item in batch:
+                    if item.is_dir:
+                        summary["dir_count"] += 1
+                    else:
+                        summary["file_count"] += 1
+                sent += len(batch)
+                last_progress = time.monotonic()
+                yield "".join(
+                    _ndjson_line({"record": "entry", **_to_directory_entry(item).model_dump()})
+                    for item in batch
+                )
+            elif done:
+                break
+            elif time.monotonic() - last_progress > DIRECTORY_TIMEOUT_SECONDS:
+                logger.warning(f"INC-001: Browse stream stalled after {DIRECTORY_TIMEOUT_SECONDS}s: {path}")
+                browse_log.record_browse_timeout(path, DIRECTORY_TIMEOUT_SECONDS)
+                get_mount_health_monitor().report_timeout(str(resolved))
+                summary["error"] = "Unable to list this folder (permissions or slow volume)"
+                yield _ndjson_line(summary)
+                return
+            else:
+                await asyncio.sleep(BROWSE_STREAM_POLL_SECONDS)
+        
+        if session.error is not None:
+            browse_log.record_browse_error(path, "io_error", str(session.error))
+            summary["error"] = str(session.error)
+        else:
+            browse_log.record_browse_success(path, summary["dir_count"], summary["file_count"])
+            summary["total"] = sent
+        yield _ndjson_line(summary)
+    
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
 @router.get("/enumerate", response_model=EnumerateResponse)
 async def enumerate_folder_media(
     path: str = Query(..., description="Absolute path to folder to enumerate"),
@@ -509,6 +723,15 @@ async def enumerate_folder_media(
     (e.g., clip.000001.exr through clip.001000.exr) are grouped and 
     returned as a single pattern path (e.g., /path/clip.%06d.exr).
     """
+    dead_mount = _dead_mount_for(path)
+    if dead_mount is not None:
+        return EnumerateResponse(
+            folder=os.path.normpath(os.path.abspath(path)),
+            files=[],
+            count=0,
+            error=_dead_mount_message(dead_mount),
+        )
+    
     resolved = normalize_and_validate_path(path)
     
     if not resolved.is_dir():
@@ -517,36 +740,19 @@ async def enumerate_folder_media(
             detail=f"Path is not a directory: {path}"
         )
     
-    media_files: List[str] = []
+    def _collect() -> List[str]:
+        found: List[str] = []
+        for item in _iter_folder_media(resolved, recursive, detect_sequences):
+            if isinstance(item, SequenceGroup):
+                _log_sequence(item)
+                found.append(item.pattern)
+            else:
+                found.append(item)
+        found.sort()
+        return found
     
     try:
-        if recursive:
-            # Walk directory tree
-            for root, _dirs, files in os.walk(resolved):
-                root_path = Path(root)
-                for filename in files:
-                    if filename.startswith('.'):
-                        continue
-                    file_path = root_path / filename
-                    if is_supported_media_file(file_path):
-                        media_files.append(str(file_path))
-        else:
-            # Just this directory
-            for item in resolved.iterdir():
-                if item.name.startswith('.'):
-                    continue
-                if is_supported_media_file(item):
-                    media_files.append(str(item))
-        
-        # Detect image sequences if requested
-        if detect_sequences and media_files:
-            sequence_patterns, standalone = detect_image_sequence(media_files)
-            # Combine: sequences first, then standalone files
-            final_files = sequence_patterns + standalone
-            final_files.sort()
-        else:
-            final_files = sorted(media_files)
-        
+        final_files = await get_io_pool().run(str(resolved), _collect)
     except PermissionError:
         return EnumerateResponse(
             folder=str(resolved),
@@ -569,6 +775,145 @@ async def enumerate_folder_media(
     )
 
 
+class _EnumerationCancelled(Exception):
+    """Raised inside the scan thread when the streaming client disconnects."""
+
+
+def _iter_folder_media(
+    resolved: Path,
+    recursive: bool,
+    detect_sequences: bool,
+    progress=None,
+):
+    """Streaming enumeration with the route's media and sequence extensions."""
+    return iter_media(
+        str(resolved),
+        _media_classifier,
+        recursive=recursive,
+        detect_sequences=detect_sequences,
+        progress=progress,
+        progress_every=ENUMERATE_PROGRESS_EVERY_ENTRIES,
+    )
+
+
+@router.get("/enumerate/stream")
+async def enumerate_folder_media_stream(
+    path: str = Query(..., description="Absolute path to folder to enumerate"),
+    recursive: bool = Query(True, description="Recursively scan subfolders"),
+    detect_sequences: bool = Query(True, description="Detect and group image sequences"),
+):
+    """
+    Stream folder enumeration as NDJSON, for folders too large to wait for.
+    
+    Each line is a JSON object:
+    - {"record": "file", "path"} for standalone media files
+    - {"record": "sequence", "path" (pattern), "first_frame", "last_frame",
+       "frame_count", "padding", "gaps"} for image sequences (gaps are
+       inclusive [first, last] missing ranges)
+    - {"record": "progress", "directories", "entries", "files", "sequences"}
+      every ENUMERATE_PROGRESS_EVERY_ENTRIES directory entries
+    - {"record": "summary", "folder", "count", "error"} once, at the end
+    
+    Results arrive per directory, in scan order (not sorted).
+    """
+    dead_mount = _dead_mount_for(path)
+    if dead_mount is not None:
+        summary = {"record": "summary", "folder": os.path.normpath(os.path.abspath(path)),
+                   "count": 0, "error": _dead_mount_message(dead_mount)}
+        return StreamingResponse(iter([_ndjson_line(summary)]), media_type="application/x-ndjson")
+    
+    resolved = normalize_and_validate_path(path)
+    
+    if not resolved.is_dir():
+        raise HTTPException(
+            status_code=400,
+            detail=f"Path is not a directory: {path}"
+        )
+    
+    loop = asyncio.get_event_loop()
+    # Bounded so a slow client applies backpressure to the scan
+    queue: asyncio.Queue = asyncio.Queue(maxsize=16)
+    cancelled = threading.Event()
+    
+    def _put(line: Optional[str]) -> None:
+        while not cancelled.is_set():
+            future = asyncio.run_coroutine_threadsafe(queue.put(line), loop)
+            try:
+                future.result(timeout=1.0)
+                return
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+    
+    def _produce() -> None:
+        summary = {"record": "summary", "folder": str(resolved), "count": 0, "error": None}
+        batch: List[str] = []
+        
+        def _progress(status: EnumerationProgress) -> None:
+            if cancelled.is_set():
+                raise _EnumerationCancelled()
+            # Flush now: a single huge directory yields nothing until it is read
+            batch.append(_ndjson_line({
+                "record": "progress",
+                "directories": status.directories,
+                "entries": status.entries,
+                "files": status.files,
+                "sequences": status.sequences,
+            }))
+            _put("".join(batch))
+            batch.clear()
+        
+        try:
+            for item in _iter_folder_media(resolved, recursive, detect_sequences, _progress):
+                if cancelled.is_set():
+                    return
+                if isinstance(item, SequenceGroup):
+                    _log_sequence(item)
+                    batch.append(_ndjson_line({
+                        "record": "sequence",
+                        "path": item.pattern,
+                        "first_frame": item.frames.first,
+                        "last_frame": item.frames.last,
+                        "frame_count": item.frames.count,
+                        "padding": item.padding,
+                        "gaps": item.frames.gaps(),
+                    }))
+                else:
+                    batch.append(_ndjson_line({"record": "file", "path": item}))
+                summary["count"] += 1
+                if len(batch) >= ENUMERATE_STREAM_BATCH_SIZE:
+                    _put("".join(batch))
+                    batch.clear()
+        except _EnumerationCancelled:
+            return
+        except PermissionError:
+            summary["error"] = "Permission denied accessing folder"
+        except OSError as e:
+            summary["error"] = str(e)
+        
+        batch.append(_ndjson_line(summary))
+        _put("".join(batch))
+        _put(None)
+    
+    async def _stream() -> AsyncIterator[str]:
+        try:
+            producer = asyncio.wrap_future(get_io_pool().submit(str(resolved), _produce))
+        except MountUnavailableError as e:
+            yield _ndjson_line({"record": "summary", "folder": str(resolved), "count": 0, "error": str(e)})
+            return
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            # Client went away: stop the scan thread
+            cancelled.set()
+            await producer
+    
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
 # ============================================================================
 # V1 OBSERVABILITY: Debug Endpoints
 # ============================================================================
@@ -593,6 +938,22 @@ async def get_browse_log_entries(limit: int = 50):
     }
 
 
+@router.get("/debug/mounts")
+async def get_mount_health():
+    """
+    Get the mount health monitor's view of monitored mounts, and the
+    per-mount I/O executors (circuit state, stuck workers).
+    
+    Debug-only: served from memory, no filesystem access.
+    """
+    monitor = get_mount_health_monitor()
+    return {
+        "mounts": [status.to_dict() for status in monitor.statuses()],
+        "has_snapshot": monitor.has_snapshot,
+        "io": [stats.to_dict() for stats in get_io_pool().stats()],
+    }
+
+
 @router.post("/debug/browse-log/clear")
 async def clear_browse_log_entries():
     """
@@ -5,15 +5,22 @@ Alpha: Provides preview video generation and streaming.
 """
 
 from fastapi import APIRouter, HTTPException, Request, BackgroundTasks
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import AsyncIterator, Optional
+from email.utils import formatdate, parsedate_to_datetime
+import asyncio
 import logging
+import os
 from pathlib import Path
 
 from app.execution.preview import (
     get_or_generate_preview,
     get_cached_preview_path,
+    get_progressive_preview_path,
+    is_progressive_preview_active,
+    final_path_for_partial,
+    PARTIAL_PREVIEW_SUFFIX,
     generate_preview_sync,
     clear_preview_cache,
     get_cache_size,
@@ -24,6 +31,93 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/preview", tags=["preview"])
 
+# Chunk size for streaming a growing preview (1 MiB keeps syscalls low
+# without holding large buffers per connection)
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# How often to check a growing (progressive) preview for new fragments
+PROGRESSIVE_POLL_INTERVAL_SECONDS = 0.25
+
+
+# ============================================================================
+# Conditional Request Helpers
+# ============================================================================
+
+def build_preview_etag(preview_path: Path, stat_result: os.stat_result) -> str:
+    """
+    Build a strong ETag for a cached preview.
+    
+    The preview filename is the cache key (source path + source mtime),
+    so combining it with the preview's own size and mtime_ns changes
+    whenever either the source or the generated preview changes.
+    """
+    return f'"{preview_path.stem}-{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def _etag_matches(header_value: str, etag: str) -> bool:
+    """Weakly compare an If-None-Match ETag list against our ETag."""
+    candidates = [c.strip() for c in header_value.split(",")]
+    if "*" in candidates:
+        return True
+    candidates = [c[2:] if c.startswith("W/") else c for c in candidates]
+    return etag in candidates
+
+
+def _header_date_timestamp(value: str) -> Optional[float]:
+    """Parse an HTTP date header into a POSIX timestamp, or None if invalid."""
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def is_not_modified(request: Request, etag: str, mtime: float) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since for a GET request.
+    
+    If-None-Match takes precedence; If-Modified-Since is only consulted
+    when no If-None-Match header is present (RFC 9110 §13.2.2).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        since = _header_date_timestamp(if_modified_since)
+        # HTTP dates have one-second resolution
+        if since is not None and int(mtime) <= since:
+            return True
+    
+    return False
+
+
+async def _iter_growing_file(path: Path) -> AsyncIterator[bytes]:
+    """
+    Yield bytes of a preview that is still being encoded.
+    
+    Reads until EOF, then waits for new fragments while the progressive
+    encode is active. The open handle survives the final rename, so the
+    tail of the file is drained after the encode completes: FFmpeg may
+    write it between an EOF read and the activity check, so the file is
+    read to EOF once more before stopping. Reads run in the default
+    executor to keep the event loop free.
+    """
+    loop = asyncio.get_running_loop()
+    with open(path, "rb") as f:
+        finished = False
+        while True:
+            chunk = await loop.run_in_executor(None, f.read, STREAM_CHUNK_SIZE)
+            if chunk:
+                yield chunk
+                continue
+            if finished:
+                break
+            if not is_progressive_preview_active(path):
+                finished = True  # Drain whatever was written before it stopped
+                continue
+            await asyncio.sleep(PROGRESSIVE_POLL_INTERVAL_SECONDS)
+
 
 # ============================================================================
 # Request/Response Models
@@ -35,6 +129,7 @@ class PreviewRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
     
     source_path: str
+    progressive: bool = False  # Allow playback of a still-encoding preview
 
 
 class ThumbnailRequest(BaseModel):
@@ -44,6 +139,7 @@ class ThumbnailRequest(BaseModel):
     
     source_path: str
     frame: Optional[float] = 0.3  # Position in video (0.0 - 1.0)
+    fast: bool = False  # Keyframe-only decode (quality fallback on black frames)
 
 
 class PreviewStatusResponse(BaseModel):
@@ -54,6 +150,7 @@ class PreviewStatusResponse(BaseModel):
     ready: bool
     path: Optional[str] = None
     url: Optional[str] = None
+    progressive: bool = False  # True if url points at a still-growing file
 
 
 class CacheStatsResponse(BaseModel):
@@ -79,6 +176,10 @@ async def get_preview_status(body: PreviewRequest) -> PreviewStatusResponse:
     If not, starts generation in background and returns ready=False.
     
     Client should poll this endpoint until ready=True.
+    
+    With progressive=True, generation writes fragmented MP4 and the response
+    becomes ready (with progressive=True) as soon as the first fragment is on
+    disk, so playback can start while the encode continues.
     """
     source_path = body.source_path
     
@@ -87,7 +188,7 @@ async def get_preview_status(body: PreviewRequest) -> PreviewStatusResponse:
         raise HTTPException(status_code=404, detail=f"Source file not found: {source_path}")
     
     # Get or start generation
-    preview_path, is_ready = get_or_generate_preview(source_path)
+    preview_path, is_ready = get_or_generate_preview(source_path, progressive=body.progressive)
     
     if is_ready and preview_path:
         return PreviewStatusResponse(
@@ -96,17 +197,38 @@ async def get_preview_status(body: PreviewRequest) -> PreviewStatusResponse:
             url=f"/preview/stream?path={preview_path}",
         )
     
+    if body.progressive:
+        partial_path = get_progressive_preview_path(source_path)
+        if partial_path:
+            return PreviewStatusResponse(
+                ready=True,
+                path=str(partial_path),
+                url=f"/preview/stream?path={partial_path}",
+                progressive=True,
+            )
+    
     return PreviewStatusResponse(ready=False)
 
 
 @router.get("/stream")
-async def stream_preview(path: str):
+async def stream_preview(path: str, request: Request):
     """
     Stream a preview video file.
     
-    Supports HTTP range requests for seeking.
+    Supports HTTP range requests for seeking (206 Partial Content, via
+    FileResponse) and conditional requests (If-None-Match /
+    If-Modified-Since → 304), so scrubbing and repeat views only transfer
+    the bytes actually needed.
+    
+    Progressive (.partial.mp4) previews are streamed as they grow; once the
+    encode finishes, requests for the partial path are served from the
+    finished cache file.
     """
     preview_path = Path(path)
+    growing = is_progressive_preview_active(preview_path)
+    
+    if preview_path.name.endswith(PARTIAL_PREVIEW_SUFFIX) and not growing:
+        preview_path = final_path_for_partial(preview_path)
     
     if not preview_path.exists():
         raise HTTPException(status_code=404, detail="Preview not found")
@@ -118,10 +240,37 @@ async def stream_preview(path: str):
     except ValueError:
         raise HTTPException(status_code=403, detail="Access denied")
     
+    if growing:
+        # Length is unknown until the encode completes: no ranges, no validators
+        return StreamingResponse(
+            _iter_growing_file(preview_path),
+            media_type="video/mp4",
+            headers={"Accept-Ranges": "none", "Cache-Control": "no-store"},
+        )
+    
+    try:
+        stat_result = preview_path.stat()
+    except OSError:
+        raise HTTPException(status_code=404, detail="Preview not found")
+    
+    etag = build_preview_etag(preview_path, stat_result)
+    headers = {
+        "ETag": etag,
+        # Previews are regenerated in place; always revalidate via ETag
+        "Cache-Control": "no-cache",
+    }
+    
+    # FileResponse handles Range, If-Range and 416 but not 304s
+    if is_not_modified(request, etag, stat_result.st_mtime):
+        headers["Last-Modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+        return Response(status_code=304, headers=headers)
+    
     return FileResponse(
         path=preview_path,
         media_type="video/mp4",
         filename=preview_path.name,
+        headers=headers,
+        stat_result=stat_result,
     )
 
 
@@ -140,7 +289,7 @@ async def get_thumbnail(body: ThumbnailRequest):
         raise HTTPException(status_code=404, detail=f"Source file not found: {source_path}")
     
     # Generate thumbnail
-    thumb_path = generate_thumbnail_sync(source_path, position=position)
+    thumb_path = generate_thumbnail_sync(source_path, position=position, fast=body.fast)
     
     if not thumb_path or not Path(thumb_path).exists():
         raise HTTPException(status_code=500, detail="Thumbnail generation failed")
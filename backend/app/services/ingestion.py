@@ -27,7 +27,7 @@ import logging
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from typing import List, Optional, Dict, Any, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..jobs.registry import JobRegistry
@@ -40,6 +40,7 @@ if TYPE_CHECKING:
 from ..jobs.models import Job, JobStatus
 from ..deliver.codec_specs import validate_codec_container, CODEC_REGISTRY
 from ..execution.ffmpeg import FFMPEG_CODEC_MAP
+from ..metadata.sequences import get_image_sequence, is_sequence_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,19 @@ class IngestionError(Exception):
         self.invalid_paths = invalid_paths or []
 
 
+@dataclass(frozen=True)
+class _IngestContext:
+    """Path-independent ingest inputs, resolved and validated once."""
+    
+    deliver_settings: "DeliverSettings"
+    effective_output_dir: Optional[str]
+    engine: str
+    preset_id: Optional[str]
+    source_preset_id: Optional[str]
+    source_preset_name: Optional[str]
+    source_preset_fingerprint: Optional[str]
+
+
 @dataclass
 class IngestionResult:
     """Result of a successful ingestion operation."""
@@ -141,14 +155,131 @@ class IngestionService:
         """
         warnings: List[str] = []
         
+        # =====================================================================
+        # 0. PHASE 6: Load settings from preset if specified
+        # =====================================================================
+        deliver_settings, source_preset = self._load_settings_preset(
+            deliver_settings, settings_preset_id,
+        )
+        
+        # =====================================================================
+        # 1. VALIDATE: paths exist, are files, are readable
+        # =====================================================================
+        if not source_paths:
+            raise IngestionError("At least one source file required")
+        
+        # GOLDEN PATH: Hard limit = 1 clip
+        if len(source_paths) > 1:
+            raise IngestionError(
+                f"Multi-clip jobs are disabled. Only 1 clip allowed (received {len(source_paths)})"
+            )
+        
+        validated_paths, invalid_paths = self._validate_paths(source_paths)
+        
+        if invalid_paths:
+            raise IngestionError(
+                f"Invalid source paths: {', '.join(invalid_paths)}",
+                invalid_paths=invalid_paths,
+            )
+        
+        if not validated_paths:
+            raise IngestionError("No valid source paths after validation")
+        
+        # =====================================================================
+        # 2. NORMALIZE: resolve symlinks, ensure absolute paths
+        # =====================================================================
+        normalized_paths = self._normalize_paths(validated_paths)
+        
+        # Steps 3-5: output directory, engine, codec, legacy preset
+        context = self._validate_shared(
+            output_dir, deliver_settings, engine, preset_id, source_preset,
+        )
+        
+        # =====================================================================
+        # 6. CREATE JOB: UUIDv4 ID generated automatically
+        # =====================================================================
+        job = self.job_engine.create_job(
+            source_paths=normalized_paths,
+            engine=engine,
+        )
+        
+        return self._register_job(job, context, warnings)
+    
+    def ingest_batch(
+        self,
+        source_paths: List[str],
+        output_dir: Optional[str],
+        deliver_settings: "DeliverSettings",
+        engine: str = "ffmpeg",
+        preset_id: Optional[str] = None,
+        settings_preset_id: Optional[str] = None,
+    ) -> List[Union[IngestionResult, IngestionError]]:
+        """
+        Ingest many sources at once, one single-clip job per source.
+        
+        Same pipeline as ingest_sources() (used for watch folder bursts such
+        as a camera card offload), but the shared validation (settings
+        preset, output directory, engine, codec, legacy preset) runs once
+        and ingest-time probing runs concurrently via JobEngine.create_jobs().
+        
+        Args:
+            source_paths: Source file paths, one job each
+            (remaining arguments as for ingest_sources())
+            
+        Returns:
+            Per source, in order: IngestionResult, or the IngestionError
+            explaining why that source was rejected
+            
+        Raises:
+            IngestionError: If the shared settings are invalid (affects every source)
+        """
+        deliver_settings, source_preset = self._load_settings_preset(
+            deliver_settings, settings_preset_id,
+        )
+        context = self._validate_shared(
+            output_dir, deliver_settings, engine, preset_id, source_preset,
+        )
+        
+        results: List[Union[IngestionResult, IngestionError]] = []
+        accepted: List[int] = []
+        accepted_paths: List[str] = []
+        for index, path_str in enumerate(source_paths):
+            validated_paths, invalid_paths = self._validate_paths([path_str])
+            if invalid_paths:
+                results.append(IngestionError(
+                    f"Invalid source paths: {', '.join(invalid_paths)}",
+                    invalid_paths=invalid_paths,
+                ))
+                continue
+            results.append(None)  # filled in below
+            accepted.append(index)
+            accepted_paths.extend(self._normalize_paths(validated_paths))
+        
+        jobs = self.job_engine.create_jobs(accepted_paths, engine=engine)
+        for index, job in zip(accepted, jobs):
+            results[index] = self._register_job(job, context, [])
+        
+        return results
+    
+    def _load_settings_preset(
+        self,
+        deliver_settings: "DeliverSettings",
+        settings_preset_id: Optional[str],
+    ) -> Tuple["DeliverSettings", Tuple[Optional[str], Optional[str], Optional[str]]]:
+        """
+        Phase 6: Copy settings from a settings preset if one is specified.
+        
+        Returns:
+            (effective settings, (preset id, preset name, preset fingerprint))
+            
+        Raises:
+            IngestionError: If the settings preset is unknown
+        """
         # Phase 6: Settings preset source tracking
         source_preset_id: Optional[str] = None
         source_preset_name: Optional[str] = None
         source_preset_fingerprint: Optional[str] = None
         
-        # =====================================================================
-        # 0. PHASE 6: Load settings from preset if specified
-        # =====================================================================
         if settings_preset_id and self.settings_preset_store:
             # Log available presets for diagnostics (Trust Stabilisation)
             available_presets = [p.id for p in self.settings_preset_store.list_presets()]
@@ -180,34 +311,23 @@ class IngestionService:
                 f"fingerprint={source_preset_fingerprint}"
             )
         
-        # =====================================================================
-        # 1. VALIDATE: paths exist, are files, are readable
-        # =====================================================================
-        if not source_paths:
-            raise IngestionError("At least one source file required")
-        
-        # GOLDEN PATH: Hard limit = 1 clip
-        if len(source_paths) > 1:
-            raise IngestionError(
-                f"Multi-clip jobs are disabled. Only 1 clip allowed (received {len(source_paths)})"
-            )
-        
-        validated_paths, invalid_paths = self._validate_paths(source_paths)
-        
-        if invalid_paths:
-            raise IngestionError(
-                f"Invalid source paths: {', '.join(invalid_paths)}",
-                invalid_paths=invalid_paths,
-            )
-        
-        if not validated_paths:
-            raise IngestionError("No valid source paths after validation")
-        
-        # =====================================================================
-        # 2. NORMALIZE: resolve symlinks, ensure absolute paths
-        # =====================================================================
-        normalized_paths = self._normalize_paths(validated_paths)
+        return deliver_settings, (source_preset_id, source_preset_name, source_preset_fingerprint)
+    
+    def _validate_shared(
+        self,
+        output_dir: Optional[str],
+        deliver_settings: "DeliverSettings",
+        engine: str,
+        preset_id: Optional[str],
+        source_preset: Tuple[Optional[str], Optional[str], Optional[str]],
+    ) -> "_IngestContext":
+        """
+        Validate everything about an ingest that does not depend on the
+        individual source paths (steps 3-5).
         
+        Raises:
+            IngestionError: If output directory, engine, codec or legacy preset are invalid
+        """
         # =====================================================================
         # 3. VALIDATE OUTPUT DIRECTORY (if provided)
         # =====================================================================
@@ -248,13 +368,30 @@ class IngestionService:
                     f"(Preset ID: {preset_id})"
                 )
         
-        # =====================================================================
-        # 6. CREATE JOB: UUIDv4 ID generated automatically
-        # =====================================================================
-        job = self.job_engine.create_job(
-            source_paths=normalized_paths,
+        return _IngestContext(
+            deliver_settings=deliver_settings,
+            effective_output_dir=effective_output_dir,
             engine=engine,
+            preset_id=preset_id,
+            source_preset_id=source_preset[0],
+            source_preset_name=source_preset[1],
+            source_preset_fingerprint=source_preset[2],
         )
+    
+    def _register_job(
+        self,
+        job: Job,
+        context: "_IngestContext",
+        warnings: List[str],
+    ) -> IngestionResult:
+        """Snapshot settings onto a created job, enqueue it and bind its preset."""
+        deliver_settings = context.deliver_settings
+        effective_output_dir = context.effective_output_dir
+        engine = context.engine
+        preset_id = context.preset_id
+        source_preset_id = context.source_preset_id
+        source_preset_name = context.source_preset_name
+        source_preset_fingerprint = context.source_preset_fingerprint
         
         # =====================================================================
         # 7. SNAPSHOT: freeze DeliverSettings
@@ -316,6 +453,9 @@ class IngestionService:
         """
         Validate that paths exist and are files.
         
+        Image sequence patterns (clip.%06d.exr) are valid when at least one
+        frame matches; the resolved sequence is cached for metadata extraction.
+        
         Returns:
             Tuple of (valid_paths, invalid_paths)
         """
@@ -325,7 +465,16 @@ class IngestionService:
         for path_str in paths:
             path = Path(path_str)
             
-            if not path.exists():
+            if is_sequence_pattern(path_str):
+                try:
+                    sequence = get_image_sequence(path_str)
+                except OSError:
+                    sequence = None
+                if sequence is None:
+                    invalid_paths.append(f"{path_str} (no frames match sequence pattern)")
+                else:
+                    valid_paths.append(path_str)
+            elif not path.exists():
                 invalid_paths.append(f"{path_str} (does not exist)")
             elif not path.is_file():
                 invalid_paths.append(f"{path_str} (not a file)")
@@ -9,7 +9,10 @@ Public API:
     WatchFolder — Watch folder configuration model
     WatchFolderRegistry — In-memory watch folder storage
     FileStabilityChecker — File size polling for copy completion detection
+    StabilityTracker — Deadline-driven copy completion detection (IN_CLOSE_WRITE aware)
     FileScanner — Filesystem traversal with extension filtering
+    create_change_source — inotify change detection with polling fallback
+    SnapshotScanner — Incremental scan re-listing only changed directories
     WatchFolderEngine — Orchestration: scan → stability → job creation
 """
 
@@ -19,10 +22,19 @@ from .errors import (
     WatchFolderNotFoundError,
     DuplicateWatchFolderError,
 )
-from .models import WatchFolder, FileStabilityCheck
+from .models import WatchFolder, FileStabilityCheck, WatchFolderScanMetrics
 from .registry import WatchFolderRegistry
-from .stability import FileStabilityChecker
+from .stability import FileStabilityChecker, StabilityTracker
 from .scanner import FileScanner
+from .snapshot import SnapshotScanner
+from .watcher import (
+    ChangeSource,
+    InotifyChangeSource,
+    PollingChangeSource,
+    SnapshotChangeSource,
+    create_change_source,
+    inotify_available,
+)
 from .engine import WatchFolderEngine
 
 __all__ = [
@@ -34,10 +46,19 @@ __all__ = [
     # Models
     "WatchFolder",
     "FileStabilityCheck",
+    "WatchFolderScanMetrics",
     # Registry
     "WatchFolderRegistry",
     # Core
     "FileStabilityChecker",
+    "StabilityTracker",
     "FileScanner",
+    "ChangeSource",
+    "InotifyChangeSource",
+    "PollingChangeSource",
+    "SnapshotChangeSource",
+    "SnapshotScanner",
+    "create_change_source",
+    "inotify_available",
     "WatchFolderEngine",
 ]
@@ -11,16 +11,27 @@ This ensures consistent validation, normalization, and settings snapshot.
 """
 
 import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
 from pathlib import Path
-from typing import List, Set, Optional, TYPE_CHECKING
+from typing import Deque, Dict, List, Set, Optional, Tuple, Union, TYPE_CHECKING
 
 from ..jobs.engine import JobEngine
 from ..jobs.models import Job
 from ..jobs.bindings import JobPresetBindingRegistry
-from .models import WatchFolder
+from ..jobs.registry import job_to_persistence_dict
+from ..filesystem.classifier import SEQUENCE_EXTENSIONS
+from ..filesystem.enumeration import SequenceGroup, SequenceGrouper, frame_pattern
+from ..filesystem.mounts import mount_point_for
+from .models import WatchFolder, WatchFolderScanMetrics
 from .registry import WatchFolderRegistry
 from .scanner import FileScanner
-from .stability import FileStabilityChecker
+from .stability import StabilityTracker
+from .watcher import ChangeSource, InotifyError, SnapshotChangeSource, create_change_source
 from .errors import WatchFolderError
 
 if TYPE_CHECKING:
@@ -29,14 +40,58 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Concurrent scans allowed per mount point
+MAX_SCANS_PER_MOUNT = 2
+
+# Executors for watch folder scans, one per mount point, so a hung network
+# share only ties up its own threads (same pattern as the filesystem I/O
+# executors). A shared pool would be exhausted by a few hung mounts.
+_scan_executors: Dict[str, ThreadPoolExecutor] = {}
+_scan_executors_lock = threading.Lock()
+
+# A scan running longer than this is abandoned for the current pass
+SCAN_TIMEOUT_SECONDS = 30.0
+
+# SequenceGrouper wants lowercase extensions without the dot
+_SEQUENCE_EXTENSIONS_KEY = SEQUENCE_EXTENSIONS
+
+
+def _scan_executor_for(mount_point: str, max_workers: int) -> ThreadPoolExecutor:
+    """Get (or create) the scan executor of a mount point."""
+    with _scan_executors_lock:
+        executor = _scan_executors.get(mount_point)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="watch_scan"
+            )
+            _scan_executors[mount_point] = executor
+        return executor
+
+
+def _sequence_frame_paths(sequence: SequenceGroup) -> List[str]:
+    """Paths of the frames grouped into a SequenceGroup."""
+    return [
+        sequence.frame_path(frame)
+        for first, last in sequence.frames.ranges()
+        for frame in range(first, last + 1)
+    ]
+
+
+def _seconds_since_modified(directory: str, now: float) -> float:
+    """Seconds since a directory last gained or lost an entry (inf if it cannot be stat'ed)."""
+    try:
+        return now - os.stat(directory).st_mtime
+    except OSError:
+        return float("inf")
+
 
 class WatchFolderEngine:
     """
     Watch folder orchestration engine.
 
     Coordinates:
-    1. Filesystem scanning (via FileScanner)
-    2. File stability detection (via FileStabilityChecker)
+    1. Change detection (inotify where available, snapshot-diff polling otherwise)
+    2. File stability detection (via per-folder StabilityTracker deadlines)
     3. Duplicate prevention (in-memory tracking)
     4. Job creation (via JobEngine)
     5. Optional auto-execution (via ExecutionAutomation mediator)
@@ -59,6 +114,7 @@ class WatchFolderEngine:
         automation_mediator: Optional["ExecutionAutomation"] = None,
         persistence_manager = None,
         ingestion_service: Optional["IngestionService"] = None,
+        use_events: bool = True,
     ):
         """
         Initialize watch folder engine.
@@ -68,8 +124,15 @@ class WatchFolderEngine:
             job_engine: Job engine for creating jobs (legacy, used if no ingestion_service)
             binding_registry: Registry for job-preset bindings
             automation_mediator: Optional mediator for auto-execution
-            persistence_manager: Optional PersistenceManager for processed files tracking
+            persistence_manager: Optional PersistenceManager for processed files
+                tracking. When set, each pass's new jobs and processed-file
+                markers are saved in one transaction.
             ingestion_service: Canonical ingestion service (preferred over job_engine)
+            use_events: Use inotify change detection where available. Disable
+                for network mounts, where remote writes raise no local events.
+
+        Image sequence ingest is configured per watch folder
+        (WatchFolder.detect_sequences).
         """
         self.watch_folder_registry = watch_folder_registry
         self.job_engine = job_engine
@@ -78,25 +141,53 @@ class WatchFolderEngine:
         self._persistence = persistence_manager
         self.ingestion_service = ingestion_service
 
-        # Initialize scanner and stability checker
+        # Initialize scanners and stability settings (image frames are only
+        # reported for folders with sequence detection on)
         self.scanner = FileScanner(skip_hidden=True, follow_symlinks=False)
-        self.stability_checker = FileStabilityChecker(
-            check_interval=5.0,
-            required_stable_checks=3,
-            min_age_seconds=10.0,
+        self.sequence_scanner = FileScanner(
+            skip_hidden=True, follow_symlinks=False, detect_sequences=True,
         )
+        self.stability_quiet_seconds = 10.0
+        self.stability_close_settle_seconds = 0.5
 
         # In-memory tracking of processed files (prevents duplicates)
         # Maps: absolute_path -> job_id
         self._processed_files: Set[str] = set()
 
+        # Concurrent scanning: in-flight scans per folder, and finished scans
+        # whose stable files have not been turned into jobs yet
+        self.max_scans_per_mount = MAX_SCANS_PER_MOUNT
+        self.scan_timeout_seconds = SCAN_TIMEOUT_SECONDS
+        self._scan_lock = threading.Lock()
+        self._scans_in_flight: Dict[str, Tuple[Future, str]] = {}
+        self._detected: Dict[str, Tuple[WatchFolder, List[Path]]] = {}
+        self._scan_metrics: Dict[str, WatchFolderScanMetrics] = {}
+
+        # Change detection per watch folder, and the candidates that have
+        # been reported but are not yet stable. Event sources only report a
+        # path when it changes, so trackers carry unstable paths between ticks.
+        self.use_events = use_events
+        self._change_sources: Dict[str, ChangeSource] = {}
+        self._stability: Dict[str, StabilityTracker] = {}
+        # Per-folder locks around the change source and tracker: held by a
+        # scan for its whole run, and by the caller while it ingests
+        self._folder_locks: Dict[str, threading.Lock] = {}
+
     def scan_all_folders(self) -> List[Job]:
         """
         Scan all enabled watch folders and create jobs for stable files.
 
         This is the main entry point for watch folder processing.
-        Call this method periodically (e.g., every 15-30 seconds) to
-        detect and ingest new files.
+        Call this method periodically to detect and ingest new files;
+        next_check_delay() says how soon the next call has work to do.
+
+        Change detection and stability checks run concurrently in
+        per-mount executors, at most max_scans_per_mount at a time per
+        mount, so a slow or hung share only delays folders on that share. A
+        scan running longer than scan_timeout_seconds is abandoned for this
+        pass and not restarted until it finishes; its result is ingested
+        then. Job creation runs on the calling thread, for folders with no
+        scan in flight (results of the others wait for the next pass).
 
         Returns:
             List of newly created jobs (may be empty)
@@ -104,36 +195,136 @@ class WatchFolderEngine:
         Warn-and-continue semantics: Individual folder failures do not
         block processing of other folders.
         """
+        queues: Dict[str, Deque[WatchFolder]] = {}
+        for watch_folder in self.watch_folder_registry.list_enabled_folders():
+            if self._scan_in_flight(watch_folder.id):
+                logger.warning(
+                    f"Previous scan of watch folder '{watch_folder.id}' is still running, skipping"
+                )
+                continue
+            queues.setdefault(mount_point_for(watch_folder.path), deque()).append(watch_folder)
+
+        waiting: Dict[Future, float] = {}  # future -> deadline
+        while True:
+            for mount_point, queue in queues.items():
+                while queue and self._scans_on_mount(mount_point) < self.max_scans_per_mount:
+                    future = self._submit_scan(queue.popleft(), mount_point)
+                    waiting[future] = time.monotonic() + self.scan_timeout_seconds
+
+            if not waiting:
+                break
+
+            now = time.monotonic()
+            done, _ = wait(waiting, timeout=max(0.0, min(waiting.values()) - now), return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in list(waiting):
+                if future in done:
+                    del waiting[future]
+                elif waiting[future] <= now:
+                    # Keeps counting against its mount until it returns
+                    del waiting[future]
+                    logger.warning(f"Watch folder scan exceeded {self.scan_timeout_seconds}s, abandoning for this pass")
+
+        for mount_point, queue in queues.items():
+            for watch_folder in queue:
+                logger.warning(
+                    f"Skipping watch folder '{watch_folder.id}': mount {mount_point} is busy with stalled scans"
+                )
+
+        with self._scan_lock:
+            detected = list(self._detected.values())
+            self._detected.clear()
+
         created_jobs = []
+        for watch_folder, stable_files in detected:
+            folder_lock = self._folder_lock(watch_folder.id)
+            if not folder_lock.acquire(blocking=False):
+                # A new scan of this folder is running (possibly hung)
+                self._add_detected(watch_folder, stable_files)
+                continue
+            try:
+                created_jobs.extend(self._ingest_stable_files(watch_folder, stable_files))
+            except Exception as e:
+                logger.error(
+                    f"Unexpected error ingesting from watch folder '{watch_folder.id}': {e}"
+                )
+                # Continue to next folder (warn-and-continue)
+                continue
+            finally:
+                folder_lock.release()
 
-        for watch_folder in self.watch_folder_registry.list_enabled_folders():
+        return created_jobs
+
+    def _folder_lock(self, watch_folder_id: str) -> threading.Lock:
+        with self._scan_lock:
+            lock = self._folder_locks.get(watch_folder_id)
+            if lock is None:
+                lock = self._folder_locks[watch_folder_id] = threading.Lock()
+            return lock
+
+    def _scan_in_flight(self, watch_folder_id: str) -> bool:
+        with self._scan_lock:
+            return watch_folder_id in self._scans_in_flight
+
+    def _scans_on_mount(self, mount_point: str) -> int:
+        with self._scan_lock:
+            return sum(1 for _, mount in self._scans_in_flight.values() if mount == mount_point)
+
+    def _add_detected(self, watch_folder: WatchFolder, stable_files: List[Path]) -> None:
+        """Queue stable files for ingestion on the calling thread."""
+        with self._scan_lock:
+            _, previous = self._detected.get(watch_folder.id, (watch_folder, []))
+            self._detected[watch_folder.id] = (watch_folder, previous + stable_files)
+
+    def _submit_scan(self, watch_folder: WatchFolder, mount_point: str) -> Future:
+        """Run change detection for one folder in its mount's executor."""
+        def _scan() -> None:
             try:
-                jobs = self.scan_folder(watch_folder)
-                created_jobs.extend(jobs)
+                with self._folder_lock(watch_folder.id):
+                    stable_files = self._detect_stable_files(watch_folder, mount_point)
+                if stable_files:
+                    self._add_detected(watch_folder, stable_files)
             except WatchFolderError as e:
                 logger.warning(
                     f"Watch folder scan failed for '{watch_folder.id}': {e}"
                 )
-                # Continue to next folder (warn-and-continue)
-                continue
             except Exception as e:
                 logger.error(
                     f"Unexpected error scanning watch folder '{watch_folder.id}': {e}"
                 )
-                # Continue to next folder (warn-and-continue)
-                continue
+            finally:
+                # Only now may the folder be scanned again
+                with self._scan_lock:
+                    self._scans_in_flight.pop(watch_folder.id, None)
+
+        executor = _scan_executor_for(mount_point, self.max_scans_per_mount)
+        with self._scan_lock:
+            future = executor.submit(_scan)
+            self._scans_in_flight[watch_folder.id] = (future, mount_point)
+        return future
+
+    def get_scan_metrics(self) -> Dict[str, WatchFolderScanMetrics]:
+        """
+        Get metrics for the most recent scan of each watch folder.
 
-        return created_jobs
+        Returns:
+            Mapping of watch folder ID to its latest scan metrics
+        """
+        with self._scan_lock:
+            return dict(self._scan_metrics)
 
     def scan_folder(self, watch_folder: WatchFolder) -> List[Job]:
         """
         Scan a single watch folder and create jobs for stable files.
 
         Process:
-        1. Scan filesystem for candidate files
-        2. Check stability for each file
-        3. Skip already-processed files
-        4. Create one job per stable file
+        1. Poll the change source for changed candidate files
+        2. Feed them to the folder's stability tracker
+        3. Re-check only files whose stability deadline has passed
+        4. Create one job per stable, not-yet-processed file
+
+        Runs synchronously on the calling thread (no timeout), waiting for
+        any scan of the folder already in flight.
 
         Returns:
             List of newly created jobs (may be empty)
@@ -141,93 +332,361 @@ class WatchFolderEngine:
         Raises:
             WatchFolderError: If watch folder path is inaccessible
         """
+        with self._folder_lock(watch_folder.id):
+            stable_files = self._detect_stable_files(watch_folder, mount_point_for(watch_folder.path))
+            return self._ingest_stable_files(watch_folder, stable_files)
+
+    def _detect_stable_files(self, watch_folder: WatchFolder, mount_point: str) -> List[Path]:
+        """
+        Run change detection and stability checks for one folder.
+
+        Touches only this folder's change source and tracker, so different
+        folders can be detected concurrently. The caller holds the folder's
+        lock. Records scan metrics.
+
+        Returns:
+            Newly stable, not-yet-processed files
+
+        Raises:
+            WatchFolderError: If watch folder path is inaccessible
+        """
+        started_at = datetime.now()
+        started = time.monotonic()
+        metrics = WatchFolderScanMetrics(
+            watch_folder_id=watch_folder.id,
+            mount_point=mount_point,
+            started_at=started_at,
+            duration_seconds=0.0,
+        )
+        try:
+            stable_files = self._detect_stable_files_inner(watch_folder, metrics)
+            metrics.stable_files = len(stable_files)
+            return stable_files
+        except Exception as e:
+            metrics.error = str(e)
+            raise
+        finally:
+            metrics.duration_seconds = time.monotonic() - started
+            metrics.timed_out = metrics.duration_seconds > self.scan_timeout_seconds
+            with self._scan_lock:
+                self._scan_metrics[watch_folder.id] = metrics
+
+    def _detect_stable_files_inner(
+        self, watch_folder: WatchFolder, metrics: WatchFolderScanMetrics
+    ) -> List[Path]:
         # Verify watch folder still exists
         folder_path = Path(watch_folder.path)
         if not folder_path.exists():
+            # Watches on a vanished tree are dead; start over if it returns
+            self.reset_change_source(watch_folder.id, forget_snapshot=True)
             raise WatchFolderError(
                 f"Watch folder path does not exist: {watch_folder.path}"
             )
 
         if not folder_path.is_dir():
+            self.reset_change_source(watch_folder.id, forget_snapshot=True)
             raise WatchFolderError(
                 f"Watch folder path is not a directory: {watch_folder.path}"
             )
 
-        # Scan for candidate files
-        candidate_files = self.scanner.scan(watch_folder)
+        # Feed changed paths to the folder's tracker, then act on the files
+        # whose stability deadline has passed
+        tracker = self._stability.get(watch_folder.id)
+        if tracker is None:
+            tracker = StabilityTracker(
+                quiet_seconds=self.stability_quiet_seconds,
+                close_settle_seconds=self.stability_close_settle_seconds,
+            )
+            with self._scan_lock:
+                self._stability[watch_folder.id] = tracker
+
+        changed = self._poll_changes(watch_folder)
+        source = self._change_sources[watch_folder.id]
+        for file_path in changed:
+            if str(file_path) in self._processed_files:
+                continue
+            # Polling sources re-report unchanged files; only events mean activity
+            if source.is_event_driven or file_path not in tracker:
+                tracker.observe(file_path, closed=file_path in source.closed)
+
+        stable_files = []
+        for stability in tracker.due():
+            if not stability.is_stable:
+                # File vanished or became unreadable - tracker dropped it
+                logger.debug(f"Stopped tracking {Path(stability.path).name}: {stability.reason}")
+                continue
+            if stability.path in self._processed_files:
+                logger.debug(f"Skipping already-processed file: {stability.path}")
+                continue
+            stable_files.append(Path(stability.path))
+
+        metrics.changed_files = len(changed)
+        metrics.tracked_files = len(tracker)
         logger.debug(
-            f"Watch folder '{watch_folder.id}': Found {len(candidate_files)} candidate file(s)"
+            f"Watch folder '{watch_folder.id}': {len(changed)} changed, "
+            f"{len(tracker)} tracked, {len(stable_files)} stable file(s)"
         )
+        return stable_files
 
-        # Check stability and create jobs
-        created_jobs = []
+    def _ingest_stable_files(self, watch_folder: WatchFolder, stable_files: List[Path]) -> List[Job]:
+        """
+        Create one job per stable source as a batch, then checkpoint the change source.
+
+        A burst (e.g. a camera card offload) is handled in one pass: sources
+        are probed concurrently, and when a persistence manager is configured
+        the new jobs and their processed-file markers are saved in a single
+        transaction before any job is auto-executed.
+
+        With the folder's sequence detection on, stable image frames are first
+        collapsed into one source per sequence (see _group_sources).
+
+        The caller holds the folder's lock.
+        """
+        tracker = self._stability.get(watch_folder.id)
+        new_files = []
+        # A finished abandoned scan and the next scan may both report a file
+        for file_path in dict.fromkeys(stable_files):
+            if str(file_path) in self._processed_files:
+                logger.debug(f"Skipping already-processed file: {file_path}")
+            else:
+                new_files.append(file_path)
 
-        for file_path in candidate_files:
-            file_path_str = str(file_path)
+        # (source path, stable files it covers)
+        sources = self._group_sources(new_files, tracker, watch_folder)
+        source_paths = [Path(source) for source, _ in sources]
 
-            # Skip if already processed
-            if file_path_str in self._processed_files:
-                logger.debug(f"Skipping already-processed file: {file_path_str}")
+        created: List[Tuple[str, Job]] = []
+        for (source, members), outcome in zip(sources, self._create_jobs_for_files(source_paths, watch_folder)):
+            if isinstance(outcome, Exception):
+                logger.error(
+                    f"Failed to create job for file {source}: {outcome}"
+                )
+                # Retry after another quiet window (warn-and-continue)
+                if tracker is not None:
+                    for member in members:
+                        tracker.defer(Path(member))
                 continue
 
-            # Check stability
-            stability = self.stability_checker.check_stability(file_path)
+            # Mark as processed (frames in memory only; the pattern is the
+            # persisted marker, and frames are re-marked against it on restart)
+            self._processed_files.add(source)
+            self._processed_files.update(members)
+            outcome.watch_folder_id = watch_folder.id
+            created.append((source, outcome))
+            logger.info(
+                f"Created job {outcome.id} for file: {Path(source).name} (watch folder: {watch_folder.id})"
+            )
 
-            if stability.is_stable:
-                # File is stable - create job
-                try:
-                    job = self._create_job_for_file(file_path, watch_folder)
-                    created_jobs.append(job)
+        if created and self._persistence is not None:
+            try:
+                self._persistence.save_ingest_batch(
+                    [job_to_persistence_dict(job) for _, job in created],
+                    [(watch_folder.id, source) for source, _ in created],
+                )
+            except Exception as e:
+                # Jobs exist in memory; markers are re-saved on the next explicit save
+                logger.error(
+                    f"Failed to persist {len(created)} job(s) from watch folder '{watch_folder.id}': {e}"
+                )
 
-                    # Mark as processed
-                    self._processed_files.add(file_path_str)
+        for _, job in created:
+            self._auto_execute(job, watch_folder)
 
-                    # Reset stability tracking (file successfully ingested)
-                    self.stability_checker.reset_tracking(file_path)
+        source = self._change_sources.get(watch_folder.id)
+        if source is not None and tracker is not None:
+            source.checkpoint(tracker.paths)
 
-                    logger.info(
-                        f"Created job {job.id} for file: {file_path.name} (watch folder: {watch_folder.id})"
-                    )
+        return [job for _, job in created]
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to create job for file {file_path_str}: {e}"
+    def _group_sources(
+        self,
+        files: List[Path],
+        tracker: Optional[StabilityTracker],
+        watch_folder: WatchFolder,
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Turn stable files into ingest sources: (source path, files covered).
+
+        With the folder's sequence detection on, image frames are grouped
+        per directory into sequences whose source path is the %0Nd pattern.
+        A directory's stable frames are deferred while any frame in it is
+        still being tracked, or while the directory has gained an entry
+        within watch_folder.sequence_settle_seconds (a render landing frame
+        by frame, possibly slower than the stability quiet window), so the
+        sequence is ingested once, whole. Frames of an already-ingested
+        pattern are marked processed and dropped. Other lone frames are
+        ingested as ordinary files.
+        """
+        if not watch_folder.detect_sequences:
+            return [(str(file_path), [str(file_path)]) for file_path in files]
+
+        scanner = self.sequence_scanner
+        sources: List[Tuple[str, List[str]]] = []
+        groupers: Dict[str, SequenceGrouper] = {}
+        for file_path in files:
+            if not scanner.is_sequence_frame(file_path):
+                sources.append((str(file_path), [str(file_path)]))
+                continue
+            directory = str(file_path.parent)
+            grouper = groupers.get(directory)
+            if grouper is None:
+                grouper = groupers[directory] = SequenceGrouper(directory, _SEQUENCE_EXTENSIONS_KEY)
+            grouper.add(file_path.name, file_path.suffix[1:].lower())
+
+        if not groupers:
+            return sources
+
+        busy_dirs = set()
+        if tracker is not None:
+            busy_dirs = {
+                str(path.parent) for path in tracker.paths if scanner.is_sequence_frame(path)
+            }
+        now = time.time()
+
+        for directory, grouper in groupers.items():
+            sequences, standalone = grouper.finish()
+            if tracker is not None and (
+                directory in busy_dirs
+                or _seconds_since_modified(directory, now) < watch_folder.sequence_settle_seconds
+            ):
+                for sequence in sequences:
+                    for frame_path in _sequence_frame_paths(sequence):
+                        tracker.defer(Path(frame_path))
+                for name in standalone:
+                    tracker.defer(Path(directory) / name)
+                logger.debug(f"Deferring image frames in {directory}: frames still arriving")
+                continue
+
+            for name in standalone:
+                path = str(Path(directory) / name)
+                if frame_pattern(directory, name) in self._processed_files:
+                    logger.warning(f"Ignoring late frame of already-ingested sequence: {path}")
+                    self._processed_files.add(path)
+                    continue
+                sources.append((path, [path]))
+
+            for sequence in sequences:
+                frame_paths = _sequence_frame_paths(sequence)
+                if sequence.pattern in self._processed_files:
+                    logger.warning(
+                        f"Ignoring {len(frame_paths)} late frame(s) of already-ingested "
+                        f"sequence {sequence.pattern}"
                     )
-                    # Continue to next file (warn-and-continue)
+                    self._processed_files.update(frame_paths)
                     continue
-            else:
-                # File not yet stable
-                logger.debug(
-                    f"File not stable: {file_path.name} - {stability.reason}"
-                )
+                sources.append((sequence.pattern, frame_paths))
 
-        return created_jobs
+        return sources
+
+    def next_check_delay(self) -> Optional[float]:
+        """
+        Seconds until the earliest stability deadline across all folders.
+
+        Returns None when no file is being tracked. Callers driving
+        scan_all_folders() can sleep min(this, their poll interval), so a
+        closed file is accepted within close_settle_seconds of its close.
+        Folders being scanned are skipped rather than waited for: their
+        scan is still in flight, possibly on a hung mount.
+        """
+        with self._scan_lock:
+            trackers = list(self._stability.items())
+        deadlines = []
+        for watch_folder_id, tracker in trackers:
+            folder_lock = self._folder_lock(watch_folder_id)
+            if not folder_lock.acquire(blocking=False):
+                continue
+            try:
+                deadline = tracker.next_deadline()
+            finally:
+                folder_lock.release()
+            if deadline is not None:
+                deadlines.append(deadline)
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+
+    def _scanner_for(self, watch_folder: WatchFolder) -> FileScanner:
+        """The scanner for a folder: image frames are reported only with sequence detection on."""
+        return self.sequence_scanner if watch_folder.detect_sequences else self.scanner
+
+    def _poll_changes(self, watch_folder: WatchFolder) -> Set[Path]:
+        """
+        Get paths that may have changed in a watch folder since the last tick.
+
+        Uses the folder's change source, creating it on first use. If the
+        event source fails (e.g. inotify watch limit reached), the folder
+        falls back to snapshot polling permanently.
+        """
+        source = self._change_sources.get(watch_folder.id)
+        if source is None:
+            source = create_change_source(
+                watch_folder,
+                self._scanner_for(watch_folder),
+                prefer_events=self.use_events,
+                persistence_manager=self._persistence,
+            )
+            self._change_sources[watch_folder.id] = source
+
+        try:
+            return source.poll()
+        except InotifyError as e:
+            logger.warning(
+                f"Event watching failed for watch folder '{watch_folder.id}', "
+                f"falling back to polling: {e}"
+            )
+            source.close()
+            source = SnapshotChangeSource(watch_folder, self._scanner_for(watch_folder), self._persistence)
+            self._change_sources[watch_folder.id] = source
+            return source.poll()
 
-    def _create_job_for_file(
-        self, file_path: Path, watch_folder: WatchFolder
-    ) -> Job:
+    def reset_change_source(self, watch_folder_id: str, forget_snapshot: bool = False) -> None:
         """
-        Create a job for a single file.
+        Drop change detection state for a watch folder.
+
+        Args:
+            watch_folder_id: Watch folder ID
+            forget_snapshot: Also discard persisted directory snapshots, so the
+                next scan is a full walk even after a restart
+        """
+        source = self._change_sources.pop(watch_folder_id, None)
+        if source is not None:
+            if forget_snapshot:
+                source.forget()
+            source.close()
+        elif forget_snapshot and self._persistence is not None:
+            self._persistence.clear_directory_snapshot(watch_folder_id)
+        self._stability.pop(watch_folder_id, None)
+
+    def close(self) -> None:
+        """Release change detection resources (inotify descriptors)."""
+        for watch_folder_id in list(self._change_sources):
+            self.reset_change_source(watch_folder_id)
+
+    def _create_jobs_for_files(
+        self, file_paths: List[Path], watch_folder: WatchFolder
+    ) -> List[Union[Job, Exception]]:
+        """
+        Create one job per file, probing the sources concurrently.
 
         CANONICAL INGESTION PIPELINE:
-        Uses IngestionService.ingest_sources() when available.
-        Falls back to direct JobEngine.create_job() for backwards compatibility.
+        Uses IngestionService.ingest_batch() when available.
+        Falls back to direct JobEngine.create_jobs() for backwards compatibility.
 
         Phase 11 behavior:
         - One job per file
         - Bind preset if watch_folder.preset_id is set
-        - Optionally auto-execute if watch_folder.auto_execute=True
-        - Job left in PENDING state if not auto-executed
-
-        Auto-execution is mediated and subject to safety checks.
+        - Jobs are left in PENDING state (auto-execution happens after persisting)
 
         Args:
-            file_path: Absolute path to stable file
+            file_paths: Absolute paths to stable files
             watch_folder: Watch folder configuration
 
         Returns:
-            New job (PENDING or post-execution state)
+            Per file, in order: the new job, or the exception that prevented it
         """
+        if not file_paths:
+            return []
+
         # Use canonical ingestion pipeline when available
         if self.ingestion_service:
             from ..deliver.settings import DeliverSettings
@@ -238,45 +697,69 @@ class WatchFolderEngine:
                 output_dir=watch_folder.output_dir if hasattr(watch_folder, 'output_dir') else None
             )
             
-            result = self.ingestion_service.ingest_sources(
-                source_paths=[str(file_path)],
-                output_dir=getattr(watch_folder, 'output_dir', None),
-                deliver_settings=deliver_settings,
-                engine="ffmpeg",  # Watch folders default to ffmpeg
-                preset_id=watch_folder.preset_id,
-            )
-            job = result.job
-        else:
-            # Fallback: direct job creation (legacy path)
-            job = self.job_engine.create_job(source_paths=[str(file_path)])
-            
+            try:
+                results = self.ingestion_service.ingest_batch(
+                    source_paths=[str(file_path) for file_path in file_paths],
+                    output_dir=getattr(watch_folder, 'output_dir', None),
+                    deliver_settings=deliver_settings,
+                    engine="ffmpeg",  # Watch folders default to ffmpeg
+                    preset_id=watch_folder.preset_id,
+                )
+            except Exception as e:
+                # Shared settings are invalid: every file fails the same way
+                return [e] * len(file_paths)
+            return [
+                result if isinstance(result, Exception) else result.job
+                for result in results
+            ]
+
+        # Fallback: direct job creation (legacy path)
+        try:
+            jobs = self.job_engine.create_jobs([str(file_path) for file_path in file_paths])
+        except Exception as e:
+            return [e] * len(file_paths)
+
+        outcomes: List[Union[Job, Exception]] = []
+        for job in jobs:
             # Bind preset if configured
             if watch_folder.preset_id:
-                self.binding_registry.bind_preset(job.id, watch_folder.preset_id)
+                try:
+                    self.binding_registry.bind_preset(job.id, watch_folder.preset_id)
+                except Exception as e:
+                    outcomes.append(e)
+                    continue
                 logger.debug(
                     f"Bound preset '{watch_folder.preset_id}' to job {job.id}"
                 )
+            outcomes.append(job)
+        return outcomes
 
-        # Attempt auto-execution if enabled
-        if watch_folder.auto_execute and self.automation_mediator:
-            if not watch_folder.preset_id:
-                logger.warning(
-                    f"Watch folder '{watch_folder.id}' has auto_execute=True "
-                    "but no preset_id configured. Skipping auto-execution."
-                )
-            else:
-                success, error = self.automation_mediator.auto_execute_job(
-                    job=job,
-                    preset_id=watch_folder.preset_id,
-                )
-                
-                if not success:
-                    logger.warning(
-                        f"Auto-execution failed for job {job.id} "
-                        f"(watch folder: {watch_folder.id}): {error}"
-                    )
+    def _auto_execute(self, job: Job, watch_folder: WatchFolder) -> None:
+        """
+        Attempt auto-execution if enabled for the watch folder.
 
-        return job
+        Auto-execution is mediated and subject to safety checks.
+        """
+        if not (watch_folder.auto_execute and self.automation_mediator):
+            return
+
+        if not watch_folder.preset_id:
+            logger.warning(
+                f"Watch folder '{watch_folder.id}' has auto_execute=True "
+                "but no preset_id configured. Skipping auto-execution."
+            )
+            return
+
+        success, error = self.automation_mediator.auto_execute_job(
+            job=job,
+            preset_id=watch_folder.preset_id,
+        )
+        
+        if not success:
+            logger.warning(
+                f"Auto-execution failed for job {job.id} "
+                f"(watch folder: {watch_folder.id}): {error}"
+            )
 
     def mark_file_as_processed(self, file_path: str) -> None:
         """
@@ -297,7 +780,9 @@ class WatchFolderEngine:
         WARNING: This will allow files to be re-ingested.
         """
         self._processed_files.clear()
-        self.stability_checker.clear_all_tracking()
+        for watch_folder in self.watch_folder_registry.list_folders():
+            self.reset_change_source(watch_folder.id, forget_snapshot=True)
+        self.close()
 
     def get_processed_files(self) -> Set[str]:
         """
@@ -23,6 +23,11 @@ class WatchFolder(BaseModel):
     
     Auto-execution requires explicit opt-in and is subject to safety checks.
     Default behavior remains manual (auto_execute=False).
+
+    Image sequence ingest is opt-in per folder (detect_sequences). A
+    sequence is ingested only once its directory has gone
+    sequence_settle_seconds without a new frame, so set it above the
+    slowest frame interval of the renders writing into the folder.
     """
 
     model_config = {"extra": "forbid"}
@@ -43,6 +48,15 @@ class WatchFolder(BaseModel):
         default=False,
         description="Whether to automatically execute jobs (requires preset_id)"
     )
+    detect_sequences: bool = Field(
+        default=False,
+        description="Whether to ingest numbered image frames as one image sequence source"
+    )
+    sequence_settle_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds a directory must go without new frames before its sequence is ingested"
+    )
     created_at: datetime = Field(default_factory=datetime.now)
 
     @field_validator("path")
@@ -76,3 +90,24 @@ class FileStabilityCheck(BaseModel):
     reason: Optional[str] = Field(
         None, description="Human-readable explanation if unstable or inaccessible"
     )
+
+
+class WatchFolderScanMetrics(BaseModel):
+    """
+    Metrics for the most recent scan of one watch folder.
+
+    A scan that exceeds the engine's scan timeout is abandoned for that
+    pass (timed_out=True); its result is picked up when it finishes.
+    """
+
+    model_config = {"extra": "forbid"}
+
+    watch_folder_id: str = Field(..., description="Watch folder ID")
+    mount_point: str = Field(..., description="Mount the folder lives on (concurrency key)")
+    started_at: datetime = Field(..., description="When the scan started")
+    duration_seconds: float = Field(..., description="Wall time of change detection + stability checks")
+    changed_files: int = Field(default=0, description="Candidate files reported by the change source")
+    tracked_files: int = Field(default=0, description="Files still waiting to become stable")
+    stable_files: int = Field(default=0, description="Files that became stable in this scan")
+    timed_out: bool = Field(default=False, description="Scan exceeded the per-scan timeout")
+    error: Optional[str] = Field(default=None, description="Error message if the scan failed")
@@ -164,6 +164,8 @@ class WatchFolderRegistry:
             "recursive": folder.recursive,
             "preset_id": folder.preset_id,
             "auto_execute": folder.auto_execute,
+            "detect_sequences": folder.detect_sequences,
+            "sequence_settle_seconds": folder.sequence_settle_seconds,
             "created_at": folder.created_at.isoformat(),
         }
         
@@ -192,6 +194,8 @@ class WatchFolderRegistry:
                 recursive=folder_data["recursive"],
                 preset_id=folder_data["preset_id"],
                 auto_execute=folder_data["auto_execute"],
+                detect_sequences=folder_data["detect_sequences"],
+                sequence_settle_seconds=folder_data["sequence_settle_seconds"],
                 created_at=datetime.fromisoformat(folder_data["created_at"]),
             )
             
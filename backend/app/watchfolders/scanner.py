@@ -5,8 +5,9 @@ Recursively scans directories for media files with extension filtering.
 """
 
 from pathlib import Path
-from typing import List, Set
+from typing import List
 
+from ..filesystem import classifier as media_classifier
 from .models import WatchFolder
 
 
@@ -18,20 +19,38 @@ class FileScanner:
     Skips hidden files, directories, and symlinks.
     """
 
-    # Media file extensions to process
-    # Based on supported formats from metadata/extractors.py
-    MEDIA_EXTENSIONS = {".mov", ".mxf", ".mp4", ".avi", ".mkv"}
+    # Media file extensions to process (shared with app/filesystem/classifier.py)
+    MEDIA_EXTENSIONS = {f".{ext}" for ext in media_classifier.WATCH_FOLDER_EXTENSIONS}
 
-    def __init__(self, skip_hidden: bool = True, follow_symlinks: bool = False):
+    # Image frame extensions, candidates only when sequence detection is on.
+    # The engine groups stable frames into one ImageSequence source.
+    SEQUENCE_EXTENSIONS = {f".{ext}" for ext in media_classifier.SEQUENCE_EXTENSIONS}
+
+    def __init__(
+        self,
+        skip_hidden: bool = True,
+        follow_symlinks: bool = False,
+        detect_sequences: bool = False,
+    ):
         """
         Initialize file scanner.
 
         Args:
             skip_hidden: Skip files/dirs starting with '.' (default: True)
             follow_symlinks: Follow symbolic links (default: False for safety)
+            detect_sequences: Also report image frames (SEQUENCE_EXTENSIONS)
         """
         self.skip_hidden = skip_hidden
         self.follow_symlinks = follow_symlinks
+        self.detect_sequences = detect_sequences
+        # Name checks go through the shared precompiled classifier
+        self.classifier = media_classifier.get_watch_folder_classifier(detect_sequences)
+        self.extensions = {f".{ext}" for ext in self.classifier.media_extensions}
+
+    def is_sequence_frame(self, path: Path) -> bool:
+        """True if path has an image frame extension (name check only)."""
+        ext = self.classifier.extension(path.name)
+        return ext is not None and ext in self.classifier.sequence_extensions
 
     def scan(self, watch_folder: WatchFolder) -> List[Path]:
         """
@@ -64,6 +83,26 @@ class FileScanner:
         # Sort for deterministic ordering
         return sorted(candidates)
 
+    def is_candidate(self, path: Path) -> bool:
+        """
+        Check a single path against the scan rules.
+
+        Used by event-driven change sources, which learn about individual
+        paths instead of walking the tree. Name checks run before any stat.
+        """
+        if self.skip_hidden and path.name.startswith("."):
+            return False
+
+        if not self.classifier.is_media(path.name):
+            return False
+
+        try:
+            if path.is_symlink() and not self.follow_symlinks:
+                return False
+            return path.is_file()
+        except OSError:
+            return False
+
     def _scan_recursive(self, root: Path) -> List[Path]:
         """
         Recursively scan directory tree.
@@ -72,23 +111,24 @@ class FileScanner:
             List of candidate file paths
         """
         candidates = []
+        is_media = self.classifier.is_media
 
         try:
             for item in root.rglob("*"):
-                # Skip based on symlink policy
-                if item.is_symlink() and not self.follow_symlinks:
-                    continue
-
                 # Skip hidden files/dirs
                 if self.skip_hidden and item.name.startswith("."):
                     continue
 
-                # Only process files (not directories)
-                if not item.is_file():
+                # Check extension (name only, before any stat)
+                if not is_media(item.name):
                     continue
 
-                # Check extension
-                if item.suffix.lower() in self.MEDIA_EXTENSIONS:
+                # Skip based on symlink policy
+                if item.is_symlink() and not self.follow_symlinks:
+                    continue
+
+                # Only process files (not directories)
+                if item.is_file():
                     candidates.append(item.resolve())
 
         except (OSError, PermissionError):
@@ -106,23 +146,24 @@ class FileScanner:
             List of candidate file paths
         """
         candidates = []
+        is_media = self.classifier.is_media
 
         try:
             for item in root.iterdir():
-                # Skip based on symlink policy
-                if item.is_symlink() and not self.follow_symlinks:
-                    continue
-
                 # Skip hidden files/dirs
                 if self.skip_hidden and item.name.startswith("."):
                     continue
 
-                # Only process files (not directories)
-                if not item.is_file():
+                # Check extension (name only, before any stat)
+                if not is_media(item.name):
                     continue
 
-                # Check extension
-                if item.suffix.lower() in self.MEDIA_EXTENSIONS:
+                # Skip based on symlink policy
+                if item.is_symlink() and not self.follow_symlinks:
+                    continue
+
+                # Only process files (not directories)
+                if item.is_file():
                     candidates.append(item.resolve())
 
         except (OSError, PermissionError):
@@ -0,0 +1,192 @@
+"""
+Snapshot-diff scanning for watch folders.
+
+For mounts where inotify is unavailable (SMB/NFS), FileScanner re-walks and
+stats every entry on every tick. SnapshotScanner instead keeps, per
+directory, (mtime_ns, entry_count, subdirectory names):
+
+- A directory whose mtime is unchanged has the same direct entries as last
+  time, so it is not listed again; its recorded subdirectories are still
+  visited (one stat each), because a change deeper in the tree only bumps
+  the mtime of the directory that actually changed.
+- A directory whose mtime changed is re-listed with os.scandir, using the
+  DirEntry d_type (no per-file stat), and all its candidate files are
+  reported. The engine drops already-processed paths by set lookup.
+
+Steady-state cost is therefore one stat per directory instead of several
+syscalls per file. The snapshot can be persisted (PersistenceManager) so
+a restart does not require a full walk to re-establish it.
+
+Directories modified within MTIME_GRACE_SECONDS of the scan are recorded
+as unsettled and re-listed next pass, since coarse mtime granularity could
+otherwise hide a change made in the same tick.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .models import WatchFolder
+from .scanner import FileScanner
+
+# See module docstring: re-list directories this recently modified
+MTIME_GRACE_SECONDS = 2.0
+
+# mtime_ns recorded for unsettled directories (never matches a real mtime)
+UNSETTLED_MTIME_NS = -1
+
+
+@dataclass(frozen=True)
+class DirectoryState:
+    """Recorded state of one directory."""
+
+    mtime_ns: int
+    entry_count: int
+    subdirs: Tuple[str, ...]
+
+
+@dataclass
+class SnapshotScanStats:
+    """Counters for the most recent snapshot scan."""
+
+    dirs_listed: int = 0
+    dirs_skipped: int = 0
+    dirs_removed: int = 0
+    candidates: int = 0
+    duration_seconds: float = 0.0
+
+
+class SnapshotScanner:
+    """
+    Incremental scanner that only re-lists directories whose mtime changed.
+
+    Applies the same rules as FileScanner (extensions, hidden files,
+    symlink policy); symlinked directories are not descended, matching rglob.
+    """
+
+    def __init__(
+        self,
+        scanner: FileScanner,
+        snapshot: Optional[Dict[str, DirectoryState]] = None,
+    ):
+        """
+        Initialize snapshot scanner.
+
+        Args:
+            scanner: FileScanner providing the filtering rules
+            snapshot: Previously persisted directory states (optional)
+        """
+        self.scanner = scanner
+        self._snapshot: Dict[str, DirectoryState] = dict(snapshot or {})
+        self.last_stats = SnapshotScanStats()
+        self.changed_dirs: Dict[str, DirectoryState] = {}
+        self.removed_dirs: List[str] = []
+
+    @property
+    def snapshot(self) -> Dict[str, DirectoryState]:
+        return dict(self._snapshot)
+
+    def scan(self, watch_folder: WatchFolder) -> Set[Path]:
+        """
+        Scan a watch folder, listing only changed directories.
+
+        Returns:
+            Candidate files found in changed directories (all candidates on
+            the first pass). Paths are absolute and resolved.
+        """
+        started = time.monotonic()
+        stats = SnapshotScanStats()
+        self.changed_dirs = {}
+
+        root = Path(watch_folder.path)
+        try:
+            root = root.resolve()
+        except OSError:
+            pass
+
+        new_snapshot: Dict[str, DirectoryState] = {}
+        candidates: Set[Path] = set()
+        now = time.time()
+        stack = [str(root)]
+
+        while stack:
+            directory = stack.pop()
+            try:
+                dir_stat = os.stat(directory)
+            except OSError:
+                continue
+
+            previous = self._snapshot.get(directory)
+            if previous is not None and previous.mtime_ns == dir_stat.st_mtime_ns:
+                stats.dirs_skipped += 1
+                new_snapshot[directory] = previous
+                if watch_folder.recursive:
+                    stack.extend(os.path.join(directory, name) for name in previous.subdirs)
+                continue
+
+            try:
+                state = self._list_directory(directory, dir_stat, now, candidates)
+            except OSError:
+                # Unreadable right now: forget it so it is re-listed next pass
+                continue
+
+            stats.dirs_listed += 1
+            new_snapshot[directory] = state
+            self.changed_dirs[directory] = state
+            if watch_folder.recursive:
+                stack.extend(os.path.join(directory, name) for name in state.subdirs)
+
+        self.removed_dirs = [d for d in self._snapshot if d not in new_snapshot]
+        stats.dirs_removed = len(self.removed_dirs)
+        stats.candidates = len(candidates)
+        stats.duration_seconds = time.monotonic() - started
+
+        self._snapshot = new_snapshot
+        self.last_stats = stats
+        return candidates
+
+    def _list_directory(
+        self,
+        directory: str,
+        dir_stat: os.stat_result,
+        now: float,
+        candidates: Set[Path],
+    ) -> DirectoryState:
+        """List one directory, adding its candidate files to candidates."""
+        scanner = self.scanner
+        is_media = scanner.classifier.is_media
+        subdirs = []
+        entry_count = 0
+
+        with os.scandir(directory) as it:
+            for entry in it:
+                entry_count += 1
+                name = entry.name
+
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(name)
+                    continue
+
+                if scanner.skip_hidden and name.startswith("."):
+                    continue
+
+                if not is_media(name):
+                    continue
+
+                if entry.is_symlink():
+                    if not scanner.follow_symlinks or not entry.is_file():
+                        continue
+                    candidates.add(Path(entry.path).resolve())
+                elif entry.is_file(follow_symlinks=False):
+                    # Parent is already resolved and symlinks are not
+                    # descended, so entry.path is canonical
+                    candidates.add(Path(entry.path))
+
+        if now - dir_stat.st_mtime < MTIME_GRACE_SECONDS:
+            mtime_ns = UNSETTLED_MTIME_NS
+        else:
+            mtime_ns = dir_stat.st_mtime_ns
+
+        return DirectoryState(mtime_ns=mtime_ns, entry_count=entry_count, subdirs=tuple(subdirs))
@@ -1,14 +1,25 @@
 """
 File stability detection.
 
-Uses polling to determine when files have finished copying/writing.
-A file is considered stable when its size has not changed for N consecutive checks.
+Determines when files have finished copying/writing.
+
+- StabilityTracker (used by WatchFolderEngine): deadline-driven. Each
+  tracked file sits in a min-heap keyed by the time it should next be
+  checked, so files that are still settling cost nothing between deadlines.
+  A file is stable when its (size, mtime_ns) is unchanged across the quiet
+  window. A writer closing the file (inotify IN_CLOSE_WRITE, or a rename
+  into place) shortens the window to close_settle_seconds, so a finished
+  copy is accepted in under a second.
+- FileStabilityChecker: the original poll-based checker. A file is stable
+  when its size has not changed for N consecutive checks.
 """
 
+import heapq
 import os
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from .models import FileStabilityCheck
 from .errors import FileStabilityError
@@ -165,3 +176,191 @@ class FileStabilityChecker:
         Used primarily for testing or when resetting watch folder state.
         """
         self._file_state.clear()
+
+
+@dataclass
+class _TrackedFile:
+    """Stat recorded for a tracked file and when to check it next."""
+
+    size: int
+    mtime_ns: int
+    deadline: float
+    # Deadline of the live heap entry; other heap entries for the path are stale
+    scheduled: float
+    checks: int = 1
+
+
+class StabilityTracker:
+    """
+    Deadline-driven file stability tracker.
+
+    observe() is called when a change source reports a path; due() is
+    called each tick and re-stats only the files whose deadline passed.
+    Activity on a tracked file postpones its deadline in O(1) (the heap
+    entry is re-pushed lazily when it fires), so a file receiving a stream
+    of write events is not re-stat'd per event.
+
+    Configuration:
+        quiet_seconds: (size, mtime_ns) must be unchanged this long (default: 10)
+        close_settle_seconds: Window after the writer closed the file (default: 0.5)
+
+    A file whose mtime is already older than quiet_seconds when first seen
+    (e.g. present before startup) only waits close_settle_seconds.
+    """
+
+    def __init__(self, quiet_seconds: float = 10.0, close_settle_seconds: float = 0.5):
+        self.quiet_seconds = quiet_seconds
+        self.close_settle_seconds = close_settle_seconds
+        self._files: Dict[str, _TrackedFile] = {}
+        self._heap: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, path: Path) -> bool:
+        return str(path) in self._files
+
+    @property
+    def paths(self) -> Set[Path]:
+        """Files currently tracked (not yet stable)."""
+        return {Path(p) for p in self._files}
+
+    def next_deadline(self) -> Optional[float]:
+        """Monotonic time of the earliest pending check, or None if idle."""
+        while self._heap:
+            deadline, path_str = self._heap[0]
+            entry = self._files.get(path_str)
+            if entry is not None and entry.scheduled == deadline:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def observe(self, path: Path, closed: bool = False) -> None:
+        """
+        Record that a path was created, written or closed.
+
+        Args:
+            path: Absolute, resolved file path
+            closed: The writer closed the file (or renamed it into place)
+        """
+        path_str = str(path)
+        now = time.monotonic()
+        entry = self._files.get(path_str)
+
+        if entry is not None and not closed:
+            # Still being written: push the check out, no syscall
+            entry.deadline = max(entry.deadline, now + self.quiet_seconds)
+            return
+
+        try:
+            stat = os.stat(path_str)
+        except OSError:
+            # Gone already; due() reports it if it was tracked
+            if entry is not None:
+                self._schedule(path_str, entry, now)
+            return
+
+        if closed:
+            delay = self.close_settle_seconds
+        else:
+            # Files that have been quiet since before we saw them need no full window
+            age = time.time() - stat.st_mtime
+            delay = max(self.quiet_seconds - age, self.close_settle_seconds)
+
+        if entry is None:
+            entry = _TrackedFile(
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                deadline=now + delay,
+                scheduled=now + delay,
+            )
+            self._files[path_str] = entry
+            heapq.heappush(self._heap, (entry.scheduled, path_str))
+            return
+
+        entry.size = stat.st_size
+        entry.mtime_ns = stat.st_mtime_ns
+        entry.deadline = now + delay
+        self._schedule(path_str, entry, entry.deadline)
+
+    def due(self) -> List[FileStabilityCheck]:
+        """
+        Check every file whose deadline has passed.
+
+        Returns:
+            Results for files that became stable (is_stable=True) or vanished
+            (size_bytes=None); both stop being tracked. Files that changed
+            are rescheduled and not returned.
+        """
+        now = time.monotonic()
+        results = []
+
+        while self._heap and self._heap[0][0] <= now:
+            scheduled, path_str = heapq.heappop(self._heap)
+            entry = self._files.get(path_str)
+            if entry is None or entry.scheduled != scheduled:
+                continue  # stale heap entry
+            if entry.deadline > now:
+                # Postponed by activity since it was scheduled
+                self._schedule(path_str, entry, entry.deadline)
+                continue
+
+            try:
+                stat = os.stat(path_str)
+            except OSError as e:
+                del self._files[path_str]
+                results.append(FileStabilityCheck(
+                    path=path_str,
+                    is_stable=False,
+                    size_bytes=None,
+                    check_count=entry.checks,
+                    reason=f"File not accessible: {e}",
+                ))
+                continue
+
+            entry.checks += 1
+            if stat.st_size == entry.size and stat.st_mtime_ns == entry.mtime_ns:
+                del self._files[path_str]
+                results.append(FileStabilityCheck(
+                    path=path_str,
+                    is_stable=True,
+                    size_bytes=stat.st_size,
+                    check_count=entry.checks,
+                    reason=None,
+                ))
+                continue
+
+            # Still growing: wait a full quiet window from now
+            entry.size = stat.st_size
+            entry.mtime_ns = stat.st_mtime_ns
+            entry.deadline = now + self.quiet_seconds
+            self._schedule(path_str, entry, entry.deadline)
+
+        return results
+
+    def defer(self, path: Path) -> None:
+        """Track a path again and check it after a full quiet window."""
+        path_str = str(path)
+        try:
+            stat = os.stat(path_str)
+        except OSError:
+            return
+        deadline = time.monotonic() + self.quiet_seconds
+        entry = _TrackedFile(
+            size=stat.st_size, mtime_ns=stat.st_mtime_ns, deadline=deadline, scheduled=deadline,
+        )
+        self._files[path_str] = entry
+        heapq.heappush(self._heap, (deadline, path_str))
+
+    def forget(self, path: Path) -> None:
+        """Stop tracking a path (its heap entry is dropped lazily)."""
+        self._files.pop(str(path), None)
+
+    def clear(self) -> None:
+        """Stop tracking all files."""
+        self._files.clear()
+        self._heap.clear()
+
+    def _schedule(self, path_str: str, entry: _TrackedFile, deadline: float) -> None:
+        entry.scheduled = deadline
+        heapq.heappush(self._heap, (deadline, path_str))
@@ -0,0 +1,391 @@
+"""
+Change sources for watch folders.
+
+A change source answers "which paths might have changed since the last
+tick?" so the engine only stability-checks those paths.
+
+- InotifyChangeSource: Linux inotify via ctypes (no extra dependency).
+  The first poll walks the tree once to register watches and report the
+  existing files; afterwards each poll drains pending events without
+  touching the filesystem, so idle cost is O(changes), not O(tree size).
+- SnapshotChangeSource: snapshot-diff polling (see snapshot.py). Used where
+  inotify is unavailable (non-Linux, watch limit exhausted) or unreliable
+  (network mounts, where remote writers do not generate local events).
+  Only directories whose mtime changed are re-listed.
+- PollingChangeSource: full FileScanner.scan() on every poll.
+
+create_change_source() picks inotify for local folders when possible and
+snapshot polling otherwise.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from ..filesystem.staging import is_network_path
+from .models import WatchFolder
+from .scanner import FileScanner
+from .snapshot import UNSETTLED_MTIME_NS, DirectoryState, SnapshotScanner
+
+logger = logging.getLogger(__name__)
+
+
+# inotify constants (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+
+# Events that mean "this file may have new content or just appeared"
+FILE_CHANGE_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+# Mask registered on every watched directory
+WATCH_MASK = (
+    FILE_CHANGE_MASK | IN_MOVED_FROM | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Bytes read from the inotify fd per read() call
+_READ_BUFFER_SIZE = 64 * 1024
+
+
+class ChangeSource:
+    """Base class: reports paths that may have changed since the last poll."""
+
+    def __init__(self, watch_folder: WatchFolder, scanner: FileScanner):
+        self.watch_folder = watch_folder
+        self.scanner = scanner
+        # Paths from the latest poll() whose writer closed them (or renamed
+        # them into place) after the last write; only event sources know this
+        self.closed: Set[Path] = set()
+
+    @property
+    def is_event_driven(self) -> bool:
+        return False
+
+    def poll(self) -> Set[Path]:
+        """Return candidate media files that may have changed."""
+        raise NotImplementedError
+
+    def checkpoint(self, pending: Set[Path]) -> None:
+        """
+        Called after a tick with the candidates that are still unresolved.
+
+        Sources that persist state must make sure these are reported again
+        after a restart.
+        """
+        pass
+
+    def forget(self) -> None:
+        """Discard persisted state so the next source does a full scan."""
+        pass
+
+    def close(self) -> None:
+        """Release any OS resources."""
+        pass
+
+
+class PollingChangeSource(ChangeSource):
+    """Reports the full scan result on every poll (O(tree size))."""
+
+    def poll(self) -> Set[Path]:
+        return set(self.scanner.scan(self.watch_folder))
+
+
+class SnapshotChangeSource(ChangeSource):
+    """
+    Polls with SnapshotScanner: one stat per directory in steady state.
+
+    If a persistence manager is given, the directory snapshot is loaded on
+    creation and incremental changes are saved at each checkpoint.
+    Directories holding still-unresolved candidates are persisted as
+    unsettled, so a restart re-lists them instead of losing those files.
+    """
+
+    def __init__(self, watch_folder: WatchFolder, scanner: FileScanner, persistence_manager=None):
+        super().__init__(watch_folder, scanner)
+        self._persistence = persistence_manager
+
+        snapshot = None
+        if persistence_manager is not None:
+            try:
+                snapshot = {
+                    path: DirectoryState(
+                        mtime_ns=state["mtime_ns"],
+                        entry_count=state["entry_count"],
+                        subdirs=tuple(state["subdirs"]),
+                    )
+                    for path, state in persistence_manager.load_directory_snapshot(watch_folder.id).items()
+                }
+            except Exception as e:
+                logger.warning(f"Could not load directory snapshot for '{watch_folder.id}': {e}")
+
+        self.snapshot_scanner = SnapshotScanner(scanner, snapshot)
+        self._persisted_pending_dirs: Set[str] = set()
+
+    def poll(self) -> Set[Path]:
+        return self.snapshot_scanner.scan(self.watch_folder)
+
+    def checkpoint(self, pending: Set[Path]) -> None:
+        if self._persistence is None:
+            return
+
+        scanner = self.snapshot_scanner
+        pending_dirs = {str(path.parent) for path in pending}
+        # Directories whose pending files resolved get their real state back
+        touched = set(scanner.changed_dirs) | pending_dirs | (self._persisted_pending_dirs - pending_dirs)
+        if not touched and not scanner.removed_dirs:
+            return
+        if not scanner.changed_dirs and not scanner.removed_dirs and pending_dirs == self._persisted_pending_dirs:
+            return
+
+        snapshot = scanner.snapshot
+        changed = {}
+        for directory in touched:
+            state = snapshot.get(directory)
+            if state is None:
+                continue
+            changed[directory] = {
+                "mtime_ns": UNSETTLED_MTIME_NS if directory in pending_dirs else state.mtime_ns,
+                "entry_count": state.entry_count,
+                "subdirs": state.subdirs,
+            }
+
+        try:
+            self._persistence.save_directory_snapshot(self.watch_folder.id, changed, scanner.removed_dirs)
+            self._persisted_pending_dirs = pending_dirs
+        except Exception as e:
+            # Non-fatal: the in-memory snapshot stays correct
+            logger.warning(f"Could not save directory snapshot for '{self.watch_folder.id}': {e}")
+
+    def forget(self) -> None:
+        if self._persistence is None:
+            return
+        try:
+            self._persistence.clear_directory_snapshot(self.watch_folder.id)
+        except Exception as e:
+            logger.warning(f"Could not clear directory snapshot for '{self.watch_folder.id}': {e}")
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Load libc with inotify symbols, or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        for symbol in ("inotify_init1", "inotify_add_watch", "inotify_rm_watch"):
+            getattr(libc, symbol)
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_libc = _load_libc()
+
+
+def inotify_available() -> bool:
+    """True if this platform supports inotify."""
+    return _libc is not None
+
+
+class InotifyError(OSError):
+    """inotify initialisation or watch registration failed."""
+
+    pass
+
+
+class InotifyChangeSource(ChangeSource):
+    """
+    Event-driven change source backed by Linux inotify.
+
+    Watches every directory under the watch folder (one watch per
+    directory). New subdirectories are watched as they appear, and their
+    existing contents are reported, since files may land before the watch
+    is added. A queue overflow triggers one full rescan.
+    """
+
+    def __init__(self, watch_folder: WatchFolder, scanner: FileScanner):
+        super().__init__(watch_folder, scanner)
+        if _libc is None:
+            raise InotifyError(errno.ENOSYS, "inotify is not available on this platform")
+
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise InotifyError(err, f"inotify_init1 failed: {os.strerror(err)}")
+
+        self._fd = fd
+        self._watches: Dict[int, str] = {}  # wd -> directory path
+        self._needs_full_scan = True
+
+    @property
+    def is_event_driven(self) -> bool:
+        return True
+
+    @property
+    def watch_count(self) -> int:
+        return len(self._watches)
+
+    def poll(self) -> Set[Path]:
+        self.closed = set()
+        if self._needs_full_scan:
+            self._needs_full_scan = False
+            self._watch_tree(self.watch_folder.path)
+            return set(self.scanner.scan(self.watch_folder))
+
+        candidates: Set[Path] = set()
+        for wd, mask, name in self._read_events():
+            if mask & IN_Q_OVERFLOW:
+                logger.warning(
+                    f"inotify queue overflow for watch folder '{self.watch_folder.id}', rescanning"
+                )
+                self._needs_full_scan = True
+                return self.poll()
+
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+
+            path = Path(directory) / name
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and self.watch_folder.recursive:
+                    # Files can land before the new watch is registered
+                    self._watch_tree(str(path))
+                    candidates.update(self._walk_files(path))
+                continue
+
+            if mask & FILE_CHANGE_MASK and self.scanner.is_candidate(path):
+                resolved = path.resolve()
+                candidates.add(resolved)
+                if mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                    self.closed.add(resolved)
+                elif mask & IN_MODIFY:
+                    # Written again after an earlier close in this batch
+                    self.closed.discard(resolved)
+
+        return candidates
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._watches.clear()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _add_watch(self, directory: str) -> None:
+        mask = WATCH_MASK
+        if not self.scanner.follow_symlinks:
+            mask |= IN_DONT_FOLLOW
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(directory), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                # Directory vanished or is unreadable - nothing to watch
+                return
+            raise InotifyError(err, f"inotify_add_watch failed for {directory}: {os.strerror(err)}")
+        self._watches[wd] = directory
+
+    def _watch_tree(self, root: str) -> None:
+        """Add watches for root and (if recursive) every directory below it."""
+        self._add_watch(root)
+        if not self.watch_folder.recursive:
+            return
+
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        # Matches rglob: symlinked directories are not descended
+                        if entry.is_dir(follow_symlinks=False):
+                            self._add_watch(entry.path)
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+    def _walk_files(self, root: Path) -> List[Path]:
+        """Candidate files already present in a newly created directory."""
+        found = []
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                if self.scanner.is_candidate(path):
+                    found.append(path.resolve())
+        return found
+
+    def _read_events(self):
+        """Drain all pending events without blocking."""
+        while True:
+            try:
+                data = os.read(self._fd, _READ_BUFFER_SIZE)
+            except BlockingIOError:
+                return
+            if not data:
+                return
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                raw_name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                yield wd, mask, os.fsdecode(raw_name)
+
+
+def create_change_source(
+    watch_folder: WatchFolder,
+    scanner: FileScanner,
+    prefer_events: bool = True,
+    persistence_manager=None,
+) -> ChangeSource:
+    """
+    Create the best available change source for a watch folder.
+
+    Network mounts (NFS/SMB/...) always get snapshot polling: writes from
+    other hosts raise no local inotify events. Otherwise falls back to
+    snapshot polling only if inotify cannot be initialised here. Watch
+    limit exhaustion (fs.inotify.max_user_watches) is only discovered when
+    the first poll() registers watches; the engine handles that
+    InotifyError by switching the folder to snapshot polling.
+    """
+    if prefer_events and is_network_path(watch_folder.path):
+        logger.info(
+            f"Watch folder '{watch_folder.id}' is on a network mount, using snapshot polling"
+        )
+        prefer_events = False
+    if prefer_events and inotify_available():
+        try:
+            return InotifyChangeSource(watch_folder, scanner)
+        except InotifyError as e:
+            logger.warning(
+                f"inotify unavailable for watch folder '{watch_folder.id}', falling back to polling: {e}"
+            )
+    return SnapshotChangeSource(watch_folder, scanner, persistence_manager)
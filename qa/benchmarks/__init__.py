@@ -0,0 +1,6 @@
+"""
+Performance benchmarks.
+
+Standalone scripts (not collected by pytest). Run from the repo root, e.g.:
+    python -m qa.benchmarks.bench_thumbnails
+"""
@@ -0,0 +1,81 @@
+"""
+Benchmark: aggregate encode fps at 1, 2, 4 and 8 concurrent renders.
+
+Runs N identical FFmpeg encodes at once, first unbudgeted (every process
+sizes its thread pools to the whole machine) and then with the
+ResourceManager's per-slot thread budget and core pinning, and reports
+the aggregate frames per second of each.
+
+The source is FFmpeg's synthetic testsrc2 pattern, so no media is needed.
+
+Usage:
+    python -m qa.benchmarks.bench_concurrent_encodes [--frames N] [--size WxH]
+        [--codec libx264] [--jobs 1,2,4,8]
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+
+from app.execution.resources import ResourceManager, ThreadBudget  # noqa: E402
+from app.execution.thumbnails import find_ffmpeg  # noqa: E402
+
+
+def _command(ffmpeg_path: str, output: str, frames: int, size: str, codec: str) -> list:
+    return [
+        ffmpeg_path, "-y", "-hide_banner", "-loglevel", "error",
+        "-f", "lavfi", "-i", f"testsrc2=size={size}:rate=25",
+        "-frames:v", str(frames), "-c:v", codec, "-pix_fmt", "yuv420p",
+        output,
+    ]
+
+
+def _run_batch(ffmpeg_path: str, jobs: int, args, budgeted: bool) -> float:
+    """Run `jobs` encodes at once; return aggregate fps."""
+    manager = ResourceManager(slots=jobs, pin=True) if budgeted else None
+    with tempfile.TemporaryDirectory() as tmpdir:
+        processes = []
+        start = time.perf_counter()
+        for index in range(jobs):
+            output = str(Path(tmpdir) / f"out{index}.mp4")
+            cmd = _command(ffmpeg_path, output, args.frames, args.size, args.codec)
+            budget = manager.acquire(f"clip{index}") if manager else ThreadBudget()
+            process = subprocess.Popen(budget.apply(cmd, [output]))
+            budget.pin(process.pid)
+            processes.append(process)
+        failed = sum(1 for process in processes if process.wait() != 0)
+        elapsed = time.perf_counter() - start
+    if failed:
+        raise RuntimeError(f"{failed} of {jobs} encodes failed")
+    return jobs * args.frames / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=250)
+    parser.add_argument("--size", default="1920x1080")
+    parser.add_argument("--codec", default="libx264")
+    parser.add_argument("--jobs", default="1,2,4,8")
+    args = parser.parse_args()
+
+    ffmpeg_path = find_ffmpeg()
+    if not ffmpeg_path:
+        print("FFmpeg not found - cannot run concurrency benchmark")
+        return 1
+
+    print(f"{'jobs':>4} {'unbudgeted (fps)':>17} {'budgeted (fps)':>15} {'speedup':>9}")
+    for jobs in (int(value) for value in args.jobs.split(",")):
+        plain = _run_batch(ffmpeg_path, jobs, args, budgeted=False)
+        budgeted = _run_batch(ffmpeg_path, jobs, args, budgeted=True)
+        print(f"{jobs:>4} {plain:>17.1f} {budgeted:>15.1f} {budgeted / plain:>8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Benchmark: media classification of raw file names.
+
+Generates synthetic names (default 1,000,000; a mix of media, numbered
+frames, sidecars, extensionless names and mixed-case extensions) and times:
+
+- Path(name).suffix.lower() in set (the previous per-path check)
+- MediaClassifier.is_media per name
+- MediaClassifier.select over the whole batch
+- MediaClassifier.classify per name (includes the frame pattern)
+- MediaClassifier.classify_names over the whole batch
+
+No filesystem access: this measures the name test alone.
+
+Usage:
+    python -m qa.benchmarks.bench_media_classifier [--names N] [--seed N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+
+from app.filesystem.classifier import get_media_classifier  # noqa: E402
+
+# (weight, name factory)
+_SHAPES = [
+    (30, lambda i: f"A{i:03d}_C{i % 97:03d}_0101XY.mov"),
+    (10, lambda i: f"CLIP_{i:06d}.MXF"),
+    (25, lambda i: f"shot_v001.{1001 + i % 5000:04d}.exr"),
+    (5, lambda i: f"scan_{i:07d}.DPX"),
+    (15, lambda i: f"A{i:03d}_C{i % 97:03d}.xml"),
+    (5, lambda i: f"notes_{i}.txt"),
+    (5, lambda i: f"README_{i}"),
+    (3, lambda i: f"Clip_{i}.Mp4"),
+    (2, lambda i: f".DS_Store{i}"),
+]
+
+
+def _names(count: int, seed: int):
+    rng = random.Random(seed)
+    factories = [factory for weight, factory in _SHAPES for _ in range(weight)]
+    return [rng.choice(factories)(i) for i in range(count)]
+
+
+def _timed(label: str, fn, count: int):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<36} {elapsed:8.3f}s  {count / elapsed / 1e6:6.2f}M names/s  {result:>9} media")
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--names", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"Generating {args.names} names ...")
+    names = _names(args.names, args.seed)
+    classifier = get_media_classifier()
+    extensions = {f".{ext}" for ext in classifier.media_extensions}
+    print()
+
+    baseline = _timed(
+        "Path.suffix.lower() in set",
+        lambda: sum(1 for name in names if Path(name).suffix.lower() in extensions),
+        args.names,
+    )
+    _timed(
+        "is_media per name",
+        lambda: sum(1 for name in names if classifier.is_media(name)),
+        args.names,
+    )
+    selected = _timed("select (batch)", lambda: len(classifier.select(names)), args.names)
+    _timed(
+        "classify per name",
+        lambda: sum(1 for name in names if classifier.classify(name).value != "none"),
+        args.names,
+    )
+    _timed(
+        "classify_names (batch)",
+        lambda: sum(1 for kind in classifier.classify_names(names) if kind.value != "none"),
+        args.names,
+    )
+
+    if selected != baseline:
+        # Path.suffix treats ".DS_Store1" as having no suffix, as does the classifier
+        print(f"\nMismatch: baseline {baseline} vs classifier {selected}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
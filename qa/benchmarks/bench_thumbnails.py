@@ -0,0 +1,83 @@
+"""
+Benchmark: quality vs fast (keyframe-only) thumbnail generation.
+
+Runs both thumbnail modes over every video in test_media/ (or a folder
+given on the command line) and reports mean wall time per clip.
+
+Quality mode reproduces the pre-fast ingest path (ffprobe + thumbnail
+filter window). Fast mode uses a pre-known duration, as ingest does with
+ClipTask.duration, and decodes a single keyframe.
+
+Usage:
+    python -m qa.benchmarks.bench_thumbnails [media_dir] [--runs N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+
+from app.execution.thumbnails import (  # noqa: E402
+    find_ffmpeg,
+    generate_thumbnail_sync,
+    get_video_duration,
+)
+
+VIDEO_EXTENSIONS = {".mp4", ".mov", ".mxf", ".mkv", ".avi", ".m4v"}
+
+
+def _time_mode(source: Path, runs: int, fast: bool, duration) -> float:
+    """Return mean seconds per thumbnail for one mode."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output = str(Path(tmpdir) / "thumb.jpg")
+        start = time.perf_counter()
+        for _ in range(runs):
+            if fast:
+                generate_thumbnail_sync(str(source), output, duration=duration, fast=True)
+            else:
+                generate_thumbnail_sync(str(source), output)
+        return (time.perf_counter() - start) / runs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("media_dir", nargs="?", default=str(REPO_ROOT / "test_media"))
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    
+    ffmpeg_path = find_ffmpeg()
+    if not ffmpeg_path:
+        print("FFmpeg not found - cannot run thumbnail benchmark")
+        return 1
+    
+    sources = sorted(
+        p for p in Path(args.media_dir).rglob("*")
+        if p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS
+    )
+    if not sources:
+        print(f"No media found in {args.media_dir}")
+        return 1
+    
+    print(f"{'clip':<40} {'quality (ms)':>14} {'fast (ms)':>12} {'speedup':>9}")
+    total_quality = total_fast = 0.0
+    for source in sources:
+        # Ingest already knows the duration; measure only the thumbnail itself
+        duration = get_video_duration(str(source), ffmpeg_path)
+        quality = _time_mode(source, args.runs, fast=False, duration=duration)
+        fast = _time_mode(source, args.runs, fast=True, duration=duration)
+        total_quality += quality
+        total_fast += fast
+        speedup = quality / fast if fast > 0 else float("inf")
+        print(f"{source.name[:40]:<40} {quality * 1000:>14.1f} {fast * 1000:>12.1f} {speedup:>8.1f}x")
+    
+    speedup = total_quality / total_fast if total_fast > 0 else float("inf")
+    print(f"{'TOTAL':<40} {total_quality * 1000:>14.1f} {total_fast * 1000:>12.1f} {speedup:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,8 @@ Pytest configuration for QA test suite.
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add backend to Python path for test imports
 backend_path = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_path))
@@ -18,3 +20,48 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "e2e: marks tests as end-to-end (requires FFmpeg)"
     )
+
+
+@pytest.fixture
+def fake_ffmpeg_engine(monkeypatch):
+    """
+    Factory for FFmpegEngines that render without running FFmpeg.
+
+    fake_ffmpeg_engine(output=b"proxy", fail_at=None) returns an engine
+    whose single-clip render (_run_clip_direct) and command execution
+    (_execute_ffmpeg_command) write `output` to the output path and
+    succeed, with the status the real method reports. Call number fail_at
+    (1-based) instead leaves a partial file and fails, like an interrupted
+    encode. engine.rendered lists the output path of every call,
+    engine.commands every executed command.
+    """
+    from app.execution.ffmpeg import FFmpegEngine
+    from app.execution.results import ExecutionResult, ExecutionStatus
+
+    def make(output=b"proxy", fail_at=None):
+        engine = FFmpegEngine()
+        engine.rendered = []
+        engine.commands = []
+
+        def render(task, output_path, status):
+            engine.rendered.append(output_path)
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            if fail_at is not None and len(engine.rendered) == fail_at:
+                Path(output_path).write_bytes(b"partial")
+                return ExecutionResult(status=ExecutionStatus.FAILED, source_path=task.source_path)
+            Path(output_path).write_bytes(output)
+            return ExecutionResult(status=status, source_path=task.source_path, output_path=output_path)
+
+        def run_clip_direct(task, resolved_params, output_path, watermark_text, on_progress, input_path=None):
+            return render(task, output_path, ExecutionStatus.SUCCESS)
+
+        def execute(task, cmd, output_path, start_time, on_progress=None, warnings=None,
+                    additional_output_paths=None):
+            engine.commands.append(cmd)
+            return render(task, output_path, ExecutionStatus.COMPLETED)
+
+        monkeypatch.setattr(engine, "_run_clip_direct", run_clip_direct)
+        monkeypatch.setattr(engine, "_execute_ffmpeg_command", execute)
+        return engine
+
+    return make
@@ -79,3 +79,659 @@ class TestExactlyOnceIngestion:
             # Results should be Path objects
             for result in results:
                 assert isinstance(result, Path)
+
+
+class TestChangeSources:
+    """Test event-driven change detection with polling fallback."""
+    
+    def test_polling_source_reports_full_scan(self, tmp_path):
+        from app.watchfolders.scanner import FileScanner
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.watcher import PollingChangeSource
+        
+        (tmp_path / "a.mov").write_bytes(b"x")
+        source = PollingChangeSource(WatchFolder(id="poll", path=str(tmp_path)), FileScanner())
+        
+        assert {p.name for p in source.poll()} == {"a.mov"}
+        assert {p.name for p in source.poll()} == {"a.mov"}
+    
+    def test_inotify_source_reports_only_changes(self, tmp_path):
+        from app.watchfolders.scanner import FileScanner
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.watcher import InotifyChangeSource, inotify_available
+        
+        if not inotify_available():
+            pytest.skip("inotify not available on this platform")
+        
+        (tmp_path / "existing.mov").write_bytes(b"x")
+        source = InotifyChangeSource(WatchFolder(id="events", path=str(tmp_path)), FileScanner())
+        try:
+            # First poll: full scan to establish watches
+            assert {p.name for p in source.poll()} == {"existing.mov"}
+            # Idle: nothing reported
+            assert source.poll() == set()
+            
+            (tmp_path / "new.mxf").write_bytes(b"x")
+            (tmp_path / "ignored.txt").write_text("x")
+            sub = tmp_path / "card01"
+            sub.mkdir()
+            (sub / "nested.mp4").write_bytes(b"x")
+            
+            assert {p.name for p in source.poll()} == {"new.mxf", "nested.mp4"}
+            
+            (sub / "later.mov").write_bytes(b"x")
+            assert {p.name for p in source.poll()} == {"later.mov"}
+        finally:
+            source.close()
+    
+    def test_network_mount_uses_snapshot_polling(self, tmp_path, monkeypatch):
+        from app.watchfolders import watcher
+        from app.watchfolders.scanner import FileScanner
+        from app.watchfolders.models import WatchFolder
+        
+        monkeypatch.setattr(watcher, "inotify_available", lambda: True)
+        monkeypatch.setattr(watcher, "is_network_path", lambda path: True)
+        source = watcher.create_change_source(WatchFolder(id="nfs", path=str(tmp_path)), FileScanner())
+        try:
+            assert isinstance(source, watcher.SnapshotChangeSource)
+            assert not source.is_event_driven
+        finally:
+            source.close()
+    
+    def test_engine_carries_unstable_candidates_between_ticks(self, tmp_path):
+        from unittest.mock import MagicMock
+        from app.watchfolders.engine import WatchFolderEngine
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.registry import WatchFolderRegistry
+        
+        registry = WatchFolderRegistry()
+        folder = WatchFolder(id="wf", path=str(tmp_path))
+        registry.add_folder(folder)
+        job_engine = MagicMock()
+        job_engine.create_jobs.side_effect = lambda source_paths: [MagicMock() for _ in source_paths]
+        engine = WatchFolderEngine(
+            watch_folder_registry=registry,
+            job_engine=job_engine,
+            binding_registry=MagicMock(),
+        )
+        engine.stability_quiet_seconds = 0.2
+        engine.stability_close_settle_seconds = 0.2
+        
+        clip = tmp_path / "clip.mov"
+        clip.write_bytes(b"x")
+        try:
+            assert engine.scan_folder(folder) == []
+            assert engine.next_check_delay() is not None
+            time.sleep(0.25)
+            # No new filesystem events, but the pending candidate is re-checked
+            jobs = engine.scan_folder(folder)
+            assert len(jobs) == 1
+            assert str(clip.resolve()) in engine.get_processed_files()
+            assert engine.scan_folder(folder) == []
+        finally:
+            engine.close()
+
+
+class TestStabilityTracker:
+    """Test deadline-driven stability detection."""
+    
+    def test_closed_file_accepted_after_settle_window(self, tmp_path):
+        from app.watchfolders.stability import StabilityTracker
+        
+        clip = tmp_path / "clip.mov"
+        clip.write_bytes(b"x" * 100)
+        tracker = StabilityTracker(quiet_seconds=60, close_settle_seconds=0.1)
+        tracker.observe(clip, closed=True)
+        
+        assert tracker.due() == []
+        time.sleep(0.15)
+        results = tracker.due()
+        assert [(r.path, r.is_stable, r.size_bytes) for r in results] == [(str(clip), True, 100)]
+        assert len(tracker) == 0
+        assert tracker.next_deadline() is None
+    
+    def test_growing_file_is_rescheduled(self, tmp_path):
+        from app.watchfolders.stability import StabilityTracker
+        
+        clip = tmp_path / "clip.mov"
+        clip.write_bytes(b"x")
+        tracker = StabilityTracker(quiet_seconds=0.1, close_settle_seconds=0.05)
+        tracker.observe(clip, closed=True)
+        
+        with open(clip, "ab") as f:
+            f.write(b"more")
+        time.sleep(0.06)
+        assert tracker.due() == []
+        assert clip in tracker
+        
+        time.sleep(0.12)
+        assert [r.is_stable for r in tracker.due()] == [True]
+    
+    def test_write_activity_postpones_check(self, tmp_path):
+        from app.watchfolders.stability import StabilityTracker
+        
+        clip = tmp_path / "clip.mov"
+        clip.write_bytes(b"x")
+        tracker = StabilityTracker(quiet_seconds=0.2, close_settle_seconds=0.2)
+        tracker.observe(clip, closed=True)
+        time.sleep(0.1)
+        tracker.observe(clip)  # another write event
+        time.sleep(0.15)
+        assert tracker.due() == []
+        time.sleep(0.1)
+        assert [r.is_stable for r in tracker.due()] == [True]
+    
+    def test_vanished_file_is_reported_and_dropped(self, tmp_path):
+        from app.watchfolders.stability import StabilityTracker
+        
+        clip = tmp_path / "clip.mov"
+        clip.write_bytes(b"x")
+        tracker = StabilityTracker(quiet_seconds=0.05, close_settle_seconds=0.05)
+        tracker.observe(clip)
+        clip.unlink()
+        time.sleep(0.06)
+        results = tracker.due()
+        assert [(r.is_stable, r.size_bytes) for r in results] == [(False, None)]
+        assert len(tracker) == 0
+    
+    def test_engine_accepts_close_write_within_a_second(self, tmp_path):
+        from unittest.mock import MagicMock
+        from app.watchfolders.engine import WatchFolderEngine
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.registry import WatchFolderRegistry
+        from app.watchfolders.watcher import inotify_available
+        
+        if not inotify_available():
+            pytest.skip("inotify not available on this platform")
+        
+        registry = WatchFolderRegistry()
+        folder = WatchFolder(id="wf", path=str(tmp_path))
+        registry.add_folder(folder)
+        job_engine = MagicMock()
+        job_engine.create_jobs.side_effect = lambda source_paths: [MagicMock() for _ in source_paths]
+        engine = WatchFolderEngine(
+            watch_folder_registry=registry,
+            job_engine=job_engine,
+            binding_registry=MagicMock(),
+        )
+        try:
+            assert engine.scan_folder(folder) == []  # establishes watches
+            
+            with open(tmp_path / "clip.mov", "wb") as f:
+                f.write(b"x" * 1024)
+            started = time.monotonic()
+            jobs = []
+            while not jobs and time.monotonic() - started < 5:
+                jobs = engine.scan_folder(folder)
+                delay = engine.next_check_delay()
+                time.sleep(min(delay if delay is not None else 0.05, 0.05))
+            
+            assert len(jobs) == 1
+            assert time.monotonic() - started < 1.0
+        finally:
+            engine.close()
+
+
+class TestSnapshotScanning:
+    """Test incremental snapshot-diff scanning and its persistence."""
+    
+    @staticmethod
+    def _backdate(root: Path, seconds: float = 60.0):
+        """Push directory mtimes out of the unsettled grace window."""
+        import os
+        stamp = time.time() - seconds
+        for directory in [root, *(p for p in root.rglob("*") if p.is_dir())]:
+            os.utime(directory, (stamp, stamp))
+    
+    def test_unchanged_tree_is_not_relisted(self, tmp_path):
+        from app.watchfolders.scanner import FileScanner
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.snapshot import SnapshotScanner
+        
+        card = tmp_path / "card01" / "clips"
+        card.mkdir(parents=True)
+        (tmp_path / "a.mov").write_bytes(b"x")
+        (card / "b.mxf").write_bytes(b"x")
+        (card / "notes.txt").write_text("x")
+        self._backdate(tmp_path)
+        
+        folder = WatchFolder(id="snap", path=str(tmp_path))
+        scanner = SnapshotScanner(FileScanner())
+        
+        assert {p.name for p in scanner.scan(folder)} == {"a.mov", "b.mxf"}
+        assert scanner.last_stats.dirs_listed == 3
+        
+        assert scanner.scan(folder) == set()
+        assert scanner.last_stats.dirs_listed == 0
+        assert scanner.last_stats.dirs_skipped == 3
+        
+        (card / "c.mp4").write_bytes(b"x")
+        assert {p.name for p in scanner.scan(folder)} == {"b.mxf", "c.mp4"}
+        assert scanner.last_stats.dirs_listed == 1
+    
+    def test_snapshot_matches_file_scanner(self, tmp_path):
+        from app.watchfolders.scanner import FileScanner
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.snapshot import SnapshotScanner
+        
+        (tmp_path / "x" / "y").mkdir(parents=True)
+        (tmp_path / "x" / "y" / "deep.MOV").write_bytes(b"x")
+        (tmp_path / ".hidden.mov").write_bytes(b"x")
+        (tmp_path / "top.mkv").write_bytes(b"x")
+        
+        for recursive in (True, False):
+            folder = WatchFolder(id="cmp", path=str(tmp_path), recursive=recursive)
+            expected = set(FileScanner().scan(folder))
+            assert SnapshotScanner(FileScanner()).scan(folder) == expected
+    
+    def test_persisted_snapshot_survives_restart(self, tmp_path):
+        from app.persistence.manager import PersistenceManager
+        from app.watchfolders.scanner import FileScanner
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.watcher import SnapshotChangeSource
+        
+        root = tmp_path / "watch"
+        (root / "done").mkdir(parents=True)
+        (root / "copying").mkdir()
+        (root / "done" / "a.mov").write_bytes(b"x")
+        (root / "copying" / "b.mov").write_bytes(b"x")
+        self._backdate(root)
+        
+        persistence = PersistenceManager(db_path=str(tmp_path / "proxx.db"))
+        folder = WatchFolder(id="wf", path=str(root))
+        
+        source = SnapshotChangeSource(folder, FileScanner(), persistence)
+        assert {p.name for p in source.poll()} == {"a.mov", "b.mov"}
+        # b.mov is still being copied when the process stops
+        source.checkpoint({(root / "copying" / "b.mov").resolve()})
+        
+        restarted = SnapshotChangeSource(folder, FileScanner(), persistence)
+        assert {p.name for p in restarted.poll()} == {"b.mov"}
+        restarted.checkpoint(set())
+        
+        assert SnapshotChangeSource(folder, FileScanner(), persistence).poll() == set()
+        
+        restarted.forget()
+        assert persistence.load_directory_snapshot("wf") == {}
+
+
+class TestParallelScanning:
+    """Test concurrent multi-folder scanning with per-mount limits."""
+    
+    @staticmethod
+    def _engine(registry):
+        from unittest.mock import MagicMock
+        from app.watchfolders.engine import WatchFolderEngine
+        
+        job_engine = MagicMock()
+        job_engine.create_jobs.side_effect = lambda source_paths: [
+            MagicMock(id=Path(path).name) for path in source_paths
+        ]
+        engine = WatchFolderEngine(
+            watch_folder_registry=registry,
+            job_engine=job_engine,
+            binding_registry=MagicMock(),
+            use_events=False,
+        )
+        engine.stability_quiet_seconds = 0
+        engine.stability_close_settle_seconds = 0
+        return engine
+    
+    def _stall(self, engine, folder_id, release):
+        """Make change detection for one folder block until release is set."""
+        original = engine._poll_changes
+        
+        def poll(watch_folder):
+            if watch_folder.id == folder_id:
+                release.wait(5)
+            return original(watch_folder)
+        
+        engine._poll_changes = poll
+    
+    def test_stalled_folder_does_not_block_others(self, tmp_path):
+        import threading
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.registry import WatchFolderRegistry
+        
+        slow_dir, fast_dir = tmp_path / "slow", tmp_path / "fast"
+        slow_dir.mkdir()
+        fast_dir.mkdir()
+        (slow_dir / "a.mov").write_bytes(b"x")
+        (fast_dir / "b.mov").write_bytes(b"x")
+        
+        registry = WatchFolderRegistry()
+        registry.add_folder(WatchFolder(id="slow", path=str(slow_dir)))
+        registry.add_folder(WatchFolder(id="fast", path=str(fast_dir)))
+        engine = self._engine(registry)
+        engine.scan_timeout_seconds = 0.2
+        release = threading.Event()
+        self._stall(engine, "slow", release)
+        
+        try:
+            started = time.monotonic()
+            jobs = engine.scan_all_folders()
+            while not jobs and time.monotonic() - started < 2:
+                jobs = engine.scan_all_folders()
+            assert [job.id for job in jobs] == ["b.mov"]
+            assert time.monotonic() - started < 1.0
+            
+            metrics = engine.get_scan_metrics()
+            assert metrics["fast"].stable_files == 1
+            assert metrics["fast"].timed_out is False
+            assert "slow" not in metrics  # still running
+            
+            release.set()
+            time.sleep(0.1)
+            assert engine.get_scan_metrics()["slow"].timed_out is True
+            # The abandoned scan's result is ingested on the next pass
+            jobs = engine.scan_all_folders()
+            assert "a.mov" in [job.id for job in jobs]
+        finally:
+            release.set()
+            engine.close()
+    
+    def test_per_mount_cap_skips_folders_behind_stalled_scan(self, tmp_path):
+        import threading
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.registry import WatchFolderRegistry
+        
+        for name in ("slow", "other"):
+            (tmp_path / name).mkdir()
+        registry = WatchFolderRegistry()
+        # Newest first: "slow" takes the mount's only slot
+        registry.add_folder(WatchFolder(id="other", path=str(tmp_path / "other")))
+        time.sleep(0.01)
+        registry.add_folder(WatchFolder(id="slow", path=str(tmp_path / "slow")))
+        engine = self._engine(registry)
+        engine.scan_timeout_seconds = 0.1
+        engine.max_scans_per_mount = 1  # both folders share tmp_path's mount
+        release = threading.Event()
+        self._stall(engine, "slow", release)
+        
+        try:
+            engine.scan_all_folders()
+            assert "other" not in engine.get_scan_metrics()
+            
+            release.set()
+            time.sleep(0.1)
+            engine.scan_all_folders()
+            assert {"slow", "other"} <= set(engine.get_scan_metrics())
+        finally:
+            release.set()
+            engine.close()
+
+    def test_stalled_scan_is_not_restarted(self, tmp_path):
+        import threading
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.registry import WatchFolderRegistry
+        
+        (tmp_path / "slow").mkdir()
+        (tmp_path / "slow" / "a.mov").write_bytes(b"x")
+        registry = WatchFolderRegistry()
+        registry.add_folder(WatchFolder(id="slow", path=str(tmp_path / "slow")))
+        engine = self._engine(registry)
+        engine.scan_timeout_seconds = 0.1
+        release = threading.Event()
+        polls = []
+        original = engine._poll_changes
+        
+        def poll(watch_folder):
+            polls.append(watch_folder.id)
+            release.wait(5)
+            return original(watch_folder)
+        
+        engine._poll_changes = poll
+        
+        try:
+            engine.scan_all_folders()
+            engine.scan_all_folders()
+            assert polls == ["slow"]
+            # Does not wait on the stalled scan's tracker
+            started = time.monotonic()
+            engine.next_check_delay()
+            assert time.monotonic() - started < 0.5
+            
+            release.set()
+            time.sleep(0.1)
+            assert [job.id for job in engine.scan_all_folders()] == ["a.mov"]
+        finally:
+            release.set()
+            engine.close()
+    
+    def test_hung_mounts_do_not_starve_other_mounts(self, tmp_path, monkeypatch):
+        import threading
+        from app.watchfolders import engine as engine_module
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.registry import WatchFolderRegistry
+        
+        # Each mountN directory is its own "mount point"
+        monkeypatch.setattr(engine_module, "mount_point_for", lambda path: str(Path(path).parent))
+        registry = WatchFolderRegistry()
+        stalled = set()
+        for mount in range(5):
+            for name in ("a", "b"):
+                folder = tmp_path / f"mount{mount}" / name
+                folder.mkdir(parents=True)
+                registry.add_folder(WatchFolder(id=f"{mount}{name}", path=str(folder)))
+                stalled.add(f"{mount}{name}")
+        (tmp_path / "fast" / "in").mkdir(parents=True)
+        (tmp_path / "fast" / "in" / "b.mov").write_bytes(b"x")
+        registry.add_folder(WatchFolder(id="fast", path=str(tmp_path / "fast" / "in")))
+        engine = self._engine(registry)
+        engine.scan_timeout_seconds = 0.2
+        release = threading.Event()
+        original = engine._poll_changes
+        
+        def poll(watch_folder):
+            if watch_folder.id in stalled:
+                release.wait(5)
+            return original(watch_folder)
+        
+        engine._poll_changes = poll
+        
+        try:
+            # Ten hung scans on five mounts; the other mount still scans
+            assert [job.id for job in engine.scan_all_folders()] == ["b.mov"]
+        finally:
+            release.set()
+            engine.close()
+
+
+class TestBatchedIngest:
+    """Test batched job creation for watch folder bursts."""
+    
+    def test_burst_is_persisted_in_one_transaction(self, tmp_path):
+        from unittest.mock import MagicMock, patch
+        from app.jobs.engine import JobEngine
+        from app.persistence.manager import PersistenceManager
+        from app.watchfolders.engine import WatchFolderEngine
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.registry import WatchFolderRegistry
+        
+        card = tmp_path / "card"
+        card.mkdir()
+        for i in range(6):
+            (card / f"A001C00{i}.mov").write_bytes(b"x")
+        
+        persistence = PersistenceManager(db_path=str(tmp_path / "proxx.db"))
+        registry = WatchFolderRegistry()
+        folder = WatchFolder(id="card", path=str(card))
+        registry.add_folder(folder)
+        engine = WatchFolderEngine(
+            watch_folder_registry=registry,
+            job_engine=JobEngine(),
+            binding_registry=MagicMock(),
+            persistence_manager=persistence,
+            use_events=False,
+        )
+        engine.stability_quiet_seconds = 0
+        engine.stability_close_settle_seconds = 0
+        
+        probed = []
+        def fake_probe(path):
+            probed.append(path)
+            time.sleep(0.2)
+            raise RuntimeError("no ffprobe in test")
+        
+        try:
+            with patch("app.metadata.extractors.extract_metadata", side_effect=fake_probe), \
+                 patch("app.execution.thumbnails.generate_thumbnail_sync", return_value=None), \
+                 patch.object(persistence, "save_ingest_batch", wraps=persistence.save_ingest_batch) as save_batch:
+                started = time.monotonic()
+                jobs = engine.scan_folder(folder)
+                elapsed = time.monotonic() - started
+            
+            assert len(jobs) == 6
+            assert len(probed) == 6
+            # Probes ran concurrently, not 6 x 0.2s
+            assert elapsed < 1.0
+            save_batch.assert_called_once()
+            
+            assert len(persistence.load_all_jobs()) == 6
+            assert persistence.load_processed_files("card") == {
+                str((card / f"A001C00{i}.mov").resolve()) for i in range(6)
+            }
+        finally:
+            engine.close()
+    
+    def test_failed_file_does_not_block_batch(self, tmp_path):
+        from unittest.mock import MagicMock
+        from app.watchfolders.engine import WatchFolderEngine
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.registry import WatchFolderRegistry
+        
+        (tmp_path / "good.mov").write_bytes(b"x")
+        (tmp_path / "bad.mov").write_bytes(b"x")
+        registry = WatchFolderRegistry()
+        folder = WatchFolder(id="wf", path=str(tmp_path), preset_id="preset")
+        registry.add_folder(folder)
+        binding_registry = MagicMock()
+        binding_registry.bind_preset.side_effect = lambda job_id, preset_id: (
+            (_ for _ in ()).throw(ValueError("bind failed")) if job_id == "bad.mov" else None
+        )
+        job_engine = MagicMock()
+        job_engine.create_jobs.side_effect = lambda source_paths: [
+            MagicMock(id=Path(path).name) for path in source_paths
+        ]
+        engine = WatchFolderEngine(
+            watch_folder_registry=registry,
+            job_engine=job_engine,
+            binding_registry=binding_registry,
+            use_events=False,
+        )
+        engine.stability_quiet_seconds = 0
+        engine.stability_close_settle_seconds = 0
+        try:
+            jobs = engine.scan_folder(folder)
+            assert [job.id for job in jobs] == ["good.mov"]
+            job_engine.create_jobs.assert_called_once()
+            # The failed file is retried later, not marked processed
+            assert str((tmp_path / "bad.mov").resolve()) not in engine.get_processed_files()
+            assert (tmp_path / "bad.mov").resolve() in engine._stability["wf"]
+        finally:
+            engine.close()
+
+
+class TestSequenceIngest:
+    """Test that image frames are ingested as one sequence source."""
+    
+    @staticmethod
+    def _make_engine(tmp_path, **options):
+        from unittest.mock import MagicMock
+        from app.watchfolders.engine import WatchFolderEngine
+        from app.watchfolders.models import WatchFolder
+        from app.watchfolders.registry import WatchFolderRegistry
+        
+        options = {"detect_sequences": True, "sequence_settle_seconds": 0, **options}
+        registry = WatchFolderRegistry()
+        folder = WatchFolder(id="renders", path=str(tmp_path), **options)
+        registry.add_folder(folder)
+        job_engine = MagicMock()
+        job_engine.create_jobs.side_effect = lambda source_paths: [
+            MagicMock(id=path) for path in source_paths
+        ]
+        engine = WatchFolderEngine(
+            watch_folder_registry=registry,
+            job_engine=job_engine,
+            binding_registry=MagicMock(),
+            use_events=False,
+        )
+        engine.stability_quiet_seconds = 0
+        engine.stability_close_settle_seconds = 0
+        return engine, folder
+    
+    def test_frames_become_one_pattern_source(self, tmp_path):
+        shot = tmp_path / "shot"
+        shot.mkdir()
+        for frame in range(1, 6):
+            (shot / f"comp.{frame:04d}.exr").write_bytes(b"x")
+        (tmp_path / "clip.mov").write_bytes(b"x")
+        
+        engine, folder = self._make_engine(tmp_path)
+        try:
+            jobs = engine.scan_folder(folder)
+            pattern = str((shot / "comp.%04d.exr").resolve())
+            assert sorted(job.id for job in jobs) == sorted([
+                pattern, str((tmp_path / "clip.mov").resolve()),
+            ])
+            assert pattern in engine.get_processed_files()
+            
+            # A late frame of an ingested sequence does not create a second job
+            (shot / "comp.0006.exr").write_bytes(b"x")
+            assert engine.scan_folder(folder) == []
+            assert engine.scan_folder(folder) == []
+        finally:
+            engine.close()
+    
+    def test_sequences_are_opt_in(self, tmp_path):
+        from app.watchfolders.models import WatchFolder
+        assert not WatchFolder(id="wf", path=str(tmp_path)).detect_sequences
+        
+        for frame in range(1, 4):
+            (tmp_path / f"comp.{frame:04d}.exr").write_bytes(b"x")
+        (tmp_path / "clip.mov").write_bytes(b"x")
+        
+        engine, folder = self._make_engine(tmp_path, detect_sequences=False)
+        try:
+            jobs = engine.scan_folder(folder)
+            assert [job.id for job in jobs] == [str((tmp_path / "clip.mov").resolve())]
+        finally:
+            engine.close()
+    
+    def test_sequence_waits_for_directory_to_settle(self, tmp_path):
+        import os
+        for frame in range(1, 4):
+            (tmp_path / f"comp.{frame:04d}.exr").write_bytes(b"x")
+        
+        # Frames land slower than the stability quiet window
+        engine, folder = self._make_engine(tmp_path, sequence_settle_seconds=60)
+        try:
+            assert engine.scan_folder(folder) == []
+            assert len(engine._stability[folder.id]) == 3
+            
+            stamp = time.time() - 120
+            os.utime(tmp_path, (stamp, stamp))
+            jobs = engine.scan_folder(folder)
+            assert [job.id for job in jobs] == [str((tmp_path / "comp.%04d.exr").resolve())]
+        finally:
+            engine.close()
+    
+    def test_sequence_waits_for_frames_still_arriving(self, tmp_path):
+        for frame in range(1, 4):
+            (tmp_path / f"comp.{frame:04d}.exr").write_bytes(b"x")
+        
+        engine, folder = self._make_engine(tmp_path)
+        try:
+            tracker_path = (tmp_path / "comp.0004.exr").resolve()
+            tracker_path.write_bytes(b"x")
+            from app.watchfolders.stability import StabilityTracker
+            tracker = StabilityTracker(quiet_seconds=60)
+            tracker.observe(tracker_path)
+            engine._stability[folder.id] = tracker
+            
+            # Frame 4 is still being written: frames 1-3 are held back
+            stable = [(tmp_path / f"comp.{frame:04d}.exr").resolve() for frame in range(1, 4)]
+            assert engine._ingest_stable_files(folder, stable) == []
+            assert all(path in tracker for path in stable)
+        finally:
+            engine.close()
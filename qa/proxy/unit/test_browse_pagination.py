@@ -0,0 +1,126 @@
+"""
+Unit tests for paginated and streamed directory browsing.
+
+Tests:
+- Cursor pagination covers every entry exactly once
+- Total is reported once the scan completes
+- Expired / malformed cursors are rejected
+- NDJSON stream emits entries followed by a summary line
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.filesystem.browse_sessions import decode_cursor
+from app.routes.filesystem import (
+    browse_directory,
+    browse_directory_stream,
+    get_directory_page,
+)
+
+
+@pytest.fixture
+def big_dir(tmp_path):
+    for i in range(25):
+        (tmp_path / f"clip_{i:03d}.mov").write_bytes(b"x")
+    (tmp_path / "notes.txt").write_text("ignored")
+    (tmp_path / "subdir").mkdir()
+    past = time.time() - 60
+    os.utime(tmp_path, (past, past))
+    return tmp_path
+
+
+def _browse(path: Path, **kwargs):
+    params = {"include_hidden": False, "media_only": True, "limit": None, "cursor": None}
+    params.update(kwargs)
+    return asyncio.run(browse_directory(path=str(path), **params))
+
+
+class TestCursorPagination:
+    """Test cursor-based browse pagination."""
+    
+    def test_pages_cover_all_entries(self, big_dir):
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            response = _browse(big_dir, limit=10, cursor=cursor)
+            seen.extend(e.name for e in response.entries)
+            pages += 1
+            cursor = response.next_cursor
+            if cursor is None:
+                break
+        
+        assert pages == 3
+        assert len(seen) == 26
+        assert len(set(seen)) == 26
+        assert response.complete
+        assert response.total == 26
+    
+    def test_unpaginated_browse_unchanged(self, big_dir):
+        response = _browse(big_dir)
+        
+        assert len(response.entries) == 26
+        assert response.entries[0].name == "subdir"
+        assert response.next_cursor is None
+    
+    def test_cached_directory_pages_are_sorted(self, big_dir):
+        # Full browse populates the listing cache
+        _browse(big_dir)
+        
+        response = _browse(big_dir, limit=5)
+        
+        assert [e.name for e in response.entries] == [
+            "subdir", "clip_000.mov", "clip_001.mov", "clip_002.mov", "clip_003.mov",
+        ]
+        assert response.total == 26
+    
+    def test_unknown_cursor_is_gone(self, big_dir):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(get_directory_page(big_dir, limit=10, cursor="deadbeef.10"))
+        assert exc.value.status_code == 410
+    
+    def test_malformed_cursor(self, big_dir):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(get_directory_page(big_dir, limit=10, cursor="nonsense"))
+        assert exc.value.status_code == 400
+    
+    def test_decode_cursor(self):
+        assert decode_cursor("abc.42") == ("abc", 42)
+
+
+class TestBrowseStream:
+    """Test the NDJSON streaming browse endpoint."""
+    
+    def test_stream_emits_entries_then_summary(self, big_dir):
+        async def run():
+            response = await browse_directory_stream(
+                path=str(big_dir), include_hidden=False, media_only=True,
+            )
+            body = ""
+            async for chunk in response.body_iterator:
+                body += chunk
+            return response, body
+        
+        response, body = asyncio.run(run())
+        records = [json.loads(line) for line in body.splitlines()]
+        
+        assert response.media_type == "application/x-ndjson"
+        assert all(r["record"] == "entry" for r in records[:-1])
+        assert len(records) == 27
+        summary = records[-1]
+        assert summary["record"] == "summary"
+        assert summary["total"] == 26
+        assert summary["dir_count"] == 1
+        assert summary["file_count"] == 25
+        assert summary["error"] is None
@@ -0,0 +1,127 @@
+"""
+Unit tests for the scandir-based directory listing engine.
+
+Tests:
+- Filtering, sorting and size reporting
+- mtime-validated caching (hit on unchanged directory, rescan on change)
+- Route integration via get_directory_entries
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.filesystem.listing import DirectoryListingCache, scan_directory
+
+
+def _age_directory(path: Path, seconds: float = 60.0) -> None:
+    """Backdate a directory mtime so it is outside the cache grace window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    (tmp_path / "B_folder").mkdir()
+    (tmp_path / "a_folder").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / "clip.MOV").write_bytes(b"x" * 10)
+    (tmp_path / "notes.txt").write_text("not media")
+    (tmp_path / ".secret.mp4").write_bytes(b"x")
+    _age_directory(tmp_path)
+    return tmp_path
+
+
+class TestScanDirectory:
+    """Test a single uncached scan."""
+    
+    def test_media_only_listing(self, media_dir):
+        listing = scan_directory(str(media_dir), media_extensions=frozenset({"mov"}))
+        
+        names = [e.name for e in listing.entries]
+        assert names == ["a_folder", "B_folder", "clip.MOV"]
+        clip = listing.entries[-1]
+        assert clip.size == 10
+        assert clip.extension == "mov"
+        assert listing.dir_count == 2
+        assert listing.file_count == 1
+    
+    def test_include_hidden_and_all_files(self, media_dir):
+        listing = scan_directory(str(media_dir), include_hidden=True)
+        
+        names = {e.name for e in listing.entries}
+        assert {".hidden", ".secret.mp4", "notes.txt"} <= names
+    
+    def test_missing_directory_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            scan_directory(str(tmp_path / "missing"))
+
+
+class TestDirectoryListingCache:
+    """Test mtime-validated listing cache."""
+    
+    def test_repeat_listing_is_cache_hit(self, media_dir):
+        cache = DirectoryListingCache()
+        
+        first = cache.list_directory(str(media_dir))
+        second = cache.list_directory(str(media_dir))
+        
+        assert first is second
+        assert cache.hits == 1
+        assert cache.misses == 1
+    
+    def test_directory_change_triggers_rescan(self, media_dir):
+        cache = DirectoryListingCache()
+        cache.list_directory(str(media_dir))
+        
+        (media_dir / "new.mp4").write_bytes(b"x")
+        _age_directory(media_dir, seconds=30.0)
+        listing = cache.list_directory(str(media_dir))
+        
+        assert "new.mp4" in [e.name for e in listing.entries]
+        assert cache.misses == 2
+    
+    def test_recently_modified_directory_not_cached(self, tmp_path):
+        cache = DirectoryListingCache()
+        (tmp_path / "clip.mov").write_bytes(b"x")
+        
+        cache.list_directory(str(tmp_path))
+        
+        assert len(cache) == 0
+    
+    def test_lru_bound(self, tmp_path):
+        cache = DirectoryListingCache(max_directories=2)
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            _age_directory(tmp_path / name)
+            cache.list_directory(str(tmp_path / name))
+        
+        assert len(cache) == 2
+    
+    def test_options_cached_separately(self, media_dir):
+        cache = DirectoryListingCache()
+        
+        media = cache.list_directory(str(media_dir), media_extensions=frozenset({"mov"}))
+        everything = cache.list_directory(str(media_dir))
+        
+        assert len(everything.entries) > len(media.entries)
+
+
+class TestBrowseIntegration:
+    """Test the browse route helper uses the listing engine."""
+    
+    def test_get_directory_entries(self, media_dir):
+        from app.routes.filesystem import get_directory_entries
+        
+        entries = asyncio.run(get_directory_entries(media_dir))
+        
+        assert [e.type for e in entries] == ["dir", "dir", "file"]
+        assert entries[-1].name == "clip.MOV"
+        assert entries[-1].path == str(media_dir / "clip.MOV")
@@ -0,0 +1,115 @@
+"""
+Unit tests for the per-mount filesystem I/O pool.
+
+Tests:
+- A call that outlives its timeout is accounted as a stuck worker until it returns
+- Repeated timeouts open the mount's circuit; other mounts are unaffected
+- An open circuit lets one trial call through after the reset timeout
+- Calls that time out while queued are cancelled and not counted as failures
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.filesystem.io_pool import CircuitState, FilesystemIOPool, MountUnavailableError
+from app.observability.browse_log import BrowseEventType, get_browse_log
+
+
+def _mount_of(path: str) -> str:
+    """Two fake mounts: /hung and everything else."""
+    return "/hung" if path.startswith("/hung") else "/"
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+def _pool(**kwargs) -> FilesystemIOPool:
+    kwargs.setdefault("workers_per_mount", 2)
+    return FilesystemIOPool(mount_lookup=_mount_of, **kwargs)
+
+
+def _stats(pool, mount_point):
+    return next(stats for stats in pool.stats() if stats.mount_point == mount_point)
+
+
+def test_timed_out_call_is_stuck_until_it_returns(release):
+    pool = _pool(failure_threshold=5)
+    get_browse_log().clear()
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(pool.run("/hung/dailies", release.wait, 5, timeout=0.05))
+
+    stuck = _stats(pool, "/hung")
+    assert stuck.stuck_workers == 1 and stuck.state == CircuitState.CLOSED
+
+    release.set()
+    deadline = time.monotonic() + 2
+    while _stats(pool, "/hung").stuck_workers and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _stats(pool, "/hung").stuck_workers == 0
+
+    event_types = [event.event_type for event in get_browse_log().get_events()]
+    assert BrowseEventType.WORKER_STUCK in event_types
+    assert BrowseEventType.WORKER_RELEASED in event_types
+
+
+def test_circuit_opens_without_affecting_other_mounts(release):
+    pool = _pool(failure_threshold=2)
+
+    async def _scenario():
+        for _ in range(2):
+            with pytest.raises(asyncio.TimeoutError):
+                await pool.run("/hung/a", release.wait, 5, timeout=0.05)
+        with pytest.raises(MountUnavailableError):
+            await pool.run("/hung/b", lambda: "never runs")
+        return await pool.run("/local/media", lambda: "listed", timeout=1)
+
+    assert asyncio.run(_scenario()) == "listed"
+    assert _stats(pool, "/hung").state == CircuitState.OPEN
+    assert _stats(pool, "/hung").rejected == 1
+    assert _stats(pool, "/").state == CircuitState.CLOSED
+
+
+def test_trial_call_closes_circuit_after_reset(release):
+    pool = _pool(workers_per_mount=3, failure_threshold=1, reset_timeout_seconds=0.05)
+
+    async def _scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.run("/hung/a", release.wait, 5, timeout=0.05)
+        assert _stats(pool, "/hung").state == CircuitState.OPEN
+        await asyncio.sleep(0.1)
+        return await pool.run("/hung/a", lambda: "recovered", timeout=1)
+
+    assert asyncio.run(_scenario()) == "recovered"
+    assert _stats(pool, "/hung").state == CircuitState.CLOSED
+
+
+def test_queued_timeout_is_cancelled_not_counted(release):
+    pool = _pool(workers_per_mount=1, failure_threshold=1)
+    ran = []
+
+    async def _scenario():
+        blocker = pool.submit("/hung/a", release.wait, 5)
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.run("/hung/b", ran.append, "queued", timeout=0.05)
+        return blocker
+
+    asyncio.run(_scenario())
+    stats = _stats(pool, "/hung")
+    assert stats.total_timeouts == 1 and stats.consecutive_timeouts == 0
+    assert stats.state == CircuitState.CLOSED
+    release.set()
+    time.sleep(0.05)
+    assert ran == []
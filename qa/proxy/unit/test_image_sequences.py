@@ -0,0 +1,158 @@
+"""
+Unit tests for image sequence sources.
+
+Tests:
+- resolve_image_sequence reports frame range, padding, gaps and total bytes
+- ImageSequenceCache reuses a resolution until the directory changes
+- FFmpegEngine reads sequences with -start_number before -i
+- FFmpegEngine refuses sequences with missing frames, re-resolving
+  them in case the frames have landed since ingest
+- Ingestion accepts sequence patterns that match frames on disk
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.metadata.sequences import (
+    ImageSequenceCache,
+    is_sequence_pattern,
+    resolve_image_sequence,
+    source_stem,
+)
+
+
+@pytest.fixture
+def plate_dir(tmp_path):
+    plate = tmp_path / "plate"
+    plate.mkdir()
+    for frame in list(range(1001, 1011)) + list(range(1015, 1021)):
+        (plate / f"shot_v001.{frame:04d}.exr").write_bytes(b"x" * 10)
+    # Different padding and a different extension are not part of the pattern
+    (plate / "shot_v001.01001.exr").write_bytes(b"x")
+    (plate / "shot_v001.1001.dpx").write_bytes(b"x")
+    # Backdate so the cache accepts the directory
+    stamp = time.time() - 60
+    os.utime(plate, (stamp, stamp))
+    return plate
+
+
+def test_pattern_detection():
+    assert is_sequence_pattern("/plates/shot.%04d.exr")
+    assert not is_sequence_pattern("/plates/shot.1001.exr")
+    assert not is_sequence_pattern("/plates/%04d_%04d.exr")
+
+
+def test_source_stem_drops_frame_token():
+    assert source_stem("/plates/shot_v001.%04d.exr") == "shot_v001"
+    assert source_stem("/plates/scan_%06d.dpx") == "scan"
+    assert source_stem("/media/clip.mov") == "clip"
+
+
+def test_resolve_reports_range_gaps_and_bytes(plate_dir):
+    sequence = resolve_image_sequence(str(plate_dir / "shot_v001.%04d.exr"))
+
+    assert sequence.first_frame == 1001
+    assert sequence.last_frame == 1020
+    assert sequence.padding == 4
+    assert sequence.frame_count == 16
+    assert sequence.gaps == [(1011, 1014)]
+    assert sequence.missing_frame_count == 4
+    assert sequence.total_bytes == 160
+    assert sequence.first_frame_path == str(plate_dir / "shot_v001.1001.exr")
+
+
+def test_resolve_without_frames_returns_none(plate_dir):
+    assert resolve_image_sequence(str(plate_dir / "other.%04d.exr")) is None
+
+
+def test_cache_reuses_resolution_until_directory_changes(plate_dir):
+    cache = ImageSequenceCache()
+    pattern = str(plate_dir / "shot_v001.%04d.exr")
+
+    first = cache.get(pattern)
+    assert cache.get(pattern) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    (plate_dir / "shot_v001.1021.exr").write_bytes(b"x")
+    stamp = time.time() - 30
+    os.utime(plate_dir, (stamp, stamp))
+    assert cache.get(pattern).last_frame == 1021
+
+
+def _fill_gap(plate_dir):
+    for frame in range(1011, 1015):
+        (plate_dir / f"shot_v001.{frame:04d}.exr").write_bytes(b"x" * 10)
+    stamp = time.time() - 30
+    os.utime(plate_dir, (stamp, stamp))
+
+
+def test_ffmpeg_command_uses_start_number(plate_dir):
+    from app.execution.ffmpeg import FFmpegEngine
+    from app.execution.resolved_params import DEFAULT_H264_PARAMS
+
+    _fill_gap(plate_dir)
+    sequence = resolve_image_sequence(str(plate_dir / "shot_v001.%04d.exr"))
+    engine = FFmpegEngine()
+    with patch.object(engine, "_find_ffmpeg", return_value="ffmpeg"):
+        cmd = engine._build_ffmpeg_command(
+            source_path=sequence.pattern,
+            output_path="/tmp/out.mov",
+            resolved_params=DEFAULT_H264_PARAMS,
+            image_sequence=sequence,
+        )
+
+    start = cmd.index("-start_number")
+    assert cmd[start + 1] == "1001"
+    assert cmd.index("-framerate") < cmd.index("-i")
+    assert start < cmd.index("-i")
+    assert cmd[cmd.index("-i") + 1] == sequence.pattern
+
+
+def test_ffmpeg_refuses_sequence_with_gaps(plate_dir):
+    from app.execution.ffmpeg import FFmpegEngine
+    from app.execution.resolved_params import DEFAULT_H264_PARAMS
+    from app.jobs.models import ClipTask
+
+    pattern = str(plate_dir / "shot_v001.%04d.exr")
+    task = ClipTask(source_path=pattern, image_sequence=resolve_image_sequence(pattern))
+    engine = FFmpegEngine()
+    with patch.object(engine, "_find_ffmpeg", return_value="ffmpeg"):
+        with pytest.raises(ValueError, match="missing 4 frame\\(s\\) in 1 gap\\(s\\), first missing: 1011-1014"):
+            engine._build_ffmpeg_command(
+                source_path=pattern,
+                output_path="/tmp/out.mov",
+                resolved_params=DEFAULT_H264_PARAMS,
+                image_sequence=engine._resolve_image_sequence(task),
+            )
+
+        # The missing frames landed after ingest: the sequence is re-resolved
+        _fill_gap(plate_dir)
+        cmd = engine._build_ffmpeg_command(
+            source_path=pattern,
+            output_path="/tmp/out.mov",
+            resolved_params=DEFAULT_H264_PARAMS,
+            image_sequence=engine._resolve_image_sequence(task),
+        )
+    assert cmd[cmd.index("-start_number") + 1] == "1001"
+    assert not task.image_sequence.has_gaps
+
+
+def test_ingestion_accepts_sequence_pattern(plate_dir):
+    from app.services.ingestion import IngestionService
+
+    service = IngestionService.__new__(IngestionService)
+    valid, invalid = service._validate_paths([
+        str(plate_dir / "shot_v001.%04d.exr"),
+        str(plate_dir / "missing.%04d.exr"),
+    ])
+
+    assert valid == [str(plate_dir / "shot_v001.%04d.exr")]
+    assert len(invalid) == 1 and "no frames match" in invalid[0]
@@ -0,0 +1,88 @@
+"""
+Unit tests for the shared media classifier.
+
+Tests:
+- Extension lookup on raw names is case-insensitive and ignores dot-files
+- Batch classification matches per-name classification
+- Numbered names with a sequence extension are frames
+- The magic-byte sniff is opt-in and only used for rejected names
+- Browse and watch folder scanning share the classifier's extension sets
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.filesystem.classifier import (
+    MediaClassifier,
+    MediaKind,
+    get_media_classifier,
+    sniff_media,
+)
+
+NAMES = [
+    "clip.mov", "CLIP.MOV", "Clip.Mov", "clip.mOv", "notes.txt", "README",
+    ".mov", "archive.tar.gz", "shot.1001.exr", "shot.EXR", "scan_000100.DPX",
+    "trailing.", "plate_v001.tif",
+]
+
+
+def test_extension_lookup_on_raw_names():
+    classifier = MediaClassifier({"mov", "exr"}, {"exr", "dpx"})
+
+    assert classifier.extension("CLIP.MOV") == "mov"
+    assert classifier.extension("clip.mOv") == "mov"
+    assert classifier.extension("scan_000100.DPX") == "dpx"  # Sequence extensions are media too
+    assert classifier.extension(".mov") is None
+    assert classifier.extension("trailing.") is None
+    assert classifier.extension("README") is None
+
+
+def test_batch_matches_single_classification():
+    classifier = get_media_classifier()
+
+    assert classifier.classify_names(NAMES) == [classifier.classify(name) for name in NAMES]
+    assert classifier.select(NAMES) == [
+        name for name in NAMES if classifier.classify(name) is not MediaKind.NONE
+    ]
+
+
+def test_numbered_sequence_names_are_frames():
+    classifier = get_media_classifier()
+
+    assert classifier.classify("shot.1001.exr") == MediaKind.FRAME
+    assert classifier.classify("scan_000100.DPX") == MediaKind.FRAME
+    assert classifier.classify("shot.EXR") == MediaKind.MEDIA
+    assert classifier.classify("clip_0001.mov") == MediaKind.MEDIA
+
+
+def test_sniff_is_opt_in(tmp_path):
+    mxf = tmp_path / "CAM_A_0001"
+    mxf.write_bytes(b"\x06\x0e\x2b\x34\x02\x05\x01\x01\x0d\x01\x02\x01\x01\x02\x04\x00")
+    quicktime = tmp_path / "clip.bin"
+    quicktime.write_bytes(b"\x00\x00\x00\x14ftypqt  \x00\x00\x00\x00")
+    text = tmp_path / "notes"
+    text.write_text("not media at all")
+
+    assert sniff_media(str(mxf)) == "mxf"
+    assert sniff_media(str(quicktime)) == "mov"
+    assert sniff_media(str(text)) is None
+
+    assert get_media_classifier().classify_file(str(mxf)) == MediaKind.NONE
+    sniffing = MediaClassifier({"mov", "mxf"}, sniff=True)
+    assert sniffing.classify_file(str(mxf)) == MediaKind.MEDIA
+    assert sniffing.classify_file(str(quicktime)) == MediaKind.MEDIA
+    assert sniffing.classify_file(str(text)) == MediaKind.NONE
+
+
+def test_browse_and_watch_folders_share_extension_sets():
+    from app.routes.filesystem import SUPPORTED_MEDIA_EXTENSIONS
+    from app.watchfolders.scanner import FileScanner
+
+    assert SUPPORTED_MEDIA_EXTENSIONS == get_media_classifier().media_extensions
+    assert FileScanner(detect_sequences=True).classifier.sequence_extensions == \
+        get_media_classifier().sequence_extensions
+    assert not FileScanner().classifier.is_media("plate.1001.exr")
+    assert MediaClassifier({"mov"}) == MediaClassifier({".MOV"})
@@ -0,0 +1,160 @@
+"""
+Unit tests for streaming media enumeration and sequence grouping.
+
+Tests:
+- FrameRanges merges out-of-order frames and reports gaps
+- iter_media filters on raw names and groups sequences per directory
+- /filesystem/enumerate output and the NDJSON enumerate stream
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.filesystem.classifier import MediaClassifier
+from app.filesystem.enumeration import FrameRanges, SequenceGroup, iter_media
+from app.routes.filesystem import (
+    detect_image_sequence,
+    enumerate_folder_media,
+    enumerate_folder_media_stream,
+)
+
+CLASSIFIER = MediaClassifier({"mov", "exr", "dpx"}, {"exr", "dpx"})
+
+
+@pytest.fixture
+def plate_dir(tmp_path):
+    plate = tmp_path / "plate"
+    plate.mkdir()
+    for frame in list(range(1001, 1011)) + list(range(1015, 1021)):
+        (plate / f"shot_v001.{frame:04d}.exr").write_bytes(b"x")
+    (plate / "single.0001.exr").write_bytes(b"x")
+    (tmp_path / "scan_000100.dpx").write_bytes(b"x")
+    (tmp_path / "scan_000101.dpx").write_bytes(b"x")
+    (tmp_path / "clip.mov").write_bytes(b"x")
+    (tmp_path / ".hidden.mov").write_bytes(b"x")
+    (tmp_path / "notes.txt").write_text("x")
+    return tmp_path
+
+
+class TestFrameRanges:
+    """Test range-merged frame storage."""
+    
+    def test_out_of_order_frames_merge(self):
+        frames = FrameRanges()
+        for frame in (5, 3, 1, 2, 4, 9, 8):
+            frames.add(frame)
+        
+        assert frames.ranges() == [(1, 5), (8, 9)]
+        assert (frames.first, frames.last, frames.count) == (1, 9, 7)
+        assert frames.gaps() == [(6, 7)]
+    
+    def test_contiguous_plate_is_one_range(self):
+        frames = FrameRanges()
+        for frame in reversed(range(100_000)):
+            frames.add(frame)
+        assert frames.ranges() == [(0, 99_999)]
+        assert frames.gaps() == []
+
+
+class TestIterMedia:
+    """Test the streaming enumerator."""
+    
+    def test_groups_sequences_and_filters(self, plate_dir):
+        results = list(iter_media(str(plate_dir), CLASSIFIER))
+        sequences = {r.pattern: r for r in results if isinstance(r, SequenceGroup)}
+        files = sorted(r for r in results if isinstance(r, str))
+        
+        assert set(sequences) == {
+            str(plate_dir / "plate" / "shot_v001.%04d.exr"),
+            # Underscore separator is kept in the pattern
+            str(plate_dir / "scan_%06d.dpx"),
+        }
+        plate = sequences[str(plate_dir / "plate" / "shot_v001.%04d.exr")]
+        assert plate.frames.count == 16
+        assert plate.frames.gaps() == [(1011, 1014)]
+        assert files == [
+            str(plate_dir / "clip.mov"),
+            str(plate_dir / "plate" / "single.0001.exr"),
+        ]
+    
+    def test_non_recursive_and_no_grouping(self, plate_dir):
+        results = list(iter_media(str(plate_dir), CLASSIFIER, recursive=False, detect_sequences=False))
+        assert sorted(results) == sorted(
+            str(plate_dir / name) for name in ("clip.mov", "scan_000100.dpx", "scan_000101.dpx")
+        )
+    
+    def test_progress_reported(self, plate_dir):
+        reports = []
+        list(iter_media(str(plate_dir), CLASSIFIER, progress=reports.append, progress_every=5))
+        
+        assert len(reports) >= 2
+        assert reports[-1].directories == 2
+        assert reports[-1].sequences == 2
+        assert reports[-1].files == 2
+    
+    def test_progress_reported_for_skipped_entries(self, tmp_path):
+        for index in range(12):
+            (tmp_path / f"notes_{index}.txt").write_bytes(b"x")
+        reports = []
+        assert list(iter_media(str(tmp_path), CLASSIFIER, progress=reports.append, progress_every=5)) == []
+        
+        assert [report.entries for report in reports] == [5, 10, 12]
+    
+    def test_unreadable_root_raises(self, tmp_path):
+        with pytest.raises(OSError):
+            list(iter_media(str(tmp_path / "missing"), CLASSIFIER))
+
+
+class TestEnumerateRoutes:
+    """Test the enumerate endpoints."""
+    
+    def test_enumerate_returns_sorted_patterns_and_files(self, plate_dir):
+        response = asyncio.run(enumerate_folder_media(
+            path=str(plate_dir), recursive=True, detect_sequences=True,
+        ))
+        
+        assert response.error is None
+        assert response.files == sorted([
+            str(plate_dir / "clip.mov"),
+            str(plate_dir / "plate" / "shot_v001.%04d.exr"),
+            str(plate_dir / "plate" / "single.0001.exr"),
+            str(plate_dir / "scan_%06d.dpx"),
+        ])
+        assert response.count == 4
+    
+    def test_detect_image_sequence_compat(self, plate_dir):
+        files = [str(p) for p in (plate_dir / "plate").iterdir()]
+        patterns, standalone = detect_image_sequence(files)
+        
+        assert patterns == [str(plate_dir / "plate" / "shot_v001.%04d.exr")]
+        assert standalone == [str(plate_dir / "plate" / "single.0001.exr")]
+    
+    def test_stream_emits_results_then_summary(self, plate_dir):
+        async def run():
+            response = await enumerate_folder_media_stream(
+                path=str(plate_dir), recursive=True, detect_sequences=True,
+            )
+            body = ""
+            async for chunk in response.body_iterator:
+                body += chunk
+            return body
+        
+        records = [json.loads(line) for line in asyncio.run(run()).splitlines()]
+        by_kind = {}
+        for record in records:
+            by_kind.setdefault(record["record"], []).append(record)
+        
+        assert records[-1] == {
+            "record": "summary", "folder": str(plate_dir), "count": 4, "error": None,
+        }
+        assert len(by_kind["file"]) == 2
+        plate = next(r for r in by_kind["sequence"] if r["path"].endswith("shot_v001.%04d.exr"))
+        assert (plate["first_frame"], plate["last_frame"], plate["frame_count"]) == (1001, 1020, 16)
+        assert by_kind["progress"][-1]["directories"] == 2
@@ -0,0 +1,122 @@
+"""
+Unit tests for the mount health monitor.
+
+Tests:
+- Candidate roots come from mountinfo (root prefixes and network mounts)
+- A probe that hangs marks its mount dead and is not resubmitted
+- Browse and enumerate short-circuit dead mounts without filesystem access
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.filesystem import mount_health
+from app.filesystem.mount_health import MountHealthMonitor, MountState
+
+
+@pytest.fixture
+def mounts(tmp_path):
+    share = tmp_path / "share"
+    share.mkdir()
+    stale = tmp_path / "stale"
+    stale.mkdir()
+    local = tmp_path / "local"
+    local.mkdir()
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_text(
+        "22 1 8:1 / / rw shared:1 - ext4 /dev/sda1 rw\n"
+        "30 22 0:30 / /proc rw - proc proc rw\n"
+        f"40 22 0:35 / {share} rw shared:2 - nfs4 nas:/share rw\n"
+        f"41 22 0:36 / {stale} rw shared:3 - cifs //srv/stale rw\n"
+        f"42 22 8:2 / {local} rw shared:4 - ext4 /dev/sdb1 rw\n"
+    )
+    home = tmp_path / "home"
+    home.mkdir()
+    return {
+        "mountinfo": str(mountinfo), "home": str(home),
+        "share": str(share), "stale": str(stale), "local": str(local),
+    }
+
+
+def _monitor(mounts, probe_timeout=0.2):
+    return MountHealthMonitor(
+        mountinfo_path=mounts["mountinfo"],
+        probe_timeout_seconds=probe_timeout,
+        home=mounts["home"],
+    )
+
+
+def test_roots_are_network_mounts_and_home(mounts):
+    monitor = _monitor(mounts)
+    monitor.refresh()
+
+    paths = {root.path for root in monitor.roots()}
+    assert paths == {mounts["share"], mounts["stale"], mounts["home"]}
+    assert {status.mount_point for status in monitor.statuses()} == {mounts["share"], mounts["stale"]}
+    assert all(status.state == MountState.OK for status in monitor.statuses())
+
+
+def test_hung_probe_marks_mount_dead_once(mounts):
+    release = threading.Event()
+    calls = []
+    real_probe = mount_health._probe
+
+    def fake_probe(mount_point):
+        calls.append(mount_point)
+        if mount_point == mounts["stale"]:
+            release.wait(5)
+        return real_probe(mount_point)
+
+    monitor = _monitor(mounts)
+    try:
+        with patch.object(mount_health, "_probe", side_effect=fake_probe):
+            monitor.refresh()
+            monitor.refresh()
+
+            assert monitor.is_dead(mounts["stale"] + "/dailies/clip.mov")
+            assert not monitor.is_dead(mounts["share"])
+            assert mounts["stale"] not in {root.path for root in monitor.roots()}
+            # The hung probe was not resubmitted on the second pass
+            assert calls.count(mounts["stale"]) == 1
+    finally:
+        release.set()
+
+
+def test_report_timeout_marks_mount_dead(mounts):
+    monitor = _monitor(mounts)
+    monitor.refresh()
+
+    monitor.report_timeout(mounts["share"] + "/deep/folder")
+    assert monitor.is_dead(mounts["share"])
+    # Unmonitored paths are never marked
+    monitor.report_timeout(mounts["local"])
+    assert not monitor.is_dead(mounts["local"])
+
+
+def test_browse_and_enumerate_short_circuit_dead_mount(mounts):
+    from app.routes.filesystem import browse_directory, enumerate_folder_media
+
+    monitor = _monitor(mounts)
+    monitor.refresh()
+    monitor.report_timeout(mounts["stale"])
+    target = mounts["stale"] + "/dailies"
+
+    with patch.object(mount_health, "_mount_health_monitor", monitor), \
+         patch("app.routes.filesystem.normalize_and_validate_path", side_effect=AssertionError("touched")):
+        browse = asyncio.run(browse_directory(
+            path=target, include_hidden=False, media_only=True, limit=None, cursor=None,
+        ))
+        enumerate_response = asyncio.run(enumerate_folder_media(
+            path=target, recursive=True, detect_sequences=True,
+        ))
+
+    assert browse.entries == [] and "not responding" in browse.error
+    assert enumerate_response.count == 0 and "not responding" in enumerate_response.error
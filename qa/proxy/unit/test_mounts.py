@@ -0,0 +1,64 @@
+"""
+Unit tests for lexical mount point lookup.
+
+Tests:
+- mountinfo parsing, including octal-escaped mount points
+- Longest-prefix matching without touching the looked-up path
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.filesystem.mounts import MountTable, read_mount_points
+
+
+MOUNTINFO = (
+    "22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw\n"
+    "40 22 0:35 / /mnt/media rw,relatime shared:2 - nfs4 nas:/media rw\n"
+    "41 40 0:36 / /mnt/media/archive rw,relatime shared:3 - nfs4 nas:/archive rw\n"
+    "42 22 0:37 / /mnt/edit\\040bay rw,relatime shared:4 - cifs //srv/edit rw\n"
+)
+
+
+def _write_mountinfo(tmp_path: Path) -> str:
+    path = tmp_path / "mountinfo"
+    path.write_text(MOUNTINFO)
+    return str(path)
+
+
+def test_read_mount_points_longest_first(tmp_path):
+    mount_points = read_mount_points(_write_mountinfo(tmp_path))
+    
+    assert mount_points[0] == "/mnt/media/archive"
+    assert mount_points[-1] == "/"
+    assert "/mnt/edit bay" in mount_points
+
+
+def test_mount_point_for_uses_longest_prefix(tmp_path):
+    table = MountTable(_write_mountinfo(tmp_path))
+    
+    assert table.mount_point_for("/mnt/media/archive/2024/clip.mov") == "/mnt/media/archive"
+    assert table.mount_point_for("/mnt/media/dailies") == "/mnt/media"
+    assert table.mount_point_for("/mnt/media") == "/mnt/media"
+    # Prefix match must stop at a path separator
+    assert table.mount_point_for("/mnt/mediafiles/x") == "/"
+    assert table.mount_point_for("/mnt/edit bay/ingest") == "/mnt/edit bay"
+
+
+def test_missing_mount_table_falls_back_to_anchor(tmp_path):
+    table = MountTable(str(tmp_path / "missing"))
+    
+    assert table.mount_point_for("/mnt/media/x") == "/"
+
+
+def test_read_mounts_reports_fs_type_and_source(tmp_path):
+    from app.filesystem.mounts import read_mounts
+    
+    mounts = {mount.mount_point: mount for mount in read_mounts(_write_mountinfo(tmp_path))}
+    
+    assert mounts["/mnt/media"].fs_type == "nfs4"
+    assert mounts["/mnt/media"].source == "nas:/media"
+    assert mounts["/mnt/edit bay"].source == "//srv/edit"
@@ -0,0 +1,210 @@
+"""
+Unit tests for single-decode multi-output rendering.
+
+Tests:
+- Settings without additional outputs keep their command and serialization
+- Additional outputs round-trip through to_dict/from_dict
+- One input, one split graph, one path per output
+- The primary output keeps its stream maps; only the first video stream
+  goes through the split
+- Thumbnails map no audio and encode a single still with the image2 muxer,
+  as jpg when no image container is given
+- Additional output paths sit next to the primary output and never collide
+- Jobs with additional outputs render through the DeliverSettings path and
+  report every deliverable; with a bound preset they fail instead
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.deliver.capabilities import (
+    AudioCapabilities,
+    AudioCodec,
+    DeliverableOutput,
+    OutputKind,
+    OverlayCapabilities,
+    ResolutionPolicy,
+    TextOverlay,
+    VideoCapabilities,
+)
+from app.deliver.engine_mapping import map_to_ffmpeg
+from app.deliver.paths import OutputCollisionError, resolve_additional_output_paths
+from app.deliver.settings import DeliverSettings
+from app.execution.resolved_params import ResolvedPresetParams
+from app.execution.results import ExecutionResult, ExecutionStatus
+from app.jobs.engine import JobEngine
+from app.jobs.models import ClipTask, Job, TaskStatus
+from app.observability import trace
+
+REVIEW = DeliverableOutput(
+    name="review",
+    video=VideoCapabilities(
+        codec="h264",
+        quality=23,
+        resolution_policy=ResolutionPolicy.SCALE,
+        width=1280,
+        height=720,
+    ),
+    audio=AudioCapabilities(codec=AudioCodec.AAC, bitrate="192k"),
+    container="mp4",
+)
+THUMBNAIL = DeliverableOutput(
+    name="thumb",
+    kind=OutputKind.THUMBNAIL,
+    container="jpg",
+    thumbnail_time=2.0,
+    burn_in_overlays=False,
+)
+
+
+def _settings(*outputs) -> DeliverSettings:
+    return DeliverSettings(
+        overlay=OverlayCapabilities(text_layers=(TextOverlay(text="REVIEW"),)),
+        additional_outputs=tuple(outputs),
+    )
+
+
+def test_single_output_command_is_unchanged():
+    settings = _settings()
+    cmd = map_to_ffmpeg(settings).build_command("ffmpeg", "/in/a.mov", "/out/a.mov")
+
+    assert "-filter_complex" not in cmd
+    assert cmd[cmd.index("-vf") + 1].startswith("drawtext=")
+    assert cmd[-7:] == ["-map_metadata", "0", "-map", "0:v", "-map", "0:a?", "/out/a.mov"]
+    assert "additional_outputs" not in settings.to_dict()
+
+
+def test_additional_outputs_round_trip():
+    settings = _settings(REVIEW, THUMBNAIL)
+    restored = DeliverSettings.from_dict(settings.to_dict())
+
+    assert restored.additional_outputs == (REVIEW, THUMBNAIL)
+    assert restored == settings
+
+
+def test_outputs_share_one_decode():
+    settings = _settings(REVIEW, THUMBNAIL)
+    paths = ["/out/a_review.mp4", "/out/a_thumb.jpg"]
+    cmd = map_to_ffmpeg(settings).build_command("ffmpeg", "/in/a.mov", "/out/a.mov", paths)
+
+    assert cmd.count("-i") == 1
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert graph.startswith("[0:v:0]split=3[s0][s1][s2];")
+    assert "[s1]scale=w=1280:h=720:force_original_aspect_ratio=decrease,drawtext=" in graph
+    assert "[s2]trim=start=2.0[v2]" in graph
+
+    # Primary first, then each additional output with its own maps and path
+    assert cmd.index("/out/a.mov") < cmd.index("[v1]") < cmd.index(paths[0]) < cmd.index("[v2]")
+    assert cmd[-1] == paths[1]
+
+    primary = cmd[cmd.index(graph) + 1:cmd.index("/out/a.mov")]
+    assert primary[:8] == ["-map", "[v0]", "-map", "0:v", "-map", "-0:v:0", "-map", "0:a?"]
+
+    review = cmd[cmd.index("/out/a.mov") + 1:cmd.index(paths[0])]
+    assert review[:4] == ["-map", "[v1]", "-map", "0:a?"]
+    assert "libx264" in review and "aac" in review
+
+
+def test_thumbnail_has_no_audio():
+    result = map_to_ffmpeg(_settings(THUMBNAIL))
+    thumb = result.additional_outputs[0]
+
+    assert not thumb.map_audio and thumb.metadata_args == []
+    assert thumb.video_args == [
+        "-c:v", "mjpeg", "-q:v", "2", "-frames:v", "1", "-f", "image2", "-update", "1",
+    ]
+
+    cmd = result.build_command("ffmpeg", "/in/a.mov", "/out/a.mov", ["/out/a_thumb.jpg"])
+    assert cmd[-6:] == ["-f", "image2", "-update", "1", "-an", "/out/a_thumb.jpg"]
+    with pytest.raises(ValueError):
+        result.build_command("ffmpeg", "/in/a.mov", "/out/a.mov")
+
+
+def test_thumbnail_defaults_to_jpg(tmp_path):
+    default = DeliverableOutput(name="thumb", kind=OutputKind.THUMBNAIL)
+    png = DeliverableOutput(name="thumb", kind=OutputKind.THUMBNAIL, container="png")
+
+    assert default.container == "mov" and default.file_extension == "jpg"
+    assert png.file_extension == "png"
+    assert map_to_ffmpeg(_settings(default)).additional_outputs[0].video_args[:2] == ["-c:v", "mjpeg"]
+    assert resolve_additional_output_paths(str(tmp_path / "a.mov"), _settings(default)) == [
+        str(tmp_path / "a_thumb.jpg"),
+    ]
+
+
+def test_additional_output_paths(tmp_path):
+    primary = str(tmp_path / "a__proxy.mov")
+
+    assert resolve_additional_output_paths(primary, _settings(REVIEW, THUMBNAIL)) == [
+        str(tmp_path / "a__proxy_review.mp4"),
+        str(tmp_path / "a__proxy_thumb.jpg"),
+    ]
+    with pytest.raises(OutputCollisionError):
+        resolve_additional_output_paths(primary, _settings(REVIEW, REVIEW))
+
+
+class _MultiOutputEngine:
+    """Renders every deliverable of run_clip_with_deliver_settings; run_clip must not be used."""
+
+    def run_clip(self, **kwargs):
+        raise AssertionError("multi-output job rendered through run_clip")
+
+    def run_clip_with_deliver_settings(self, task, deliver_settings, output_path, on_progress=None):
+        extra = resolve_additional_output_paths(output_path, deliver_settings)
+        for path in (output_path, *extra):
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_bytes(b"rendered")
+        return ExecutionResult(
+            status=ExecutionStatus.SUCCESS,
+            source_path=task.source_path,
+            output_path=output_path,
+            additional_output_paths=extra,
+        )
+
+
+class _Registry:
+    def get_available_engine(self, engine_type):
+        return _MultiOutputEngine()
+
+
+class _PresetRegistry:
+    def resolve_preset_params(self, preset_id):
+        return ResolvedPresetParams(preset_id=preset_id, preset_name="Dailies", video_codec="h264", container="mp4")
+
+
+def _multi_output_job(tmp_path):
+    source = tmp_path / "A001.mov"
+    source.write_bytes(b"camera original")
+    settings = DeliverSettings(output_dir=str(tmp_path / "out"), additional_outputs=(REVIEW, THUMBNAIL))
+    return Job(engine="ffmpeg", tasks=[ClipTask(source_path=str(source))], settings_dict=settings.to_dict())
+
+
+def test_job_renders_and_reports_additional_outputs(tmp_path, monkeypatch):
+    monkeypatch.setattr(trace, "_trace_manager", trace.TraceManager(tmp_path / "traces"))
+    engine = JobEngine(engine_registry=_Registry())
+    job = _multi_output_job(tmp_path)
+    engine.start_job(job)
+
+    results = engine._process_job(job, global_preset_id=f"_job_{job.id}_settings", preset_registry=None)
+    task = job.tasks[0]
+    assert task.status == TaskStatus.COMPLETED
+    extra = results[task.id].additional_output_paths
+    assert [Path(path).name for path in extra] == ["A001_proxy_review.mp4", "A001_proxy_thumb.jpg"]
+
+    reports = engine._generate_job_reports(job, results, output_base_dir=str(tmp_path))
+    clip = json.loads(reports["json"].read_text())["clips"][0]
+    assert clip["additional_output_paths"] == extra
+
+    # A bound preset renders through run_clip, which cannot produce them
+    job = _multi_output_job(tmp_path)
+    engine.start_job(job)
+    results = engine._process_job(job, global_preset_id="dailies", preset_registry=_PresetRegistry())
+    task = job.tasks[0]
+    assert task.status == TaskStatus.FAILED
+    assert "review, thumb" in results[task.id].failure_reason
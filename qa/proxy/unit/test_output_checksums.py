@@ -0,0 +1,134 @@
+"""
+Unit tests for output checksums.
+
+Tests:
+- StreamHasher matches hashlib and rejects unknown algorithms
+- Publishing a staged output hashes it in the copy pass (no extra read)
+- FFmpegEngine stores checksums on the result and writes MHL sidecars
+- Checksums force staging even with staging off; a clip without a
+  scratch reservation is hashed in place
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+from xml.etree import ElementTree
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.execution.results import ExecutionStatus
+from app.filesystem import checksums, staging
+from app.filesystem.checksums import ChecksumPolicy, StreamHasher, hash_file
+from app.filesystem.staging import ScratchSpace, publish_file
+from app.jobs.models import ClipTask
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    policy = ChecksumPolicy(algorithms=("md5", "sha1"), write_mhl=True)
+    monkeypatch.setattr(checksums, "_checksum_policy", policy)
+    return policy
+
+
+@pytest.fixture
+def scratch(tmp_path, monkeypatch):
+    space = ScratchSpace(root=tmp_path / "scratch", quota_bytes=10 ** 9, min_free_bytes=0, mode="always")
+    monkeypatch.setattr(staging, "_scratch_space", space)
+    return space
+
+
+def test_stream_hasher():
+    data = os.urandom(100_000)
+    hasher = StreamHasher(["md5", "sha1", "md5"])
+    hasher.update(data[:1234])
+    hasher.update(data[1234:])
+
+    assert hasher.hexdigests() == {
+        "md5": hashlib.md5(data).hexdigest(),
+        "sha1": hashlib.sha1(data).hexdigest(),
+    }
+    assert hasher.bytes_hashed == len(data)
+    with pytest.raises(ValueError):
+        StreamHasher(["crc32"])
+    with pytest.raises(ValueError):
+        ChecksumPolicy(algorithms=(), write_mhl=True)
+
+
+@pytest.mark.parametrize("same_filesystem", [True, False])
+def test_publish_hashes_in_copy_pass(tmp_path, monkeypatch, same_filesystem):
+    data = os.urandom(3 * 1024 * 1024 + 5)
+    staged = tmp_path / "scratch.mov"
+    staged.write_bytes(data)
+    final = tmp_path / "share" / "a.mov"
+    monkeypatch.setattr(staging, "_same_filesystem", lambda path, other: same_filesystem)
+
+    reads = []
+    real_open = open
+
+    def counting_open(path, mode="r", *args, **kwargs):
+        if "r" in mode and str(path) == str(staged):
+            reads.append(path)
+        return real_open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+    hasher = StreamHasher(["md5"])
+    publish_file(str(staged), str(final), hasher)
+    monkeypatch.undo()
+
+    assert final.read_bytes() == data
+    assert hasher.hexdigests() == {"md5": hashlib.md5(data).hexdigest()}
+    assert len(reads) == 1
+
+
+def test_engine_records_checksums_and_mhl(tmp_path, policy, scratch, fake_ffmpeg_engine):
+    source = tmp_path / "A001.mov"
+    source.write_bytes(b"camera original")
+    final = tmp_path / "share" / "A001_proxy.mov"
+    task = ClipTask(source_path=str(source), output_path=str(final))
+
+    result = fake_ffmpeg_engine().run_clip(task, resolved_params=None)
+
+    expected = {"md5": hashlib.md5(b"proxy").hexdigest(), "sha1": hashlib.sha1(b"proxy").hexdigest()}
+    assert result.status == ExecutionStatus.SUCCESS
+    assert result.checksums == {str(final): expected}
+
+    mhl = ElementTree.parse(str(final) + ".mhl").getroot()
+    assert mhl.get("version") == "1.1"
+    assert mhl.findtext("hash/file") == "A001_proxy.mov"
+    assert mhl.findtext("hash/size") == "5"
+    assert mhl.findtext("hash/md5") == expected["md5"]
+    assert mhl.findtext("hash/sha1") == expected["sha1"]
+
+
+def test_checksums_force_staging(tmp_path, monkeypatch, policy, scratch, fake_ffmpeg_engine):
+    scratch.set_mode("off")
+    policy.configure(["md5"])
+    source = tmp_path / "A001.mov"
+    source.write_bytes(b"camera original")
+    final = tmp_path / "out" / "A001_proxy.mov"
+    task = ClipTask(source_path=str(source), output_path=str(final), duration=1.0)
+    engine = fake_ffmpeg_engine()
+    hashed_in_place = []
+    monkeypatch.setattr(checksums, "hash_file", lambda *args: hashed_in_place.append(args))
+
+    result = engine.run_clip(task, resolved_params=None)
+
+    assert engine.rendered[0].startswith(str(scratch.root))
+    assert result.checksums == {str(final): {"md5": hashlib.md5(b"proxy").hexdigest()}}
+    assert hashed_in_place == []
+
+
+def test_unreserved_output_hashed_in_place(tmp_path, policy, scratch, fake_ffmpeg_engine):
+    scratch.quota_bytes = 0
+    policy.configure(["md5"])
+    final = tmp_path / "out" / "A001_proxy.mov"
+    task = ClipTask(source_path=str(tmp_path / "A001.mov"), output_path=str(final))
+
+    result = fake_ffmpeg_engine().run_clip(task, resolved_params=None)
+
+    assert result.checksums == {str(final): hash_file(str(final), ["md5"])}
+    assert not Path(str(final) + ".mhl").exists()
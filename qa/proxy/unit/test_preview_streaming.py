@@ -0,0 +1,240 @@
+"""
+Unit tests for preview streaming (HTTP range + conditional requests).
+
+Tests:
+- Full responses carry validators and the download filename
+- 206 Partial Content for explicit and suffix ranges, 416 when unsatisfiable
+- 304 Not Modified via If-None-Match / If-Modified-Since
+- Progressive (fragmented MP4) previews streamed while growing, including
+  a tail written just before the encode is reported finished
+"""
+
+import asyncio
+import sys
+from email.utils import formatdate
+from pathlib import Path
+
+import pytest
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from starlette.requests import Request
+
+from app.execution import preview as preview_module
+from app.execution.preview import CACHE_DIR
+from app.routes.preview import stream_preview
+
+
+def _scope(headers=None) -> dict:
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return {"type": "http", "method": "GET", "headers": raw, "asgi": {"spec_version": "2.4"}}
+
+
+def _make_request(headers=None) -> Request:
+    return Request(_scope(headers))
+
+
+def _call(path: Path, headers=None):
+    return asyncio.run(stream_preview(str(path), _make_request(headers)))
+
+
+def _serve(path: Path, headers=None):
+    """Run the endpoint's response as ASGI: (status, headers, body)."""
+    messages = []
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        messages.append(message)
+    
+    async def run():
+        response = await stream_preview(str(path), _make_request(headers))
+        await response(_scope(headers), receive, send)
+    
+    asyncio.run(run())
+    start = messages[0]
+    response_headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], response_headers, body
+
+
+async def _collect_body(response) -> bytes:
+    chunks = []
+    async for chunk in response.body_iterator:
+        chunks.append(chunk if isinstance(chunk, bytes) else chunk.encode())
+    return b"".join(chunks)
+
+
+@pytest.fixture
+def cached_preview():
+    """Create a fake cached preview inside the preview cache directory."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    preview = CACHE_DIR / "unittest_stream_preview.mp4"
+    preview.write_bytes(bytes(range(256)) * 4)
+    yield preview
+    if preview.exists():
+        preview.unlink()
+
+
+class TestStreamPreview:
+    """Test the /preview/stream endpoint responses."""
+    
+    def test_full_response_has_validators(self, cached_preview):
+        status, headers, body = _serve(cached_preview)
+        
+        assert status == 200
+        assert headers["accept-ranges"] == "bytes"
+        assert headers["content-length"] == "1024"
+        assert headers["etag"].startswith('"unittest_stream_preview-')
+        assert headers["content-disposition"] == 'attachment; filename="unittest_stream_preview.mp4"'
+        assert "last-modified" in headers
+        assert body == bytes(range(256)) * 4
+    
+    def test_range_returns_partial_content(self, cached_preview):
+        status, headers, body = _serve(cached_preview, {"Range": "bytes=10-19"})
+        
+        assert status == 206
+        assert headers["content-range"] == "bytes 10-19/1024"
+        assert headers["content-length"] == "10"
+        assert body == bytes(range(10, 20))
+    
+    def test_suffix_range(self, cached_preview):
+        status, headers, body = _serve(cached_preview, {"Range": "bytes=-4"})
+        
+        assert status == 206
+        assert headers["content-range"] == "bytes 1020-1023/1024"
+        assert body == bytes(range(252, 256))
+    
+    def test_unsatisfiable_range_returns_416(self, cached_preview):
+        status, headers, _ = _serve(cached_preview, {"Range": "bytes=4096-"})
+        
+        assert status == 416
+        assert headers["content-range"] == "bytes */1024"
+    
+    def test_if_none_match_returns_304(self, cached_preview):
+        etag = _call(cached_preview).headers["etag"]
+        
+        response = _call(cached_preview, {"If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+    
+    def test_if_modified_since_returns_304(self, cached_preview):
+        mtime = cached_preview.stat().st_mtime
+        
+        response = _call(cached_preview, {"If-Modified-Since": formatdate(mtime + 60, usegmt=True)})
+        
+        assert response.status_code == 304
+    
+    def test_stale_if_range_serves_full_file(self, cached_preview):
+        status, headers, _ = _serve(cached_preview, {"Range": "bytes=0-9", "If-Range": '"stale"'})
+        
+        assert status == 200
+        assert headers["content-length"] == "1024"
+    
+    def test_matching_if_range_serves_range(self, cached_preview):
+        etag = _call(cached_preview).headers["etag"]
+        
+        status, _, body = _serve(cached_preview, {"Range": "bytes=0-9", "If-Range": etag})
+        
+        assert status == 206
+        assert body == bytes(range(10))
+
+
+class TestProgressivePreview:
+    """Test streaming of still-encoding (fragmented MP4) previews."""
+    
+    def test_growing_file_streams_until_encode_finishes(self, cached_preview):
+        partial = cached_preview.with_suffix(preview_module.PARTIAL_PREVIEW_SUFFIX)
+        partial.write_bytes(b"moof")
+        preview_module._progressive_active.add(str(partial))
+        
+        async def run():
+            response = await stream_preview(str(partial), _make_request({"Range": "bytes=0-1"}))
+            assert response.status_code == 200
+            assert response.headers["accept-ranges"] == "none"
+            
+            async def finish_encode():
+                await asyncio.sleep(0.05)
+                with open(partial, "ab") as f:
+                    f.write(b"mdat")
+                preview_module._progressive_active.discard(str(partial))
+            
+            finisher = asyncio.create_task(finish_encode())
+            body = await _collect_body(response)
+            await finisher
+            return body
+        
+        try:
+            assert asyncio.run(run()) == b"moofmdat"
+        finally:
+            preview_module._progressive_active.discard(str(partial))
+            partial.unlink()
+    
+    def test_tail_written_as_encode_finishes_is_streamed(self, cached_preview):
+        import app.routes.preview as routes_module
+        
+        partial = cached_preview.with_suffix(preview_module.PARTIAL_PREVIEW_SUFFIX)
+        partial.write_bytes(b"moof")
+        preview_module._progressive_active.add(str(partial))
+        
+        def finished_after_tail(path):
+            # FFmpeg writes its last fragment right after the EOF read
+            with open(partial, "ab") as f:
+                f.write(b"tail")
+            return False
+        
+        async def run():
+            response = await stream_preview(str(partial), _make_request())
+            with patch.object(routes_module, "is_progressive_preview_active", finished_after_tail):
+                return await _collect_body(response)
+        
+        try:
+            assert asyncio.run(run()) == b"mooftail"
+        finally:
+            preview_module._progressive_active.discard(str(partial))
+            partial.unlink()
+    
+    def test_partial_path_served_from_final_after_completion(self, cached_preview):
+        partial = cached_preview.with_suffix(preview_module.PARTIAL_PREVIEW_SUFFIX)
+        
+        status, headers, _ = _serve(partial)
+        
+        assert status == 200
+        assert headers["content-length"] == "1024"
+    
+    def test_progressive_encode_uses_fragmented_mp4(self, tmp_path):
+        source = tmp_path / "clip.mov"
+        source.write_bytes(b"source")
+        output = tmp_path / "clip_preview.mp4"
+        captured = {}
+        
+        class FakeProcess:
+            returncode = 0
+            stdout = iter(())
+            stderr = None
+            
+            def wait(self):
+                Path(captured["cmd"][-1]).write_bytes(b"fmp4")
+        
+        def fake_popen(cmd, **kwargs):
+            captured["cmd"] = cmd
+            return FakeProcess()
+        
+        with patch.object(preview_module, "find_ffmpeg", return_value="ffmpeg"), \
+             patch.object(preview_module, "get_video_info", return_value=None), \
+             patch.object(preview_module.subprocess, "Popen", side_effect=fake_popen):
+            result = preview_module.generate_preview_sync(
+                str(source), output_path=str(output), progressive=True,
+            )
+        
+        cmd = captured["cmd"]
+        assert cmd[cmd.index("-movflags") + 1] == preview_module.PREVIEW_PROGRESSIVE_MOVFLAGS
+        assert cmd[-1].endswith(preview_module.PARTIAL_PREVIEW_SUFFIX)
+        assert result == str(output)
+        assert output.read_bytes() == b"fmp4"
+        assert not Path(cmd[-1]).exists()
+        assert not preview_module.is_progressive_preview_active(Path(cmd[-1]))
@@ -0,0 +1,166 @@
+"""
+Unit tests for priority lanes, aging and preemption in the scheduler.
+
+Tests:
+- Urgent jobs jump ahead of earlier normal and low priority jobs
+- Waiting jobs are promoted one lane per aging interval
+- Re-prioritizing a queued job moves it between lanes
+- A running low priority job yields at a clip boundary and resumes later
+- Only urgent jobs somebody is waiting to run preempt; a yielded job
+  takes the slot past queued jobs nobody is waiting for
+- A wait for the slot can be cancelled
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.execution import scheduler as scheduler_module
+from app.execution.scheduler import Scheduler
+from app.execution.scheduling import priority_lane
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(scheduler_module.time, "monotonic", clock)
+    return clock
+
+
+def _eventually(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_urgent_jumps_the_queue():
+    scheduler = Scheduler()
+    scheduler.enqueue_job("archive", priority="low")
+    scheduler.enqueue_job("edit", priority="normal")
+    assert scheduler.enqueue_job("dailies", priority="urgent") == 1
+
+    assert scheduler.get_queued_job_ids() == ["dailies", "edit", "archive"]
+    assert scheduler.get_queue_position("archive") == 3
+    assert not scheduler.acquire_execution("edit")
+    assert scheduler.acquire_execution("dailies")
+
+    with pytest.raises(ValueError):
+        priority_lane("asap")
+
+
+def test_waiting_jobs_age_into_higher_lanes(clock):
+    scheduler = Scheduler(aging_seconds=60)
+    scheduler.enqueue_job("archive", priority="low")
+    clock.now += 30
+    scheduler.enqueue_job("edit", priority="normal")
+    assert scheduler.get_queued_job_ids() == ["edit", "archive"]
+
+    # archive: low -> normal, and it was submitted first
+    clock.now += 30
+    assert scheduler.get_queued_job_ids() == ["archive", "edit"]
+    assert [e.priority for e in scheduler.get_queue_estimates()] == ["normal", "normal"]
+
+    # Keeps climbing, but never above urgent
+    clock.now += 600
+    scheduler.enqueue_job("dailies", priority="urgent")
+    assert scheduler.get_queued_job_ids() == ["archive", "edit", "dailies"]
+    assert {e.job_id: e.priority for e in scheduler.get_queue_estimates()}["archive"] == "urgent"
+
+
+def test_set_job_priority_moves_lanes():
+    scheduler = Scheduler()
+    scheduler.enqueue_job("a")
+    scheduler.enqueue_job("b")
+
+    assert scheduler.set_job_priority("b", "high")
+    assert scheduler.get_queued_job_ids() == ["b", "a"]
+    assert not scheduler.set_job_priority("missing", "high")
+
+
+def test_preemption_at_clip_boundary():
+    scheduler = Scheduler(preemption=True)
+    scheduler.enqueue_job("archive", estimated_seconds=100, priority="low")
+    assert scheduler.acquire_execution("archive")
+    assert not scheduler.should_yield("archive")
+
+    scheduler.enqueue_job("dailies", priority="urgent")
+    assert scheduler.will_preempt_for("dailies")
+
+    # The urgent start waits for the slot while the archive job yields
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(scheduler.wait_for_turn("dailies", timeout=5)))
+    waiter.start()
+    assert _eventually(lambda: scheduler.should_yield("archive"))
+    assert scheduler.yield_execution("archive")
+    waiter.join(5)
+    assert acquired == [True]
+    assert scheduler.get_current_job_id() == "dailies"
+    assert scheduler.get_queue_position("archive") == 1
+
+    # The preempted job resumes once the urgent one is done
+    resumed = []
+    waiter = threading.Thread(target=lambda: resumed.append(scheduler.wait_for_turn("archive", timeout=5)))
+    waiter.start()
+    scheduler.release_execution("dailies")
+    waiter.join(5)
+    assert resumed == [True]
+    assert scheduler.get_current_job_id() == "archive"
+
+
+def test_no_preemption_unless_enabled():
+    scheduler = Scheduler()
+    scheduler.enqueue_job("archive", priority="low")
+    assert scheduler.acquire_execution("archive")
+    scheduler.enqueue_job("dailies", priority="urgent")
+
+    assert not scheduler.should_yield("archive")
+    assert not scheduler.will_preempt_for("dailies")
+    assert not scheduler.wait_for_turn("dailies", timeout=0.05)
+
+
+def test_no_yield_without_waiter():
+    scheduler = Scheduler()
+    scheduler.enqueue_job("archive", priority="low")
+    assert scheduler.acquire_execution("archive")
+    scheduler.enqueue_job("dailies", priority="normal")
+
+    # Preemption enabled / lane raised after the competitor was queued:
+    # nobody is waiting to run it, so the running job keeps the slot
+    scheduler.set_preemption(True)
+    assert scheduler.set_job_priority("dailies", "urgent")
+    assert not scheduler.should_yield("archive")
+
+    # Even after a yield, the job does not wait on a competitor that
+    # nothing will start
+    assert scheduler.yield_execution("archive")
+    assert scheduler.wait_for_turn("archive", timeout=1)
+    assert scheduler.get_current_job_id() == "archive"
+    assert scheduler.get_queued_job_ids() == ["dailies"]
+
+
+def test_wait_for_turn_cancelled():
+    scheduler = Scheduler()
+    scheduler.enqueue_job("archive")
+    assert scheduler.acquire_execution("archive")
+    scheduler.enqueue_job("edit")
+
+    started = time.monotonic()
+    assert not scheduler.wait_for_turn("edit", cancelled=lambda: True)
+    assert time.monotonic() - started < 1
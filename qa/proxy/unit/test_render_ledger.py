@@ -0,0 +1,167 @@
+"""
+Unit tests for the render ledger.
+
+Tests:
+- Source fingerprints change with the file (including same-size edits
+  in the middle), not with unrelated reads
+- Entries whose output changed on disk are forgotten
+- Entries survive a restart through PersistenceManager
+- A re-submitted clip completes from cache without running the engine
+- Clips completed from cache get checksums and MHL sidecars
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.deliver.settings import DeliverSettings
+from app.execution.results import ExecutionResult, ExecutionStatus
+from app.filesystem import checksums
+from app.jobs.engine import JobEngine
+from app.jobs.models import ClipTask, Job, TaskStatus
+from app.jobs.render_ledger import SAMPLE_BYTES, RenderKey, RenderLedger, source_fingerprint
+from app.observability import trace
+from app.persistence.manager import PersistenceManager
+
+KEY = RenderKey("source", "settings", "ffmpeg:test")
+
+
+class _FakeEngine:
+    version = "ffmpeg version test"
+
+    def __init__(self):
+        self.rendered = []
+
+    def run_clip(self, task, resolved_params, output_path, **kwargs):
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(output_path).write_bytes(b"proxy of " + Path(task.source_path).read_bytes())
+        self.rendered.append(output_path)
+        return ExecutionResult(
+            status=ExecutionStatus.COMPLETED,
+            source_path=task.source_path,
+            output_path=output_path,
+        )
+
+
+class _FakeEngineRegistry:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def get_available_engine(self, engine_type):
+        return self.engine
+
+
+@pytest.fixture(autouse=True)
+def _trace_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(trace, "_trace_manager", trace.TraceManager(tmp_path / "traces"))
+
+
+def test_source_fingerprint_tracks_the_file(tmp_path):
+    a = tmp_path / "a.mov"
+    data = os.urandom(3 * SAMPLE_BYTES)
+    a.write_bytes(data)
+    fingerprint = source_fingerprint(str(a))
+
+    assert source_fingerprint(str(a)) == fingerprint
+    # Same-size patch outside the sampled head and tail
+    st = a.stat()
+    with open(a, "r+b") as f:
+        f.seek(len(data) // 2)
+        f.write(b"\xff" * 16)
+    os.utime(a, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    assert source_fingerprint(str(a)) != fingerprint
+
+    # Same bytes in another file: a different source
+    b = tmp_path / "b.mov"
+    b.write_bytes(a.read_bytes())
+    os.utime(b, ns=(a.stat().st_atime_ns, a.stat().st_mtime_ns))
+    assert source_fingerprint(str(b)) != source_fingerprint(str(a))
+
+    assert source_fingerprint(str(tmp_path / "missing.mov")) is None
+    assert source_fingerprint(str(tmp_path / "shot.%04d.exr")) is None
+
+
+def test_changed_output_is_forgotten(tmp_path):
+    output = tmp_path / "a__proxy.mov"
+    output.write_bytes(b"rendered")
+    ledger = RenderLedger()
+    ledger.record(KEY, str(output))
+
+    assert ledger.lookup(KEY).output_size == len(b"rendered")
+    output.write_bytes(b"re-rendered elsewhere")
+    assert ledger.lookup(KEY) is None
+    assert len(ledger) == 0
+    assert ledger.stats() == {"entries": 0, "hits": 1, "misses": 1}
+
+
+def test_entries_are_persisted(tmp_path):
+    output = tmp_path / "a__proxy.mov"
+    output.write_bytes(b"rendered")
+    persistence = PersistenceManager(db_path=str(tmp_path / "state.db"))
+    RenderLedger(persistence_manager=persistence).record(KEY, str(output))
+
+    reloaded = RenderLedger(persistence_manager=PersistenceManager(db_path=str(tmp_path / "state.db")))
+    assert reloaded.lookup(KEY).output_path == str(output)
+
+
+def _run(engine, source, output_dir):
+    job = Job(
+        engine="ffmpeg",
+        tasks=[ClipTask(source_path=str(source))],
+        settings_dict=DeliverSettings(output_dir=str(output_dir)).to_dict(),
+    )
+    engine.start_job(job)
+    engine._process_job(job, global_preset_id=f"_job_{job.id}_settings", preset_registry=None)
+    return job.tasks[0]
+
+
+def test_resubmitted_clip_completes_from_cache(tmp_path):
+    source = tmp_path / "A001.mov"
+    source.write_bytes(b"camera original")
+    fake = _FakeEngine()
+    engine = JobEngine(engine_registry=_FakeEngineRegistry(fake), render_ledger=RenderLedger())
+
+    first = _run(engine, source, tmp_path / "out")
+    again = _run(engine, source, tmp_path / "out")
+    elsewhere = _run(engine, source, tmp_path / "other")
+
+    assert fake.rendered == [first.output_path]
+    assert not first.from_render_cache
+    assert again.status == TaskStatus.COMPLETED and again.from_render_cache
+    assert again.output_path == first.output_path
+    assert elsewhere.from_render_cache
+    assert Path(elsewhere.output_path).read_bytes() == Path(first.output_path).read_bytes()
+
+    # Different source bytes render again
+    source.write_bytes(b"camera original, re-exported")
+    _run(engine, source, tmp_path / "out")
+    assert len(fake.rendered) == 2
+
+
+def test_cached_clip_gets_checksums(tmp_path, monkeypatch):
+    monkeypatch.setattr(checksums, "_checksum_policy", checksums.ChecksumPolicy(("md5",), write_mhl=True))
+    source = tmp_path / "A001.mov"
+    source.write_bytes(b"camera original")
+    engine = JobEngine(engine_registry=_FakeEngineRegistry(_FakeEngine()), render_ledger=RenderLedger())
+    first = _run(engine, source, tmp_path / "out")
+    expected = {"md5": hashlib.md5(Path(first.output_path).read_bytes()).hexdigest()}
+
+    for output_dir in ("out", "other"):
+        job = Job(
+            engine="ffmpeg",
+            tasks=[ClipTask(source_path=str(source))],
+            settings_dict=DeliverSettings(output_dir=str(tmp_path / output_dir)).to_dict(),
+        )
+        engine.start_job(job)
+        results = engine._process_job(job, global_preset_id=f"_job_{job.id}_settings", preset_registry=None)
+        task = job.tasks[0]
+
+        assert task.from_render_cache
+        assert results[task.id].checksums == {task.output_path: expected}
+        assert Path(task.output_path + ".mhl").is_file()
@@ -0,0 +1,134 @@
+"""
+Unit tests for cost-model-aware scheduling.
+
+Tests:
+- The cost model falls back to defaults and learns from observed renders
+- Estimates use the codec renders are trained under (a bound preset's)
+- SJF runs a 5 second job ahead of a 3 hour job
+- Fair share interleaves watch folders
+- Bin packing groups jobs into core-bounded waves
+- Queue positions and ETAs follow the policy
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.execution.cost_model import DEFAULT_ENCODE_FPS, EncodeCostModel
+from app.execution.scheduler import Scheduler
+from app.execution.scheduling import (
+    BinPackingPolicy,
+    FairSharePolicy,
+    QueuedJob,
+    ShortestJobFirstPolicy,
+    create_policy,
+)
+from app.execution.resolved_params import ResolvedPresetParams
+from app.jobs.engine import JobEngine
+from app.jobs.models import ClipTask, Job, TaskStatus
+
+
+def _queued(job_id, sequence, seconds=0.0, group=None, cores=1):
+    return QueuedJob(job_id, sequence, datetime.now(), seconds, group, cores)
+
+
+def test_cost_model_learns_encode_speed():
+    model = EncodeCostModel(cores=8)
+    task = ClipTask(source_path="/in/a.mov", height=1080, duration=100.0, frame_rate="25", codec="prores hq")
+    job = Job(tasks=[task, ClipTask(source_path="/in/b.mov", height=2160, status=TaskStatus.COMPLETED)])
+
+    assert model.estimate_task_seconds(task, "h264") == pytest.approx(2500 / DEFAULT_ENCODE_FPS["hd"])
+
+    model.observe(task, "h264", 250.0)
+    assert model.estimate_task_seconds(task, "h264") == pytest.approx(10.0)
+    # Other source codecs fall back to the (output codec, resolution) average
+    other = ClipTask(source_path="/in/c.mxf", height=1080, duration=100.0, frame_rate="25", codec="dnxhd")
+    assert model.encode_fps(other, "h264") == pytest.approx(250.0)
+
+    model.observe(task, "h264", 50.0)
+    assert model.encode_fps(task, "h264") == pytest.approx(0.3 * 50 + 0.7 * 250)
+
+    # Completed clips cost nothing, but still count toward core demand
+    assert model.estimate_job_seconds(job) == pytest.approx(model.estimate_task_seconds(task, job.settings.video.codec))
+    assert model.job_cores(job) == 8
+
+
+def test_estimates_use_the_rendering_codec():
+    class _Presets:
+        def resolve_preset_params(self, preset_id):
+            return ResolvedPresetParams(preset_id=preset_id, preset_name="Dailies", video_codec="h264", container="mp4")
+
+    model = EncodeCostModel(cores=8)
+    task = ClipTask(source_path="/in/a.mov", height=1080, duration=100.0, frame_rate="25", codec="prores hq")
+    job = Job(tasks=[task])
+    engine = JobEngine()
+    assert job.settings.video.codec != "h264"
+
+    # _execute_task trains under the resolved params; estimates use the same
+    trained = engine.resolve_job_params(job, _Presets(), "dailies")
+    model.observe(task, trained.video_codec, 250.0)
+    codec = engine.resolve_job_params(job, _Presets(), "dailies").video_codec
+    assert model.estimate_job_seconds(job, codec) == pytest.approx(10.0)
+    # Without a preset, the job's own codec
+    assert engine.resolve_job_params(job, _Presets(), None).video_codec == job.settings.video.codec
+
+
+def test_sjf_runs_short_job_first():
+    jobs = [_queued("three_hours", 0, 3 * 3600), _queued("five_seconds", 1, 5)]
+
+    ordered = ShortestJobFirstPolicy().order(jobs, {})
+    assert [job.job_id for job in ordered] == ["five_seconds", "three_hours"]
+
+
+def test_fair_share_interleaves_folders():
+    jobs = [_queued(f"a{i}", i, 60, group="folder_a") for i in range(3)]
+    jobs += [_queued("b0", 3, 60, group="folder_b"), _queued("manual", 4, 60)]
+
+    ordered = FairSharePolicy().order(jobs, {"folder_a": 0.0})
+    assert [job.job_id for job in ordered] == ["a0", "b0", "manual", "a1", "a2"]
+
+    # A folder that already received render time yields to the others
+    ordered = FairSharePolicy().order(jobs, {"folder_a": 600.0})
+    assert [job.job_id for job in ordered][:2] == ["b0", "manual"]
+
+
+def test_bin_packing_waves():
+    jobs = [
+        _queued("uhd", 0, 600, cores=8),
+        _queued("hd_long", 1, 300, cores=4),
+        _queued("hd_short", 2, 30, cores=4),
+        _queued("sd", 3, 10, cores=2),
+    ]
+
+    ordered = BinPackingPolicy(cores=8).order(jobs, {})
+    # Waves (8 cores each): [sd], [hd_long, hd_short], [uhd]; shortest wave first
+    assert [job.job_id for job in ordered] == ["sd", "hd_short", "hd_long", "uhd"]
+
+
+def test_scheduler_positions_and_etas():
+    scheduler = Scheduler()
+    scheduler.enqueue_job("long", estimated_seconds=300)
+    scheduler.enqueue_job("short", estimated_seconds=5)
+    assert scheduler.get_queued_job_ids() == ["long", "short"]
+
+    scheduler.set_policy(create_policy("sjf"))
+    assert scheduler.get_queue_position("short") == 1
+    assert scheduler.get_queue_position("long") == 2
+    assert not scheduler.acquire_execution("long")
+    assert scheduler.acquire_execution("short")
+
+    estimates = scheduler.get_queue_estimates()
+    assert [(e.job_id, e.position) for e in estimates] == [("short", 0), ("long", 1)]
+    assert estimates[1].eta_seconds == pytest.approx(305, abs=1)
+
+    scheduler.release_execution("short")
+    assert scheduler.remove_from_queue("long")
+    assert scheduler.get_queue_position("long") == -1
+
+    with pytest.raises(ValueError):
+        create_policy("random")
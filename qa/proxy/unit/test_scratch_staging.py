@@ -0,0 +1,134 @@
+"""
+Unit tests for local scratch staging.
+
+Tests:
+- copy_file falls back cleanly when copy_file_range is unavailable
+- A failed publish leaves nothing at (or next to) the destination
+- Quota and mode decide whether a clip is staged
+- FFmpegEngine renders to scratch and publishes only successful renders
+- Clips reserve their estimated output size, not their source size
+"""
+
+import errno
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.execution.cost_model import OUTPUT_SIZE_HEADROOM, estimate_output_bytes
+from app.execution.resolved_params import ResolvedPresetParams
+from app.execution.results import ExecutionStatus
+from app.filesystem import staging
+from app.filesystem.staging import ScratchSpace, copy_file, publish_file
+from app.jobs.models import ClipTask
+
+
+@pytest.fixture
+def scratch(tmp_path, monkeypatch):
+    space = ScratchSpace(root=tmp_path / "scratch", quota_bytes=1000, min_free_bytes=0, mode="always")
+    monkeypatch.setattr(staging, "_scratch_space", space)
+    return space
+
+
+def test_copy_file_fallback(tmp_path, monkeypatch):
+    source = tmp_path / "a.mov"
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    source.write_bytes(data)
+
+    assert copy_file(str(source), str(tmp_path / "fast.mov")) == len(data)
+    assert (tmp_path / "fast.mov").read_bytes() == data
+
+    def unsupported(*args):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(os, "sendfile", unsupported, raising=False)
+    assert copy_file(str(source), str(tmp_path / "buffered.mov")) == len(data)
+    assert (tmp_path / "buffered.mov").read_bytes() == data
+
+
+def test_failed_publish_leaves_no_partial(tmp_path, monkeypatch):
+    staged = tmp_path / "scratch.mov"
+    staged.write_bytes(b"complete render")
+    final = tmp_path / "share" / "a.mov"
+    final.parent.mkdir()
+    final.write_bytes(b"previous render")
+    # Scratch on local disk, destination on a share
+    monkeypatch.setattr(staging, "_same_filesystem", lambda path, other: False)
+
+    def broken_copy(source, destination, hasher=None):
+        Path(destination).write_bytes(b"compl")
+        raise OSError(errno.EIO, "network went away")
+
+    with monkeypatch.context() as m:
+        m.setattr(staging, "copy_file", broken_copy)
+        with pytest.raises(OSError):
+            publish_file(str(staged), str(final))
+    assert final.read_bytes() == b"previous render"
+    assert sorted(p.name for p in final.parent.iterdir()) == ["a.mov"]
+
+    publish_file(str(staged), str(final))
+    assert final.read_bytes() == b"complete render"
+    assert not staged.exists()
+
+
+def test_quota_and_mode(tmp_path, scratch):
+    final = [str(tmp_path / "out" / "a.mov")]
+
+    with scratch.stage("clip1", final, size_hint=800) as first:
+        assert first.staged and scratch.reserved_bytes == 800
+        with scratch.stage("clip2", final, size_hint=800) as second:
+            assert not second.staged  # Over quota: written directly
+    assert scratch.reserved_bytes == 0
+    assert not any((tmp_path / "scratch").iterdir())
+
+    scratch.set_mode("off")
+    with scratch.stage("clip3", final, size_hint=1) as staged:
+        assert not staged.staged
+    with pytest.raises(ValueError):
+        scratch.set_mode("sometimes")
+
+
+def test_engine_publishes_only_successful_renders(tmp_path, scratch, fake_ffmpeg_engine):
+    scratch.quota_bytes = 10 ** 9
+    source = tmp_path / "A001.mov"
+    source.write_bytes(b"camera original")
+    final = tmp_path / "share" / "A001_proxy.mov"
+
+    task = ClipTask(source_path=str(source), output_path=str(final), duration=1.0)
+    result = fake_ffmpeg_engine().run_clip(task, resolved_params=None)
+    assert result.status == ExecutionStatus.SUCCESS
+    assert result.output_path == str(final)
+    assert final.read_bytes() == b"proxy"
+
+    failed_final = tmp_path / "share" / "A002_proxy.mov"
+    task = ClipTask(source_path=str(source), output_path=str(failed_final), duration=1.0)
+    result = fake_ffmpeg_engine(fail_at=1).run_clip(task, resolved_params=None)
+    assert result.status == ExecutionStatus.FAILED
+    assert not failed_final.exists()
+    assert not any((tmp_path / "scratch").iterdir())
+
+
+def test_reservation_estimates_the_output(tmp_path, monkeypatch, scratch, fake_ffmpeg_engine):
+    scratch.quota_bytes = 10 ** 12
+    reserved = []
+    reserve = scratch._reserve
+    monkeypatch.setattr(scratch, "_reserve", lambda clip_id, size_hint: reserved.append(size_hint) or reserve(clip_id, size_hint))
+    source = tmp_path / "A001.mov"
+    source.write_bytes(b"camera original")
+    task = ClipTask(
+        source_path=str(source), output_path=str(tmp_path / "share" / "A001_proxy.mov"),
+        width=1920, height=1080, frame_rate="30000/1001", duration=60.0,
+    )
+    params = ResolvedPresetParams(preset_id="p", preset_name="Proxy", video_codec="prores_proxy", container="mov")
+
+    fake_ffmpeg_engine().run_clip(task, resolved_params=params)
+
+    # ProRes Proxy at 1080p29.97 is nominally 45 Mbit/s
+    assert reserved == [int(45e6 / 8 * 60 * OUTPUT_SIZE_HEADROOM)]
+    assert estimate_output_bytes(task, "h264", "8M") == int(8e6 / 8 * 60 * OUTPUT_SIZE_HEADROOM)
+    assert estimate_output_bytes(task.model_copy(update={"duration": None}), "h264") is None
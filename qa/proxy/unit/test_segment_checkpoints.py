@@ -0,0 +1,127 @@
+"""
+Unit tests for checkpointed segment encodes.
+
+Tests:
+- Segment plan covers the clip; segment commands seek the source input
+- Short, multi-input and timecode-dependent commands (including a burnt-in
+  {timecode} built by the mapper) are not segmented
+- Checkpoints persist across PersistenceManager instances and are
+  dropped when the segment file changed
+- A render interrupted mid-clip resumes with only the missing segments
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.deliver.capabilities import OverlayCapabilities, TextOverlay
+from app.deliver.engine_mapping import map_to_ffmpeg
+from app.deliver.settings import DeliverSettings
+from app.execution import segments
+from app.execution.results import ExecutionStatus
+from app.execution.segments import (
+    Segment,
+    SegmentCheckpointStore,
+    is_segmentable,
+    plan_segments,
+    segment_command,
+)
+from app.jobs.models import ClipTask
+from app.persistence.manager import PersistenceManager
+
+
+def _cmd(source, output):
+    return ["ffmpeg", "-y", "-i", source, "-c:v", "prores_ks", "-profile:v", "0", output]
+
+
+def test_plan_and_segment_command():
+    plan = plan_segments(2500.0, 1000.0)
+    assert plan == [Segment(0, 0.0, 1000.0), Segment(1, 1000.0, 2000.0), Segment(2, 2000.0, 2500.0)]
+
+    cmd = segment_command(_cmd("/nas/A001.mov", "/out/A001.mov"), "/nas/A001.mov", "/out/A001.mov", plan[2], "/seg/2.mov")
+    assert cmd == [
+        "ffmpeg", "-y", "-ss", "2000.000000", "-t", "500.000000", "-i", "/nas/A001.mov",
+        "-c:v", "prores_ks", "-profile:v", "0", "/seg/2.mov",
+    ]
+
+
+def test_segmentable():
+    cmd = _cmd("/nas/A001.mov", "/out/A001.mov")
+    assert is_segmentable(cmd, "/nas/A001.mov", 7200.0)
+    assert not is_segmentable(cmd, "/nas/A001.mov", 60.0)
+    assert not is_segmentable(cmd, "/nas/A001.mov", None)
+    with_logo = ["ffmpeg", "-i", "/nas/A001.mov", "-i", "/logo.png", "/out/A001.mov"]
+    assert not is_segmentable(with_logo, "/nas/A001.mov", 7200.0)
+
+    # Burnt-in timecode as built by the mapper (drawtext %{pts} expansion)
+    def mapped(text):
+        settings = DeliverSettings(overlay=OverlayCapabilities(text_layers=(TextOverlay(text=text),)))
+        return map_to_ffmpeg(settings).build_command("ffmpeg", "/nas/A001.mov", "/out/A001.mov")
+
+    assert not is_segmentable(mapped("TC {timecode}"), "/nas/A001.mov", 7200.0)
+    assert is_segmentable(mapped("REVIEW"), "/nas/A001.mov", 7200.0)
+    tc_option = cmd[:-1] + ["-vf", "drawtext=timecode='01\\:00\\:00\\:00':rate=25", "/out/A001.mov"]
+    assert not is_segmentable(tc_option, "/nas/A001.mov", 7200.0)
+
+
+def test_checkpoints_survive_restart(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    store = SegmentCheckpointStore(PersistenceManager(db_path=db_path), root=tmp_path / "segments")
+    work_dir = store.work_dir("k")
+    work_dir.mkdir(parents=True)
+    for index in range(2):
+        path = work_dir / f"segment_{index}.mov"
+        path.write_bytes(b"x" * (index + 1))
+        store.record("k", Segment(index, index * 10.0, index * 10.0 + 10.0), str(path))
+
+    # "Restart": fresh manager and store on the same database
+    restarted = SegmentCheckpointStore(PersistenceManager(db_path=db_path), root=tmp_path / "segments")
+    assert restarted.completed("k") == {0: str(work_dir / "segment_0.mov"), 1: str(work_dir / "segment_1.mov")}
+
+    (work_dir / "segment_1.mov").write_bytes(b"truncated")
+    assert list(restarted.completed("k")) == [0]
+
+    restarted.clear("k")
+    assert restarted.completed("k") == {}
+    assert not work_dir.exists()
+
+
+@pytest.fixture
+def long_clip(tmp_path, monkeypatch):
+    monkeypatch.setattr(segments, "SEGMENT_SECONDS", 100.0)
+    monkeypatch.setattr(segments, "MIN_SEGMENTED_SECONDS", 200.0)
+    source = tmp_path / "A001.mov"
+    source.write_bytes(b"camera original")
+    return ClipTask(source_path=str(source), duration=350.0)
+
+
+def test_interrupted_render_resumes(tmp_path, monkeypatch, long_clip, fake_ffmpeg_engine):
+    db_path = str(tmp_path / "test.db")
+    root = tmp_path / "segments"
+    monkeypatch.setattr(segments, "_segment_checkpoints", SegmentCheckpointStore(PersistenceManager(db_path=db_path), root=root))
+    (tmp_path / "out").mkdir()
+    output = str(tmp_path / "out" / "A001_proxy.mov")
+    cmd = _cmd(long_clip.source_path, output)
+
+    result = fake_ffmpeg_engine(output=b"segment", fail_at=3)._run_segmented(
+        long_clip, cmd, long_clip.source_path, output, start_time=None
+    )
+    assert result.status == ExecutionStatus.FAILED
+    assert result.output_path is None
+
+    # Restart: new store on the same database
+    monkeypatch.setattr(segments, "_segment_checkpoints", SegmentCheckpointStore(PersistenceManager(db_path=db_path), root=root))
+    engine = fake_ffmpeg_engine(output=b"segment")
+    result = engine._run_segmented(
+        long_clip, cmd, long_clip.source_path, output, start_time=None
+    )
+    assert result.status == ExecutionStatus.COMPLETED
+    # Segments 2 and 3 (of 0..3), then the concat
+    assert [c[c.index("-ss") + 1] for c in engine.commands[:-1]] == ["200.000000", "300.000000"]
+    assert engine.commands[-1][-1] == output and "concat" in engine.commands[-1]
+    # Checkpoints and segment files are gone once the output exists
+    assert not any(root.iterdir())
@@ -5,6 +5,7 @@ Tests:
 - Settings immutability rules
 - Default values
 - Validation
+- Job settings memoization and interning
 """
 
 import pytest
@@ -98,3 +99,46 @@ class TestDeliverSettingsSerialization:
         
         restored = DeliverSettings.from_dict(data)
         assert isinstance(restored, DeliverSettings)
+
+
+class TestJobSettingsCache:
+    """Test memoized, interned settings on Job."""
+    
+    def _job(self, settings: DeliverSettings):
+        from app.jobs.models import Job
+        return Job(settings_dict=settings.to_dict())
+    
+    def test_settings_deserialized_once_per_job(self):
+        """Repeated access returns the same object."""
+        job = self._job(DeliverSettings(output_dir="/out/a"))
+        
+        assert job.settings is job.settings
+        assert job.settings.output_dir == "/out/a"
+    
+    def test_identical_settings_are_interned(self):
+        """Jobs with equal settings dicts share one DeliverSettings."""
+        settings = DeliverSettings(output_dir="/out/shared")
+        jobs = [self._job(settings) for _ in range(3)]
+        
+        assert jobs[0].settings is jobs[1].settings is jobs[2].settings
+        assert jobs[0].settings_fingerprint == jobs[2].settings_fingerprint
+    
+    def test_override_invalidates_cache(self):
+        """set_override_settings replaces the memoized effective settings."""
+        job = self._job(DeliverSettings(output_dir="/out/a"))
+        before = job.settings
+        
+        job.update_settings(DeliverSettings(output_dir="/out/b"))
+        
+        assert job.settings.output_dir == "/out/b"
+        assert job.settings_snapshot is before
+        assert job.settings_fingerprint != self._job(DeliverSettings(output_dir="/out/a")).settings_fingerprint
+    
+    def test_reassigned_settings_dict_is_picked_up(self):
+        """Assigning a new settings_dict invalidates the snapshot cache."""
+        job = self._job(DeliverSettings(output_dir="/out/a"))
+        assert job.settings.output_dir == "/out/a"
+        
+        job.settings_dict = DeliverSettings(output_dir="/out/c").to_dict()
+        
+        assert job.settings.output_dir == "/out/c"
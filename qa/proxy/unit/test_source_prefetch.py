@@ -0,0 +1,122 @@
+"""
+Unit tests for the source prefetch cache.
+
+Tests:
+- Prefetched sources are read from the local copy
+- A source changed since it was copied is read from its original path
+- A copy is released once the clip reading it is done
+- Eviction keeps the cache within capacity and spares copies being read
+- Nothing is prefetched below the cache disk's free-space floor
+- Mode "off" prefetches nothing
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.filesystem import prefetch
+from app.filesystem.prefetch import SourcePrefetchCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SourcePrefetchCache(root=tmp_path / "cache", capacity_bytes=100, min_free_bytes=0, mode="always")
+    yield cache
+    cache.shutdown()
+
+
+def _source(tmp_path, name, size):
+    path = tmp_path / "nas" / name
+    path.parent.mkdir(exist_ok=True)
+    path.write_bytes(os.urandom(size))
+    return str(path)
+
+
+def test_reads_local_copy(tmp_path, cache):
+    source = _source(tmp_path, "A001.mov", 40)
+
+    assert cache.prefetch([source, source]) == 1
+    with cache.local_source(source) as path:
+        assert path != source
+        assert Path(path).parent == tmp_path / "cache"
+        assert Path(path).read_bytes() == Path(source).read_bytes()
+        # Already cached: not copied again
+        assert cache.prefetch([source]) == 0
+    assert cache.snapshot()["hits"] == 1
+
+    # Released once the clip is done
+    assert not os.path.exists(path)
+    assert cache.used_bytes == 0
+
+
+def test_changed_source_reads_original(tmp_path, cache):
+    source = _source(tmp_path, "A001.mov", 40)
+    cache.prefetch([source])
+    cache._entries[source].future.result()
+
+    Path(source).write_bytes(b"re-rendered")
+    with cache.local_source(source) as path:
+        assert path == source
+    assert cache.snapshot()["misses"] == 1
+
+    # The stale copy is replaced on the next prefetch
+    assert cache.prefetch([source]) == 1
+    with cache.local_source(source) as path:
+        assert Path(path).read_bytes() == b"re-rendered"
+
+
+def test_eviction_respects_capacity_and_readers(tmp_path, cache):
+    first = _source(tmp_path, "A001.mov", 40)
+    second = _source(tmp_path, "A002.mov", 40)
+    third = _source(tmp_path, "A003.mov", 40)
+
+    cache.prefetch([first, second])
+    with cache.local_source(first) as first_local:
+        cache._entries[second].future.result()
+        # Full: the idle copy of A002 goes, A001 is being read and stays
+        assert cache.prefetch([third]) == 1
+        cache._entries[third].future.result()
+        assert os.path.exists(first_local)
+        assert second not in cache._entries
+        assert cache.used_bytes <= cache.capacity_bytes
+
+        # Would need A001's space too: nothing is evicted
+        assert cache.prefetch([_source(tmp_path, "A004.mov", 61)]) == 0
+        assert third in cache._entries
+
+    too_big = _source(tmp_path, "A005.mov", 101)
+    assert cache.prefetch([too_big]) == 0
+
+
+def test_mode_off(tmp_path, cache):
+    source = _source(tmp_path, "A001.mov", 40)
+    cache.set_mode("off")
+
+    assert cache.prefetch([source]) == 0
+    with cache.local_source(source) as path:
+        assert path == source
+    with pytest.raises(ValueError):
+        cache.set_mode("sometimes")
+
+
+def test_free_space_floor(tmp_path, cache, monkeypatch):
+    first = _source(tmp_path, "A001.mov", 40)
+    second = _source(tmp_path, "A002.mov", 40)
+    free = {"bytes": 1000}
+    monkeypatch.setattr(prefetch.shutil, "disk_usage", lambda path: type("Usage", (), {"free": free["bytes"]}))
+    cache.min_free_bytes = 950
+
+    assert cache.prefetch([first]) == 1
+    cache._entries[first].future.result()
+    free["bytes"] -= 40
+    # A002 would leave 920 free: the idle A001 copy makes way
+    assert cache.prefetch([second]) == 1
+    assert first not in cache._entries
+
+    cache.min_free_bytes = 2000
+    assert cache.prefetch([first]) == 0
@@ -0,0 +1,124 @@
+"""
+Unit tests for per-clip CPU budgets.
+
+Tests:
+- Kernel cpulists parse, and CPUs split into per-slot shares by NUMA node
+- A single slot leaves FFmpeg commands untouched
+- Thread options land before the input, before each output, and globally
+- Leases hand out distinct shares and are returned
+- Concurrent FFmpeg processes get budgets even with one scheduler slot
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.execution import ffmpeg, resources
+from app.execution.ffmpeg import FFmpegEngine
+from app.execution.resources import (
+    AFFINITY_SUPPORTED,
+    ResourceManager,
+    ThreadBudget,
+    numa_nodes,
+    parse_cpulist,
+    partition_cpus,
+)
+from app.jobs.models import ClipTask
+
+CMD = ["ffmpeg", "-y", "-i", "/in/a.mov", "-c:v", "prores_ks", "/out/a.mov", "-c:v", "mjpeg", "/out/a.jpg"]
+
+
+def test_cpu_shares_follow_numa_nodes(tmp_path):
+    assert parse_cpulist("0-3,8,10-11\n") == (0, 1, 2, 3, 8, 10, 11)
+
+    for node, cpulist in ((0, "0-3,8-11"), (1, "4-7,12-15")):
+        (tmp_path / f"node{node}").mkdir()
+        (tmp_path / f"node{node}" / "cpulist").write_text(cpulist)
+    nodes = numa_nodes(tmp_path)
+
+    # Interleaved numbering, but each half stays on one node
+    assert partition_cpus(range(16), 2, nodes) == [
+        (0, 1, 2, 3, 8, 9, 10, 11),
+        (4, 5, 6, 7, 12, 13, 14, 15),
+    ]
+    assert partition_cpus(range(5), 2) == [(0, 1, 2), (3, 4)]
+    assert partition_cpus(range(2), 3) == [(0,), (1,), (0,)]
+
+
+def test_single_slot_is_automatic():
+    manager = ResourceManager(slots=1, cpus=range(8))
+
+    budget = manager.acquire("clip")
+    assert budget == ThreadBudget()
+    assert budget.apply(CMD, ["/out/a.mov", "/out/a.jpg"]) is CMD
+
+
+def test_thread_options_placement():
+    budget = ThreadBudget(threads=4, filter_threads=4)
+
+    assert budget.apply(CMD, ["/out/a.mov", "/out/a.jpg"]) == [
+        "ffmpeg", "-filter_threads", "4", "-y",
+        "-threads", "4", "-i", "/in/a.mov",
+        "-c:v", "prores_ks", "-threads", "4", "/out/a.mov",
+        "-c:v", "mjpeg", "-threads", "4", "/out/a.jpg",
+    ]
+
+
+def test_leases_get_distinct_shares():
+    manager = ResourceManager(slots=4, cpus=range(8), pin=True, nodes={})
+
+    budgets = [manager.acquire(f"clip{i}") for i in range(4)]
+    assert [b.cpus for b in budgets] == [(0, 1), (2, 3), (4, 5), (6, 7)]
+    assert all(b.threads == 2 for b in budgets)
+    assert manager.acquire("clip0") == budgets[0]
+
+    manager.release("clip1")
+    assert manager.acquire("clip4").cpus == (2, 3)
+    assert manager.snapshot()["leases"] == {"clip0": 0, "clip2": 2, "clip3": 3, "clip4": 1}
+
+
+
+def test_concurrent_spawns_split_the_cpus(monkeypatch):
+    monkeypatch.setattr(resources, "_resource_manager", ResourceManager(slots=1, cpus=range(8), pin=False, nodes={}))
+    spawned = []
+
+    class _Process:
+        pid = 0
+
+        def __init__(self, cmd, **kwargs):
+            spawned.append(cmd)
+
+    monkeypatch.setattr(ffmpeg.subprocess, "Popen", _Process)
+    engine = FFmpegEngine()
+    first, second, third = (ClipTask(source_path=f"/in/{name}.mov") for name in "abc")
+    cmd = ["ffmpeg", "-i", "/in/a.mov", "/out/a.mov"]
+
+    engine._spawn(first, cmd, ["/out/a.mov"])
+    engine._spawn(second, cmd, ["/out/a.mov"])
+    # Alone: FFmpeg picks its threads. Next to another render: half the CPUs
+    assert spawned[0] == cmd
+    assert spawned[1] == ["ffmpeg", "-filter_threads", "4", "-threads", "4", "-i", "/in/a.mov", "-threads", "4", "/out/a.mov"]
+
+    engine._forget_process(first.id)
+    engine._spawn(third, cmd, ["/out/a.mov"])
+    assert spawned[2][1:3] == ["-filter_threads", "4"]
+    engine._forget_process(second.id)
+    engine._forget_process(third.id)
+    assert resources._resource_manager.snapshot()["leases"] == {}
+
+
+@pytest.mark.skipif(not AFFINITY_SUPPORTED, reason="sched_setaffinity not available")
+def test_pin_current_process():
+    original = os.sched_getaffinity(0)
+    cpu = min(original)
+    try:
+        assert ThreadBudget(threads=1, cpus=(cpu,)).pin(os.getpid())
+        assert os.sched_getaffinity(0) == {cpu}
+    finally:
+        os.sched_setaffinity(0, original)
+    assert not ThreadBudget(threads=1).pin(os.getpid())
@@ -0,0 +1,88 @@
+"""
+Unit tests for thumbnail generation.
+
+Tests:
+- Fast mode uses keyframe-only decode and the caller-supplied duration
+- Fast mode falls back to the thumbnail filter only for black frames
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "backend"))
+
+from app.execution import thumbnails
+
+
+def _fake_run_factory(commands, stderr_for_fast=b""):
+    """Record FFmpeg commands and write the output file like FFmpeg would."""
+    def fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        Path(cmd[-1]).write_bytes(b"jpeg")
+        stderr = stderr_for_fast if "-skip_frame" in cmd else b""
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"", stderr=stderr)
+    return fake_run
+
+
+class TestFastThumbnail:
+    """Test the keyframe-only fast thumbnail path."""
+    
+    def test_fast_mode_skips_probe_and_decodes_keyframes(self, tmp_path):
+        source = tmp_path / "clip.mov"
+        source.write_bytes(b"source")
+        output = tmp_path / "thumb.jpg"
+        commands = []
+        
+        with patch.object(thumbnails, "find_ffmpeg", return_value="ffmpeg"), \
+             patch.object(thumbnails, "get_video_duration") as probe, \
+             patch.object(thumbnails.subprocess, "run", side_effect=_fake_run_factory(commands)):
+            result = thumbnails.generate_thumbnail_sync(
+                str(source), str(output), position=0.5, duration=10.0, fast=True,
+            )
+        
+        assert result == str(output)
+        probe.assert_not_called()
+        assert len(commands) == 1
+        cmd = commands[0]
+        assert cmd[cmd.index("-skip_frame") + 1] == "nokey"
+        assert cmd[cmd.index("-ss") + 1] == "5.0"
+        # Lands on the keyframe at or before -ss, not the next one after it
+        assert cmd.index("-noaccurate_seek") < cmd.index("-i")
+        assert "thumbnail" not in cmd[cmd.index("-vf") + 1].split(",")
+    
+    def test_black_keyframe_falls_back_to_quality(self, tmp_path):
+        source = tmp_path / "clip.mov"
+        source.write_bytes(b"source")
+        output = tmp_path / "thumb.jpg"
+        commands = []
+        black = b"[Parsed_blackframe_0 @ 0x1] frame:0 pblack:100 pts:0 t:0.000000 type:I last_keyframe:0\n"
+        
+        with patch.object(thumbnails, "find_ffmpeg", return_value="ffmpeg"), \
+             patch.object(thumbnails.subprocess, "run", side_effect=_fake_run_factory(commands, black)):
+            result = thumbnails.generate_thumbnail_sync(
+                str(source), str(output), duration=10.0, fast=True,
+            )
+        
+        assert result == str(output)
+        assert len(commands) == 2
+        assert "-skip_frame" not in commands[1]
+        assert commands[1][commands[1].index("-vf") + 1].startswith("thumbnail,")
+    
+    def test_quality_mode_unchanged(self, tmp_path):
+        source = tmp_path / "clip.mov"
+        source.write_bytes(b"source")
+        output = tmp_path / "thumb.jpg"
+        commands = []
+        
+        with patch.object(thumbnails, "find_ffmpeg", return_value="ffmpeg"), \
+             patch.object(thumbnails, "get_video_duration", return_value=20.0), \
+             patch.object(thumbnails.subprocess, "run", side_effect=_fake_run_factory(commands)):
+            result = thumbnails.generate_thumbnail_sync(str(source), str(output))
+        
+        assert result == str(output)
+        assert len(commands) == 1
+        assert "-skip_frame" not in commands[0]
+        assert commands[0][commands[0].index("-ss") + 1] == "6.0"
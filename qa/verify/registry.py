@@ -128,7 +128,7 @@ TEST_GROUPS: List[TestGroup] = [
         category=TestCategory.E2E,
         min_level=VerifyLevel.FULL,
         path="proxy/e2e/test_recovery.py",
-        description="Restart/recovery scenarios",
+        description="Restart/recovery scenarios (incl. segment checkpoint resume)",
     ),
     
     # UI tests (UI level - also included in FULL)